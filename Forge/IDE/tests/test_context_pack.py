@@ -10,11 +10,14 @@ from forge_ide.context_pack import (
     DependencySnippet,
     RepoSummary,
     TargetFile,
+    approx_bpe_tokens,
     assemble_pack,
     build_repo_summary,
     build_structure_tree,
+    count_tokens,
     estimate_tokens,
     pack_to_text,
+    set_tokenizer,
 )
 from forge_ide.lang import DiagnosticReport
 
@@ -44,6 +47,60 @@ class TestEstimateTokens:
         assert estimate_tokens(t) == estimate_tokens(t)
 
 
+# ===================================================================
+# count_tokens / tokenizer
+# ===================================================================
+
+
+class TestCountTokens:
+    def test_empty_string(self):
+        assert count_tokens("") == 0
+        assert approx_bpe_tokens("") == 0
+
+    def test_short_words_one_token_each(self):
+        assert approx_bpe_tokens("def main return") == 3
+
+    def test_long_identifier_split(self):
+        assert approx_bpe_tokens("x" * 400) == 100
+
+    def test_punctuation_heavier_than_len4(self):
+        code = "foo(a[0], b[1]) -> {x: y};\n" * 20
+        assert approx_bpe_tokens(code) > estimate_tokens(code)
+
+    def test_pluggable_tokenizer(self):
+        try:
+            set_tokenizer(len)
+            assert count_tokens("abcdef") == 6
+            pack = assemble_pack(
+                target_files=[TargetFile(path="a.py", content="x")],
+                test_output="y" * 100,
+                budget_tokens=60,
+            )
+            assert pack.test_output == ""
+            assert pack.token_estimate == len(pack_to_text(pack))
+        finally:
+            set_tokenizer(None)
+        assert count_tokens("abcdef") == approx_bpe_tokens("abcdef")
+
+    def test_cache_holds_digests_not_text(self):
+        from forge_ide import context_pack
+
+        text = "token cache entry " * 10
+        count_tokens(text)
+        assert all(
+            isinstance(k, bytes) and len(k) == 16 for k in context_pack._token_cache
+        )
+        assert count_tokens(text) == approx_bpe_tokens(text)
+
+    def test_large_text_not_cached(self):
+        from forge_ide import context_pack
+
+        big = "y" * (context_pack._TOKEN_CACHE_MAX_CHARS + 1)
+        before = len(context_pack._token_cache)
+        assert count_tokens(big) == approx_bpe_tokens(big)
+        assert len(context_pack._token_cache) == before
+
+
 # ===================================================================
 # build_structure_tree
 # ===================================================================
@@ -242,6 +299,46 @@ class TestAssemblePack:
         assert len(pack.related_snippets) == 0
 
 
+    def test_never_exceeds_budget(self):
+        related = [_snippet(f"r{i}.py", "word(x) " * (10 * i + 5)) for i in range(30)]
+        for budget in (100, 250, 500, 1000):
+            pack = assemble_pack(
+                target_files=[TargetFile(path="a.py", content="sm")],
+                related_snippets=related,
+                budget_tokens=budget,
+            )
+            assert pack.token_estimate <= budget
+            assert pack.token_estimate == count_tokens(pack_to_text(pack))
+
+    def test_fills_budget_past_oversized_item(self):
+        """An item that doesn't fit doesn't stop smaller ones being added."""
+        pack = assemble_pack(
+            target_files=[TargetFile(path="a.py", content="sm")],
+            related_snippets=[_snippet("big.py", "x" * 4000), _snippet("small.py", "tiny")],
+            budget_tokens=100,
+        )
+        assert [rs.path for rs in pack.related_snippets] == ["small.py"]
+
+    def test_prefers_more_value_per_token(self):
+        """Two small deps beat one large dep of the same total size."""
+        pack = assemble_pack(
+            target_files=[TargetFile(path="a.py", content="sm")],
+            dependency_snippets=[
+                DependencySnippet(path="big.py", content="b" * 400, why="dep"),
+                DependencySnippet(path="s1.py", content="s" * 180, why="dep"),
+                DependencySnippet(path="s2.py", content="t" * 180, why="dep"),
+            ],
+            budget_tokens=150,
+        )
+        assert [ds.path for ds in pack.dependency_snippets] == ["s1.py", "s2.py"]
+
+    def test_kept_items_keep_original_order(self):
+        related = [_snippet(f"r{i}.py", "z" * (40 * (i % 3 + 1))) for i in range(6)]
+        pack = assemble_pack(related_snippets=related, budget_tokens=80)
+        paths = [rs.path for rs in pack.related_snippets]
+        assert paths == sorted(paths)
+
+
 # ===================================================================
 # pack_to_text
 # ===================================================================
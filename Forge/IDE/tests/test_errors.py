@@ -9,6 +9,7 @@ from forge_ide.errors import (
     SandboxViolation,
     ToolNotFound,
     ToolTimeout,
+    TransactionAborted,
 )
 
 
@@ -165,3 +166,27 @@ class TestToolNotFound:
         err = ToolNotFound("x", [])
         assert err.available_tools == []
         assert "Available:" in str(err)
+
+
+# ---------------------------------------------------------------------------
+# TransactionAborted
+# ---------------------------------------------------------------------------
+
+
+class TestTransactionAborted:
+    def test_construction(self):
+        err = TransactionAborted("boom", paths=["a.py"])
+        assert err.reason == "boom"
+        assert err.paths == ["a.py"]
+        assert err.diagnostics == []
+        assert "boom" in str(err)
+
+    def test_to_dict(self):
+        diag = {"file": "a.py", "line": 1, "message": "invalid syntax"}
+        d = TransactionAborted("bad", paths=["a.py"], diagnostics=[diag]).to_dict()
+        assert d["error"] == "TransactionAborted"
+        assert d["paths"] == ["a.py"]
+        assert d["diagnostics"] == [diag]
+
+    def test_is_ide_error(self):
+        assert issubclass(TransactionAborted, IDEError)
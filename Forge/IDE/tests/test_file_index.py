@@ -385,6 +385,22 @@ class TestInvalidateFile:
         assert "collections" in imports
         assert "os" not in imports
 
+    def test_relevance_index_kept_current(self, idx: FileIndex, ws: Workspace) -> None:
+        from forge_ide.relevance import find_related
+
+        assert "circular_a.py" in [r.path for r in idx.find_related("main.py")]
+        (ws.root / "circular_a.py").unlink()
+        (ws.root / "main_test.py").write_text("import main\n", encoding="utf-8")
+        idx.invalidate_file("circular_a.py")
+        idx.invalidate_file("main_test.py")
+
+        related = idx.find_related("main.py")
+        assert "circular_a.py" not in [r.path for r in related]
+        assert "main_test.py" in [r.path for r in related]
+        assert related == find_related(
+            "main.py", list(idx._index.values()), idx._import_graph, idx._reverse_graph,
+        )
+
 
 # ===================================================================
 # Utility methods
@@ -8,6 +8,7 @@ from forge_ide.log_parser import (
     BuildIssue,
     BuildSummary,
     GenericSummary,
+    IncrementalSummariser,
     NpmTestSummary,
     PytestSummary,
     TestFailure,
@@ -543,3 +544,78 @@ class TestAutoSummarise:
         s = auto_summarise(FakeResult())
         assert isinstance(s, PytestSummary)
         assert s.passed == 3
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# IncrementalSummariser
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _feed_all(parser, text):
+    inc = IncrementalSummariser(parser)
+    for line in text.splitlines(keepends=True):
+        inc.feed(line)
+    return inc
+
+
+class TestIncrementalSummariser:
+    PYTEST_OUT = (
+        "============================= test session starts ==============================\n"
+        "collected 5 items\n"
+        "\n"
+        "tests/test_a.py ..F.s                                                    [100%]\n"
+        "\n"
+        "=================================== FAILURES ===================================\n"
+        "E       assert 1 == 2\n"
+        "=========================== short test summary info ============================\n"
+        "FAILED tests/test_a.py::test_x - assert 1 == 2\n"
+        "==================== 1 failed, 3 passed, 1 skipped in 0.12s ====================\n"
+    )
+
+    def test_pytest_matches_full_parse(self):
+        inc = _feed_all("pytest", self.PYTEST_OUT)
+        assert inc.summary() == summarise_pytest(self.PYTEST_OUT)
+
+    def test_pytest_live_counts_from_progress_dots(self):
+        inc = IncrementalSummariser("pytest")
+        assert inc.feed("tests/test_a.py ..F.s   [ 40%]\n") is True
+        assert (inc.passed, inc.failed, inc.skipped) == (3, 1, 1)
+        assert inc.failures == 1
+
+    def test_pytest_verbose_and_xdist_lines(self):
+        inc = IncrementalSummariser("pytest")
+        inc.feed("tests/t.py::test_a PASSED   [ 33%]")
+        inc.feed("tests/t.py::test_b FAILED   [ 66%]")
+        inc.feed("[gw0] [100%] ERROR tests/t.py::Suite::test_c")
+        assert (inc.passed, inc.failed, inc.errors) == (1, 1, 1)
+
+    def test_pytest_report_section_not_double_counted(self):
+        inc = _feed_all("pytest", self.PYTEST_OUT)
+        assert inc.failed == 1
+        assert inc.passed == 3
+
+    def test_pytest_without_counts_line_uses_live_counts(self):
+        inc = IncrementalSummariser("pytest")
+        inc.feed("tests/t.py::test_a PASSED")
+        inc.feed("tests/t.py::test_b FAILED")
+        s = inc.summary()
+        assert (s.total, s.passed, s.failed) == (2, 1, 1)
+        assert s.failures[0].test_name == "test_b"
+        assert s.failures[0].file == "tests/t.py"
+
+    def test_npm_matches_full_parse(self):
+        out = (
+            " ✓ src/a.test.ts > adds 1ms\n"
+            " \u00d7 src/a.test.ts > subtracts 3ms\n"
+            " FAIL  src/a.test.ts > subtracts\n"
+            " Test Files  1 failed (1)\n"
+            "      Tests  1 failed | 1 passed (2)\n"
+        )
+        inc = _feed_all("npm", out)
+        assert (inc.passed, inc.failed) == (1, 1)
+        assert inc.summary() == summarise_npm_test(out)
+
+    def test_generic_parses_supplied_text(self):
+        inc = _feed_all("generic", "hello\n")
+        assert inc.summary("hello\n") == summarise_generic("hello\n")
+        assert inc.lines_seen == 1
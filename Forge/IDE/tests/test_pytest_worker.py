@@ -0,0 +1,200 @@
+"""Tests for forge_ide.pytest_worker — warm, forked pytest runs."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from forge_ide.pytest_worker import (
+    PytestWorker,
+    get_worker,
+    parse_pytest_command,
+    resolve_interpreter,
+    run_pytest,
+    shutdown_workers,
+)
+
+needs_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="worker requires os.fork")
+
+_ARGS = ["-q", "-p", "no:cacheprovider"]
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "conftest.py").write_text("", encoding="utf-8")  # puts the root on sys.path
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    (tmp_path / "pkg" / "mod.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_mod.py").write_text(
+        "from pkg.mod import VALUE\n"
+        "\n"
+        "def test_value():\n"
+        "    assert VALUE == 1\n"
+        "\n"
+        "def test_other():\n"
+        "    assert True\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+@pytest.fixture()
+async def worker(project: Path):
+    w = PytestWorker(str(project), python=sys.executable, env=dict(os.environ))
+    yield w
+    await w.close()
+
+
+# ===================================================================
+# Command parsing
+# ===================================================================
+
+
+class TestParsePytestCommand:
+    def test_bare_pytest(self) -> None:
+        assert parse_pytest_command("pytest tests/ -x -q") == ("python", ["tests/", "-x", "-q"], False)
+
+    def test_module_form(self) -> None:
+        assert parse_pytest_command("python3 -m pytest -k 'a or b'") == ("python3", ["-k", "a or b"], True)
+
+    def test_other_commands_rejected(self) -> None:
+        assert parse_pytest_command("npm test") is None
+        assert parse_pytest_command("python -m mypy .") is None
+        assert parse_pytest_command("pytest 'unterminated") is None
+
+
+class TestResolveInterpreter:
+    def test_prefers_virtual_env(self, tmp_path: Path) -> None:
+        bin_dir = tmp_path / ("Scripts" if os.name == "nt" else "bin")
+        bin_dir.mkdir()
+        (bin_dir / "python").write_text("", encoding="utf-8")
+        found = resolve_interpreter("python", {"VIRTUAL_ENV": str(tmp_path), "PATH": ""})
+        assert found == str(bin_dir / "python")
+
+    def test_missing_interpreter(self) -> None:
+        assert resolve_interpreter("no-such-python", {"PATH": ""}) is None
+
+
+# ===================================================================
+# PytestWorker
+# ===================================================================
+
+
+@needs_fork
+class TestPytestWorker:
+    async def test_run_reports_results(self, worker: PytestWorker) -> None:
+        result = await worker.run([*_ARGS, "tests/test_mod.py"], module_mode=True)
+        assert result is not None
+        assert result.exit_code == 0
+        assert result.summary.passed == 2
+        assert "2 passed" in result.stdout
+        assert worker.alive
+
+    async def test_picks_up_source_changes(self, worker: PytestWorker, project: Path) -> None:
+        first = await worker.run([*_ARGS, "tests/test_mod.py"], module_mode=True)
+        (project / "pkg" / "mod.py").write_text("VALUE = 2\n", encoding="utf-8")
+        second = await worker.run([*_ARGS, "tests/test_mod.py"], module_mode=True)
+        assert first.exit_code == 0
+        assert second.exit_code == 1
+        assert second.summary.failed == 1
+        assert second.summary.failures[0].test_name == "test_value"
+
+    async def test_workspace_module_not_shadowed_by_forge(self, worker: PytestWorker, project: Path) -> None:
+        # forge_ide has an ``errors`` module too; the project's must win.
+        (project / "errors.py").write_text("ORIGIN = 'project'\n", encoding="utf-8")
+        (project / "tests" / "test_errors.py").write_text(
+            "import errors\n\ndef test_origin():\n    assert errors.ORIGIN == 'project'\n",
+            encoding="utf-8",
+        )
+        result = await worker.run([*_ARGS, "tests/test_errors.py"])
+        assert result.exit_code == 0, result.stdout
+        assert result.summary.passed == 1
+
+    async def test_warm_runs_emit_no_rewrite_warning(self, worker: PytestWorker) -> None:
+        args = [*_ARGS, "-W", "error::pytest.PytestAssertRewriteWarning", "tests/test_mod.py"]
+        first = await worker.run(args, module_mode=True)
+        second = await worker.run(args, module_mode=True)
+        assert first.exit_code == second.exit_code == 0, second.stdout
+        assert "PytestAssertRewriteWarning" not in second.stdout
+
+    async def test_max_failures_maps_to_maxfail(self, worker: PytestWorker, project: Path) -> None:
+        (project / "tests" / "test_fail.py").write_text(
+            "import pytest\n"
+            "\n"
+            "@pytest.mark.parametrize('i', range(20))\n"
+            "def test_fail(i):\n"
+            "    assert False\n",
+            encoding="utf-8",
+        )
+        result = await worker.run([*_ARGS, "tests/test_fail.py"], max_failures=2)
+        assert result.summary.failed == 2
+        assert result.stopped_early is True
+
+    async def test_timeout_kills_child_but_not_worker(self, worker: PytestWorker, project: Path) -> None:
+        (project / "tests" / "test_slow.py").write_text(
+            "import time\n\ndef test_slow():\n    time.sleep(30)\n", encoding="utf-8",
+        )
+        result = await worker.run([*_ARGS, "tests/test_slow.py"], timeout_s=1)
+        assert result.killed is True
+        assert result.exit_code == -1
+        assert worker.alive
+
+    async def test_run_scoped(self, worker: PytestWorker) -> None:
+        result = await worker.run_scoped(
+            ["pkg/mod.py"], ["tests/test_mod.py", "pkg/mod.py"], extra_args="-q -p no:cacheprovider",
+        )
+        assert result is not None
+        assert result.summary.passed == 2
+
+    async def test_run_scoped_without_matches(self, worker: PytestWorker) -> None:
+        assert await worker.run_scoped(["README.md"], ["tests/test_mod.py"]) is None
+
+    async def test_unstartable_interpreter(self, project: Path) -> None:
+        w = PytestWorker(str(project), python=str(project / "missing-python"))
+        assert await w.run(_ARGS) is None
+        assert not w.alive
+
+
+# ===================================================================
+# Registry / run_pytest
+# ===================================================================
+
+
+@needs_fork
+class TestRunPytest:
+    async def test_reuses_worker(self, project: Path) -> None:
+        env = dict(os.environ)
+        try:
+            cmd = "python -m pytest -q -p no:cacheprovider tests/test_mod.py"
+            first = await run_pytest(cmd, cwd=str(project), env=env)
+            worker = get_worker(str(project), python=resolve_interpreter("python", env), env=env)
+            second = await run_pytest(cmd, cwd=str(project), env=env)
+            assert first.exit_code == second.exit_code == 0
+            assert second.command == cmd
+            assert worker.alive
+        finally:
+            await shutdown_workers(str(project))
+        assert not worker.alive
+
+    async def test_env_change_replaces_worker(self, project: Path) -> None:
+        try:
+            a = get_worker(str(project), python=sys.executable, env={"A": "1"})
+            b = get_worker(str(project), python=sys.executable, env={"A": "2"})
+            assert a is not b
+            assert get_worker(str(project), python=sys.executable, env={"A": "2"}) is b
+        finally:
+            await shutdown_workers(str(project))
+
+    async def test_falls_back_for_unknown_interpreter(self, project: Path) -> None:
+        env = {"PATH": os.environ.get("PATH", "")}
+        assert await run_pytest(
+            "pytest -q", cwd=str(project), env={"PATH": ""}, fallback=False,
+        ) is None
+        result = await run_pytest(
+            f'"{sys.executable}" -c "print(1)"', cwd=str(project), env=env,
+        )
+        assert result.exit_code == 0
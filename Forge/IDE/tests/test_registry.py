@@ -80,6 +80,16 @@ class TestRegistryListTools:
         names = {t["name"] for t in reg.list_tools()}
         assert names == {"a", "b"}
 
+    def test_list_is_reused_until_register(self):
+        reg = Registry()
+        reg.register("a", lambda r, w: {}, ReadFileRequest, "A")
+        first = reg.list_tools()
+        first.append({"name": "mutated"})
+        assert reg.list_tools() == first[:1]
+        assert reg.list_tools()[0] is first[0]
+        reg.register("b", lambda r, w: {}, ReadFileRequest, "B")
+        assert [t["name"] for t in reg.list_tools()] == ["a", "b"]
+
 
 @pytest.mark.asyncio
 class TestRegistryDispatch:
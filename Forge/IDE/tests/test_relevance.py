@@ -9,6 +9,7 @@ import pytest
 from forge_ide.file_index import FileMetadata
 from forge_ide.relevance import (
     RelatedFile,
+    RelevanceIndex,
     find_related,
     score_directory_proximity,
     score_import_graph,
@@ -261,3 +262,84 @@ class TestFindRelated:
         rf = RelatedFile(path="a.py", score=1.0, reasons=["test"])
         with pytest.raises(Exception):
             rf.path = "b.py"  # type: ignore[misc]
+
+
+# ===================================================================
+# RelevanceIndex
+# ===================================================================
+
+
+def _sample_files() -> list[FileMetadata]:
+    return [
+        _meta("src/foo.py", NOW),
+        _meta("src/bar.py", NOW - timedelta(hours=2)),
+        _meta("src/sub/deep.py", NOW - timedelta(hours=30)),
+        _meta("tests/test_foo.py", NOW - timedelta(hours=1)),
+        _meta("lib/util.py", NOW - timedelta(hours=5)),
+        _meta("lib/far/away/other.py", NOW - timedelta(hours=12)),
+        _meta("docs/readme.md"),
+        _meta("src/foobar_helpers.py", None),
+    ]
+
+
+class TestRelevanceIndex:
+    def test_matches_find_related(self):
+        files = _sample_files()
+        imports = {
+            "src/foo.py": ["src/bar.py"],
+            "src/bar.py": ["lib/util.py"],
+            "tests/test_foo.py": ["src/foo.py"],
+        }
+        idx = RelevanceIndex.build(files, imports)
+        for fm in files:
+            for k in (1, 3, 15):
+                assert idx.related(fm.path, max_results=k) == find_related(
+                    fm.path, files, imports, {}, max_results=k,
+                )
+
+    def test_import_neighbourhood(self):
+        files = [_meta("a/a/x.py"), _meta("b/b/y.py"), _meta("c/c/z.py"), _meta("d/d/w.py")]
+        imports = {"a/a/x.py": ["b/b/y.py"], "b/b/y.py": ["c/c/z.py"], "d/d/w.py": ["a/a/x.py"]}
+        idx = RelevanceIndex.build(files, imports)
+        reasons = {r.path: r.reasons for r in idx.related("a/a/x.py")}
+        assert reasons == {
+            "b/b/y.py": ["direct import"],
+            "d/d/w.py": ["reverse import"],
+            "c/c/z.py": ["transitive import"],
+        }
+
+    def test_unknown_target(self):
+        idx = RelevanceIndex.build(_sample_files(), {})
+        result = idx.related("src/new.py")
+        assert result == find_related("src/new.py", _sample_files(), {}, {})
+        assert "src/foo.py" in [r.path for r in result]
+
+    def test_recency_only_candidates_truncated(self):
+        files = [_meta(f"d{i}/f{i}.py", NOW - timedelta(minutes=i)) for i in range(50)]
+        idx = RelevanceIndex.build(files, {})
+        result = idx.related("d0/f0.py", max_results=3)
+        assert [r.path for r in result] == ["d1/f1.py", "d2/f2.py", "d3/f3.py"]
+        assert result == find_related("d0/f0.py", files, {}, {}, max_results=3)
+
+    def test_update_file_add_and_remove(self):
+        files = _sample_files()
+        imports: dict[str, list[str]] = {"src/foo.py": ["src/bar.py"]}
+        idx = RelevanceIndex.build(files, imports)
+        bar = files[1]
+
+        # Re-point src/bar.py's imports (moves it to the end of the
+        # tie-break order) and drop src/foo.py entirely
+        imports["src/bar.py"] = ["lib/util.py"]
+        idx.update_file("src/bar.py", bar, imports["src/bar.py"])
+        del imports["src/foo.py"]
+        idx.update_file("src/foo.py", None)
+        files = [fm for fm in files if fm.path not in ("src/foo.py", "src/bar.py")] + [bar]
+
+        assert "src/foo.py" not in idx
+        assert len(idx) == len(files)
+        for fm in files:
+            assert idx.related(fm.path) == find_related(fm.path, files, imports, {})
+
+    def test_zero_max_results(self):
+        idx = RelevanceIndex.build(_sample_files(), {})
+        assert idx.related("src/foo.py", max_results=0) == []
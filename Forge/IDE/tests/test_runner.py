@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,10 +19,15 @@ from forge_ide.runner import (
     MAX_STDOUT_BYTES,
     RUN_COMMAND_PREFIXES,
     RUN_TESTS_PREFIXES,
+    RunProgress,
     RunResult,
+    StreamRunResult,
     _build_env,
+    _OutputBuffer,
     _truncate,
     run,
+    run_streaming,
+    stream_process,
     validate_command,
 )
 
@@ -513,3 +519,108 @@ class TestRun:
         assert result.killed is True
         assert result.stdout == ""
         assert result.stderr == ""
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Streaming runner
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _py(source: str) -> str:
+    """Shell command running *source* with the current interpreter."""
+    return f'"{sys.executable}" -c "{source}"'
+
+
+class TestOutputBuffer:
+    def test_small_output_kept_verbatim(self):
+        buf = _OutputBuffer(100)
+        buf.append("a\n")
+        buf.append("b\n")
+        assert buf.text() == "a\nb\n"
+        assert buf.truncated is False
+
+    def test_keeps_head_and_tail(self):
+        buf = _OutputBuffer(40)
+        for i in range(100):
+            buf.append(f"line{i:03d}\n")
+        text = buf.text()
+        assert text.startswith("line000")
+        assert text.endswith("line099\n")
+        assert "bytes omitted" in text
+        assert buf.truncated is True
+        assert buf.total == 800
+
+
+class TestStreamProcess:
+    def test_captures_output_and_exit_code(self):
+        result = _run_sync(stream_process(
+            _py("import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"),
+        ))
+        assert isinstance(result, StreamRunResult)
+        assert result.exit_code == 3
+        assert result.stdout.strip() == "out"
+        assert result.stderr.strip() == "err"
+        assert result.killed is False
+        assert result.stopped_early is False
+
+    def test_output_is_bounded(self):
+        result = _run_sync(stream_process(
+            _py("[print('x' * 99) for _ in range(5000)]"), max_stdout_bytes=1000,
+        ))
+        assert result.exit_code == 0
+        assert result.truncated is True
+        assert result.output_bytes == 500_000
+        assert len(result.stdout) < 1100
+
+    def test_timeout_kills(self):
+        result = _run_sync(stream_process(_py("import time; time.sleep(30)"), timeout_s=0.5))
+        assert result.killed is True
+        assert result.exit_code == -1
+        assert result.duration_ms < 10_000
+
+    def test_stops_after_max_failures(self):
+        source = (
+            "import time\n"
+            "for i in range(200):\n"
+            "    print(f'tests/t.py::test_{i} FAILED', flush=True)\n"
+            "    time.sleep(0.02)"
+        )
+        result = _run_sync(stream_process(_py(source), parser="pytest", max_failures=2))
+        assert result.stopped_early is True
+        assert result.killed is False
+        assert result.summary.failed >= 2
+        assert result.summary.failed < 200
+
+    def test_progress_events(self):
+        events: list[RunProgress] = []
+        source = "print('tests/t.py::test_a PASSED'); print('tests/t.py::test_b FAILED')"
+        result = _run_sync(stream_process(_py(source), parser="pytest", on_progress=events.append))
+        assert result.summary.passed == 1
+        assert result.summary.failed == 1
+        assert events
+        assert (events[-1].passed, events[-1].failed) == (1, 1)
+
+    def test_async_callback_errors_are_ignored(self):
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        result = _run_sync(stream_process(_py("print('hi')"), on_progress=broken))
+        assert result.exit_code == 0
+
+
+class TestRunStreaming:
+    def test_blocked_command_raises(self):
+        with pytest.raises(SandboxViolation):
+            _run_sync(run_streaming("rm -rf /"))
+
+    def test_passes_restricted_env_and_limit(self):
+        with patch("forge_ide.runner.stream_process") as mock_stream:
+            async def fake(command, **kwargs):
+                return StreamRunResult(exit_code=0, command=command)
+
+            mock_stream.side_effect = fake
+            _run_sync(run_streaming("pytest tests/", max_failures=3))
+
+        kwargs = mock_stream.call_args.kwargs
+        assert kwargs["max_failures"] == 3
+        assert set(kwargs["env"]) <= set(_build_env())
@@ -0,0 +1,193 @@
+"""Tests for forge_ide.transaction — atomic multi-file patch transactions."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from forge_ide.contracts import Edit
+from forge_ide.errors import PatchConflict, SandboxViolation, TransactionAborted
+from forge_ide.transaction import PatchTransaction
+
+
+@pytest.fixture()
+def root(tmp_path: Path) -> Path:
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "main.py").write_text("def main():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "app" / "util.py").write_text("X = 1\nY = 2\n", encoding="utf-8")
+    return tmp_path
+
+
+def _read(root: Path, rel: str) -> str:
+    return (root / rel).read_text(encoding="utf-8")
+
+
+# ===================================================================
+# Staging
+# ===================================================================
+
+
+class TestStaging:
+    def test_stage_does_not_touch_disk(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.stage("app/util.py", "X = 10\n")
+        assert _read(root, "app/util.py") == "X = 1\nY = 2\n"
+        assert txn.read("app/util.py") == "X = 10\n"
+        assert txn.staged_paths == ["app/util.py"]
+
+    def test_stage_edits_builds_on_staged_content(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.stage_edits("app/util.py", [Edit(old_text="X = 1", new_text="X = 10")])
+        result = txn.stage_edits("app/util.py", [Edit(old_text="Y = 2", new_text="Y = 20")])
+        assert result.success
+        assert txn.read("app/util.py") == "X = 10\nY = 20\n"
+
+    def test_failed_edits_stage_nothing(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        result = txn.stage_edits(
+            "app/util.py",
+            [Edit(old_text="X = 1", new_text="X = 10"), Edit(old_text="nowhere to be found at all", new_text="")],
+        )
+        assert not result.success
+        assert txn.staged_paths == []
+
+    def test_stage_edits_missing_file(self, root: Path) -> None:
+        result = PatchTransaction(root).stage_edits("nope.py", [Edit(old_text="a", new_text="b")])
+        assert not result.success
+
+    def test_stage_patch(self, root: Path) -> None:
+        diff = "--- a/app/util.py\n+++ b/app/util.py\n@@ -1,2 +1,2 @@\n-X = 1\n+X = 5\n Y = 2\n"
+        txn = PatchTransaction(root)
+        txn.stage_patch("app/util.py", diff)
+        assert txn.read("app/util.py") == "X = 5\nY = 2\n"
+
+    def test_stage_patch_conflict(self, root: Path) -> None:
+        diff = "--- a/app/util.py\n+++ b/app/util.py\n@@ -1,1 +1,1 @@\n-Z = 9\n+Z = 0\n"
+        txn = PatchTransaction(root)
+        with pytest.raises(PatchConflict):
+            txn.stage_patch("app/util.py", diff)
+        assert txn.staged_paths == []
+
+    def test_sandbox_enforced(self, root: Path) -> None:
+        with pytest.raises(SandboxViolation):
+            PatchTransaction(root).stage("../escape.py", "x")
+
+
+# ===================================================================
+# Commit
+# ===================================================================
+
+
+class TestCommit:
+    def test_commit_writes_all(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.stage("app/util.py", "X = 3\n")
+        txn.stage("app/new/mod.py", "Z = 1\n")
+        txn.stage("app/main.py", None)
+        assert txn.commit() == ["app/main.py", "app/new/mod.py", "app/util.py"]
+        assert _read(root, "app/util.py") == "X = 3\n"
+        assert _read(root, "app/new/mod.py") == "Z = 1\n"
+        assert not (root / "app" / "main.py").exists()
+        assert txn.state == "committed"
+        assert not list(root.rglob("*.forge-tmp"))
+
+    def test_unchanged_content_not_written(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.stage("app/util.py", "X = 1\nY = 2\n")
+        assert txn.commit() == []
+
+    def test_syntax_error_aborts_before_writing(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.stage("app/util.py", "X = 2\n")
+        txn.stage("app/main.py", "def main(:\n")
+        with pytest.raises(TransactionAborted) as exc_info:
+            txn.commit()
+        assert exc_info.value.paths == ["app/main.py"]
+        assert exc_info.value.diagnostics
+        assert _read(root, "app/util.py") == "X = 1\nY = 2\n"
+        assert txn.state == "aborted"
+
+    def test_already_broken_file_may_stay_broken(self, root: Path) -> None:
+        (root / "broken.py").write_text("def (:\n", encoding="utf-8")
+        txn = PatchTransaction(root)
+        txn.stage("broken.py", "def (:\n# still wip\n")
+        assert txn.commit() == ["broken.py"]
+
+    def test_validation_can_be_disabled(self, root: Path) -> None:
+        txn = PatchTransaction(root, validate_python=False)
+        txn.stage("app/main.py", "def main(:\n")
+        assert txn.commit() == ["app/main.py"]
+
+    def test_concurrent_change_aborts(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.stage_edits("app/util.py", [Edit(old_text="X = 1", new_text="X = 10")])
+        (root / "app" / "util.py").write_text("X = 1\nY = 99\n", encoding="utf-8")
+        with pytest.raises(TransactionAborted, match="changed on disk"):
+            txn.commit()
+        assert _read(root, "app/util.py") == "X = 1\nY = 99\n"
+
+    def test_failed_rename_restores_written_files(
+        self, root: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        real_replace = os.replace
+        calls = {"n": 0}
+
+        def flaky_replace(src: str, dst: object) -> None:
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        monkeypatch.setattr("forge_ide.transaction.os.replace", flaky_replace)
+        txn = PatchTransaction(root)
+        txn.stage("app/main.py", "def main():\n    return 2\n")
+        txn.stage("app/util.py", "X = 2\n")
+        with pytest.raises(TransactionAborted, match="disk full"):
+            txn.commit()
+        monkeypatch.undo()
+        assert _read(root, "app/main.py") == "def main():\n    return 1\n"
+        assert _read(root, "app/util.py") == "X = 1\nY = 2\n"
+        assert not list(root.rglob("*.forge-tmp"))
+
+    def test_closed_transaction_rejects_staging(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.commit()
+        with pytest.raises(TransactionAborted):
+            txn.stage("app/util.py", "X = 3\n")
+
+
+# ===================================================================
+# Rollback & context manager
+# ===================================================================
+
+
+class TestRollback:
+    def test_rollback_restores_originals(self, root: Path) -> None:
+        txn = PatchTransaction(root)
+        txn.stage("app/util.py", "X = 3\n")
+        txn.stage("app/new.py", "N = 1\n")
+        txn.stage("app/main.py", None)
+        txn.commit()
+        assert txn.rollback() == ["app/main.py", "app/new.py", "app/util.py"]
+        assert _read(root, "app/util.py") == "X = 1\nY = 2\n"
+        assert _read(root, "app/main.py") == "def main():\n    return 1\n"
+        assert not (root / "app" / "new.py").exists()
+        assert txn.state == "rolled_back"
+
+    def test_rollback_requires_commit(self, root: Path) -> None:
+        with pytest.raises(TransactionAborted):
+            PatchTransaction(root).rollback()
+
+    def test_context_manager_commits(self, root: Path) -> None:
+        with PatchTransaction(root) as txn:
+            txn.stage("app/util.py", "X = 4\n")
+        assert _read(root, "app/util.py") == "X = 4\n"
+
+    def test_context_manager_discards_on_error(self, root: Path) -> None:
+        with pytest.raises(RuntimeError), PatchTransaction(root) as txn:
+            txn.stage("app/util.py", "X = 4\n")
+            raise RuntimeError("agent crashed")
+        assert _read(root, "app/util.py") == "X = 1\nY = 2\n"
+        assert txn.state == "aborted"
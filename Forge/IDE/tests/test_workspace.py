@@ -4,7 +4,7 @@ Covers:
 - Construction (valid dir, nonexistent, file-as-root)
 - resolve() sandbox enforcement (absolute, .., null bytes, symlinks, empty)
 - is_within() constant-time membership check
-- file_tree() recursive listing, skipping, caching, TTL
+- file_tree() recursive listing, skipping, caching, TTL, incremental refresh
 - workspace_summary() aggregation + caching
 - FileEntry / WorkspaceSummary model constraints
 - Edge cases (unicode, hidden files, long paths, 0-byte files)
@@ -328,6 +328,92 @@ class TestFileTreeCaching:
         assert tree1 is not tree2  # TTL expired
 
 
+class TestIncrementalRefresh:
+    """After the TTL only directories whose mtime changed are re-listed."""
+
+    @pytest.fixture(autouse=True)
+    def _no_racy_window(self):
+        with patch("forge_ide.workspace._RACY_WINDOW_NS", 0):
+            yield
+
+    @staticmethod
+    def _bump_mtime(path: Path) -> None:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    def test_only_changed_dirs_rescanned(self, ws_dir: Path) -> None:
+        import forge_ide.workspace as mod
+
+        ws = Workspace(ws_dir, cache_ttl=0)
+        ws.file_tree()
+        (ws_dir / "src" / "new.py").write_text("x = 1\n")
+        self._bump_mtime(ws_dir / "src")
+
+        with patch.object(mod, "_scan_dir", wraps=mod._scan_dir) as scan:
+            paths = {e.path for e in ws.file_tree()}
+
+        assert "src/new.py" in paths
+        assert [c.args[1] for c in scan.call_args_list] == ["src"]
+
+    def test_unchanged_tree_lists_nothing(self, ws_dir: Path) -> None:
+        import forge_ide.workspace as mod
+
+        ws = Workspace(ws_dir, cache_ttl=0)
+        tree1 = ws.file_tree()
+        with patch.object(mod, "_scan_dir", wraps=mod._scan_dir) as scan:
+            tree2 = ws.file_tree()
+
+        assert scan.call_count == 0
+        assert [e.path for e in tree1] == [e.path for e in tree2]
+
+    def test_added_and_removed_directories(self, ws_dir: Path) -> None:
+        ws = Workspace(ws_dir, cache_ttl=0)
+        ws.file_tree()
+        (ws_dir / "pkg" / "sub").mkdir(parents=True)
+        (ws_dir / "pkg" / "sub" / "mod.py").write_text("y = 2\n")
+        for child in (ws_dir / "src").iterdir():
+            child.unlink()
+        (ws_dir / "src").rmdir()
+        self._bump_mtime(ws_dir)
+
+        paths = {e.path for e in ws.file_tree()}
+
+        assert {"pkg", "pkg/sub", "pkg/sub/mod.py"} <= paths
+        assert not any(p == "src" or p.startswith("src/") for p in paths)
+        assert ws.workspace_summary().file_count == sum(
+            1 for e in ws.file_tree() if not e.is_dir
+        )
+
+    def test_in_place_edit_refreshes_size_and_mtime(self, ws_dir: Path) -> None:
+        import forge_ide.workspace as mod
+
+        ws = Workspace(ws_dir, cache_ttl=0)
+        ws.file_tree()
+        main = ws_dir / "src" / "main.py"
+        main.write_text("print('a much longer hello than before')\n")
+        self._bump_mtime(main)
+
+        with patch.object(mod, "_scan_dir", wraps=mod._scan_dir) as scan:
+            by_path = {e.path: e for e in ws.file_tree()}
+
+        assert scan.call_count == 0  # no directory re-listed
+        assert by_path["src/main.py"].size_bytes == main.stat().st_size
+        assert by_path["src/main.py"].last_modified.timestamp() == pytest.approx(main.stat().st_mtime)
+        assert ws.workspace_summary().total_size_bytes == sum(
+            e.size_bytes for e in by_path.values() if not e.is_dir
+        )
+
+    def test_invalidate_paths_refreshes_sizes(self, ws_dir: Path) -> None:
+        ws = Workspace(ws_dir)
+        ws.file_tree()
+        (ws_dir / "src" / "main.py").write_text("print('a much longer hello')\n")
+
+        ws.invalidate_cache(["src/main.py"])
+        by_path = {e.path: e for e in ws.file_tree()}
+
+        assert by_path["src/main.py"].size_bytes == (ws_dir / "src" / "main.py").stat().st_size
+
+
 # ---------------------------------------------------------------------------
 # workspace_summary()
 # ---------------------------------------------------------------------------
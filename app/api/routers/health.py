@@ -2,11 +2,12 @@
 
 import os
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 
-from app.config import VERSION
-from app.repos.db import get_pool
+from app.api.deps import get_current_user
+from app.config import VERSION, settings
+from app.repos.db import get_pool, pool_stats, query_stats
 
 router = APIRouter()
 
@@ -36,4 +37,21 @@ async def health_check():
 @router.get("/health/version")
 async def health_version() -> dict:
     """Return application version and current phase."""
-    return {"version": VERSION, "phase": "6"}
\ No newline at end of file
+    return {"version": VERSION, "phase": "6"}
+
+
+@router.get("/health/db")
+async def health_db(
+    top: int = Query(default=50, ge=1, le=500),
+    _user: dict = Depends(get_current_user),
+) -> dict:
+    """Return pool status and per-statement query statistics.
+
+    Statements are sorted by total time spent, so the hottest queries
+    (and the repo functions issuing them) come first.  The response
+    includes SQL text, so it is only served when
+    ``DB_QUERY_STATS_ENDPOINT_ENABLED`` is set.
+    """
+    if not settings.DB_QUERY_STATS_ENDPOINT_ENABLED:
+        raise HTTPException(status_code=404, detail="Not found")
+    return {"pool": pool_stats(), "queries": query_stats(top=top)}
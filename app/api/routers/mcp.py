@@ -9,6 +9,7 @@ Routes
 GET /api/mcp/context/{project_id}             — project manifest (metadata)
 GET /api/mcp/context/{project_id}/{type}      — single contract content
 GET /api/mcp/build/{build_id}/contracts       — pinned snapshot for a build
+GET /api/mcp/build/{build_id}/bundle          — every contract for a build, one call
 """
 
 from __future__ import annotations
@@ -164,3 +165,51 @@ async def get_build_contracts(
             for c in contracts
         ],
     }
+
+
+# ---------------------------------------------------------------------------
+# GET /mcp/build/{build_id}/bundle  — all contracts for a build, one call
+# ---------------------------------------------------------------------------
+
+
+@router.get("/build/{build_id}/bundle")
+async def get_build_bundle(
+    build_id: UUID,
+    user: dict = Depends(get_forge_user),
+) -> dict:
+    """Return every contract a build's agents work from, with full content.
+
+    Serves the pinned snapshot when the build has one, otherwise the
+    project's current contracts.  Sub-agents fetch this once instead of
+    the manifest followed by one request per contract.
+    """
+    build = await get_build_by_id(build_id)
+    if not build:
+        raise HTTPException(status_code=404, detail="Build not found")
+
+    project = await _verify_project_access(build["project_id"], user)
+
+    batch = build.get("contract_batch")
+    if batch is not None:
+        contracts = await get_snapshot_contracts(build["project_id"], batch)
+        source = "snapshot"
+    else:
+        contracts = await get_contracts_by_project(build["project_id"])
+        source = "project_db"
+
+    return {
+        "build_id": str(build_id),
+        "project_id": str(build["project_id"]),
+        "project_name": project.get("name", ""),
+        "batch": batch,
+        "source": source,
+        "contracts": [
+            {
+                "contract_type": c["contract_type"],
+                "content": c["content"],
+                "version": c.get("version"),
+                "size_chars": len(c.get("content") or ""),
+            }
+            for c in contracts
+        ],
+    }
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import math
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
@@ -9,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from app.api.deps import get_current_user
+from app.clients.github_client import GitHubRateLimitError
 from app.services.audit_service import backfill_repo_commits, get_audit_detail, get_repo_audits
 from app.services.repo_service import (
     connect_repo,
@@ -223,6 +225,12 @@ async def sync_commits(
         )
     except ValueError:
         raise  # centralised handler maps to 400/404
+    except GitHubRateLimitError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(exc),
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        ) from exc
     except Exception:
         logger.exception("Failed to sync commits for repo %s", repo_id)
         raise HTTPException(
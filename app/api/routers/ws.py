@@ -6,7 +6,7 @@ import jwt as pyjwt
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.auth import decode_token
-from app.ws_manager import MAX_MESSAGE_SIZE, manager
+from app.ws_manager import MAX_MESSAGE_SIZE, manager, resolve_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,14 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
     Auth via query param: /ws?token=<jwt>
     Server sends messages of type "audit_update" with AuditRunSummary payload.
+
+    Every event carries a per-user ``seq`` and the ``epoch`` of the stream
+    it belongs to.  A reconnecting client passes ``resume_from=<last seq
+    seen>&epoch=<its epoch>`` to have the missed events replayed instead
+    of reloading full state over REST.
+
+    ``encoding=msgpack`` requests compact binary frames (when the server
+    has msgpack installed); JSON text frames are the default.
     """
     token = websocket.query_params.get("token")
     if not token:
@@ -36,8 +44,21 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         await websocket.close(code=4001, reason="Invalid token payload")
         return
 
+    resume_from: int | None = None
+    raw_resume = websocket.query_params.get("resume_from")
+    if raw_resume:
+        try:
+            resume_from = max(int(raw_resume), 0)
+        except ValueError:
+            resume_from = None
+    epoch = websocket.query_params.get("epoch") or None
+
+    encoding = resolve_encoding(websocket.query_params.get("encoding"))
+
     await websocket.accept()
-    await manager.connect(user_id, websocket)
+    await manager.connect(
+        user_id, websocket, resume_from=resume_from, encoding=encoding, epoch=epoch,
+    )
     count = manager.connection_count(user_id)
     logger.info("WS open  user=%s conns=%d", user_id[:8], count)
 
@@ -145,6 +145,10 @@ class TokenBudgetLimiter:
 # API Key Pool — round-robin across multiple keys for higher throughput
 # ---------------------------------------------------------------------------
 
+# Process-wide limiter per API key, used by pools created with shared=True
+# so every build and generation on the same key draws from one TPM budget.
+_shared_limiters: dict[str, TokenBudgetLimiter] = {}
+
 
 class ApiKeyPool:
     """Manages multiple Anthropic API keys, each with its own rate limiter.
@@ -152,6 +156,9 @@ class ApiKeyPool:
     On each call, picks the key whose limiter has the most remaining
     input-token budget (least-loaded).  This lets N keys achieve ~N×
     the throughput of a single key.
+
+    With ``shared=True`` the pool reuses the process-wide limiter for each
+    key (created with this pool's limits on first use) instead of its own.
     """
 
     def __init__(
@@ -159,6 +166,8 @@ class ApiKeyPool:
         api_keys: list[str],
         input_tpm: int = DEFAULT_INPUT_TPM,
         output_tpm: int = DEFAULT_OUTPUT_TPM,
+        *,
+        shared: bool = False,
     ) -> None:
         if not api_keys:
             raise ValueError("At least one API key is required")
@@ -172,9 +181,11 @@ class ApiKeyPool:
         if not unique:
             raise ValueError("At least one non-empty API key is required")
         self._keys = unique
-        self._limiters = {
-            k: TokenBudgetLimiter(input_tpm, output_tpm) for k in unique
-        }
+        registry: dict[str, TokenBudgetLimiter] = _shared_limiters if shared else {}
+        for k in unique:
+            if k not in registry:
+                registry[k] = TokenBudgetLimiter(input_tpm, output_tpm)
+        self._limiters = {k: registry[k] for k in unique}
 
     @property
     def key_count(self) -> int:
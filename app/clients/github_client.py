@@ -1,12 +1,22 @@
 """GitHub API client -- OAuth token exchange, user info, repos, and webhooks."""
 
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
 import httpx
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 
 GITHUB_OAUTH_URL = "https://github.com/login/oauth/authorize"
 GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
 GITHUB_USER_URL = "https://api.github.com/user"
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
 # ── Response caches (reduces GitHub API rate-limit pressure) ────────────────
 # Key format: (access_token, full_name) or (access_token,)
@@ -16,6 +26,16 @@ _repo_list_cache: TTLCache[str, list[dict]] = TTLCache(maxsize=200, ttl=300)
 _repo_meta_cache: TTLCache[tuple[str, str], dict] = TTLCache(maxsize=500, ttl=300)
 _repo_lang_cache: TTLCache[tuple[str, str], dict[str, int]] = TTLCache(maxsize=500, ttl=300)
 
+# ── Conditional-request cache (ETag / Last-Modified) ────────────────────────
+# Once the TTL caches above expire, reads are revalidated instead of
+# re-fetched: the validators from the last 200 are sent back as
+# If-None-Match / If-Modified-Since, and a 304 (which GitHub does not count
+# against the primary rate limit) reuses the stored body.
+# Key: (access_token, url, sorted params) → (etag, last_modified, body).
+# Bodies are stored already projected down to the fields we use.
+
+_conditional_cache: LRUCache[tuple, tuple[str | None, str | None, Any]] = LRUCache(maxsize=2000)
+
 # ── Shared HTTP client (connection pooling) ─────────────────────────────────
 
 _client: httpx.AsyncClient | None = None
@@ -37,6 +57,231 @@ async def close_client() -> None:
         _client = None
 
 
+# ── Rate-limit-aware scheduling ─────────────────────────────────────────────
+# Every authenticated call goes through a per-token scheduler that:
+#   - tracks the primary quota from X-RateLimit-Remaining / -Limit / -Reset
+#     and keeps the last BACKGROUND_RESERVE of it for interactive requests;
+#   - backs off on secondary limits (429, or 403 with Retry-After /
+#     "rate limit" in the body), halving its concurrency (AIMD) and
+#     retrying after the advertised delay;
+#   - hands free slots to interactive waiters before background ones.
+# Callers mark sweeps and backfills with ``request_priority(PRIORITY_BACKGROUND)``;
+# everything else (webhook audits, API handlers) is interactive.
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+MAX_CONCURRENCY = 8  # per token; GitHub asks for ≲ 100 concurrent requests
+BACKGROUND_RESERVE = 0.1  # fraction of the primary quota background may not use
+MAX_RATE_LIMIT_WAIT_S = 60.0  # longer waits fail fast with GitHubRateLimitError
+RATE_LIMIT_RETRIES = 2
+SECONDARY_LIMIT_DEFAULT_WAIT_S = 60.0  # GitHub's advice when Retry-After is absent
+
+_priority: ContextVar[int] = ContextVar("github_request_priority", default=PRIORITY_INTERACTIVE)
+
+
+class GitHubRateLimitError(Exception):
+    """Raised when a request would have to wait longer than MAX_RATE_LIMIT_WAIT_S."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"GitHub rate limit exhausted; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Run GitHub calls made in this context (and tasks it spawns) at *priority*."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _header(response: httpx.Response, name: str) -> str | None:
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _header_float(response: httpx.Response, name: str) -> float | None:
+    value = _header(response, name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class _TokenScheduler:
+    """Quota tracking and prioritised, adaptive concurrency for one token."""
+
+    __slots__ = (
+        "_seq", "_successes", "_waiters", "blocked_until", "in_flight",
+        "limit", "quota", "remaining", "reset_at",
+    )
+
+    def __init__(self) -> None:
+        self.limit = MAX_CONCURRENCY
+        self.in_flight = 0
+        self.remaining: int | None = None
+        self.quota: int | None = None
+        self.reset_at = 0.0  # wall-clock epoch seconds, as GitHub reports it
+        self.blocked_until = 0.0  # time.monotonic()
+        self._successes = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    # -- quota ---------------------------------------------------------------
+
+    def quota_wait(self, priority: int) -> float:
+        """Seconds a request at *priority* must wait before it may be sent."""
+        now = time.monotonic()
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.remaining is None:
+            return 0.0
+        reset_in = self.reset_at - time.time()
+        if reset_in <= 0:
+            self.remaining = None  # window rolled over; next response re-seeds it
+            return 0.0
+        floor = 0
+        if priority != PRIORITY_INTERACTIVE:
+            floor = int((self.quota or 0) * BACKGROUND_RESERVE)
+        if self.remaining - self.in_flight > floor:
+            return 0.0
+        return reset_in + 1.0
+
+    def observe(self, response: httpx.Response) -> float | None:
+        """Update state from *response*; return a retry delay if rate-limited."""
+        remaining = _header_float(response, "X-RateLimit-Remaining")
+        resource = _header(response, "X-RateLimit-Resource")
+        if resource not in (None, "core"):
+            remaining = None  # GraphQL / search quotas are separate budgets
+        if remaining is not None:
+            self.remaining = int(remaining)
+            quota = _header_float(response, "X-RateLimit-Limit")
+            if quota is not None:
+                self.quota = int(quota)
+            reset = _header_float(response, "X-RateLimit-Reset")
+            if reset is not None:
+                self.reset_at = reset
+
+        status = response.status_code
+        if status not in (403, 429):
+            self._on_success()
+            return None
+        retry_after = _header_float(response, "Retry-After")
+        if status == 403 and retry_after is None and remaining != 0:
+            text = response.text if isinstance(response.text, str) else ""
+            if "rate limit" not in text.lower():
+                return None  # an ordinary permission error
+
+        # Rate limited.  Primary limits tell us when the window resets;
+        # secondary ones send Retry-After (or nothing — GitHub says wait a minute).
+        if retry_after is None and remaining == 0 and self.reset_at:
+            retry_after = max(self.reset_at - time.time(), 0.0) + 1.0
+        if retry_after is None:
+            retry_after = SECONDARY_LIMIT_DEFAULT_WAIT_S
+        self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+        self.limit = max(1, self.limit // 2)
+        self._successes = 0
+        return retry_after
+
+    def _on_success(self) -> None:
+        if self.limit >= MAX_CONCURRENCY:
+            return
+        self._successes += 1
+        if self._successes >= self.limit:  # additive increase: +1 per window
+            self._successes = 0
+            self.limit += 1
+            self._wake()
+
+    # -- concurrency ---------------------------------------------------------
+
+    async def acquire(self, priority: int) -> None:
+        """Take a slot, waiting on quota and on higher-priority requests."""
+        while True:
+            wait = self.quota_wait(priority)
+            if wait > MAX_RATE_LIMIT_WAIT_S:
+                raise GitHubRateLimitError(wait)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            if self.in_flight < self.limit and not self._ahead_of(priority):
+                self.in_flight += 1
+                return
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._seq), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self.release()  # slot was handed over just as we were cancelled
+                raise
+            # The slot was handed over; re-check quota before using it.
+            if self.quota_wait(priority) == 0:
+                return
+            self.release()
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _ahead_of(self, priority: int) -> bool:
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)  # cancelled waiters
+        return bool(self._waiters) and self._waiters[0][0] <= priority
+
+    def _wake(self) -> None:
+        """Hand free slots to the highest-priority waiters."""
+        while self._waiters and self.in_flight < self.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+
+_schedulers: LRUCache[str, _TokenScheduler] = LRUCache(maxsize=1000)
+
+
+def _scheduler_for(access_token: str) -> _TokenScheduler:
+    scheduler = _schedulers.get(access_token)
+    if scheduler is None:
+        scheduler = _schedulers[access_token] = _TokenScheduler()
+    return scheduler
+
+
+async def _request(
+    access_token: str,
+    method: str,
+    url: str,
+    *,
+    headers: dict | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send an authenticated request through the token's scheduler.
+
+    Rate-limited responses are retried (up to RATE_LIMIT_RETRIES times)
+    after the advertised delay; if that delay is too long, or retries run
+    out, the rate-limited response is returned for the caller to handle.
+    """
+    scheduler = _scheduler_for(access_token)
+    priority = _priority.get()
+    send = getattr(_get_client(), method)
+    if headers is None:
+        headers = _auth_headers(access_token)
+    attempt = 0
+    while True:
+        await scheduler.acquire(priority)
+        try:
+            response = await send(url, headers=headers, **kwargs)
+            retry_after = scheduler.observe(response)
+        finally:
+            scheduler.release()
+        if retry_after is None or attempt >= RATE_LIMIT_RETRIES or retry_after > MAX_RATE_LIMIT_WAIT_S:
+            return response
+        attempt += 1
+
+
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
@@ -48,6 +293,53 @@ def _auth_headers(access_token: str) -> dict:
     }
 
 
+async def _get_json(
+    access_token: str,
+    url: str,
+    *,
+    params: dict | None = None,
+    transform: Callable[[Any], Any] | None = None,
+    raise_errors: bool = True,
+) -> tuple[int, Any]:
+    """GET *url* as JSON through the conditional-request cache.
+
+    Returns ``(status_code, body)``, where *body* is the response JSON
+    passed through *transform*.  A 304 is reported as ``200`` with the
+    cached body.  Other non-200 responses raise when *raise_errors* is
+    true, otherwise return ``(status_code, None)``.
+    """
+    key = (access_token, url, tuple(sorted((params or {}).items())))
+    headers = _auth_headers(access_token)
+    cached = _conditional_cache.get(key)
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = await _request(access_token, "get", url, params=params, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return 200, cached[2]
+    if raise_errors:
+        response.raise_for_status()
+    if response.status_code != 200:
+        return response.status_code, None
+
+    body = response.json()
+    if transform is not None:
+        body = transform(body)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    etag = etag if isinstance(etag, str) else None
+    last_modified = last_modified if isinstance(last_modified, str) else None
+    if etag or last_modified:
+        _conditional_cache[key] = (etag, last_modified, body)
+    else:
+        _conditional_cache.pop(key, None)
+    return 200, body
+
+
 async def exchange_code_for_token(
     client_id: str,
     client_secret: str,
@@ -75,11 +367,7 @@ async def exchange_code_for_token(
 
 async def get_github_user(access_token: str) -> dict:
     """Fetch the authenticated GitHub user profile."""
-    client = _get_client()
-    response = await client.get(
-        GITHUB_USER_URL,
-        headers=_auth_headers(access_token),
-    )
+    response = await _request(access_token, "get", GITHUB_USER_URL)
     response.raise_for_status()
     data = response.json()
     return {
@@ -103,9 +391,9 @@ async def list_user_repos(access_token: str) -> list[dict]:
     repos: list[dict] = []
     page = 1
     per_page = 100
-    client = _get_client()
     while page <= 3:  # cap at 300 repos
-        response = await client.get(
+        _, data = await _get_json(
+            access_token,
             f"{GITHUB_API_BASE}/user/repos",
             params={
                 "per_page": per_page,
@@ -114,19 +402,11 @@ async def list_user_repos(access_token: str) -> list[dict]:
                 "direction": "desc",
                 "affiliation": "owner,collaborator,organization_member",
             },
-            headers=_auth_headers(access_token),
+            transform=_repo_list_entries,
         )
-        response.raise_for_status()
-        data = response.json()
         if not data:
             break
-        for repo in data:
-            repos.append({
-                "github_repo_id": repo["id"],
-                "full_name": repo["full_name"],
-                "default_branch": repo.get("default_branch", "main"),
-                "private": repo.get("private", False),
-            })
+        repos.extend(data)
         if len(data) < per_page:
             break
         page += 1
@@ -135,6 +415,18 @@ async def list_user_repos(access_token: str) -> list[dict]:
     return repos
 
 
+def _repo_list_entries(data: list[dict]) -> list[dict]:
+    return [
+        {
+            "github_repo_id": repo["id"],
+            "full_name": repo["full_name"],
+            "default_branch": repo.get("default_branch", "main"),
+            "private": repo.get("private", False),
+        }
+        for repo in data
+    ]
+
+
 async def create_github_repo(
     access_token: str,
     name: str,
@@ -149,8 +441,9 @@ async def create_github_repo(
     safe_desc = (description or "").replace("\r", " ").replace("\n", " ")
     safe_desc = safe_desc[:350]
 
-    client = _get_client()
-    response = await client.post(
+    response = await _request(
+        access_token,
+        "post",
         f"{GITHUB_API_BASE}/user/repos",
         json={
             "name": name,
@@ -158,7 +451,6 @@ async def create_github_repo(
             "private": private,
             "auto_init": True,
         },
-        headers=_auth_headers(access_token),
     )
     if response.status_code == 422:
         errors = response.json().get("errors", [])
@@ -185,10 +477,10 @@ async def delete_github_repo(
     Returns True if deleted, False if not found.
     Raises on other errors.
     """
-    client = _get_client()
-    response = await client.delete(
+    response = await _request(
+        access_token,
+        "delete",
         f"{GITHUB_API_BASE}/repos/{full_name}",
-        headers=_auth_headers(access_token),
     )
     if response.status_code == 204:
         return True
@@ -217,9 +509,6 @@ async def reset_github_repo(
 
     Returns the new HEAD commit SHA.
     """
-    client = _get_client()
-    headers = _auth_headers(access_token)
-
     # Resolve default branch if not provided
     if not default_branch:
         meta = await get_repo_metadata(access_token, full_name)
@@ -228,16 +517,19 @@ async def reset_github_repo(
     repo_name = full_name.split("/")[-1]
 
     # 1. Create a blob for the README
-    blob_resp = await client.post(
+    blob_resp = await _request(
+        access_token,
+        "post",
         f"{GITHUB_API_BASE}/repos/{full_name}/git/blobs",
         json={"content": f"# {repo_name}\n", "encoding": "utf-8"},
-        headers=headers,
     )
     blob_resp.raise_for_status()
     blob_sha = blob_resp.json()["sha"]
 
     # 2. Create a tree with only the README (no base_tree → clean slate)
-    tree_resp = await client.post(
+    tree_resp = await _request(
+        access_token,
+        "post",
         f"{GITHUB_API_BASE}/repos/{full_name}/git/trees",
         json={
             "tree": [
@@ -249,37 +541,39 @@ async def reset_github_repo(
                 }
             ]
         },
-        headers=headers,
     )
     tree_resp.raise_for_status()
     tree_sha = tree_resp.json()["sha"]
 
     # 3. Get the current HEAD SHA for the default branch
-    ref_resp = await client.get(
+    ref_resp = await _request(
+        access_token,
+        "get",
         f"{GITHUB_API_BASE}/repos/{full_name}/git/ref/heads/{default_branch}",
-        headers=headers,
     )
     ref_resp.raise_for_status()
     current_sha = ref_resp.json()["object"]["sha"]
 
     # 4. Create a commit with the clean tree, parented to current HEAD
-    commit_resp = await client.post(
+    commit_resp = await _request(
+        access_token,
+        "post",
         f"{GITHUB_API_BASE}/repos/{full_name}/git/commits",
         json={
             "message": "Reset repository for fresh build",
             "tree": tree_sha,
             "parents": [current_sha],
         },
-        headers=headers,
     )
     commit_resp.raise_for_status()
     new_sha = commit_resp.json()["sha"]
 
     # 5. Force-update the branch ref to the new commit
-    update_resp = await client.patch(
+    update_resp = await _request(
+        access_token,
+        "patch",
         f"{GITHUB_API_BASE}/repos/{full_name}/git/refs/heads/{default_branch}",
         json={"sha": new_sha, "force": True},
-        headers=headers,
     )
     update_resp.raise_for_status()
 
@@ -296,8 +590,9 @@ async def create_webhook(
 
     Returns the webhook ID from GitHub.
     """
-    client = _get_client()
-    response = await client.post(
+    response = await _request(
+        access_token,
+        "post",
         f"{GITHUB_API_BASE}/repos/{full_name}/hooks",
         json={
             "name": "web",
@@ -310,7 +605,6 @@ async def create_webhook(
                 "insecure_ssl": "0",
             },
         },
-        headers=_auth_headers(access_token),
     )
     response.raise_for_status()
     return response.json()["id"]
@@ -322,10 +616,10 @@ async def delete_webhook(
     webhook_id: int,
 ) -> None:
     """Delete a webhook from a GitHub repo."""
-    client = _get_client()
-    response = await client.delete(
+    response = await _request(
+        access_token,
+        "delete",
         f"{GITHUB_API_BASE}/repos/{full_name}/hooks/{webhook_id}",
-        headers=_auth_headers(access_token),
     )
     # 404 is fine -- webhook may already be gone
     if response.status_code != 404:
@@ -344,11 +638,11 @@ async def get_repo_file_content(
     """
     import base64
 
-    client = _get_client()
-    response = await client.get(
+    response = await _request(
+        access_token,
+        "get",
         f"{GITHUB_API_BASE}/repos/{full_name}/contents/{path}",
         params={"ref": ref},
-        headers=_auth_headers(access_token),
     )
     if response.status_code == 404:
         return None
@@ -359,16 +653,117 @@ async def get_repo_file_content(
     return data.get("content", "")
 
 
+# Blobs per GraphQL round trip.  GitHub caps a query at 500k nodes and
+# returns ``text`` only for blobs under ~512 KB, so 100 aliases keeps
+# responses well inside its limits.
+GRAPHQL_BATCH_SIZE = 100
+
+_MISSING_ALIAS: Any = object()  # alias absent from the GraphQL response
+
+
+async def get_repo_file_contents(
+    access_token: str,
+    full_name: str,
+    paths: list[str],
+    ref: str,
+) -> dict[str, str | None]:
+    """Fetch many files from a GitHub repo at *ref* in as few requests as possible.
+
+    Uses one GraphQL query per GRAPHQL_BATCH_SIZE paths, each path an
+    aliased ``object(expression: "<ref>:<path>")`` lookup.  Binary or
+    truncated (large) blobs, and whole chunks whose query fails, fall back
+    to ``get_repo_file_content`` over REST.
+
+    Returns ``{path: text or None}`` for every requested path (None when
+    the file doesn't exist), in request order.
+    """
+    unique = list(dict.fromkeys(paths))
+    if not unique:
+        return {}
+    owner, _, name = full_name.partition("/")
+    results: dict[str, str | None] = {}
+    fallback: list[str] = []
+    for start in range(0, len(unique), GRAPHQL_BATCH_SIZE):
+        chunk = unique[start:start + GRAPHQL_BATCH_SIZE]
+        blobs = await _graphql_blobs(access_token, owner, name, ref, chunk)
+        if blobs is None:
+            fallback.extend(chunk)
+            continue
+        for path, blob in zip(chunk, blobs, strict=True):
+            if blob is _MISSING_ALIAS:
+                fallback.append(path)
+            elif not blob:
+                results[path] = None  # no such path at ref, or a tree
+            elif blob.get("isBinary") or blob.get("isTruncated") or blob.get("text") is None:
+                fallback.append(path)
+            else:
+                results[path] = blob["text"]
+
+    if fallback:
+        contents = await asyncio.gather(*[
+            get_repo_file_content(access_token, full_name, path, ref)
+            for path in fallback
+        ])
+        results.update(zip(fallback, contents, strict=True))
+    return {path: results.get(path) for path in unique}
+
+
+async def _graphql_blobs(
+    access_token: str,
+    owner: str,
+    name: str,
+    ref: str,
+    paths: list[str],
+) -> list[Any] | None:
+    """Run one batched blob query; ``None`` if the request itself failed.
+
+    Each entry is the blob dict, ``None`` for a missing object, or
+    ``_MISSING_ALIAS`` when GitHub returned no value for that alias.
+    """
+    variables: dict[str, str] = {"owner": owner, "name": name}
+    params = ["$owner: String!", "$name: String!"]
+    fields = []
+    for i, path in enumerate(paths):
+        variables[f"e{i}"] = f"{ref}:{path}"
+        params.append(f"$e{i}: String!")
+        fields.append(
+            f"f{i}: object(expression: $e{i}) "
+            "{ ... on Blob { text isBinary isTruncated } }"
+        )
+    query = (
+        f"query({', '.join(params)}) "
+        "{ repository(owner: $owner, name: $name) { " + " ".join(fields) + " } }"
+    )
+    try:
+        response = await _request(
+            access_token,
+            "post",
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+        )
+    except httpx.RequestError:
+        return None
+    if response.status_code != 200:
+        return None
+    try:
+        repository = (response.json().get("data") or {}).get("repository")
+    except ValueError:
+        return None
+    if not isinstance(repository, dict):
+        return None
+    return [repository.get(f"f{i}", _MISSING_ALIAS) for i in range(len(paths))]
+
+
 async def get_commit_files(
     access_token: str,
     full_name: str,
     commit_sha: str,
 ) -> list[str]:
     """Fetch the list of changed file paths for a specific commit."""
-    client = _get_client()
-    response = await client.get(
+    response = await _request(
+        access_token,
+        "get",
         f"{GITHUB_API_BASE}/repos/{full_name}/commits/{commit_sha}",
-        headers=_auth_headers(access_token),
     )
     response.raise_for_status()
     data = response.json()
@@ -392,10 +787,10 @@ async def compare_commits(
       - head_message: commit message of the head commit
       - head_author: author name of the head commit
     """
-    client = _get_client()
-    response = await client.get(
+    response = await _request(
+        access_token,
+        "get",
         f"{GITHUB_API_BASE}/repos/{full_name}/compare/{base_sha}...{head_sha}",
-        headers=_auth_headers(access_token),
     )
     response.raise_for_status()
     data = response.json()
@@ -429,11 +824,11 @@ async def get_repo_tree(
     params: dict[str, str | int] = {}
     if recursive:
         params["recursive"] = "1"
-    client = _get_client()
-    response = await client.get(
+    response = await _request(
+        access_token,
+        "get",
         f"{GITHUB_API_BASE}/repos/{full_name}/git/trees/{sha}",
         params=params,
-        headers=_auth_headers(access_token),
     )
     response.raise_for_status()
     data = response.json()
@@ -461,13 +856,7 @@ async def get_repo_languages(
     if cached is not None:
         return cached
 
-    client = _get_client()
-    response = await client.get(
-        f"{GITHUB_API_BASE}/repos/{full_name}/languages",
-        headers=_auth_headers(access_token),
-    )
-    response.raise_for_status()
-    result = response.json()
+    _, result = await _get_json(access_token, f"{GITHUB_API_BASE}/repos/{full_name}/languages")
     _repo_lang_cache[key] = result
     return result
 
@@ -476,26 +865,32 @@ async def get_repo_health(
     access_token: str,
     full_name: str,
 ) -> tuple[int, dict | None]:
-    """Fetch current status of a repo for health checking (no cache, fresh data).
+    """Fetch current status of a repo for health checking (fresh data).
+
+    Always asks GitHub, but as a conditional request — an unchanged repo
+    costs a 304 rather than a rate-limited 200.
 
     Returns (status_code, metadata_dict_or_None).
     On HTTP error returns (status_code, None).
+    When the rate limit is exhausted returns (429, None).
     On network error returns (0, None).
     Metadata dict contains: full_name, archived.
     """
-    client = _get_client()
     try:
-        response = await client.get(
+        status_code, data = await _get_json(
+            access_token,
             f"{GITHUB_API_BASE}/repos/{full_name}",
-            headers=_auth_headers(access_token),
+            transform=_repo_metadata_fields,
+            raise_errors=False,
         )
+    except GitHubRateLimitError:
+        return 429, None
     except httpx.RequestError:
         return 0, None
-    if response.status_code != 200:
-        return response.status_code, None
-    data = response.json()
+    if status_code != 200:
+        return status_code, None
     return 200, {
-        "full_name": data.get("full_name", full_name),
+        "full_name": data.get("full_name") or full_name,
         "archived": data.get("archived", False),
     }
 
@@ -514,14 +909,19 @@ async def get_repo_metadata(
     if cached is not None:
         return cached
 
-    client = _get_client()
-    response = await client.get(
+    _, fields = await _get_json(
+        access_token,
         f"{GITHUB_API_BASE}/repos/{full_name}",
-        headers=_auth_headers(access_token),
+        transform=_repo_metadata_fields,
     )
-    response.raise_for_status()
-    data = response.json()
-    result = {
+    result = {**fields, "full_name": fields["full_name"] or full_name}
+    _repo_meta_cache[key] = result
+    return result
+
+
+def _repo_metadata_fields(data: dict) -> dict:
+    """Project a ``GET /repos/{full_name}`` body (shared by health + metadata)."""
+    return {
         "stargazers_count": data.get("stargazers_count", 0),
         "forks_count": data.get("forks_count", 0),
         "size": data.get("size", 0),
@@ -533,10 +933,8 @@ async def get_repo_metadata(
         "description": data.get("description"),
         "private": data.get("private", False),
         "archived": data.get("archived", False),
-        "full_name": data.get("full_name", full_name),
+        "full_name": data.get("full_name"),
     }
-    _repo_meta_cache[key] = result
-    return result
 
 
 async def delete_branch(
@@ -552,11 +950,11 @@ async def delete_branch(
     # Safety: never delete common default branches
     if branch in ("main", "master", "develop"):
         return False
-    client = _get_client()
     ref = f"heads/{branch}"
-    response = await client.delete(
+    response = await _request(
+        access_token,
+        "delete",
         f"{GITHUB_API_BASE}/repos/{full_name}/git/refs/{ref}",
-        headers=_auth_headers(access_token),
     )
     # 204 = deleted, 422 = ref not found (already gone) — both are fine
     return response.status_code in (204, 422)
@@ -582,32 +980,36 @@ async def list_commits(
     """
     commits: list[dict] = []
     page = 1
-    client = _get_client()
     while page <= max_pages:
         params: dict[str, str | int] = {"per_page": per_page, "page": page}
         if branch:
             params["sha"] = branch
         if since:
             params["since"] = since
-        response = await client.get(
+        _, data = await _get_json(
+            access_token,
             f"{GITHUB_API_BASE}/repos/{full_name}/commits",
             params=params,
-            headers=_auth_headers(access_token),
+            transform=_commit_entries,
         )
-        response.raise_for_status()
-        data = response.json()
         if not data:
             break
-        for c in data:
-            commit_data = c.get("commit", {})
-            author_data = commit_data.get("author", {})
-            commits.append({
-                "sha": c["sha"],
-                "message": commit_data.get("message", ""),
-                "author": author_data.get("name", ""),
-                "date": author_data.get("date", ""),
-            })
+        commits.extend(data)
         if len(data) < per_page:
             break
         page += 1
     return commits
+
+
+def _commit_entries(data: list[dict]) -> list[dict]:
+    entries = []
+    for c in data:
+        commit_data = c.get("commit", {})
+        author_data = commit_data.get("author", {})
+        entries.append({
+            "sha": c["sha"],
+            "message": commit_data.get("message", ""),
+            "author": author_data.get("name", ""),
+            "date": author_data.get("date", ""),
+        })
+    return entries
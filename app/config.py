@@ -8,6 +8,7 @@ fast if critical vars are missing outside of tests.
 VERSION = "0.1.0"
 
 import sys
+from typing import Literal
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -112,11 +113,42 @@ class Settings(BaseSettings):
             self.LLM_AUDITOR_MODEL = self.LLM_QUESTIONNAIRE_MODEL
         return self
 
+    @model_validator(mode="after")
+    def _check_pool_sizes(self) -> "Settings":
+        """Reject a pool whose minimum size exceeds its maximum."""
+        if self.DB_POOL_MIN_SIZE > self.DB_POOL_MAX_SIZE:
+            raise ValueError(
+                f"DB_POOL_MIN_SIZE ({self.DB_POOL_MIN_SIZE}) must not exceed "
+                f"DB_POOL_MAX_SIZE ({self.DB_POOL_MAX_SIZE})"
+            )
+        return self
+
     # Persistent workspace directory for all build working trees.
     # Defaults to ~/.forgeguard/workspaces so it survives server restarts.
     # In Docker set to /data/workspaces and mount a volume there.
     WORKSPACE_DIR: str = ""
 
+    # Database pool sizing and asyncpg prepared-statement cache.
+    # Set DB_STATEMENT_CACHE_SIZE=0 behind PgBouncer in transaction mode.
+    DB_POOL_MIN_SIZE: int = Field(default=2, ge=1)
+    DB_POOL_MAX_SIZE: int = Field(default=10, ge=1)
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=100, ge=0)
+    DB_STATEMENT_CACHE_LIFETIME: float = 300.0  # seconds
+    # Record per-statement latency / row / retry stats
+    DB_QUERY_STATS_ENABLED: bool = True
+    # Serve those stats (which include SQL text) at /health/db.  Off by
+    # default; enable on deployments where every user may see them.
+    DB_QUERY_STATS_ENDPOINT_ENABLED: bool = False
+    # Optional read replica for dashboard reads (repo calls with readonly=True).
+    # Reads of tables written within DB_READ_YOUR_WRITES_SECONDS go to the
+    # primary so users always see their own writes.
+    DATABASE_REPLICA_URL: str = ""
+    DB_REPLICA_POOL_MAX_SIZE: int = Field(default=10, ge=1)
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+    # After the replica fails, reads go to the primary for this long
+    # before the replica is tried again.
+    DB_REPLICA_RETRY_SECONDS: float = Field(default=30.0, ge=0)
+
     PAUSE_THRESHOLD: int = Field(default=3, ge=1)
     BUILD_PAUSE_TIMEOUT_MINUTES: int = 30
     PHASE_TIMEOUT_MINUTES: int = 10
@@ -140,6 +172,18 @@ class Settings(BaseSettings):
     BUILD_COST_WARN_PCT: int = 80
     # How often (in seconds) the backend broadcasts a cost_ticker WS event.
     BUILD_COST_TICKER_INTERVAL: int = 5
+    # How a phase's files are scheduled onto builder pipelines:
+    #   "tier" — planner chunks run one after another (barrier per chunk)
+    #   "dag"  — the whole phase is one dependency graph; each file starts
+    #            as soon as its own depends_on are written.  Skips the
+    #            between-chunk interface planning/review passes.
+    BUILD_SCHEDULE: Literal["tier", "dag"] = "tier"
+    # Concurrent builder pipelines per API key in "dag" mode (the key pool
+    # size times this value bounds total concurrency).
+    BUILD_AGENTS_PER_KEY: int = Field(default=2, ge=1)
+    # Contracts generated at once per API key during contract generation
+    # (independent contracts in CONTRACT_DEPENDENCIES run concurrently).
+    CONTRACT_AGENTS_PER_KEY: int = Field(default=3, ge=1)
 
     # Auto-fix loop settings — tiered escalation when push tests fail
     LLM_FIX_MAX_TIER1: int = 3       # Sonnet plan → Opus code attempts
@@ -159,6 +203,11 @@ class Settings(BaseSettings):
     # (requirements.txt, package.json, etc.) into the project.
     AUTO_INSTALL_DEPS: bool = True
 
+    # Run pytest commands from builder / upgrade tools on a warm per-workspace
+    # worker (forked from a pre-imported interpreter) instead of a cold
+    # subprocess.  POSIX only; other platforms always run cold.
+    PYTEST_WORKER_ENABLED: bool = True
+
     # Builder clarification tool settings
     CLARIFICATION_TIMEOUT_MINUTES: int = 10   # how long to wait before auto-skip
     MAX_CLARIFICATIONS_PER_BUILD: int = 10    # abuse guard
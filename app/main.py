@@ -178,10 +178,13 @@ async def lifespan(application: FastAPI):
     # 1. Stop heartbeat (no more WS pings)
     # 2. Cancel all background upgrade/retry/narrate tasks
     #    (must finish before httpx clients are closed)
-    # 3. Close HTTP clients
-    # 4. Close DB pool
+    # 3. Stop warm pytest workers
+    # 4. Close HTTP clients
+    # 5. Close DB pool
     await ws_manager.stop_heartbeat()
     await _shutdown_upgrades()
+    from forge_ide.pytest_worker import shutdown_workers
+    await shutdown_workers()
     await github_client.close_client()
     await llm_client.close_client()
     await close_pool()
@@ -73,6 +73,7 @@ async def http_exception_handler(
             detail=str(exc.detail) if exc.detail else None,
             request_id=request_id,
         ),
+        headers=getattr(exc, "headers", None),
     )
 
 
@@ -2,7 +2,30 @@
 
 from uuid import UUID
 
-from app.repos.db import get_pool
+from app.repos.db import get_pool, note_write
+
+# Recompute the repo_health rollup from the repo's 10 most recent completed
+# audits (same window the dashboard has always shown).
+_REFRESH_REPO_HEALTH_SQL = """
+    INSERT INTO repo_health (repo_id, last_audit_at, pass_count, total_count, updated_at)
+    SELECT $1,
+           max(a.completed_at),
+           count(*) FILTER (WHERE a.overall_result = 'PASS'),
+           count(*),
+           now()
+    FROM (
+        SELECT overall_result, completed_at
+        FROM audit_runs
+        WHERE repo_id = $1 AND status = 'completed'
+        ORDER BY created_at DESC
+        LIMIT 10
+    ) a
+    ON CONFLICT (repo_id) DO UPDATE
+    SET last_audit_at = EXCLUDED.last_audit_at,
+        pass_count = EXCLUDED.pass_count,
+        total_count = EXCLUDED.total_count,
+        updated_at = EXCLUDED.updated_at
+"""
 
 
 async def create_audit_run(
@@ -46,24 +69,46 @@ async def update_audit_run(
     overall_result: str | None,
     files_checked: int,
 ) -> None:
-    """Update an audit run with results."""
+    """Update an audit run with results.
+
+    When the run completes, the repo_health rollup for its repo is refreshed
+    in the same transaction so dashboard reads never see a stale count.
+    """
     from datetime import datetime, timezone
 
     pool = await get_pool()
     completed_at = datetime.now(timezone.utc) if status in ("completed", "error") else None
-    await pool.execute(
-        """
+    update_sql = """
         UPDATE audit_runs
         SET status = $2, overall_result = $3, files_checked = $4,
             completed_at = $5
         WHERE id = $1
-        """,
-        audit_run_id,
-        status,
-        overall_result,
-        files_checked,
-        completed_at,
-    )
+        RETURNING repo_id
+        """
+    if status != "completed":
+        await pool.fetchval(
+            update_sql, audit_run_id, status, overall_result, files_checked, completed_at,
+        )
+        return
+
+    async with pool.acquire() as conn, conn.transaction():
+        repo_id = await conn.fetchval(
+            update_sql, audit_run_id, status, overall_result, files_checked, completed_at,
+        )
+        if repo_id is not None:
+            # Serialize refreshes per repo: a concurrent completion blocks
+            # here until this transaction commits, then recomputes with
+            # both audits visible.
+            await conn.execute(
+                "INSERT INTO repo_health (repo_id) VALUES ($1) ON CONFLICT DO NOTHING",
+                repo_id,
+            )
+            await conn.execute(
+                "SELECT 1 FROM repo_health WHERE repo_id = $1 FOR UPDATE",
+                repo_id,
+            )
+            await conn.execute(_REFRESH_REPO_HEALTH_SQL, repo_id)
+    note_write("audit_runs", "repo_health")
 
 
 async def mark_stale_audit_runs(repo_id: UUID, stale_minutes: int = 5) -> int:
@@ -116,9 +161,13 @@ async def get_audit_runs_by_repo(
     repo_id: UUID,
     limit: int = 50,
     offset: int = 0,
+    readonly: bool = False,
 ) -> tuple[list[dict], int]:
-    """Fetch audit runs for a repo, newest first. Returns (items, total)."""
-    pool = await get_pool()
+    """Fetch audit runs for a repo, newest first. Returns (items, total).
+
+    ``readonly=True`` allows the query to be served by the read replica.
+    """
+    pool = await get_pool(readonly=readonly, tables=("audit_runs", "audit_checks"))
 
     total_row = await pool.fetchrow(
         "SELECT count(*) as cnt FROM audit_runs WHERE repo_id = $1",
@@ -148,9 +197,9 @@ async def get_audit_runs_by_repo(
     return [dict(r) for r in rows], total
 
 
-async def get_audit_run_detail(audit_run_id: UUID) -> dict | None:
+async def get_audit_run_detail(audit_run_id: UUID, readonly: bool = False) -> dict | None:
     """Fetch a single audit run with its checks."""
-    pool = await get_pool()
+    pool = await get_pool(readonly=readonly, tables=("audit_runs", "audit_checks"))
     run_row = await pool.fetchrow(
         """
         SELECT id, repo_id, commit_sha, commit_message, commit_author, branch,
@@ -4,10 +4,19 @@ Provides a resilient asyncpg pool wrapper that transparently retries
 operations when the underlying TCP connection has been reset by the
 remote host (common on Windows, cloud DBs with idle-connection
 reapers, or after PostgreSQL restarts).
+
+Every query issued through the wrapper is also instrumented: latency
+histogram, row count and retry count are recorded per statement and
+labelled with the repo function that issued it (see ``query_stats``).
 """
 
 import asyncio
+import contextlib
 import logging
+import re
+import sys
+import time
+from collections import OrderedDict
 from typing import Any
 
 import asyncpg
@@ -27,6 +36,151 @@ _RETRY_EXCEPTIONS = (
 _MAX_RETRIES = 4  # 5 total attempts — gives Neon time to cold-start (~5–10 s)
 
 
+# ---------------------------------------------------------------------------
+# Query instrumentation
+# ---------------------------------------------------------------------------
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is "+Inf".
+_LATENCY_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_MAX_CALLER_DEPTH = 8
+# Distinct (caller, statement) pairs kept; least recently used are dropped
+# so dynamically built SQL cannot grow the table without bound.
+_MAX_TRACKED_STATEMENTS = 1000
+_WS_RE = re.compile(r"\s+")
+_EXECUTE_ROWS_RE = re.compile(r"(\d+)$")
+
+
+class _StatementStats:
+    """Running totals for one (caller, statement) pair."""
+
+    __slots__ = ("buckets", "calls", "errors", "max_ms", "retries", "rows", "total_ms")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms: float, rows: int, retries: int, failed: bool) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.retries += retries
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        if failed:
+            self.errors += 1
+        for i, bound in enumerate(_LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "histogram_ms": {
+                **{f"le_{b:g}": n for b, n in zip(_LATENCY_BUCKETS_MS, self.buckets[:-1], strict=True)},
+                "le_inf": self.buckets[-1],
+            },
+        }
+
+
+# (caller label, normalised statement) -> stats, least recently used first
+_query_stats: OrderedDict[tuple[str, str], _StatementStats] = OrderedDict()
+
+
+def _stats_for(key: tuple[str, str]) -> _StatementStats:
+    """Return the stats slot for *key*, evicting the LRU one when full."""
+    stats = _query_stats.get(key)
+    if stats is not None:
+        _query_stats.move_to_end(key)
+        return stats
+    stats = _query_stats[key] = _StatementStats()
+    while len(_query_stats) > _MAX_TRACKED_STATEMENTS:
+        _query_stats.popitem(last=False)
+    return stats
+
+
+def _normalise_statement(query: str) -> str:
+    """Collapse whitespace so the same SQL from different call sites groups together."""
+    return _WS_RE.sub(" ", query).strip()[:200]
+
+
+def _caller_label() -> str:
+    """Return ``module.function`` of the nearest app frame outside this module."""
+    frame = sys._getframe(2)
+    for _ in range(_MAX_CALLER_DEPTH):
+        if frame is None:
+            break
+        module = frame.f_globals.get("__name__", "")
+        if module != __name__ and module.startswith("app."):
+            return f"{module.rsplit('.', 1)[-1]}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _row_count(method: str, result: Any) -> int:
+    """Best-effort row count for the result of a pool shorthand method."""
+    if method == "fetch":
+        return len(result) if result is not None else 0
+    if method == "fetchrow":
+        return 0 if result is None else 1
+    if method == "execute" and isinstance(result, str):
+        # Status tags look like "INSERT 0 5", "UPDATE 3", "DELETE 0"
+        m = _EXECUTE_ROWS_RE.search(result)
+        return int(m.group(1)) if m else 0
+    return 0 if result is None else 1
+
+
+def query_stats(top: int | None = None) -> list[dict]:
+    """Return recorded query statistics, slowest total time first."""
+    items = sorted(_query_stats.items(), key=lambda kv: kv[1].total_ms, reverse=True)
+    if top is not None:
+        items = items[:top]
+    return [
+        {"caller": caller, "statement": statement, **stats.to_dict()}
+        for (caller, statement), stats in items
+    ]
+
+
+def reset_query_stats() -> None:
+    """Clear all recorded query statistics."""
+    _query_stats.clear()
+
+
+def _describe_pool(pool: asyncpg.Pool | None) -> dict:
+    if pool is None:
+        return {"initialized": False}
+    return {
+        "initialized": True,
+        "size": pool.get_size(),
+        "idle": pool.get_idle_size(),
+        "min_size": pool.get_min_size(),
+        "max_size": pool.get_max_size(),
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+
+def pool_stats() -> dict:
+    """Return size / idle counts and cache settings for the current pools."""
+    stats = _describe_pool(_pool)
+    if settings.DATABASE_REPLICA_URL:
+        stats["replica"] = _describe_pool(_replica_pool)
+    return stats
+
+
 def _invalidate_pool() -> None:
     """Mark the current pool as dead so the next get_pool() call recreates it.
 
@@ -40,6 +194,88 @@ def _invalidate_pool() -> None:
     _wrapper = None
 
 
+def _invalidate_replica_pool(pool: asyncpg.Pool | None = None) -> None:
+    """Replica counterpart of :func:`_invalidate_pool`.
+
+    The dropped pool is closed in the background so its connections are
+    released.  With *pool*, nothing happens unless it is still the current
+    replica pool — a concurrent caller may already have replaced it.
+    """
+    global _replica_pool, _replica_wrapper
+    if pool is not None and pool is not _replica_pool:
+        return
+    old = _replica_pool
+    _replica_pool = None
+    _replica_wrapper = None
+    if old is not None:
+        _discard_pool(old)
+
+
+# Background close tasks for dropped pools (strong refs until they finish)
+_closing_pools: set[asyncio.Task] = set()
+_POOL_CLOSE_TIMEOUT_S = 10.0
+
+
+async def _close_pool_quietly(pool: asyncpg.Pool) -> None:
+    """Close *pool*, letting in-flight queries finish; terminate if that stalls."""
+    try:
+        await asyncio.wait_for(pool.close(), timeout=_POOL_CLOSE_TIMEOUT_S)
+    except Exception:
+        with contextlib.suppress(Exception):
+            pool.terminate()
+
+
+def _discard_pool(pool: asyncpg.Pool) -> None:
+    """Release a pool that is no longer referenced, without blocking the caller."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        with contextlib.suppress(Exception):
+            pool.terminate()
+        return
+    task = loop.create_task(_close_pool_quietly(pool))
+    _closing_pools.add(task)
+    task.add_done_callback(_closing_pools.discard)
+
+
+# ---------------------------------------------------------------------------
+# Read-your-writes tracking for replica routing
+# ---------------------------------------------------------------------------
+
+_WRITE_RE = re.compile(
+    r"^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+([A-Za-z_][\w.]*)",
+    re.IGNORECASE,
+)
+
+# table name -> monotonic time of the last write issued through the primary
+_recent_writes: dict[str, float] = {}
+
+
+def note_write(*tables: str) -> None:
+    """Record a write to *tables* so replica reads fall back to the primary.
+
+    Writes issued through the primary pool's shorthand methods are detected
+    automatically; call this for writes made on an acquired connection.
+    """
+    now = time.monotonic()
+    for table in tables:
+        _recent_writes[table] = now
+
+
+def _note_statement_write(query: str) -> None:
+    m = _WRITE_RE.match(query)
+    if m:
+        _recent_writes[m.group(1).rsplit(".", 1)[-1].lower()] = time.monotonic()
+
+
+def _recently_written(tables: tuple[str, ...]) -> bool:
+    """True if any of *tables* (or, with none given, any table) was just written."""
+    horizon = time.monotonic() - settings.DB_READ_YOUR_WRITES_SECONDS
+    if not tables:
+        return any(ts >= horizon for ts in _recent_writes.values())
+    return any(_recent_writes.get(t, 0.0) >= horizon for t in tables)
+
+
 class _ResilientPool:
     """Thin wrapper around :class:`asyncpg.Pool` that retries on dead connections.
 
@@ -48,35 +284,73 @@ class _ResilientPool:
     the object is a drop-in replacement for ``asyncpg.Pool``.
     """
 
-    __slots__ = ("_pool",)
+    __slots__ = ("_pool", "_replica")
 
-    def __init__(self, pool: asyncpg.Pool) -> None:
+    def __init__(self, pool: asyncpg.Pool, *, replica: bool = False) -> None:
         self._pool = pool
+        self._replica = replica
 
     # ── proxied methods with retry ────────────────────────────
 
     async def fetch(self, query: str, *args: Any, **kw: Any) -> list:
-        return await self._retry(self._pool.fetch, query, *args, **kw)
+        return await self._instrumented("fetch", query, *args, **kw)
 
     async def fetchrow(self, query: str, *args: Any, **kw: Any):
-        return await self._retry(self._pool.fetchrow, query, *args, **kw)
+        return await self._instrumented("fetchrow", query, *args, **kw)
 
     async def fetchval(self, query: str, *args: Any, **kw: Any):
-        return await self._retry(self._pool.fetchval, query, *args, **kw)
+        return await self._instrumented("fetchval", query, *args, **kw)
 
     async def execute(self, query: str, *args: Any, **kw: Any) -> str:
-        return await self._retry(self._pool.execute, query, *args, **kw)
+        return await self._instrumented("execute", query, *args, **kw)
+
+    # ── instrumentation ───────────────────────────────────────
+
+    async def _instrumented(self, method: str, query: str, *args: Any, **kw: Any):
+        if not self._replica:
+            _note_statement_write(query)
+        if not settings.DB_QUERY_STATS_ENABLED:
+            return await self._retry(method, query, *args, **kw)
+        # Resolve the caller before the first await, while the frame chain
+        # still leads back to the repo function that issued the query.
+        key = (_caller_label(), _normalise_statement(query))
+        attempts = [0]
+        failed = True
+        result: Any = None
+        start = time.perf_counter()
+        try:
+            result = await self._retry(method, query, *args, _attempts=attempts, **kw)
+            failed = False
+            return result
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            _stats_for(key).record(
+                elapsed_ms,
+                0 if failed else _row_count(method, result),
+                max(attempts[0] - 1, 0),
+                failed,
+            )
 
     # ── retry engine ──────────────────────────────────────────
 
-    @staticmethod
-    async def _retry(func, *args: Any, **kw: Any):
+    async def _retry(self, method: str, *args: Any, _attempts: list[int] | None = None, **kw: Any):
+        func = getattr(self._pool, method)
         last_exc: Exception | None = None
         for attempt in range(_MAX_RETRIES + 1):
+            if _attempts is not None:
+                _attempts[0] = attempt + 1
             try:
                 return await func(*args, **kw)
             except _RETRY_EXCEPTIONS as exc:
                 last_exc = exc
+                if self._replica and attempt >= 1:
+                    # Still failing after one retry: the primary can serve any
+                    # read — don't sit out the full backoff on a replica that
+                    # may be down for a while.
+                    _mark_replica_down(exc)
+                    _invalidate_replica_pool(self._pool)
+                    primary = await get_pool()
+                    return await primary._retry(method, *args, _attempts=_attempts, **kw)
                 if attempt < _MAX_RETRIES:
                     # Exponential backoff: 0.5 s, 1 s, 2 s, 4 s (capped at 10 s)
                     # Gives Neon enough time to complete a cold-start between attempts.
@@ -103,50 +377,130 @@ _pool: asyncpg.Pool | None = None
 _pool_loop: asyncio.AbstractEventLoop | None = None
 _wrapper: _ResilientPool | None = None
 
-
-async def get_pool() -> _ResilientPool:  # type: ignore[override]
+_replica_pool: asyncpg.Pool | None = None
+_replica_pool_loop: asyncio.AbstractEventLoop | None = None
+_replica_wrapper: _ResilientPool | None = None
+# Serialises replica pool creation; recreated per event loop
+_replica_lock: asyncio.Lock | None = None
+_replica_lock_loop: asyncio.AbstractEventLoop | None = None
+# Monotonic time before which the replica is not tried (negative cache)
+_replica_down_until: float = 0.0
+
+
+def _mark_replica_down(exc: BaseException) -> None:
+    """Send reads to the primary for ``DB_REPLICA_RETRY_SECONDS``."""
+    global _replica_down_until
+    _replica_down_until = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+    logger.warning(
+        "Read replica unavailable, using primary for %.0fs: %s",
+        settings.DB_REPLICA_RETRY_SECONDS, exc,
+    )
+
+
+async def _create_pool(dsn: str, max_size: int) -> asyncpg.Pool:
+    return await asyncio.wait_for(
+        asyncpg.create_pool(
+            dsn=dsn,
+            min_size=min(settings.DB_POOL_MIN_SIZE, max_size),
+            max_size=max_size,
+            command_timeout=60,
+            # Per-connection prepared-statement cache — repo functions
+            # reuse a small set of literal SQL strings, so a warm cache
+            # skips the parse/plan round trip on every call.
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            max_cached_statement_lifetime=settings.DB_STATEMENT_CACHE_LIFETIME,
+            max_inactive_connection_lifetime=300.0,    # 5 min — survives long planner runs
+            server_settings={
+                "statement_timeout": "30000",                    # 30s max query
+                "idle_in_transaction_session_timeout": "60000",  # 60s
+            },
+        ),
+        timeout=20,  # outer asyncio timeout (Neon cold-start can take ~10s)
+    )
+
+
+async def get_pool(
+    readonly: bool = False,
+    tables: tuple[str, ...] = (),
+) -> _ResilientPool:  # type: ignore[override]
     """Get or create the database connection pool.
 
     Returns a :class:`_ResilientPool` wrapper that transparently retries
     on dead-connection errors (``ConnectionDoesNotExistError``, etc.).
 
+    With ``readonly=True`` and ``DATABASE_REPLICA_URL`` configured, the
+    read-replica pool is returned instead — unless any of *tables* was
+    written through the primary within ``DB_READ_YOUR_WRITES_SECONDS``,
+    in which case the primary serves the read so callers see their own
+    writes.  If the replica cannot be reached the primary is used, and
+    the replica is not tried again for ``DB_REPLICA_RETRY_SECONDS``.
+
     If the running event loop has changed (common in test suites),
     the stale pool is discarded and a fresh one is created.
     """
+    if (
+        readonly
+        and settings.DATABASE_REPLICA_URL
+        and time.monotonic() >= _replica_down_until
+        and not _recently_written(tables)
+    ):
+        try:
+            return await _get_replica_pool()
+        except Exception as exc:
+            _mark_replica_down(exc)
+
     global _pool, _pool_loop, _wrapper
     loop = asyncio.get_running_loop()
     if _pool is not None and _pool_loop is not loop:
-        try:
+        with contextlib.suppress(Exception):
             _pool.terminate()
-        except Exception:
-            pass
         _pool = None
         _wrapper = None
     if _pool is None:
-        _pool = await asyncio.wait_for(
-            asyncpg.create_pool(
-                dsn=settings.DATABASE_URL,
-                min_size=2,
-                max_size=10,
-                command_timeout=60,
-                max_inactive_connection_lifetime=300.0,    # 5 min — survives long planner runs
-                server_settings={
-                    "statement_timeout": "30000",                    # 30s max query
-                    "idle_in_transaction_session_timeout": "60000",  # 60s
-                },
-            ),
-            timeout=20,  # outer asyncio timeout (Neon cold-start can take ~10s)
-        )
+        _pool = await _create_pool(settings.DATABASE_URL, settings.DB_POOL_MAX_SIZE)
         _pool_loop = loop
         _wrapper = _ResilientPool(_pool)
     return _wrapper  # type: ignore[return-value]
 
 
+async def _get_replica_pool() -> _ResilientPool:
+    """Get or create the read-replica pool (see :func:`get_pool`)."""
+    global _replica_pool, _replica_pool_loop, _replica_wrapper
+    global _replica_lock, _replica_lock_loop
+    loop = asyncio.get_running_loop()
+    if _replica_pool is not None and _replica_pool_loop is loop:
+        return _replica_wrapper  # type: ignore[return-value]
+    if _replica_lock is None or _replica_lock_loop is not loop:
+        _replica_lock = asyncio.Lock()
+        _replica_lock_loop = loop
+    async with _replica_lock:
+        if _replica_pool is not None and _replica_pool_loop is not loop:
+            with contextlib.suppress(Exception):
+                _replica_pool.terminate()
+            _replica_pool = None
+            _replica_wrapper = None
+        if _replica_pool is None:
+            # Concurrent first callers wait here instead of each creating
+            # (and leaking) a pool of their own.
+            _replica_pool = await _create_pool(
+                settings.DATABASE_REPLICA_URL, settings.DB_REPLICA_POOL_MAX_SIZE,
+            )
+            _replica_pool_loop = loop
+            _replica_wrapper = _ResilientPool(_replica_pool, replica=True)
+    return _replica_wrapper  # type: ignore[return-value]
+
+
 async def close_pool() -> None:
-    """Close the database connection pool."""
+    """Close the database connection pools."""
     global _pool, _pool_loop, _wrapper
+    global _replica_pool, _replica_pool_loop, _replica_wrapper
     if _pool is not None:
         await _pool.close()
         _pool = None
         _pool_loop = None
         _wrapper = None
+    if _replica_pool is not None:
+        await _replica_pool.close()
+        _replica_pool = None
+        _replica_pool_loop = None
+        _replica_wrapper = None
@@ -89,13 +89,15 @@ async def delete_repo(repo_id: UUID) -> bool:
     return result == "DELETE 1"
 
 
-async def get_repos_with_health(user_id: UUID) -> list[dict]:
+async def get_repos_with_health(user_id: UUID, readonly: bool = False) -> list[dict]:
     """Fetch repos with recent audit health data for a user.
 
     Returns each repo with last_audit_at and pass/total counts from the
-    10 most recent completed audit runs.
+    10 most recent completed audit runs.  The counts come from the
+    repo_health rollup maintained by ``audit_repo.update_audit_run``.
+    ``readonly=True`` allows the query to be served by the read replica.
     """
-    pool = await get_pool()
+    pool = await get_pool(readonly=readonly, tables=("repos", "repo_health"))
     rows = await pool.fetch(
         """
         SELECT
@@ -106,22 +108,10 @@ async def get_repos_with_health(user_id: UUID) -> list[dict]:
             r.latest_commit_sha, r.latest_commit_message,
             r.latest_commit_at, r.latest_commit_author,
             h.last_audit_at,
-            h.pass_count,
-            h.total_count
+            COALESCE(h.pass_count, 0) AS pass_count,
+            COALESCE(h.total_count, 0) AS total_count
         FROM repos r
-        LEFT JOIN LATERAL (
-            SELECT
-                max(a.completed_at) AS last_audit_at,
-                count(*) FILTER (WHERE a.overall_result = 'PASS') AS pass_count,
-                count(*) AS total_count
-            FROM (
-                SELECT overall_result, completed_at
-                FROM audit_runs
-                WHERE repo_id = r.id AND status = 'completed'
-                ORDER BY created_at DESC
-                LIMIT 10
-            ) a
-        ) h ON true
+        LEFT JOIN repo_health h ON h.repo_id = r.id
         WHERE r.user_id = $1
         ORDER BY r.created_at DESC
         """,
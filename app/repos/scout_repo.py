@@ -96,9 +96,10 @@ async def get_scout_runs_by_repo(
     repo_id: UUID,
     user_id: UUID,
     limit: int = 20,
+    readonly: bool = False,
 ) -> list[dict]:
     """Recent scout runs for a specific repo."""
-    pool = await get_pool()
+    pool = await get_pool(readonly=readonly, tables=("scout_runs", "repos"))
     rows = await pool.fetch(
         """
         SELECT s.id, s.repo_id, r.full_name AS repo_name,
@@ -118,9 +119,9 @@ async def get_scout_runs_by_repo(
     return [dict(r) for r in rows]
 
 
-async def get_scout_run(run_id: UUID) -> dict | None:
+async def get_scout_run(run_id: UUID, readonly: bool = False) -> dict | None:
     """Get a single scout run with full results."""
-    pool = await get_pool()
+    pool = await get_pool(readonly=readonly, tables=("scout_runs", "repos"))
     row = await pool.fetchrow(
         """
         SELECT s.*, r.full_name AS repo_name
@@ -137,9 +138,10 @@ async def get_score_history(
     repo_id: UUID,
     user_id: UUID,
     limit: int = 30,
+    readonly: bool = False,
 ) -> list[dict]:
     """Return computed_score over time for a repo's deep scans."""
-    pool = await get_pool()
+    pool = await get_pool(readonly=readonly, tables=("scout_runs",))
     rows = await pool.fetch(
         """
         SELECT id, computed_score, checks_passed, checks_failed, checks_warned,
@@ -9,10 +9,13 @@ from uuid import UUID
 from app.audit.engine import run_all_checks
 from app.audit.runner import AuditResult, run_audit
 from app.clients.github_client import (
+    PRIORITY_BACKGROUND,
+    GitHubRateLimitError,
     compare_commits,
     get_commit_files,
-    get_repo_file_content,
+    get_repo_file_contents,
     list_commits,
+    request_priority,
 )
 from app.repos.audit_repo import (
     create_audit_run,
@@ -27,6 +30,21 @@ from app.ws_manager import manager as ws_manager
 
 logger = logging.getLogger(__name__)
 
+# Where a repo may keep its boundaries.json, in lookup order.
+_BOUNDARIES_PATHS = ("boundaries.json", "Forge/Contracts/boundaries.json")
+
+
+def _load_boundaries(fetched: dict[str, str | None]) -> dict | None:
+    """Parse the first non-empty boundaries.json among *fetched* files."""
+    for path in _BOUNDARIES_PATHS:
+        content = fetched.get(path)
+        if content:
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                return None
+    return None
+
 
 async def process_push_event(payload: dict) -> dict | None:
     """Process a GitHub push webhook payload.
@@ -105,14 +123,15 @@ async def process_push_event(payload: dict) -> dict | None:
             # Fallback to API
             changed_paths = await get_commit_files(access_token, full_name, commit_sha)
 
-        # Fetch file contents
+        # Fetch file contents (plus boundaries.json candidates) in one batch
+        fetched = await get_repo_file_contents(
+            access_token, full_name, [*changed_paths, *_BOUNDARIES_PATHS], commit_sha
+        )
         files: dict[str, str] = {}
         user_id_str = str(repo["user_id"])
         total_files = len(changed_paths)
         for idx, path in enumerate(changed_paths):
-            content = await get_repo_file_content(
-                access_token, full_name, path, commit_sha
-            )
+            content = fetched.get(path)
             if content is not None:
                 files[path] = content
             # Emit per-file progress
@@ -124,18 +143,8 @@ async def process_push_event(payload: dict) -> dict | None:
                 "files_total": total_files,
             })
 
-        # Try to load boundaries.json from the repo (check common locations)
-        boundaries = None
-        for _bpath in ("boundaries.json", "Forge/Contracts/boundaries.json"):
-            boundaries_content = await get_repo_file_content(
-                access_token, full_name, _bpath, commit_sha
-            )
-            if boundaries_content:
-                try:
-                    boundaries = json.loads(boundaries_content)
-                except json.JSONDecodeError:
-                    boundaries = None
-                break
+        # Load boundaries.json from the repo (check common locations)
+        boundaries = _load_boundaries(fetched)
 
         # Run audit checks
         check_results = run_all_checks(files, boundaries)
@@ -178,7 +187,9 @@ async def process_push_event(payload: dict) -> dict | None:
             "files_checked": len(files),
         })
 
-    except Exception:
+    except Exception as exc:
+        if isinstance(exc, GitHubRateLimitError):
+            logger.warning("Push audit for %s at %s abandoned: %s", full_name, commit_sha[:7], exc)
         await update_audit_run(
             audit_run_id=audit_run["id"],
             status="error",
@@ -203,7 +214,7 @@ async def get_repo_audits(
     if repo is None or repo["user_id"] != user_id:
         raise ValueError("Repo not found or access denied")
 
-    items, total = await get_audit_runs_by_repo(repo_id, limit, offset)
+    items, total = await get_audit_runs_by_repo(repo_id, limit, offset, readonly=True)
 
     result = []
     for item in items:
@@ -236,7 +247,7 @@ async def get_audit_detail(
     if repo is None or repo["user_id"] != user_id:
         raise ValueError("Repo not found or access denied")
 
-    detail = await get_audit_run_detail(audit_id)
+    detail = await get_audit_run_detail(audit_id, readonly=True)
     if detail is None or detail["repo_id"] != repo_id:
         raise ValueError("Audit run not found")
 
@@ -298,7 +309,14 @@ async def backfill_repo_commits(
     faster and uses far fewer API calls.
 
     Returns { "synced": int, "skipped": int }.
+    Raises GitHubRateLimitError when GitHub's rate limit is exhausted
+    before the changed files are known.
     """
+    with request_priority(PRIORITY_BACKGROUND):
+        return await _backfill_repo_commits(repo_id, user_id)
+
+
+async def _backfill_repo_commits(repo_id: UUID, user_id: UUID) -> dict:
     repo = await get_repo_by_id(repo_id)
     if repo is None or repo["user_id"] != user_id:
         raise ValueError("Repo not found or access denied")
@@ -376,14 +394,20 @@ async def backfill_repo_commits(
                 "Fresh sync for %s at %s: %d changed files",
                 full_name, head_sha[:7], len(changed_paths),
             )
-    except Exception:
-        logger.exception("Failed to get changed files for sync")
+    except Exception as exc:
+        rate_limited = isinstance(exc, GitHubRateLimitError)
+        if rate_limited:
+            logger.warning("Sync of %s deferred: %s", full_name, exc)
+        else:
+            logger.exception("Failed to get changed files for sync")
         await ws_manager.broadcast_sync_progress(user_id_str, {
             "repo_id": repo_id_str,
             "commits_done": 0,
             "commits_total": 1,
             "status": "error",
         })
+        if rate_limited:
+            raise
         return {"synced": 0, "skipped": 0}
 
     # Create a single audit run for HEAD
@@ -403,13 +427,14 @@ async def backfill_repo_commits(
     )
 
     try:
-        # Fetch file contents at HEAD
+        # Fetch file contents (plus boundaries.json candidates) at HEAD
+        fetched = await get_repo_file_contents(
+            access_token, full_name, [*changed_paths, *_BOUNDARIES_PATHS], head_sha,
+        )
         files: dict[str, str] = {}
         total_files = len(changed_paths)
         for file_idx, path in enumerate(changed_paths):
-            content = await get_repo_file_content(
-                access_token, full_name, path, head_sha,
-            )
+            content = fetched.get(path)
             if content is not None:
                 files[path] = content
             # Per-file progress
@@ -422,17 +447,7 @@ async def backfill_repo_commits(
             })
 
         # Load boundaries.json if present (check common locations)
-        boundaries = None
-        for _bpath in ("boundaries.json", "Forge/Contracts/boundaries.json"):
-            boundaries_content = await get_repo_file_content(
-                access_token, full_name, _bpath, head_sha,
-            )
-            if boundaries_content:
-                try:
-                    boundaries = json.loads(boundaries_content)
-                except json.JSONDecodeError:
-                    boundaries = None
-                break
+        boundaries = _load_boundaries(fetched)
 
         # Run audit checks
         check_results = run_all_checks(files, boundaries)
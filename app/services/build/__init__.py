@@ -8,6 +8,7 @@ Sub-modules:
     planner_agent_loop  — per-phase planner agent (manifest + chunk planning)
     verification        — inline audit, per-file audit, governance checks
     subagent            — sub-agent handoff protocol, per-role tool sets, runner
+    prompts             — memoized system prompts / tool lists (prompt-cache stable)
 
 Project-level planning (what phases to build) is handled by:
     app/services/planner_service.py  — wraps Z:/ForgeCollection/planner/
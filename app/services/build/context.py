@@ -92,8 +92,8 @@ def _compact_conversation(
     the lossy turn-by-turn summary with a dense, structured state document.
 
     When *use_mcp_contracts* is True, the summary extracts which contracts
-    were fetched (from forge_get_contract tool calls) and adds a re-fetch
-    hint so the builder knows to call forge tools again.
+    were fetched (from forge_get_contract / forge_get_contracts tool calls)
+    and adds a re-fetch hint so the builder knows to call forge tools again.
     """
     if len(messages) <= 5:
         return list(messages)
@@ -113,6 +113,8 @@ def _compact_conversation(
                         inp = block.get("input", {})
                         if name == "forge_get_contract":
                             fetched_contracts.add(inp.get("name", "?"))
+                        elif name == "forge_get_contracts":
+                            fetched_contracts.update(inp.get("names") or ["?"])
                         elif name == "forge_get_phase_window":
                             fetched_contracts.add(f"phase_window({inp.get('phase_number', '?')})")
 
@@ -163,7 +165,7 @@ def _compact_conversation(
         summary_parts.append(
             f"\nContracts previously fetched: {', '.join(sorted(fetched_contracts))}\n"
             "Contract data has been compacted away — re-fetch any contract you need "
-            "using `forge_get_contract(name)` or `forge_get_phase_window(N)`.\n"
+            "using `forge_get_contracts([names])` or `forge_get_phase_window(N)`.\n"
             "Use `forge_scratchpad(\"read\", key)` to retrieve your saved notes.\n"
         )
     elif use_mcp_contracts:
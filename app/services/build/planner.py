@@ -21,6 +21,7 @@ from ._state import (
 from .cost import _accumulate_cost, _get_token_rates
 
 from app.config import get_model_for_role as _get_model_for_role
+from forge_ide.contracts import TaskDAG, TaskNode
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -1526,6 +1527,57 @@ def _batch_tier_files(
     return batches
 
 
+# ---------------------------------------------------------------------------
+# Dependency-driven scheduling — files start as soon as their own deps land
+# ---------------------------------------------------------------------------
+
+SCHEDULE_TIER = "tier"  # all files in a tier start together (barrier between tiers)
+SCHEDULE_DAG = "dag"    # each file starts once its own depends_on are written
+
+
+def _dag_concurrency(key_pool: Any | None, per_key: int | None = None) -> int:
+    """Return how many builder pipelines may run at once in DAG mode.
+
+    Scales with the number of API keys in *key_pool* (each key carries its
+    own token budget), ``per_key`` pipelines per key.  Without a pool the
+    single caller-supplied key gets ``per_key`` slots.
+    """
+    if per_key is None:
+        from app.config import settings
+        per_key = settings.BUILD_AGENTS_PER_KEY
+    key_count = getattr(key_pool, "key_count", 1) if key_pool is not None else 1
+    return max(1, key_count * per_key)
+
+
+def _file_dependency_graph(
+    files: list[dict],
+) -> tuple[list[list[dict]], dict[str, int], TaskDAG]:
+    """Build the file-level dependency graph used by DAG scheduling.
+
+    Returns ``(tiers, tier_of, dag)``:
+
+    - ``tiers`` — ``_compute_tiers(files)``, used only to group UI events.
+    - ``tier_of`` — ``{path: tier index}``.
+    - ``dag`` — a :class:`TaskDAG` with one task per entry of *files* (in
+      order).  Only in-set deps in an *earlier* tier become edges, which
+      drops the back-edge of any cycle exactly where ``_compute_tiers``
+      breaks it, so the graph is always acyclic.
+    """
+    tiers = _compute_tiers(files)
+    tier_of = {f["path"]: ti for ti, tier in enumerate(tiers) for f in tier}
+    dag = TaskDAG.from_manifest([
+        {
+            **f,
+            "depends_on": [
+                dep for dep in dict.fromkeys(f.get("depends_on", []))
+                if dep in tier_of and tier_of[dep] < tier_of[f["path"]]
+            ],
+        }
+        for f in files
+    ])
+    return tiers, tier_of, dag
+
+
 async def execute_tier(
     build_id: UUID,
     user_id: UUID,
@@ -1546,6 +1598,7 @@ async def execute_tier(
     phase_index: int = -1,
     project_id: UUID | None = None,
     phase_manifest: list[dict] | None = None,
+    schedule: str = SCHEDULE_TIER,
 ) -> tuple[dict[str, str], str]:
     """Execute a tier using per-file Builder Agent pipelines (SCOUT→CODER→AUDITOR→FIXER).
 
@@ -1553,6 +1606,13 @@ async def execute_tier(
     concurrently (controlled by a semaphore).  SCOUT/CODER use api_key; AUDITOR/FIXER
     use audit_api_key (falls back to api_key if not set).
 
+    With ``schedule="dag"`` the files are treated as one dependency graph
+    instead: each file starts as soon as the files it ``depends_on`` (within
+    *tier_files*) are written, concurrency is ``_dag_concurrency(key_pool)``,
+    and critical-path files are dispatched first.  ``tier_start`` /
+    ``tier_complete`` are then emitted per ``_compute_tiers`` group as the
+    first file of a group starts and the last one finishes.
+
     Returns ``(written_files, lessons_learned)`` — written_files is ``{path: content}``,
     lessons_learned is accumulated findings summary for downstream tiers/chunks.
     """
@@ -1582,20 +1642,22 @@ async def execute_tier(
         f"Tier {tier_index}: {len(tier_files)} files (per-file Builder pipeline)",
         source="planner", level="info",
     )
-    await _state._broadcast_build_event(user_id, build_id, "tier_start", {
-        "tier": tier_index,
-        "file_count": len(tier_files),
-        "batch_count": 1,  # sequential mode — increase with _semaphore for production
-        "files": all_paths,
-        "common_prefix": common_prefix,
-        "agents": [
-            {
-                "agent_id": f"builder-{idx}",
-                "files": [f["path"]],
-            }
-            for idx, f in enumerate(tier_files)
-        ],
-    })
+    _dag = schedule == SCHEDULE_DAG
+    if not _dag:
+        await _state._broadcast_build_event(user_id, build_id, "tier_start", {
+            "tier": tier_index,
+            "file_count": len(tier_files),
+            "batch_count": 1,  # sequential mode — increase with _semaphore for production
+            "files": all_paths,
+            "common_prefix": common_prefix,
+            "agents": [
+                {
+                    "agent_id": f"builder-{idx}",
+                    "files": [f["path"]],
+                }
+                for idx, f in enumerate(tier_files)
+            ],
+        })
 
     # Pre-fetch shared project contracts once for this tier.
     # Uses forge_get_contract (DB-direct) — forge_get_project_contract (MCP/HTTP)
@@ -1656,8 +1718,10 @@ async def execute_tier(
             )
             _tier_scout = None  # fallback: run_builder will use LLM scout
 
-    # Per-file builder pipeline — up to 3 concurrent file builds per tier
-    _semaphore = asyncio.Semaphore(3)
+    # Per-file builder pipeline — up to 3 concurrent file builds per tier,
+    # or the key-pool budget when scheduling by dependency graph
+    _concurrency = _dag_concurrency(key_pool) if _dag else 3
+    _semaphore = asyncio.Semaphore(_concurrency)
     _LESSONS_CAP = 2000  # max chars for accumulated lessons string
     _lessons_parts: list[str] = []  # mutable — shared across concurrent file runs
     _lessons_lock = asyncio.Lock()   # protects _lessons_parts
@@ -1690,10 +1754,61 @@ async def execute_tier(
     _all_entries = phase_manifest if phase_manifest else tier_files
     _file_entries_by_path: dict[str, dict] = {f["path"]: f for f in _all_entries}
 
+    # DAG scheduling state — per-file completion events and per-group
+    # progress so tier-level UI events still fire.
+    _dag_tiers: list[list[dict]] = []
+    _dag_tier_of: dict[str, int] = {}
+    _dag_graph = TaskDAG()
+    _dag_started: set[int] = set()
+    _dag_pending: list[int] = []
+    if _dag:
+        _dag_tiers, _dag_tier_of, _dag_graph = _file_dependency_graph(tier_files)
+        _dag_pending = [len(t) for t in _dag_tiers]
+        logger.info(
+            "Tier %d: DAG schedule — %d files, %d groups, concurrency %d",
+            tier_index, len(tier_files), len(_dag_tiers), _concurrency,
+        )
+
+    def _ui_tier(fp: str) -> int:
+        return _dag_tier_of.get(fp, tier_index) if _dag else tier_index
+
+    async def _dag_file_started(fp: str) -> None:
+        ti = _dag_tier_of[fp]
+        if ti in _dag_started:
+            return
+        _dag_started.add(ti)
+        _group = _dag_tiers[ti]
+        await _state._broadcast_build_event(user_id, build_id, "tier_start", {
+            "tier": ti,
+            "file_count": len(_group),
+            "batch_count": min(len(_group), _concurrency),
+            "files": [f["path"] for f in _group],
+            "common_prefix": common_prefix,
+            "agents": [
+                {"agent_id": f"builder-{all_paths.index(f['path'])}", "files": [f["path"]]}
+                for f in _group
+            ],
+        })
+
+    async def _dag_file_finished(fp: str) -> None:
+        ti = _dag_tier_of[fp]
+        _dag_pending[ti] -= 1
+        if _dag_pending[ti]:
+            return
+        _group_written = [f["path"] for f in _dag_tiers[ti] if f["path"] in tier_written]
+        await _state._broadcast_build_event(user_id, build_id, "tier_complete", {
+            "tier": ti,
+            "files_written": _group_written,
+            "file_count": len(_group_written),
+        })
+
     async def run_one_file(file_entry: dict, file_idx: int) -> None:
         fp = file_entry["path"]
         _is_test = _is_test_file(fp)
         _is_config_only = Path(fp).name in _NO_CONTRACT_FILES
+        # In DAG mode a dependency may have been written moments ago by
+        # this same call — look it up alongside prior tiers.
+        _known_files = {**all_files_written, **tier_written} if _dag else all_files_written
 
         # Build context from already-written files (prior tiers/files in this tier)
         _CTX_PER_FILE_CAP = 2_000 if _is_test else 3_000
@@ -1701,8 +1816,8 @@ async def execute_tier(
         context_files: dict[str, str] = {}
         _ctx_total = 0
         for dep in file_entry.get("depends_on", []):
-            if dep in all_files_written and dep not in context_files:
-                _snippet = all_files_written[dep]
+            if dep in _known_files and dep not in context_files:
+                _snippet = _known_files[dep]
                 if len(_snippet) > _CTX_PER_FILE_CAP:
                     _snippet = _snippet[:_CTX_PER_FILE_CAP] + "\n# [truncated]\n"
                 if _ctx_total + len(_snippet) > _CTX_TOTAL_CAP:
@@ -1710,8 +1825,8 @@ async def execute_tier(
                 context_files[dep] = _snippet
                 _ctx_total += len(_snippet)
         for ctx in file_entry.get("context_files", []):
-            if ctx in all_files_written and ctx not in context_files:
-                _snippet = all_files_written[ctx]
+            if ctx in _known_files and ctx not in context_files:
+                _snippet = _known_files[ctx]
                 if len(_snippet) > _CTX_PER_FILE_CAP:
                     _snippet = _snippet[:_CTX_PER_FILE_CAP] + "\n# [truncated]\n"
                 if _ctx_total + len(_snippet) > _CTX_TOTAL_CAP:
@@ -1791,10 +1906,12 @@ async def execute_tier(
 
         # Broadcast file_generating
         _agent_id = f"builder-{file_idx}"
+        if _dag:
+            await _dag_file_started(fp)
         await _state._broadcast_build_event(user_id, build_id, "file_generating", {
             "path": fp,
             "agent_id": _agent_id,
-            "tier": tier_index,
+            "tier": _ui_tier(fp),
             "common_prefix": common_prefix,
         })
 
@@ -1968,16 +2085,37 @@ async def execute_tier(
         # Broadcast completion
         await _state._broadcast_build_event(user_id, build_id, "agent_done", {
             "agent_id": _agent_id,
-            "tier": tier_index,
+            "tier": _ui_tier(fp),
             "files_written": [fp] if result.status == "completed" else [],
             "file_count": 1 if result.status == "completed" else 0,
             "status": result.status,
         })
 
-    # Run all files concurrently (semaphore caps at 3 simultaneous builders)
-    await asyncio.gather(*[
-        run_one_file(fe, idx) for idx, fe in enumerate(tier_files)
-    ], return_exceptions=False)
+    _dag_entries = dict(zip(_dag_graph.nodes, enumerate(tier_files), strict=True)) if _dag else {}
+    _dag_errors: list[BaseException] = []
+
+    async def run_dag_task(node: TaskNode) -> None:
+        file_idx, file_entry = _dag_entries[node.id]
+        try:
+            await run_one_file(file_entry, file_idx)
+        except Exception as exc:
+            # Release dependents even on failure — as with a tier barrier,
+            # a failed dependency does not hold back the files after it.
+            _dag_errors.append(exc)
+        finally:
+            await _dag_file_finished(file_entry["path"])
+
+    if _dag:
+        # TaskDAG dispatches critical-path files first so the longest
+        # chain starts earliest.
+        await _dag_graph.run(run_dag_task, concurrency=_concurrency)
+        if _dag_errors:
+            raise _dag_errors[0]
+    else:
+        # Run all files concurrently (semaphore caps at 3 simultaneous builders)
+        await asyncio.gather(*[
+            run_one_file(fe, idx) for idx, fe in enumerate(tier_files)
+        ], return_exceptions=False)
 
     # ────────────────────────────────────────────────────────────────────────
     # BATCH AUDIT — one LLM call reviews all tier files, fixers for failures
@@ -2208,11 +2346,12 @@ async def execute_tier(
             "duration_ms": 0,
         })
 
-    await _state._broadcast_build_event(user_id, build_id, "tier_complete", {
-        "tier": tier_index,
-        "files_written": list(tier_written.keys()),
-        "file_count": len(tier_written),
-    })
+    if not _dag:  # DAG mode already emitted tier_complete per group
+        await _state._broadcast_build_event(user_id, build_id, "tier_complete", {
+            "tier": tier_index,
+            "files_written": list(tier_written.keys()),
+            "file_count": len(tier_written),
+        })
 
     # Build final lessons — prefer structured, fall back to legacy string
     _structured_final = _tier_state_mgr.state.get("lessons", {})
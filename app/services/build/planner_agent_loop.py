@@ -34,6 +34,7 @@ from decimal import Decimal
 from . import _state
 from ._state import FORGE_CONTRACTS_DIR, logger
 from .cost import _accumulate_cost, _get_token_rates
+from .prompts import files_fingerprint, registry as _prompt_registry
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -93,6 +94,9 @@ def _load_governance_contracts() -> str:
     These are loaded at planning time. If FORGE_CONTRACTS_DIR doesn't exist,
     we return an empty string (build continues without governance context —
     this is a misconfiguration, not a fatal error at the agent level).
+
+    Files are only re-read when their mtime or size changes; otherwise the
+    previously loaded text (the same string object) is returned.
     """
     if not FORGE_CONTRACTS_DIR.exists():
         logger.warning(
@@ -101,16 +105,37 @@ def _load_governance_contracts() -> str:
         )
         return ""
 
-    parts: list[str] = []
-    for filename in _GOVERNANCE_FILES:
-        path = FORGE_CONTRACTS_DIR / filename
-        if path.exists():
-            content = path.read_text(encoding="utf-8")
-            parts.append(f"=== FORGE CONTRACT: {filename} ===\n{content}\n")
-    return "\n".join(parts)
+    paths = [FORGE_CONTRACTS_DIR / filename for filename in _GOVERNANCE_FILES]
+
+    def _read() -> str:
+        parts: list[str] = []
+        for path in paths:
+            if path.exists():
+                content = path.read_text(encoding="utf-8")
+                parts.append(f"=== FORGE CONTRACT: {path.name} ===\n{content}\n")
+        return "\n".join(parts)
+
+    return _prompt_registry.get(
+        ("planner_governance", str(FORGE_CONTRACTS_DIR), files_fingerprint(paths)),
+        _read,
+    )
 
 
 def _build_system_prompt() -> list[dict]:
+    """Return the planner system prompt blocks, compiled once per contract version.
+
+    Every planning session gets byte-identical blocks, so the cached
+    governance prefix is reused across phases and builds.
+    """
+    governance = _load_governance_contracts()
+    blocks = _prompt_registry.get(
+        ("planner", governance), lambda: _compile_system_prompt(governance),
+    )
+    # Fresh block dicts (shared text) so callers cannot mutate the registry.
+    return [dict(block) for block in blocks]
+
+
+def _compile_system_prompt(governance: str) -> list[dict]:
     """
     Build the system prompt as cacheable blocks.
 
@@ -174,8 +199,6 @@ Do NOT call write_phase_plan with an incomplete or partial plan.
 The manifest must cover all deliverables for this phase.
 """
 
-    governance = _load_governance_contracts()
-
     if governance:
         return [
             {"type": "text", "text": role},
@@ -0,0 +1,80 @@
+"""Prompt registry — system prompts and tool lists compiled once per version.
+
+Sub-agent and planner prompts are assembled from large, rarely changing
+pieces (the Forge Constitution, role prompts, governance contracts).
+Rebuilding them for every invocation wastes work and risks small byte
+differences that defeat Anthropic's prompt cache, which only hits on an
+exact prefix match.
+
+``PromptRegistry`` memoizes each compiled prompt (or tool list) under a key
+such as ``(kind, role, build_mode)`` and returns the same object on every
+call, so the cacheable prefix is byte-identical across sub-agents.  Prompts
+built from contracts read at call time add ``files_fingerprint`` of those
+files to the key: an edited contract yields a new entry instead of a stale
+prompt.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_MAX_ENTRIES = 128
+
+
+def files_fingerprint(paths: Iterable[Path]) -> tuple:
+    """Cheap version key for on-disk contracts: ``(name, mtime_ns, size)``.
+
+    Missing files contribute ``(name, None, None)`` so creating one later
+    still changes the key.
+    """
+    sig = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            sig.append((path.name, None, None))
+        else:
+            sig.append((path.name, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+class PromptRegistry:
+    """Bounded memo of compiled prompts and tool lists, keyed by version."""
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hits = 0
+        self._builds = 0
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Return the entry for *key*, calling *build* only on first use."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+        value = build()
+        self._builds += 1
+        self._entries[key] = value
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "hits": self._hits, "builds": self._builds}
+
+
+# Process-wide registry shared by the sub-agent runner and the planner.
+registry = PromptRegistry()
@@ -42,6 +42,7 @@ from app.services.tool_executor import BUILDER_TOOLS, execute_tool_async
 from app.services.build.cost import _get_token_rates
 from forge_constitution import CONSTITUTION
 from . import _state
+from .prompts import registry as _prompt_registry
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +134,7 @@ _ROLE_TOOL_NAMES: dict[SubAgentRole, frozenset[str]] = {
         "check_syntax",
         # Pull-first: Coder fetches contracts it needs
         "forge_get_contract",
+        "forge_get_contracts",
         "forge_get_project_contract",
         "forge_list_contracts",
         "forge_scratchpad",
@@ -143,6 +145,7 @@ _ROLE_TOOL_NAMES: dict[SubAgentRole, frozenset[str]] = {
         "list_directory",
         "search_code",
         "forge_get_contract",
+        "forge_get_contracts",
         "forge_list_contracts",
         "forge_get_summary",
         "forge_scratchpad",
@@ -187,6 +190,12 @@ def tools_for_role(
         all_tools = BUILDER_TOOLS
 
     allowed = _ROLE_TOOL_NAMES.get(role, frozenset())
+    if all_tools is BUILDER_TOOLS:
+        # Compiled once per role — same dicts, same order on every call.
+        return list(_prompt_registry.get(
+            ("tools", role),
+            lambda: tuple(t for t in all_tools if t["name"] in allowed),
+        ))
     return [t for t in all_tools if t["name"] in allowed]
 
 
@@ -250,10 +259,15 @@ def max_rounds_for_file(role: SubAgentRole, file_entry: dict) -> int:
 
 def _build_batch_audit_sysprompt(build_mode: str = "full") -> str:
     """Build system prompt for batch auditor: Constitution + batch prompt."""
-    parts = [CONSTITUTION, BATCH_AUDITOR_PROMPT]
-    if build_mode == "mini":
-        parts.append(_MINI_BUILD_CONTEXT)
-    return "\n\n".join(parts)
+    mode = "mini" if build_mode == "mini" else "full"
+
+    def _compile() -> str:
+        parts = [CONSTITUTION, BATCH_AUDITOR_PROMPT]
+        if mode == "mini":
+            parts.append(_MINI_BUILD_CONTEXT)
+        return "\n\n".join(parts)
+
+    return _prompt_registry.get(("batch_auditor", mode), _compile)
 
 
 def build_batch_auditor_handoff(
@@ -426,7 +440,8 @@ _ROLE_SYSTEM_PROMPTS: dict[SubAgentRole, str] = {
         "Step 1. Review the contracts in your Context Files section (contract_stack.md,\n"
         "  contract_boundaries.md are pre-loaded — do NOT fetch them via tools).\n"
         "  If you need schema/physics/ui contracts not already in context, fetch ONLY\n"
-        "  those using forge_get_contract (NOT forge_get_project_contract).\n"
+        "  those using forge_get_contract (NOT forge_get_project_contract) — or\n"
+        "  forge_get_contracts to fetch several (or just their sections) in one call.\n"
         "Step 2. Read your assignment + Scout directives. Follow every MUST/MUST NOT.\n"
         "Step 3. Verify your design: imports match stack, endpoints match physics,\n"
         "  tables match schema, layers match boundaries.\n"
@@ -528,6 +543,7 @@ _ROLE_SYSTEM_PROMPTS: dict[SubAgentRole, str] = {
         "  contract_boundaries.md are pre-loaded). Fetch ONLY missing contracts:\n"
         "  - `forge_get_contract('physics')` — if checking API endpoints\n"
         "  - `forge_get_contract('schema')` — if checking DB models\n"
+        "  - `forge_get_contracts(['physics', 'schema'])` — if you need both\n"
         "  Do NOT use forge_get_project_contract — use forge_get_contract instead.\n"
         "  Do NOT re-fetch stack or boundaries — they are already in your context.\n"
         "Step 3. Check against the severity table below.\n"
@@ -714,6 +730,7 @@ BATCH_AUDITOR_PROMPT = (
     "  contract_boundaries.md are pre-loaded). Fetch ONLY missing contracts:\n"
     "  - `forge_get_contract('physics')` — if checking API endpoints\n"
     "  - `forge_get_contract('schema')` — if checking DB models\n"
+    "  - `forge_get_contracts(['physics', 'schema'])` — if you need both\n"
     "  Do NOT use forge_get_project_contract — use forge_get_contract instead.\n"
     "Step 2. For EACH file, check against the severity table below.\n"
     "Step 3. Output your batch verdict JSON.\n\n"
@@ -785,13 +802,45 @@ def system_prompt_for_role(
     role-specific prompt, then any extra context. For mini builds, a
     scope-reduction block is appended.
     """
-    base = _ROLE_SYSTEM_PROMPTS.get(role, "")
-    parts = [CONSTITUTION, base]
-    if build_mode == "mini":
-        parts.append(_MINI_BUILD_CONTEXT)
-    if extra:
-        parts.append(extra)
-    return "\n\n".join(parts)
+    mode = "mini" if build_mode == "mini" else "full"
+
+    def _compile() -> str:
+        parts = [CONSTITUTION, _ROLE_SYSTEM_PROMPTS.get(role, "")]
+        if mode == "mini":
+            parts.append(_MINI_BUILD_CONTEXT)
+        return "\n\n".join(parts)
+
+    prompt = _prompt_registry.get(("role", role, mode), _compile)
+    return f"{prompt}\n\n{extra}" if extra else prompt
+
+
+def compiled_system_prompt(
+    role: SubAgentRole,
+    *,
+    build_mode: str = "full",
+    override: str = "",
+) -> str:
+    """Return the complete system prompt a sub-agent is started with.
+
+    That is the role prompt (or *override*) followed by the role's slice of
+    the builder contract.  Compiled once per (role, build_mode, override)
+    and returned as the same string thereafter, so every invocation sends
+    a byte-identical, prompt-cacheable prefix.  The constitution, role
+    prompts and builder contract are all loaded at import, so the key
+    needs no version component.
+    """
+    mode = "mini" if build_mode == "mini" else "full"
+
+    def _compile() -> str:
+        prompt = override or system_prompt_for_role(role, build_mode=mode)
+        contract_text = _contract_for_role(role)
+        if contract_text:
+            prompt += f"\n\n## builder_contract (governance)\n{contract_text}"
+        return prompt
+
+    return _prompt_registry.get(
+        ("subagent", role, mode, override), _compile,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1431,16 +1480,13 @@ async def run_sub_agent(
 
     # 3. Build system prompt — inject role-specific builder contract slice.
     #    §10 AEM stripped for all sub-agents; Scout/Fixer also lose §9/§1.
-    #    Loaded once at module level for Anthropic prompt caching benefit.
+    #    Compiled once per role/mode for Anthropic prompt caching benefit.
     #    system_prompt_override allows batch auditor to use a custom prompt.
-    sys_prompt = (
-        handoff.system_prompt_override
-        if handoff.system_prompt_override
-        else system_prompt_for_role(handoff.role, build_mode=handoff.build_mode)
+    sys_prompt = compiled_system_prompt(
+        handoff.role,
+        build_mode=handoff.build_mode,
+        override=handoff.system_prompt_override,
     )
-    _contract_text = _contract_for_role(handoff.role)
-    if _contract_text:
-        sys_prompt += f"\n\n## builder_contract (governance)\n{_contract_text}"
 
     # 4. Build user message
     parts: list[str] = []
@@ -4204,9 +4204,11 @@ async def _run_build_plan_execute(
         logger.info("Fresh start build %s -- wiped %d entries, workspace clean", build_id, _wiped)
     else:
         try:
-            from forge_ide.workspace import Workspace as _IdeWorkspace, capture_snapshot, snapshot_to_workspace_info, update_snapshot as _update_snapshot
+            from forge_ide.workspace import Workspace as _IdeWorkspace, snapshot_to_workspace_info
+            from forge_ide.snapshot_service import SnapshotService as _SnapshotService
             _ide_ws = _IdeWorkspace(working_dir)
-            _ws_snapshot = capture_snapshot(_ide_ws)
+            _snapshot_svc = _SnapshotService(_ide_ws)
+            _ws_snapshot = _snapshot_svc.snapshot()
             _recon_log = (
                 f"Recon complete -- {_ws_snapshot.total_files} files, "
                 f"{_ws_snapshot.total_lines:,} lines, "
@@ -4627,11 +4629,11 @@ async def _run_build_plan_execute(
             workspace_info = "(empty workspace -- fresh start)"
         elif _ws_snapshot is not None:
             try:
-                # Update snapshot incrementally if files were written
+                # Update snapshot incrementally — a stat sweep, then only
+                # files changed since the last phase are re-analysed
                 if all_files_written and _ide_ws is not None:
-                    _ws_snapshot = _update_snapshot(
-                        _ws_snapshot, list(all_files_written.keys()), _ide_ws,
-                    )
+                    _snapshot_svc.refresh()
+                    _ws_snapshot = _snapshot_svc.snapshot()
                 workspace_info = snapshot_to_workspace_info(_ws_snapshot)
             except Exception as exc:
                 logger.warning("Snapshot workspace_info failed: %s", exc)
@@ -4943,6 +4945,7 @@ async def _run_build_plan_execute(
             api_keys=pool_keys,
             input_tpm=settings.ANTHROPIC_INPUT_TPM,
             output_tpm=settings.ANTHROPIC_OUTPUT_TPM,
+            shared=True,
         )
         # Incremental commit counter (how many commits so far this phase)
         _incr_commit_count = 0
@@ -5061,7 +5064,9 @@ async def _run_build_plan_execute(
                     _review_chunk_completion,
                     _plan_tier_interfaces, _extract_tier_interfaces,
                     _review_written_files, execute_tier,
+                    _compute_tiers, SCHEDULE_DAG,
                 )
+                _dag_schedule = settings.BUILD_SCHEDULE == SCHEDULE_DAG
 
                 # ── Use chunks produced by the phase planner agent ────
                 # run_phase_planner_agent already planned manifest + chunks
@@ -5083,17 +5088,39 @@ async def _run_build_plan_execute(
                             "files": [f["path"] for f in _batch],
                         })
                 _chunk_log = f"Planner divided phase into {len(chunks)} chunks"
+                if _dag_schedule:
+                    # One dependency-driven pass over the whole phase — the
+                    # planner's chunk prompts are kept, concatenated.
+                    _dag_prompt = "\n\n".join(
+                        c["builder_prompt"] for c in chunks if c.get("builder_prompt")
+                    )
+                    chunks = [{
+                        "name": "Phase DAG",
+                        "files": [f["path"] for f in _pending_manifest],
+                        "builder_prompt": _dag_prompt,
+                    }]
+                    _dag_groups = _compute_tiers(_pending_manifest)
+                    _chunk_log = (
+                        f"Scheduling {len(_pending_manifest)} files by dependency graph "
+                        f"({len(_dag_groups)} tiers, no tier barriers)"
+                    )
+                    _computed_tiers = [
+                        {"tier": ti, "name": f"Tier {ti}", "files": [f["path"] for f in group]}
+                        for ti, group in enumerate(_dag_groups)
+                    ]
+                else:
+                    _computed_tiers = [
+                        {"tier": ci, "name": c.get("name", ""), "files": c["files"]}
+                        for ci, c in enumerate(chunks)
+                    ]
                 await build_repo.append_build_log(build_id, _chunk_log, source="planner", level="info")
                 await _broadcast_build_event(user_id, build_id, "build_log", {
                     "message": _chunk_log, "source": "planner", "level": "info",
                 })
                 await _broadcast_build_event(user_id, build_id, "tiers_computed", {
                     "phase": phase_name,
-                    "tier_count": len(chunks),
-                    "tiers": [
-                        {"tier": ci, "name": c.get("name", ""), "files": c["files"]}
-                        for ci, c in enumerate(chunks)
-                    ],
+                    "tier_count": len(_computed_tiers),
+                    "tiers": _computed_tiers,
                 })
 
                 # ── Plan confirmation gate ────────────────────────────
@@ -5370,6 +5397,7 @@ async def _run_build_plan_execute(
                         phase_index=phase_num,
                         project_id=project_id,
                         phase_manifest=manifest,
+                        schedule=settings.BUILD_SCHEDULE,
                     )
 
                     # ── Step 3: Merge results (skip background audit — inline AUDITOR already ran)
@@ -174,7 +174,7 @@ async def _aggregate_build(project_id: UUID) -> dict | None:
 async def _aggregate_audit(repo_id: UUID) -> dict:
     """Pull recent audit runs and compute pass rate."""
     try:
-        runs, total = await get_audit_runs_by_repo(repo_id, limit=20, offset=0)
+        runs, total = await get_audit_runs_by_repo(repo_id, limit=20, offset=0, readonly=True)
     except Exception:
         logger.exception("Failed to fetch audit runs for repo %s", repo_id)
         return _empty_audit()
@@ -224,7 +224,7 @@ async def _aggregate_governance(audit_data: dict) -> dict | None:
 
     try:
         from uuid import UUID as _UUID
-        detail = await get_audit_run_detail(_UUID(latest_run_id))
+        detail = await get_audit_run_detail(_UUID(latest_run_id), readonly=True)
     except Exception:
         logger.exception("Failed to fetch audit detail for %s", latest_run_id)
         return None
@@ -257,7 +257,7 @@ async def _aggregate_governance(audit_data: dict) -> dict | None:
 async def _aggregate_scout(repo_id: UUID, user_id: UUID) -> dict | None:
     """Pull latest deep-scan Scout dossier data."""
     try:
-        runs = await get_scout_runs_by_repo(repo_id, user_id, limit=5)
+        runs = await get_scout_runs_by_repo(repo_id, user_id, limit=5, readonly=True)
     except Exception:
         logger.exception("Failed to fetch scout runs for repo %s", repo_id)
         return None
@@ -271,7 +271,7 @@ async def _aggregate_scout(repo_id: UUID, user_id: UUID) -> dict | None:
         return None
 
     # Fetch full run to get results JSONB
-    full_run = await get_scout_run(deep_run["id"])
+    full_run = await get_scout_run(deep_run["id"], readonly=True)
     if full_run is None:
         return None
 
@@ -334,7 +334,7 @@ async def _extract_dossier_baseline(
     scores, or *None* if no locked dossier exists.
     """
     try:
-        runs = await get_scout_runs_by_repo(repo_id, user_id, limit=5)
+        runs = await get_scout_runs_by_repo(repo_id, user_id, limit=5, readonly=True)
     except Exception:
         logger.exception("Failed to fetch scout runs for dossier baseline")
         return None
@@ -343,7 +343,7 @@ async def _extract_dossier_baseline(
     for run in runs:
         if run.get("scan_type") != "deep" or run.get("status") != "completed":
             continue
-        full_run = await get_scout_run(run["id"])
+        full_run = await get_scout_run(run["id"], readonly=True)
         if full_run is None:
             continue
         # Check if locked (dossier_locked_at exists)
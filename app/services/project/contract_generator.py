@@ -7,6 +7,7 @@ import time
 from pathlib import Path
 from uuid import UUID
 
+from app.clients.agent_client import ApiKeyPool
 from app.clients.llm_client import chat as llm_chat, chat_streaming as llm_chat_streaming
 from app.config import settings, get_model_for_role
 from app.repos import build_repo
@@ -59,6 +60,28 @@ CONTRACT_TYPES = [
 # build time, so generating phases during the questionnaire wastes ~3-5K tokens.
 MINI_CONTRACT_TYPES = [ct for ct in CONTRACT_TYPES if ct != "phases"]
 
+# Which earlier contracts each contract is generated against (besides the
+# questionnaire answers).  generate_contracts starts a contract as soon as
+# its dependencies exist, so independent ones run concurrently:
+#   manifesto, blueprint, stack, boundaries → schema → physics → ui → phases
+#   → builder_directive
+# A contract sees exactly its transitive dependencies as prior context, so
+# list everything it reads — ui needs the API surface (physics) and phases
+# needs every contract that shapes the build plan.
+# Every dependency must come earlier in CONTRACT_TYPES (the resume and
+# repair logic still reason in that order).
+CONTRACT_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "manifesto": (),
+    "blueprint": (),
+    "stack": (),  # template
+    "schema": ("blueprint", "stack"),
+    "physics": ("blueprint", "stack", "schema"),
+    "boundaries": (),  # template
+    "ui": ("blueprint", "physics"),
+    "phases": ("manifesto", "blueprint", "stack", "schema", "physics", "boundaries", "ui"),
+    "builder_directive": ("phases",),  # template — reads the phase list
+}
+
 TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "contracts"
 BUILDER_EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "templates" / "builder_examples"
 
@@ -690,6 +713,40 @@ async def _store_forge_config(project_id: UUID, forge_config: dict) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _contract_ancestors(contract_types: list[str]) -> dict[str, list[str]]:
+    """Map each of *contract_types* to its transitive dependencies, in order.
+
+    Dependencies outside *contract_types* (e.g. phases in mini builds) are
+    dropped.
+    """
+    ancestors: dict[str, list[str]] = {}
+    for ct in contract_types:
+        seen: set[str] = set()
+        for dep in CONTRACT_DEPENDENCIES.get(ct, ()):
+            if dep in ancestors:
+                seen.add(dep)
+                seen.update(ancestors[dep])
+        ancestors[ct] = [c for c in contract_types if c in seen]
+    return ancestors
+
+
+def _contract_concurrency(key_pool: ApiKeyPool | None) -> int:
+    """How many contracts may be generated at once (per key in *key_pool*)."""
+    key_count = key_pool.key_count if key_pool is not None else 1
+    return max(1, key_count * settings.CONTRACT_AGENTS_PER_KEY)
+
+
+def _contract_row(row: dict) -> dict:
+    return {
+        "id": str(row["id"]),
+        "project_id": str(row["project_id"]),
+        "contract_type": row["contract_type"],
+        "version": row["version"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+    }
+
+
 async def generate_contracts(
     user_id: UUID,
     project_id: UUID,
@@ -698,6 +755,9 @@ async def generate_contracts(
 
     Each contract is generated individually with a contract-specific system
     prompt that references the Forge example contract as a structural blueprint.
+    Contracts follow CONTRACT_DEPENDENCIES: each starts once the contracts it
+    depends on are done, up to ``_contract_concurrency()`` at a time, and only
+    sees those contracts as prior context.
     Raises ValueError if questionnaire is not complete.
     """
     project = await get_project_by_id(project_id)
@@ -758,7 +818,7 @@ async def generate_contracts(
             logger.info("Archived contracts as snapshot batch %d for project %s", batch, pid)
         existing_map = {}  # regenerate everything
 
-    generated = []
+    generated_rows: dict[str, dict] = {}
     generation_timing: dict[str, float] = {}  # contract_type -> elapsed seconds
     gen_wall_start = time.monotonic()  # wall-clock start for total elapsed
     # Seed prior_contracts from existing contracts for chaining continuity
@@ -768,183 +828,97 @@ async def generate_contracts(
         if ct in existing_map
     }
     total = len(contract_types)
-    try:
-        for idx, contract_type in enumerate(contract_types):
-            # Check cancellation between contracts
-            if cancel_event.is_set():
-                logger.info("Contract generation cancelled for project %s", pid)
-                await manager.send_to_user(str(user_id), {
-                    "type": "contract_progress",
-                    "payload": {
-                        "project_id": pid,
-                        "contract_type": contract_type,
-                        "status": "cancelled",
-                        "index": idx,
-                        "total": total,
-                    },
-                })
-                raise ContractCancelled("Contract generation cancelled")
-
-            # ── Resume: skip contracts that already exist from partial run ─
-            if contract_type in existing_map:
-                row = existing_map[contract_type]
-                generated.append({
-                    "id": str(row["id"]),
-                    "project_id": str(row["project_id"]),
-                    "contract_type": row["contract_type"],
-                    "version": row["version"],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                })
-                logger.info("Skipping %s — already exists from partial run", contract_type)
-                # Notify frontend so it shows as done immediately
-                await manager.send_to_user(str(user_id), {
-                    "type": "contract_progress",
-                    "payload": {
-                        "project_id": pid,
-                        "contract_type": contract_type,
-                        "status": "done",
-                        "index": idx,
-                        "total": total,
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                        "resumed": True,
-                    },
-                })
-                continue
+    ancestors = _contract_ancestors(contract_types)
+    key_pool = (
+        ApiKeyPool(
+            [llm_api_key],
+            settings.ANTHROPIC_INPUT_TPM,
+            settings.ANTHROPIC_OUTPUT_TPM,
+            shared=True,
+        )
+        if provider == "anthropic" and llm_api_key else None
+    )
+    slots = asyncio.Semaphore(_contract_concurrency(key_pool))
+    finished: dict[str, asyncio.Event] = {ct: asyncio.Event() for ct in contract_types}
 
-            # Notify client that generation of this contract has started
+    async def _send_cancelled(contract_type: str, idx: int) -> None:
+        await manager.send_to_user(str(user_id), {
+            "type": "contract_progress",
+            "payload": {
+                "project_id": pid,
+                "contract_type": contract_type,
+                "status": "cancelled",
+                "index": idx,
+                "total": total,
+            },
+        })
+
+    async def _produce(idx: int, contract_type: str) -> None:
+        """Generate (or resume) one contract; its dependencies are done."""
+        # Check cancellation between contracts
+        if cancel_event.is_set():
+            logger.info("Contract generation cancelled for project %s", pid)
+            await _send_cancelled(contract_type, idx)
+            raise ContractCancelled("Contract generation cancelled")
+
+        # ── Resume: skip contracts that already exist from partial run ─
+        if contract_type in existing_map:
+            generated_rows[contract_type] = _contract_row(existing_map[contract_type])
+            logger.info("Skipping %s — already exists from partial run", contract_type)
+            # Notify frontend so it shows as done immediately
             await manager.send_to_user(str(user_id), {
                 "type": "contract_progress",
                 "payload": {
                     "project_id": pid,
                     "contract_type": contract_type,
-                    "status": "generating",
+                    "status": "done",
                     "index": idx,
                     "total": total,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "resumed": True,
                 },
             })
+            return
 
-            # Race the LLM call against the cancel event so cancellation
-            # takes effect immediately, even mid-generation.
-            answers_data = answers_data_global  # computed once before the loop
-
-            # ── Template contracts: skip LLM entirely ────────────────────
-            if contract_type in _TEMPLATE_CONTRACTS:
-                t0 = time.monotonic()
-                if contract_type == "stack":
-                    content, forge_config = _template_stack(project, answers_data)
-                    try:
-                        await _store_forge_config(project_id, forge_config)
-                    except Exception as _fc_exc:
-                        logger.warning("Failed to store forge_config: %s", _fc_exc)
-                elif contract_type == "boundaries":
-                    content = _template_boundaries(project, answers_data)
-                else:  # builder_directive
-                    content = _template_builder_directive(project, answers_data, prior_contracts)
-
-                elapsed_s = round(time.monotonic() - t0, 4)
-                generation_timing[contract_type] = elapsed_s
-                prior_contracts[contract_type] = content
-                row = await upsert_contract(project_id, contract_type, content)
-                generated.append({
-                    "id": str(row["id"]),
-                    "project_id": str(row["project_id"]),
-                    "contract_type": row["contract_type"],
-                    "version": row["version"],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                })
-                await manager.send_to_user(str(user_id), {
-                    "type": "contract_progress",
-                    "payload": {
-                        "project_id": pid,
-                        "contract_type": contract_type,
-                        "status": "done",
-                        "index": idx,
-                        "total": total,
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                        "elapsed_s": elapsed_s,
-                        "templated": True,
-                    },
-                })
-                continue  # skip LLM path
-            # ─────────────────────────────────────────────────────────────
+        # Notify client that generation of this contract has started
+        await manager.send_to_user(str(user_id), {
+            "type": "contract_progress",
+            "payload": {
+                "project_id": pid,
+                "contract_type": contract_type,
+                "status": "generating",
+                "index": idx,
+                "total": total,
+            },
+        })
 
-            # Callback for per-turn live token progress on the UI
-            async def _turn_progress(in_tok: int, out_tok: int, _ct=contract_type, _idx=idx) -> None:
-                await manager.send_to_user(str(user_id), {
-                    "type": "contract_progress",
-                    "payload": {
-                        "project_id": pid,
-                        "contract_type": _ct,
-                        "status": "streaming",
-                        "index": _idx,
-                        "total": total,
-                        "input_tokens": in_tok,
-                        "output_tokens": out_tok,
-                    },
-                })
+        answers_data = answers_data_global  # computed once up front
+        # Only the contracts this one depends on are visible as prior context,
+        # so the result doesn't depend on which siblings happened to finish first.
+        visible = {
+            ct: prior_contracts[ct] for ct in ancestors[contract_type] if ct in prior_contracts
+        }
 
+        # ── Template contracts: skip LLM entirely ────────────────────
+        if contract_type in _TEMPLATE_CONTRACTS:
             t0 = time.monotonic()
-            llm_task = asyncio.ensure_future(
-                _generate_greenfield_contract_with_tools(
-                    contract_type=contract_type,
-                    project=project,
-                    answers_data=answers_data,
-                    api_key=llm_api_key,
-                    model=llm_model,
-                    provider=provider,
-                    prior_contracts=prior_contracts,
-                    build_mode=build_mode,
-                    on_turn_progress=_turn_progress,
-                    canonical_anchor=canonical_anchor,
-                )
-            )
-            cancel_task = asyncio.ensure_future(cancel_event.wait())
-
-            done, pending = await asyncio.wait(
-                [llm_task, cancel_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            if cancel_task in done:
-                # Cancel fired while LLM was running — abort immediately
-                llm_task.cancel()
-                logger.info("Contract generation cancelled mid-LLM for project %s", pid)
-                await manager.send_to_user(str(user_id), {
-                    "type": "contract_progress",
-                    "payload": {
-                        "project_id": pid,
-                        "contract_type": contract_type,
-                        "status": "cancelled",
-                        "index": idx,
-                        "total": total,
-                    },
-                })
-                raise ContractCancelled("Contract generation cancelled")
-
-            # LLM finished first — clean up the cancel waiter
-            cancel_task.cancel()
-            elapsed_s = round(time.monotonic() - t0, 2)
+            if contract_type == "stack":
+                content, forge_config = _template_stack(project, answers_data)
+                try:
+                    await _store_forge_config(project_id, forge_config)
+                except Exception as _fc_exc:
+                    logger.warning("Failed to store forge_config: %s", _fc_exc)
+            elif contract_type == "boundaries":
+                content = _template_boundaries(project, answers_data)
+            else:  # builder_directive
+                content = _template_builder_directive(project, answers_data, visible)
+
+            elapsed_s = round(time.monotonic() - t0, 4)
             generation_timing[contract_type] = elapsed_s
-            content, usage = llm_task.result()
-
-            # Store for chaining into subsequent contracts
             prior_contracts[contract_type] = content
-
             row = await upsert_contract(project_id, contract_type, content)
-            generated.append({
-                "id": str(row["id"]),
-                "project_id": str(row["project_id"]),
-                "contract_type": row["contract_type"],
-                "version": row["version"],
-                "created_at": row["created_at"],
-                "updated_at": row["updated_at"],
-            })
-
-            # Notify client that this contract is done
+            generated_rows[contract_type] = _contract_row(row)
             await manager.send_to_user(str(user_id), {
                 "type": "contract_progress",
                 "payload": {
@@ -953,13 +927,120 @@ async def generate_contracts(
                     "status": "done",
                     "index": idx,
                     "total": total,
-                    "input_tokens": usage.get("input_tokens", 0),
-                    "output_tokens": usage.get("output_tokens", 0),
+                    "input_tokens": 0,
+                    "output_tokens": 0,
                     "elapsed_s": elapsed_s,
+                    "templated": True,
+                },
+            })
+            return  # skip LLM path
+        # ─────────────────────────────────────────────────────────────
+
+        # Callback for per-turn live token progress on the UI
+        async def _turn_progress(in_tok: int, out_tok: int) -> None:
+            await manager.send_to_user(str(user_id), {
+                "type": "contract_progress",
+                "payload": {
+                    "project_id": pid,
+                    "contract_type": contract_type,
+                    "status": "streaming",
+                    "index": idx,
+                    "total": total,
+                    "input_tokens": in_tok,
+                    "output_tokens": out_tok,
                 },
             })
+
+        api_key, limiter = key_pool.best_key() if key_pool else (llm_api_key, None)
+        if limiter is not None:
+            await limiter.wait_for_budget()
+
+        # Race the LLM call against the cancel event so cancellation
+        # takes effect immediately, even mid-generation.
+        t0 = time.monotonic()
+        llm_task = asyncio.ensure_future(
+            _generate_greenfield_contract_with_tools(
+                contract_type=contract_type,
+                project=project,
+                answers_data=answers_data,
+                api_key=api_key,
+                model=llm_model,
+                provider=provider,
+                prior_contracts=visible,
+                build_mode=build_mode,
+                on_turn_progress=_turn_progress,
+                canonical_anchor=canonical_anchor,
+            )
+        )
+        cancel_task = asyncio.ensure_future(cancel_event.wait())
+
+        try:
+            done, pending = await asyncio.wait(
+                [llm_task, cancel_task],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            if not llm_task.done():
+                llm_task.cancel()  # a sibling failed, or we were cancelled
+            cancel_task.cancel()
+
+        if cancel_task in done:
+            # Cancel fired while LLM was running — abort immediately
+            logger.info("Contract generation cancelled mid-LLM for project %s", pid)
+            await _send_cancelled(contract_type, idx)
+            raise ContractCancelled("Contract generation cancelled")
+
+        # LLM finished first
+        elapsed_s = round(time.monotonic() - t0, 2)
+        generation_timing[contract_type] = elapsed_s
+        content, usage = llm_task.result()
+        if limiter is not None:
+            limiter.record(usage.get("input_tokens", 0), usage.get("output_tokens", 0))
+
+        # Store for chaining into dependent contracts
+        prior_contracts[contract_type] = content
+
+        row = await upsert_contract(project_id, contract_type, content)
+        generated_rows[contract_type] = _contract_row(row)
+
+        # Notify client that this contract is done
+        await manager.send_to_user(str(user_id), {
+            "type": "contract_progress",
+            "payload": {
+                "project_id": pid,
+                "contract_type": contract_type,
+                "status": "done",
+                "index": idx,
+                "total": total,
+                "input_tokens": usage.get("input_tokens", 0),
+                "output_tokens": usage.get("output_tokens", 0),
+                "elapsed_s": elapsed_s,
+            },
+        })
+
+    async def _schedule(idx: int, contract_type: str) -> None:
+        for dep in CONTRACT_DEPENDENCIES.get(contract_type, ()):
+            if dep in finished:
+                await finished[dep].wait()
+        async with slots:
+            await _produce(idx, contract_type)
+        finished[contract_type].set()
+
+    tasks = [
+        asyncio.ensure_future(_schedule(idx, ct))
+        for idx, ct in enumerate(contract_types)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # First failure (or cancellation) wins — stop every other contract.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
     finally:
         _active_generations.pop(pid, None)
+    generated = [generated_rows[ct] for ct in contract_types if ct in generated_rows]
 
     # --- Post-generation cross-contract consistency check + repair ---------
     consistency_issues = await _run_consistency_check(project_id, user_id, prior_contracts)
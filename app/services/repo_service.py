@@ -6,12 +6,14 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from app.clients.github_client import (
+    PRIORITY_BACKGROUND,
     create_github_repo,
     create_webhook,
     delete_webhook,
     get_repo_health,
     list_commits,
     list_user_repos,
+    request_priority,
 )
 from app.config import settings
 from app.repos.repo_repo import (
@@ -148,7 +150,7 @@ async def disconnect_repo(user_id: UUID, repo_id: UUID) -> None:
 
 async def list_connected_repos(user_id: UUID) -> list[dict]:
     """List all connected repos for a user with computed health data."""
-    repos = await get_repos_with_health(user_id)
+    repos = await get_repos_with_health(user_id, readonly=True)
     result = []
     for repo in repos:
         total = repo.get("total_count") or 0
@@ -275,10 +277,13 @@ async def run_repo_health_check(user_id: UUID) -> None:
         if not user:
             return
         repos = await get_repos_by_user(user_id)
-        await asyncio.gather(
-            *[_check_single_repo(user, r) for r in repos],
-            return_exceptions=True,
-        )
+        # Background priority: the per-token scheduler in github_client caps
+        # how many of these run at once and keeps quota back for webhooks.
+        with request_priority(PRIORITY_BACKGROUND):
+            await asyncio.gather(
+                *[_check_single_repo(user, r) for r in repos],
+                return_exceptions=True,
+            )
     finally:
         _health_check_running.discard(uid_str)
     await manager.send_to_user(str(user_id), {
@@ -7,11 +7,14 @@ from uuid import UUID
 
 from app.audit.engine import run_all_checks
 from app.clients.github_client import (
-    get_repo_file_content,
+    PRIORITY_BACKGROUND,
+    GitHubRateLimitError,
+    get_repo_file_contents,
     get_repo_languages,
     get_repo_metadata,
     get_repo_tree,
     list_commits,
+    request_priority,
 )
 from app.repos.repo_repo import get_repo_by_id
 from app.repos.scout_repo import create_scout_run, update_scout_run, lock_dossier
@@ -68,9 +71,12 @@ async def start_deep_scan(
     run = await create_scout_run(repo_id, user_id, hypothesis, scan_type="deep")
     run_id = run["id"]
 
-    asyncio.create_task(
-        _execute_deep_scan(run_id, repo, user_id, hypothesis, include_llm)
-    )
+    # The task copies the current context, so its GitHub calls queue
+    # behind interactive ones (webhook audits, API handlers).
+    with request_priority(PRIORITY_BACKGROUND):
+        asyncio.create_task(
+            _execute_deep_scan(run_id, repo, user_id, hypothesis, include_llm)
+        )
 
     return {
         "id": str(run_id),
@@ -144,21 +150,18 @@ async def _execute_deep_scan(
         # ── Step 3: Detect stack ──────────────────────────────────
         await _send_deep_progress(user_id_str, run_id, "stack", "Detecting technology stack")
 
-        # Fetch manifests for stack detection
-        requirements_txt = await get_repo_file_content(
-            access_token, full_name, "requirements.txt", head_sha,
-        )
-        pyproject_toml = await get_repo_file_content(
-            access_token, full_name, "pyproject.toml", head_sha,
+        # Fetch manifests for stack detection (one batched request)
+        manifests = await get_repo_file_contents(
+            access_token, full_name,
+            ["requirements.txt", "pyproject.toml", "package.json", "web/package.json"],
+            head_sha,
         )
+        requirements_txt = manifests["requirements.txt"]
+        pyproject_toml = manifests["pyproject.toml"]
         # Look for package.json at root or in a web/ subdir
-        pkg_json_content = await get_repo_file_content(
-            access_token, full_name, "package.json", head_sha,
-        )
+        pkg_json_content = manifests["package.json"]
         if pkg_json_content is None:
-            pkg_json_content = await get_repo_file_content(
-                access_token, full_name, "web/package.json", head_sha,
-            )
+            pkg_json_content = manifests["web/package.json"]
 
         stack_profile = detect_stack(
             tree_paths=tree_paths,
@@ -171,20 +174,9 @@ async def _execute_deep_scan(
         # ── Step 4: Fetch key files for architecture analysis ─────
         await _send_deep_progress(user_id_str, run_id, "fetching", "Fetching key files")
         files_to_fetch = _select_key_files(tree_paths, tree_items)
-        file_contents: dict[str, str] = {}
-        total_fetched_bytes = 0
-
-        for fpath in files_to_fetch:
-            if len(file_contents) >= _DEEP_SCAN_MAX_FILES:
-                break
-            if total_fetched_bytes >= _DEEP_SCAN_MAX_BYTES:
-                break
-            content = await get_repo_file_content(
-                access_token, full_name, fpath, head_sha,
-            )
-            if content is not None:
-                total_fetched_bytes += len(content.encode("utf-8", errors="replace"))
-                file_contents[fpath] = content
+        file_contents = await _fetch_key_files(
+            access_token, full_name, files_to_fetch, head_sha,
+        )
 
         # ── Step 5: Map architecture ──────────────────────────────
         await _send_deep_progress(user_id_str, run_id, "architecture", "Mapping architecture")
@@ -286,8 +278,11 @@ async def _execute_deep_scan(
             },
         })
 
-    except Exception:
-        logger.exception("Deep scan %s failed", run_id)
+    except Exception as exc:
+        if isinstance(exc, GitHubRateLimitError):
+            logger.warning("Deep scan %s stopped: %s", run_id, exc)
+        else:
+            logger.exception("Deep scan %s failed", run_id)
         await update_scout_run(run_id, status="error")
         await ws_manager.send_to_user(user_id_str, {
             "type": "scout_complete",
@@ -338,6 +333,34 @@ async def _complete_deep_scan_empty(
     })
 
 
+async def _fetch_key_files(
+    access_token: str, full_name: str, paths: list[str], ref: str,
+) -> dict[str, str]:
+    """Fetch *paths* in priority order until the file or byte cap is reached.
+
+    Paths are requested in batches sized to the files still needed, so a
+    missing file makes room for the next candidate instead of shrinking
+    the result.
+    """
+    file_contents: dict[str, str] = {}
+    total_fetched_bytes = 0
+    pending = list(paths)
+    while pending and total_fetched_bytes < _DEEP_SCAN_MAX_BYTES:
+        need = _DEEP_SCAN_MAX_FILES - len(file_contents)
+        if need <= 0:
+            break
+        chunk, pending = pending[:need], pending[need:]
+        fetched = await get_repo_file_contents(access_token, full_name, chunk, ref)
+        for fpath in chunk:
+            if total_fetched_bytes >= _DEEP_SCAN_MAX_BYTES:
+                break
+            content = fetched.get(fpath)
+            if content is not None:
+                total_fetched_bytes += len(content.encode("utf-8", errors="replace"))
+                file_contents[fpath] = content
+    return file_contents
+
+
 def _select_key_files(
     tree_paths: list[str], tree_items: list[dict],
 ) -> list[str]:
@@ -195,7 +195,7 @@ async def get_scout_score_history(
     if repo is None or str(repo["user_id"]) != str(user_id):
         raise ValueError("Repo not found or not owned by user")
 
-    rows = await get_score_history(repo_id, user_id, limit)
+    rows = await get_score_history(repo_id, user_id, limit, readonly=True)
     return [
         {
             "run_id": str(r["id"]),
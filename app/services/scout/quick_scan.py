@@ -7,8 +7,9 @@ from uuid import UUID
 
 from app.audit.engine import run_all_checks
 from app.clients.github_client import (
+    GitHubRateLimitError,
     get_commit_files,
-    get_repo_file_content,
+    get_repo_file_contents,
     list_commits,
 )
 from app.repos.repo_repo import get_repo_by_id
@@ -94,21 +95,19 @@ async def _execute_scout(
             await _complete_with_no_changes(run_id, user_id_str)
             return
 
-        # Fetch file contents
-        files: dict[str, str] = {}
-        for path in changed_paths:
-            content = await get_repo_file_content(
-                access_token, full_name, path, head_sha
-            )
-            if content is not None:
-                files[path] = content
+        # Fetch file contents and boundaries.json candidates in one batch
+        boundaries_paths = ("boundaries.json", "Forge/Contracts/boundaries.json")
+        fetched = await get_repo_file_contents(
+            access_token, full_name, [*changed_paths, *boundaries_paths], head_sha
+        )
+        files: dict[str, str] = {
+            path: fetched[path] for path in changed_paths if fetched.get(path) is not None
+        }
 
         # Load boundaries.json if present (check common locations)
         boundaries = None
-        for _bpath in ("boundaries.json", "Forge/Contracts/boundaries.json"):
-            boundaries_content = await get_repo_file_content(
-                access_token, full_name, _bpath, head_sha
-            )
+        for _bpath in boundaries_paths:
+            boundaries_content = fetched.get(_bpath)
             if boundaries_content:
                 try:
                     boundaries = json.loads(boundaries_content)
@@ -180,8 +179,11 @@ async def _execute_scout(
             },
         })
 
-    except Exception:
-        logger.exception("Scout run %s failed", run_id)
+    except Exception as exc:
+        if isinstance(exc, GitHubRateLimitError):
+            logger.warning("Scout run %s stopped: %s", run_id, exc)
+        else:
+            logger.exception("Scout run %s failed", run_id)
         await update_scout_run(run_id, status="error")
         await ws_manager.send_to_user(user_id_str, {
             "type": "scout_complete",
@@ -8,17 +8,23 @@ Phase 18 tools: read_file, list_directory, search_code, write_file (sync)
 Phase 19 tools: run_tests, check_syntax, run_command (async -- subprocess)
 Phase 55 tools: forge_get_contract, forge_get_phase_window,
                 forge_list_contracts, forge_get_summary, forge_scratchpad (sync)
+Batched:        forge_get_contracts (several contracts / sections in one call)
 """
 
-import asyncio
 import ast
 import fnmatch
+import functools
 import json
 import logging
 import os
 import re
 import time as _time_mod
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from forge_ide.mcp.bundle import ContractBundle
+    from forge_ide.mcp.cache import BoundedCache
 
 logger = logging.getLogger(__name__)
 
@@ -185,6 +191,9 @@ async def execute_tool_async(
     # disk writes.
     forge_db_handlers = {
         "forge_get_contract": _exec_forge_get_contract_db,
+        "forge_get_contracts": functools.partial(
+            _exec_forge_get_contracts_db, build_id=str(kwargs.get("build_id") or ""),
+        ),
         "forge_get_phase_window": _exec_forge_get_phase_window_db,
         "forge_list_contracts": _exec_forge_list_contracts_db,
         "forge_get_summary": _exec_forge_get_summary_db,
@@ -427,9 +436,15 @@ def _exec_edit_file(inp: dict, working_dir: str) -> str:
         ]
     }
     Returns: Summary of applied/failed edits.
+
+    Edits are all-or-nothing: if any edit fails to match, or the result
+    would introduce a Python syntax error, the file is left unchanged.
+    The write itself goes through a ``PatchTransaction`` (temp file +
+    atomic rename).
     """
     from forge_ide.contracts import Edit as _Edit
-    from forge_ide.patcher import apply_edits as _apply_edits
+    from forge_ide.errors import TransactionAborted as _TransactionAborted
+    from forge_ide.transaction import PatchTransaction as _PatchTransaction
 
     rel_path = inp.get("path", "")
     raw_edits = inp.get("edits", [])
@@ -444,11 +459,6 @@ def _exec_edit_file(inp: dict, working_dir: str) -> str:
     if not raw_edits:
         return "Error: No edits provided"
 
-    try:
-        content = target.read_text(encoding="utf-8", errors="replace")
-    except Exception as exc:
-        return f"Error reading '{rel_path}': {exc}"
-
     edits = [
         _Edit(
             old_text=e.get("old_text", ""),
@@ -459,31 +469,36 @@ def _exec_edit_file(inp: dict, working_dir: str) -> str:
         for e in raw_edits
     ]
 
-    result = _apply_edits(content, edits, file_path=rel_path)
-
-    if result.success:
-        try:
-            target.write_text(result.final_content, encoding="utf-8")
-        except Exception as exc:
-            return f"Error writing '{rel_path}': {exc}"
+    txn = _PatchTransaction(_get_workspace(working_dir))  # type: ignore[arg-type]
+    try:
+        result = txn.stage_edits(rel_path, edits)
+    except Exception as exc:
+        return f"Error reading '{rel_path}': {exc}"
 
-        parts = [f"OK: Applied {len(result.applied)}/{len(edits)} edits to {rel_path}"]
-        if result.retargeted > 0:
-            parts.append(f" ({result.retargeted} retargeted via fuzzy match)")
-        return "".join(parts)
-    else:
-        parts = [f"PARTIAL: {len(result.applied)}/{len(edits)} edits applied to {rel_path}"]
+    if not result.success:
+        parts = [
+            f"FAILED: {len(result.applied)}/{len(edits)} edits matched in {rel_path} "
+            f"— file left unchanged (edits are all-or-nothing)"
+        ]
         for preview, reason in result.failed:
             parts.append(f"  FAILED: {preview} — {reason}")
-        if result.applied:
-            # Write partial result
-            try:
-                target.write_text(result.final_content, encoding="utf-8")
-                parts.append(f"  (partial result written — {len(result.applied)} edits applied)")
-            except Exception:
-                parts.append("  (partial result NOT written due to I/O error)")
         return "\n".join(parts)
 
+    try:
+        txn.commit()
+    except _TransactionAborted as exc:
+        if exc.diagnostics:
+            parts = [f"Error: edits to {rel_path} introduce syntax errors — file left unchanged"]
+            for d in exc.diagnostics:
+                parts.append(f"  L{d['line']}: {d['message']}")
+            return "\n".join(parts)
+        return f"Error writing '{rel_path}': {exc.reason}"
+
+    parts = [f"OK: Applied {len(result.applied)}/{len(edits)} edits to {rel_path}"]
+    if result.retargeted > 0:
+        parts.append(f" ({result.retargeted} retargeted via fuzzy match)")
+    return "".join(parts)
+
 
 # ---------------------------------------------------------------------------
 # Command validation helpers
@@ -518,13 +533,6 @@ def _validate_command(command: str, allowed_prefixes: tuple[str, ...]) -> str |
     return None
 
 
-def _truncate_output(text: str, max_bytes: int) -> str:
-    """Truncate output to max_bytes, appending a truncation notice."""
-    if len(text) <= max_bytes:
-        return text
-    return text[:max_bytes] + f"\n\n[... truncated at {max_bytes} bytes ...]"
-
-
 def _build_project_env(working_dir: str) -> dict[str, str]:
     """Build subprocess env dict with venv activation + .env loading.
 
@@ -602,6 +610,9 @@ async def _auto_install_deps(rel_path: str, working_dir: str) -> str:
             cmd, working_dir, timeout=120,
         )
         if exit_code == 0:
+            # New packages: don't fork test runs from a zygote holding old ones
+            from forge_ide.pytest_worker import shutdown_workers
+            await shutdown_workers(working_dir)
             # Summarise: count installed packages
             installed_count = stdout.lower().count("successfully installed")
             if installed_count:
@@ -615,12 +626,14 @@ async def _auto_install_deps(rel_path: str, working_dir: str) -> str:
 
 
 async def _run_subprocess(
-    command: str, working_dir: str, timeout: int,
+    command: str, working_dir: str, timeout: int, *, max_failures: int | None = None,
 ) -> tuple[int, str, str]:
     """Run a subprocess command with timeout and output limits.
 
-    Uses subprocess.run in a thread to avoid asyncio event-loop limitations
-    on Windows (ProactorEventLoop requirement for create_subprocess_shell).
+    Output is streamed through ``forge_ide.runner.stream_process``, so
+    memory stays bounded (head + tail of each stream) however much the
+    command prints.  With *max_failures*, a test run is stopped once that
+    many failures have been reported.
 
     If *working_dir* contains a ``.venv`` directory, the subprocess
     environment is configured to use that project-local virtual environment
@@ -629,28 +642,49 @@ async def _run_subprocess(
 
     Returns (exit_code, stdout, stderr).
     """
-    env = _build_project_env(working_dir)
+    from forge_ide.runner import stream_process as _stream_process
+
+    result = await _stream_process(
+        command,
+        timeout_s=timeout,
+        cwd=working_dir,
+        env=_build_project_env(working_dir),
+        max_failures=max_failures,
+        max_stdout_bytes=MAX_STDOUT_BYTES,
+        max_stderr_bytes=MAX_STDERR_BYTES,
+    )
+    return _unpack_run_result(result, timeout, max_failures)
 
-    import subprocess as _sp
 
-    def _sync() -> tuple[int, str, str]:
-        try:
-            result = _sp.run(
-                command,
-                capture_output=True,
-                text=True,
-                cwd=working_dir,
-                env=env,
-                shell=True,
-                timeout=timeout,
-            )
-            stdout = _truncate_output(result.stdout or "", MAX_STDOUT_BYTES)
-            stderr = _truncate_output(result.stderr or "", MAX_STDERR_BYTES)
-            return result.returncode, stdout, stderr
-        except _sp.TimeoutExpired:
-            return -1, "", f"Error: Command timed out after {timeout}s"
+async def _run_pytest_warm(
+    command: str, working_dir: str, timeout: int, *, max_failures: int | None = None,
+) -> tuple[int, str, str]:
+    """Like ``_run_subprocess``, but runs pytest commands on the workspace's
+    warm ``forge_ide.pytest_worker`` (cold fallback for anything else).
+    """
+    from forge_ide.pytest_worker import parse_pytest_command, run_pytest
+
+    if parse_pytest_command(command) is None:
+        return await _run_subprocess(command, working_dir, timeout, max_failures=max_failures)
+    result = await run_pytest(
+        command,
+        cwd=working_dir,
+        env=_build_project_env(working_dir),
+        timeout_s=timeout,
+        max_failures=max_failures,
+    )
+    return _unpack_run_result(result, timeout, max_failures)
 
-    return await asyncio.to_thread(_sync)
+
+def _unpack_run_result(result, timeout: int, max_failures: int | None) -> tuple[int, str, str]:
+    """``StreamRunResult`` → ``(exit_code, stdout, stderr)`` tool output."""
+    if result.killed:
+        return -1, "", f"Error: Command timed out after {timeout}s"
+    stderr = result.stderr
+    if result.stopped_early:
+        note = f"[stopped after {max_failures} failure(s)]"
+        stderr = f"{stderr.rstrip()}\n{note}" if stderr.strip() else note
+    return result.exit_code, result.stdout, stderr
 
 
 # ---------------------------------------------------------------------------
@@ -661,17 +695,26 @@ async def _run_subprocess(
 async def _exec_run_tests(inp: dict, working_dir: str) -> str:
     """Run a test command in the working directory.
 
-    Input: { "command": "pytest tests/ -v", "timeout": 120 }
+    Input: { "command": "pytest tests/ -v", "timeout": 120, "max_failures": 5 }
     Returns: Exit code, stdout, and stderr.
     """
     command = inp.get("command", "")
     timeout = min(int(inp.get("timeout", DEFAULT_RUN_TESTS_TIMEOUT)), 300)
+    max_failures = int(inp.get("max_failures") or 0) or None
 
     error = _validate_command(command, RUN_TESTS_PREFIXES)
     if error:
         return error
 
-    exit_code, stdout, stderr = await _run_subprocess(command, working_dir, timeout)
+    from app.config import settings as _settings
+    if getattr(_settings, "PYTEST_WORKER_ENABLED", True):
+        exit_code, stdout, stderr = await _run_pytest_warm(
+            command, working_dir, timeout, max_failures=max_failures,
+        )
+    else:
+        exit_code, stdout, stderr = await _run_subprocess(
+            command, working_dir, timeout, max_failures=max_failures,
+        )
 
     parts = [f"Exit code: {exit_code}"]
     if stdout:
@@ -803,6 +846,113 @@ async def _exec_forge_get_contract_db(inp: dict, project_id: str) -> str:
     return content
 
 
+# Per-build contract bundles: a build's pinned contract snapshot, fetched in
+# one query and split into sections once, shared by every sub-agent of the
+# build.  Only pinned snapshots are cached — they never change, while a
+# project's current contracts can be edited mid-build.
+_CONTRACT_BUNDLE_TTL_S = 600
+_CONTRACT_BUNDLE_MAX_ENTRIES = 64
+_contract_bundles: "BoundedCache | None" = None
+
+
+def _contract_bundle_cache() -> "BoundedCache":
+    """Return the bundle cache, creating it on first use."""
+    global _contract_bundles
+    if _contract_bundles is None:
+        from forge_ide.mcp.cache import BoundedCache
+        _contract_bundles = BoundedCache(
+            ttl=_CONTRACT_BUNDLE_TTL_S, max_entries=_CONTRACT_BUNDLE_MAX_ENTRIES,
+        )
+    return _contract_bundles
+
+
+async def _load_contract_rows(project_id: str, build_id: str = "") -> tuple[list[dict], bool]:
+    """Fetch a build's pinned contract snapshot, else the project's contracts.
+
+    Returns ``(rows, pinned)``.  Mirrors ``GET /api/mcp/build/{build_id}/bundle``.
+    """
+    from uuid import UUID
+    from app.repos import project_repo
+    if build_id:
+        from app.repos.build_repo import get_build_by_id
+        build = await get_build_by_id(UUID(build_id))
+        batch = build.get("contract_batch") if build else None
+        if batch is not None:
+            return await project_repo.get_snapshot_contracts(build["project_id"], batch), True
+    return await project_repo.get_contracts_by_project(UUID(project_id)), False
+
+
+async def _get_contract_bundle(project_id: str, build_id: str = "") -> "ContractBundle":
+    """Return the contract bundle for a build (or project).
+
+    A pinned snapshot is loaded once per build; current contracts are read
+    live (like ``forge_get_contract``), with concurrent reads coalesced.
+    """
+    from forge_ide.mcp.bundle import ContractBundle
+
+    cache = _contract_bundle_cache()
+    key = f"build:{build_id}" if build_id else f"project:{project_id}"
+    if build_id:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    async def _load() -> ContractBundle:
+        rows, pinned = await _load_contract_rows(project_id, build_id)
+        bundle = ContractBundle(rows)
+        if pinned:
+            cache.set(key, bundle)
+        return bundle
+
+    return await cache.coalesce(key, _load)
+
+
+async def _exec_forge_get_contracts_db(inp: dict, project_id: str, build_id: str = "") -> str:
+    """Read several project contracts (or sections of them) in one call.
+
+    Input: { "names": ["stack", "physics"], "sections": {"physics": ["paths"]} }
+    Served from the build's contract bundle.  "phases" requires a section
+    selector (e.g. "Phase 3").
+    """
+    names = inp.get("names")
+    if isinstance(names, str):
+        names = [names]
+    names = [n.strip() for n in names or [] if isinstance(n, str) and n.strip()]
+    if not names:
+        return "Error: 'names' is required (e.g. ['stack', 'schema', 'physics'])"
+    sections = inp.get("sections")
+    if not isinstance(sections, dict):
+        sections = {}
+
+    if not project_id:
+        return "Error: No project_id in build context — cannot fetch contracts from database"
+
+    try:
+        bundle = await _get_contract_bundle(project_id, build_id)
+    except Exception as exc:
+        return f"Error fetching contracts from database: {exc}"
+
+    selected = bundle.select(names, sections)
+    parts = []
+    for name, content in selected["contracts"].items():
+        picked = sections.get(name)
+        if picked and name not in selected["unmatched_sections"]:
+            parts.append(f"## Contract: {name} (sections: {', '.join(picked)})\n\n{content}")
+        else:
+            parts.append(f"## Contract: {name}\n\n{content}")
+    notes = [f"Error: {msg}" for msg in selected["errors"].values()]
+    if selected["missing"]:
+        notes.append(
+            f"Not found for this project: {', '.join(selected['missing'])} "
+            f"(available: {', '.join(bundle.names)})"
+        )
+    for name, misses in selected["unmatched_sections"].items():
+        notes.append(f"No section of '{name}' matched {misses!r}.")
+    if notes:
+        parts.append("\n".join(notes))
+    return "\n\n---\n\n".join(parts)
+
+
 async def _exec_forge_get_phase_window_db(inp: dict, project_id: str) -> str:
     """Extract current + next phase from the phases contract in the database.
 
@@ -1234,6 +1384,13 @@ BUILDER_TOOLS = [
                     "type": "integer",
                     "description": "Timeout in seconds (default 120, max 300).",
                 },
+                "max_failures": {
+                    "type": "integer",
+                    "description": (
+                        "Stop the run after this many failing tests "
+                        "(default: run to completion)."
+                    ),
+                },
             },
             "required": ["command"],
         },
@@ -1308,6 +1465,46 @@ FORGE_TOOLS = [
             "required": ["name"],
         },
     },
+    {
+        "name": "forge_get_contracts",
+        "description": (
+            "Read SEVERAL project contracts in one call — prefer this over "
+            "repeated forge_get_contract calls. Optionally narrow each "
+            "contract to the sections you need: selectors match markdown "
+            "headings (or top-level YAML keys) by case-insensitive substring, "
+            "e.g. {\"physics\": [\"paths\"], \"schema\": [\"users\"]}. "
+            "'phases' requires a selector such as \"Phase 3\"."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "names": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": [
+                            "manifesto", "blueprint", "stack", "schema",
+                            "physics", "boundaries", "ui", "phases",
+                            "builder_directive",
+                        ],
+                    },
+                    "description": "Contracts to fetch.",
+                },
+                "sections": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "description": (
+                        "Optional: contract name → heading selectors. "
+                        "Contracts not listed here are returned whole."
+                    ),
+                },
+            },
+            "required": ["names"],
+        },
+    },
     {
         "name": "forge_get_phase_window",
         "description": (
@@ -37,6 +37,7 @@ import json
 import logging
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import tempfile
@@ -1431,8 +1432,23 @@ async def _run_tests(
             env=test_env,
         )
 
+    async def _warm_run() -> subprocess.CompletedProcess[str] | None:
+        """Run pytest on the workspace's warm worker; ``None`` → run cold."""
+        if cmd[:3] != ["python", "-m", "pytest"] or not settings.PYTEST_WORKER_ENABLED:
+            return None
+        from forge_ide.pytest_worker import run_pytest
+
+        warm = await run_pytest(
+            shlex.join(cmd), cwd=working_dir, env=test_env, timeout_s=120, fallback=False,
+        )
+        if warm is None:
+            return None
+        if warm.killed:
+            raise subprocess.TimeoutExpired(cmd, 120)
+        return subprocess.CompletedProcess(cmd, warm.exit_code, warm.stdout, warm.stderr)
+
     try:
-        result = await asyncio.to_thread(_blocking_run)
+        result = await _warm_run() or await asyncio.to_thread(_blocking_run)
         output = (result.stdout or "") + (result.stderr or "")
 
         # Limit log output to last 40 lines
@@ -4733,6 +4749,8 @@ async def _run_upgrade(
                 return
         wd = state.get("working_dir")
         if wd:
+            from forge_ide.pytest_worker import shutdown_workers
+            await shutdown_workers(wd)
             parent = str(Path(wd).parent)
             shutil.rmtree(parent, ignore_errors=True)
         _active_upgrades.pop(run_id, None)
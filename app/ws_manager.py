@@ -3,8 +3,23 @@
 import asyncio
 import json
 import logging
+import secrets
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
 from uuid import UUID
 
+try:
+    import msgpack  # optional — enables the compact binary encoding
+except ImportError:  # pragma: no cover - depends on environment
+    msgpack = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Heartbeat interval (seconds) — ping all connections periodically
@@ -16,6 +31,117 @@ MAX_CONNECTIONS_PER_USER = 3
 # Maximum inbound message size (bytes)
 MAX_MESSAGE_SIZE = 4096
 
+# Recent events retained per user for replay on reconnect (resume_from)
+REPLAY_BUFFER_SIZE = 500
+
+# Seconds a user's replay buffer outlives their last connection
+REPLAY_RETENTION_SECONDS = 600
+
+# Wire encodings a client may request with ?encoding=<name>.  JSON goes out
+# as text frames, msgpack as binary frames, so clients can tell them apart
+# without an extra handshake message.  Compression is negotiated separately
+# by the ASGI server (uvicorn enables permessage-deflate by default).
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+
+
+# ---------------------------------------------------------------------------
+# Wire-type registry — explicit converters for the non-JSON types that show
+# up in event payloads, so encoding never falls back to reflection.
+# ---------------------------------------------------------------------------
+
+_WIRE_TYPES: dict[type, Callable[[Any], Any]] = {
+    UUID: str,
+    datetime: str,
+    date: str,
+    Decimal: str,
+    PurePath: str,
+    Enum: lambda v: v.value,
+    set: list,
+    frozenset: list,
+    tuple: list,
+    bytes: lambda v: v.decode("utf-8", errors="replace"),
+}
+
+
+def register_wire_type(tp: type, converter: Callable[[Any], Any]) -> None:
+    """Register how values of *tp* are converted for the wire."""
+    _WIRE_TYPES[tp] = converter
+
+
+# Unregistered types already warned about, so each is logged only once
+_unregistered_wire_types: set[type] = set()
+
+
+def _wire_default(obj: Any) -> Any:
+    """``default`` hook for the JSON encoder.
+
+    Types without a registered converter go out as their ``str()`` and
+    are logged once per type, so a new payload type is noticed without
+    failing the progress event that carries it.
+    """
+    for tp in type(obj).__mro__:
+        converter = _WIRE_TYPES.get(tp)
+        if converter is not None:
+            return converter(obj)
+    if type(obj) not in _unregistered_wire_types:
+        _unregistered_wire_types.add(type(obj))
+        logger.warning(
+            "%s is not a registered wire type (see register_wire_type); sending str()",
+            type(obj).__name__,
+        )
+    return str(obj)
+
+
+def _encode_body(data: dict) -> str:
+    """JSON-encode an event without the ``seq``/``epoch`` envelope fields."""
+    return json.dumps(
+        {k: v for k, v in data.items() if k not in ("seq", "epoch")},
+        default=_wire_default,
+    )
+
+
+def _stamp(body: str, seq: int, epoch: str) -> str:
+    """Append the ``seq``/``epoch`` envelope to an encoded event *body*."""
+    envelope = f'"seq": {seq}, "epoch": {json.dumps(epoch)}}}'
+    return f"{body[:-1]}, {envelope}" if body != "{}" else "{" + envelope
+
+
+def available_encodings() -> list[str]:
+    """Return the wire encodings this server can produce."""
+    return [ENCODING_JSON, ENCODING_MSGPACK] if msgpack is not None else [ENCODING_JSON]
+
+
+def resolve_encoding(requested: str | None) -> str:
+    """Map a client-requested encoding to one the server supports."""
+    if requested and requested.lower() in available_encodings():
+        return requested.lower()
+    return ENCODING_JSON
+
+
+class _WireEvent:
+    """A sequenced event, created from its already-encoded JSON frame.
+
+    Only frames are kept — not the caller's dict — so buffered events cost
+    one encoded copy and later mutation of the payload cannot change what
+    is replayed.  The msgpack frame is built on first use from the JSON
+    frame, whose values are already plain wire types.
+    """
+
+    __slots__ = ("frames", "seq")
+
+    def __init__(self, seq: int, frame: str) -> None:
+        self.seq = seq
+        self.frames: dict[str, str | bytes] = {ENCODING_JSON: frame}
+
+    def frame(self, encoding: str) -> str | bytes:
+        cached = self.frames.get(encoding)
+        if cached is None:
+            # Only msgpack is ever missing — JSON is encoded up front
+            cached = msgpack.packb(json.loads(self.frames[ENCODING_JSON]), use_bin_type=True)
+            self.frames[encoding] = cached
+        return cached
+
 
 class ConnectionManager:
     """Manages active WebSocket connections keyed by user_id."""
@@ -23,6 +149,19 @@ class ConnectionManager:
     def __init__(self) -> None:
         self._connections: dict[str, list] = {}  # user_id -> list of websockets
         self._lock = asyncio.Lock()
+        # user_id -> ring buffer of recent events for resumable streams
+        self._replay: dict[str, deque[_WireEvent]] = {}
+        self._seq: dict[str, int] = {}
+        # user_id -> stream epoch; a fresh one whenever a user's seq restarts
+        # (new process or expired buffer), so stale resume_from values from
+        # an earlier stream are never matched against the new one
+        self._epochs: dict[str, str] = {}
+        # user_id -> monotonic time the user was last left without connections
+        self._idle_since: dict[str, float] = {}
+        # websocket -> live events held back while its replay is being sent
+        self._outbox: dict[Any, list[_WireEvent]] = {}
+        # websocket -> negotiated wire encoding (json when absent)
+        self._encodings: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         self._heartbeat_task: asyncio.Task | None = None
 
     # ── lifecycle ─────────────────────────────────────────────
@@ -44,12 +183,31 @@ class ConnectionManager:
 
     # ── connection management ─────────────────────────────────
 
-    async def connect(self, user_id: str, websocket) -> None:  # noqa: ANN001
+    async def connect(
+        self,
+        user_id: str,
+        websocket,
+        resume_from: int | None = None,
+        encoding: str = ENCODING_JSON,
+        epoch: str | None = None,
+    ) -> None:
         """Register a WebSocket connection for a user.
 
         Prunes dead connections first, then enforces
         MAX_CONNECTIONS_PER_USER — oldest connection is evicted
         when the limit is reached.
+
+        If *resume_from* is given, every buffered event with a sequence
+        number greater than it is replayed to the new socket before any
+        live event is delivered.  When the gap is no longer fully buffered,
+        or *epoch* is not the user's current stream epoch (the server
+        restarted or the buffer expired), a single ``resync_required``
+        message is sent instead so the client falls back to a full REST
+        reload.  The replay is sent outside the manager lock; live events
+        arriving meanwhile are queued for the socket and sent after it.
+
+        *encoding* selects the wire format for this socket (see
+        ``resolve_encoding``); unsupported values fall back to JSON.
         """
         async with self._lock:
             if user_id not in self._connections:
@@ -71,47 +229,169 @@ class ConnectionManager:
             conns[:] = alive
 
             # Evict oldest if at capacity
+            evicted: list = []
             while len(conns) >= MAX_CONNECTIONS_PER_USER:
-                oldest = conns.pop(0)
-                try:
-                    await oldest.close(code=1008, reason="Connection limit reached")
-                except Exception:
-                    pass
+                evicted.append(conns.pop(0))
 
             conns.append(websocket)
+            self._idle_since.pop(user_id, None)
+            encoding = resolve_encoding(encoding)
+            if encoding != ENCODING_JSON:
+                self._encodings[websocket] = encoding
+
+            # Snapshot the gap under the lock: send_to_user assigns sequence
+            # numbers under the same lock, and queues live events for this
+            # socket until the replay is out, so nothing overtakes it.
+            backlog: list[_WireEvent] = []
+            if resume_from is not None:
+                backlog = self._backlog(user_id, resume_from, epoch)
+                if backlog:
+                    self._outbox[websocket] = []
+
+        for ws in evicted:
+            try:
+                await ws.close(code=1008, reason="Connection limit reached")
+            except Exception:
+                pass
+        if backlog:
+            await self._replay_to(websocket, backlog)
+
+    def _backlog(self, user_id: str, resume_from: int, epoch: str | None) -> list[_WireEvent]:
+        """Events a client resuming after *resume_from* needs (caller holds the lock)."""
+        buffer = self._replay.get(user_id)
+        last_seq = self._seq.get(user_id, 0)
+        current = self._epochs.get(user_id)
+        if epoch == current and resume_from == last_seq:
+            return []  # client is already up to date
+        if (
+            epoch != current
+            or resume_from > last_seq
+            or not buffer
+            or buffer[0].seq > resume_from + 1
+        ):
+            # Gap fell out of the buffer, or the sequence belongs to an
+            # earlier stream — the client must reload state via REST.
+            return [_WireEvent(last_seq, json.dumps({
+                "type": "resync_required",
+                "payload": {"resume_from": resume_from, "seq": last_seq, "epoch": current},
+            }))]
+        return [event for event in buffer if event.seq > resume_from]
+
+    async def _replay_to(self, websocket, backlog: list[_WireEvent]) -> None:
+        """Send *backlog*, then the live events queued for *websocket* meanwhile."""
+        try:
+            for event in backlog:
+                await self._send_event(websocket, event)
+            while True:
+                async with self._lock:
+                    pending = self._outbox.get(websocket)
+                    if not pending:
+                        self._outbox.pop(websocket, None)
+                        return
+                    self._outbox[websocket] = []
+                for event in pending:
+                    await self._send_event(websocket, event)
+        except Exception:
+            # Dead socket — send_to_user / heartbeat will prune it
+            async with self._lock:
+                self._outbox.pop(websocket, None)
+
+    async def _send_event(self, websocket, event: _WireEvent) -> None:
+        """Send *event* to one socket in that socket's negotiated encoding."""
+        frame = event.frame(self._encodings.get(websocket, ENCODING_JSON))
+        if isinstance(frame, bytes):
+            await asyncio.wait_for(websocket.send_bytes(frame), timeout=5.0)
+        else:
+            await asyncio.wait_for(websocket.send_text(frame), timeout=5.0)
+
+    def last_seq(self, user_id: str) -> int:
+        """Return the most recently assigned event sequence number for a user."""
+        return self._seq.get(user_id, 0)
+
+    def stream_epoch(self, user_id: str) -> str | None:
+        """Return the epoch of a user's current event stream, if any."""
+        return self._epochs.get(user_id)
 
     def connection_count(self, user_id: str) -> int:
         """Return the number of active connections for a user (lock-free)."""
         return len(self._connections.get(user_id, []))
 
-    async def disconnect(self, user_id: str, websocket) -> None:  # noqa: ANN001
+    async def disconnect(self, user_id: str, websocket) -> None:
         """Remove a WebSocket connection for a user."""
         async with self._lock:
-            conns = self._connections.get(user_id, [])
-            if websocket in conns:
-                conns.remove(websocket)
-            if not conns:
-                self._connections.pop(user_id, None)
+            self._remove(user_id, [websocket])
+
+    def _remove(self, user_id: str, websockets: list) -> None:
+        """Drop *websockets* from a user's connections (caller holds the lock)."""
+        conns = self._connections.get(user_id, [])
+        for ws in websockets:
+            if ws in conns:
+                conns.remove(ws)
+            self._outbox.pop(ws, None)
+        if not conns:
+            self._connections.pop(user_id, None)
+            self._idle_since.setdefault(user_id, time.monotonic())
+
+    def _expire_streams(self) -> None:
+        """Free replay state of users without connections for longer than
+        REPLAY_RETENTION_SECONDS (caller holds the lock)."""
+        cutoff = time.monotonic() - REPLAY_RETENTION_SECONDS
+        for user_id, since in list(self._idle_since.items()):
+            if since <= cutoff and user_id not in self._connections:
+                del self._idle_since[user_id]
+                self._replay.pop(user_id, None)
+                self._seq.pop(user_id, None)
+                self._epochs.pop(user_id, None)
 
     async def send_to_user(self, user_id: str, data: dict) -> None:
-        """Send a JSON message to all connections for a specific user."""
+        """Send an event to all connections for a specific user.
+
+        Each event is stamped with a per-user, monotonically increasing
+        ``seq`` and kept in a bounded replay buffer so reconnecting
+        clients can resume from the last sequence number they saw.
+
+        Never raises for the payload: callers fire these events and move
+        on, so an event that cannot be encoded at all (e.g. a circular
+        reference) is logged and dropped without consuming a sequence
+        number.
+        """
+        # Encode outside the lock; only the envelope is added under it.
+        try:
+            body = _encode_body(data)
+        except (TypeError, ValueError) as exc:
+            logger.warning(
+                "Dropping unencodable %r event for user %s: %s", data.get("type"), user_id, exc,
+            )
+            return
         async with self._lock:
-            conns = list(self._connections.get(user_id, []))
-        message = json.dumps(data, default=str)
+            epoch = self._epochs.get(user_id)
+            if epoch is None:
+                epoch = self._epochs[user_id] = secrets.token_hex(4)
+            seq = self._seq.get(user_id, 0) + 1
+            event = _WireEvent(seq, _stamp(body, seq, epoch))
+            self._seq[user_id] = seq
+            buffer = self._replay.get(user_id)
+            if buffer is None:
+                buffer = self._replay[user_id] = deque(maxlen=REPLAY_BUFFER_SIZE)
+            buffer.append(event)
+            conns = []
+            for ws in self._connections.get(user_id, []):
+                queued = self._outbox.get(ws)
+                if queued is not None:
+                    queued.append(event)  # replay in flight — sent after it
+                else:
+                    conns.append(ws)
+            if user_id not in self._connections:
+                self._idle_since.setdefault(user_id, time.monotonic())
         dead = []
         for ws in conns:
             try:
-                await asyncio.wait_for(ws.send_text(message), timeout=5.0)
+                await self._send_event(ws, event)
             except Exception:
                 dead.append(ws)
         if dead:
             async with self._lock:
-                user_conns = self._connections.get(user_id, [])
-                for ws in dead:
-                    if ws in user_conns:
-                        user_conns.remove(ws)
-                if not user_conns:
-                    self._connections.pop(user_id, None)
+                self._remove(user_id, dead)
 
     async def broadcast_audit_update(self, user_id: str, audit_summary: dict) -> None:
         """Broadcast an audit_update event to the given user."""
@@ -143,6 +423,8 @@ class ConnectionManager:
             await asyncio.sleep(HEARTBEAT_INTERVAL)
             try:
                 await self._ping_all()
+                async with self._lock:
+                    self._expire_streams()
             except Exception:
                 logger.exception("Heartbeat sweep error")
 
@@ -160,12 +442,7 @@ class ConnectionManager:
                     dead.append(ws)
             if dead:
                 async with self._lock:
-                    user_conns = self._connections.get(uid, [])
-                    for ws in dead:
-                        if ws in user_conns:
-                            user_conns.remove(ws)
-                    if not user_conns:
-                        self._connections.pop(uid, None)
+                    self._remove(uid, dead)
 
 
 manager = ConnectionManager()
@@ -0,0 +1,32 @@
+-- 031: Materialized repo health rollup.
+-- get_repos_with_health used to recompute pass/total counts over the last 10
+-- completed audits per repo with a LATERAL subquery on every dashboard load.
+-- The rollup is refreshed transactionally by update_audit_run when an audit
+-- completes, so the dashboard list is a single indexed join.
+
+CREATE TABLE IF NOT EXISTS repo_health (
+    repo_id         UUID PRIMARY KEY REFERENCES repos(id) ON DELETE CASCADE,
+    last_audit_at   TIMESTAMPTZ,
+    pass_count      INTEGER NOT NULL DEFAULT 0,
+    total_count     INTEGER NOT NULL DEFAULT 0,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Backfill from existing audit history
+INSERT INTO repo_health (repo_id, last_audit_at, pass_count, total_count)
+SELECT r.id, h.last_audit_at, h.pass_count, h.total_count
+FROM repos r
+CROSS JOIN LATERAL (
+    SELECT
+        max(a.completed_at) AS last_audit_at,
+        count(*) FILTER (WHERE a.overall_result = 'PASS') AS pass_count,
+        count(*) AS total_count
+    FROM (
+        SELECT overall_result, completed_at
+        FROM audit_runs
+        WHERE repo_id = r.id AND status = 'completed'
+        ORDER BY created_at DESC
+        LIMIT 10
+    ) a
+) h
+ON CONFLICT (repo_id) DO NOTHING;
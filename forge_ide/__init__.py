@@ -25,11 +25,12 @@ Registry::
 Errors::
 
     IDEError, SandboxViolation, ToolTimeout,
-    ParseError, PatchConflict, ToolNotFound,
+    ParseError, PatchConflict, ToolNotFound, TransactionAborted,
 
 Workspace::
 
-    Workspace, FileEntry, WorkspaceSummary
+    Workspace, FileEntry, WorkspaceSummary,
+    SnapshotService  — incrementally maintained WorkspaceSnapshot
 
 Git operations::
 
@@ -49,19 +50,26 @@ File index::
 
 Runner::
 
-    ide_run, RunResult, validate_command
+    ide_run, RunResult, validate_command,
+    run_streaming, stream_process, StreamRunResult, RunProgress
+
+Pytest worker::
+
+    PytestWorker, run_pytest, get_worker, shutdown_workers,
+    parse_pytest_command
 
 Log parsers::
 
     summarise_pytest, summarise_npm_test, summarise_build,
     summarise_generic, auto_summarise, detect_parser,
-    PytestSummary, NpmTestSummary, BuildSummary, BuildIssue,
+    IncrementalSummariser, PytestSummary, NpmTestSummary, BuildSummary, BuildIssue,
     GenericSummary, TestFailure,
 
 Patch engine::
 
     Hunk, PatchResult, apply_patch, apply_multi_patch, parse_unified_diff,
     generate_diff, generate_multi_diff, diff_to_text,
+    PatchTransaction  — stage, validate and atomically commit multi-file edits
 
 Language intelligence::
 
@@ -73,7 +81,7 @@ Language intelligence::
 
 Relevance scoring::
 
-    RelatedFile, find_related,
+    RelatedFile, RelevanceIndex, find_related,
     score_import_graph, score_directory_proximity,
     score_name_similarity, score_recency,
 
@@ -82,6 +90,7 @@ Context packs::
     ContextPack, TargetFile, DependencySnippet, RepoSummary,
     assemble_pack, build_repo_summary, build_structure_tree,
     estimate_tokens, pack_to_text,
+    Tokenizer, count_tokens, set_tokenizer, approx_bpe_tokens,
 
 Response parser::
 
@@ -144,12 +153,16 @@ from forge_ide.context_pack import (
     DependencySnippet,
     RepoSummary,
     TargetFile,
+    Tokenizer,
+    approx_bpe_tokens,
     assemble_pack,
     build_context_pack_for_file,
     build_repo_summary,
     build_structure_tree,
+    count_tokens,
     estimate_tokens,
     pack_to_text,
+    set_tokenizer,
 )
 from forge_ide.contracts import (
     CheckSyntaxRequest,
@@ -181,6 +194,7 @@ from forge_ide.errors import (
     SandboxViolation,
     ToolNotFound,
     ToolTimeout,
+    TransactionAborted,
 )
 from forge_ide.diagnostics import detect_language, merge_diagnostics
 from forge_ide.diff_generator import diff_to_text, generate_diff, generate_multi_diff
@@ -202,6 +216,7 @@ from forge_ide.log_parser import (
     BuildIssue,
     BuildSummary,
     GenericSummary,
+    IncrementalSummariser,
     NpmTestSummary,
     PytestSummary,
     TestFailure,
@@ -234,6 +249,7 @@ from forge_ide.redactor import (
 from forge_ide.registry import Registry
 from forge_ide.relevance import (
     RelatedFile,
+    RelevanceIndex,
     find_related,
     score_directory_proximity,
     score_import_graph,
@@ -261,9 +277,17 @@ from forge_ide.journal import (
     SessionJournal,
     compute_snapshot_hash,
 )
-from forge_ide.runner import RunResult
+from forge_ide.runner import RunProgress, RunResult, StreamRunResult
 from forge_ide.runner import run as ide_run
-from forge_ide.runner import validate_command
+from forge_ide.runner import run_streaming, stream_process, validate_command
+from forge_ide.pytest_worker import (
+    PytestWorker,
+    get_worker,
+    parse_pytest_command,
+    run_pytest,
+    shutdown_workers,
+)
+from forge_ide.transaction import PatchTransaction
 from forge_ide.test_scope import (
     filter_existing,
     format_scoped_command,
@@ -282,6 +306,7 @@ from forge_ide.sanitiser import (
     strip_tmpdir,
 )
 from forge_ide.searcher import Match, search
+from forge_ide.snapshot_service import SnapshotService
 from forge_ide.workspace import (
     FileEntry,
     SchemaInventory,
@@ -341,6 +366,7 @@ __all__ = [
     "ParseError",
     "PatchConflict",
     "ToolNotFound",
+    "TransactionAborted",
     # Workspace
     "Workspace",
     "FileEntry",
@@ -351,6 +377,7 @@ __all__ = [
     "capture_snapshot",
     "update_snapshot",
     "snapshot_to_workspace_info",
+    "SnapshotService",
     # Git operations
     "git_ops",
     # Reader
@@ -367,6 +394,16 @@ __all__ = [
     "ide_run",
     "RunResult",
     "validate_command",
+    "run_streaming",
+    "stream_process",
+    "StreamRunResult",
+    "RunProgress",
+    # Pytest worker
+    "PytestWorker",
+    "run_pytest",
+    "get_worker",
+    "shutdown_workers",
+    "parse_pytest_command",
     # Log parsers
     "summarise_pytest",
     "summarise_npm_test",
@@ -374,6 +411,7 @@ __all__ = [
     "summarise_generic",
     "auto_summarise",
     "detect_parser",
+    "IncrementalSummariser",
     "PytestSummary",
     "NpmTestSummary",
     "BuildSummary",
@@ -391,6 +429,7 @@ __all__ = [
     "generate_diff",
     "generate_multi_diff",
     "diff_to_text",
+    "PatchTransaction",
     # Language intelligence
     "Symbol",
     "ImportInfo",
@@ -407,6 +446,7 @@ __all__ = [
     "detect_language",
     # Relevance scoring
     "RelatedFile",
+    "RelevanceIndex",
     "find_related",
     "score_import_graph",
     "score_directory_proximity",
@@ -423,6 +463,10 @@ __all__ = [
     "build_structure_tree",
     "estimate_tokens",
     "pack_to_text",
+    "Tokenizer",
+    "count_tokens",
+    "set_tokenizer",
+    "approx_bpe_tokens",
     # Response parser
     "ParsedResponse",
     "classify_response",
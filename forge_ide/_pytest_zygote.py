@@ -0,0 +1,210 @@
+"""Pytest zygote — a warm interpreter that forks one child per test run.
+
+Started by ``forge_ide.pytest_worker.PytestWorker`` as::
+
+    <project python> -u _pytest_zygote.py <workspace root>
+
+This file runs under the *project's* interpreter, not Forge's, so it
+imports nothing from ``forge_ide`` and sticks to the standard library.
+
+Protocol (JSON lines over stdin / stdout):
+
+- On start-up the zygote imports pytest, then writes
+  ``{"ready": true, "pid": ..., "pytest": "<version>"}``.
+- Each request ``{"args": [...], "output": "<path>", "timeout": s,
+  "module_mode": bool}`` forks a child that runs ``pytest.main(args)``
+  with stdout / stderr redirected to *output*.  The reply is
+  ``{"exit_code": n, "killed": bool}``.
+
+Workspace modules are never imported into the zygote itself, so every
+run sees the current source.  After a run, third-party modules the child
+imported (anything outside the workspace) are imported into the zygote
+so later forks inherit them warm.  ``pytest11`` plugin packages are the
+exception: pytest marks them for assertion rewriting at start-up and
+warns when they are already imported, so the children load them.
+"""
+
+import os
+import sys
+
+# ``python _pytest_zygote.py`` puts this directory first on ``sys.path``;
+# drop it so Forge's own modules never shadow same-named project modules.
+if sys.path and os.path.realpath(sys.path[0] or ".") == os.path.dirname(os.path.realpath(__file__)):
+    del sys.path[0]
+
+import contextlib
+import json
+import signal
+import time
+import traceback
+
+_POLL_S = 0.01
+
+
+_INSTALL_PREFIXES = tuple(
+    os.path.realpath(p) + os.sep for p in {sys.prefix, sys.base_prefix, sys.exec_prefix}
+)
+
+
+def _is_workspace_module(module, root):
+    """True when *module* was loaded from the workspace (a ``.venv`` inside
+    the workspace counts as installed, not workspace)."""
+    paths = [getattr(module, "__file__", None) or ""]
+    paths.extend(getattr(module, "__path__", None) or [])
+    for path in paths:
+        if not path:
+            continue
+        real = os.path.realpath(path)
+        if not real.startswith(root + os.sep) or real.startswith(_INSTALL_PREFIXES):
+            continue
+        if "site-packages" in real or "dist-packages" in real:
+            continue
+        return True
+    return False
+
+
+def _plugin_packages():
+    """Top-level names pytest marks for rewrite — those of every
+    distribution with a ``pytest11`` entry point."""
+    names = set()
+    try:
+        from importlib.metadata import distributions
+
+        for dist in distributions():
+            if not any(ep.group == "pytest11" for ep in dist.entry_points):
+                continue
+            for ep in dist.entry_points:
+                if ep.group == "pytest11":
+                    names.add(ep.value.split(":")[0].split(".")[0])
+            for path in dist.files or []:
+                parts = str(path).replace("\\", "/").split("/")
+                if parts[0] == "src" and len(parts) > 1:
+                    parts = parts[1:]
+                if len(parts) == 1 and parts[0].endswith(".py"):
+                    names.add(parts[0][:-3])
+                elif len(parts) == 2 and parts[1] == "__init__.py":
+                    names.add(parts[0])
+    except Exception:
+        pass
+    return names
+
+
+def _third_party_modules(root, known, skip):
+    names = []
+    for name, module in list(sys.modules.items()):
+        if name in known or module is None or name.startswith("__"):
+            continue
+        if name.split(".")[0] in skip:
+            continue
+        if not _is_workspace_module(module, root):
+            names.append(name)
+    return names
+
+
+def _child(request, root, known, skip, proto_fd):
+    """Body of the forked child — never returns."""
+    code = 3
+    try:
+        os.close(proto_fd)
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.close(devnull)
+        fd = os.open(request["output"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        os.close(fd)
+        if request.get("module_mode"):
+            sys.path.insert(0, root)  # what ``python -m pytest`` does
+        import pytest
+
+        code = int(pytest.main(list(request["args"])))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        warm_path = request["output"] + ".warm"
+        with open(warm_path, "w") as fh:
+            fh.write("\n".join(_third_party_modules(root, known, skip)))
+    except BaseException:
+        traceback.print_exc()
+        sys.stderr.flush()
+    os._exit(code)
+
+
+def _warm(path, root, known, skip):
+    """Import third-party modules the last child needed."""
+    try:
+        with open(path) as fh:
+            names = [n for n in fh.read().split("\n") if n]
+        os.unlink(path)
+    except OSError:
+        return
+    for name in sorted(names, key=lambda n: n.count(".")):
+        if name in sys.modules:
+            continue
+        try:
+            __import__(name)
+        except BaseException:
+            known.add(name)  # don't retry every run
+    for name in list(sys.modules):
+        module = sys.modules[name]
+        if module is None:
+            continue
+        if name.split(".")[0] in skip or _is_workspace_module(module, root):
+            del sys.modules[name]  # never keep workspace code or plugins in the zygote
+    known.update(sys.modules)
+
+
+def _run(request, root, known, skip, proto):
+    proto.flush()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        _child(request, root, known, skip, proto.fileno())
+    deadline = time.monotonic() + float(request.get("timeout") or 120)
+    killed = False
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            break
+        if time.monotonic() >= deadline:
+            with contextlib.suppress(OSError):
+                os.killpg(pid, signal.SIGKILL)
+            _, status = os.waitpid(pid, 0)
+            killed = True
+            break
+        time.sleep(_POLL_S)
+    exit_code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    if not killed:
+        _warm(request["output"] + ".warm", root, known, skip)
+    return {"exit_code": -1 if killed else exit_code, "killed": killed}
+
+
+def main():
+    root = os.path.realpath(sys.argv[1])
+    os.chdir(root)
+    # Keep the protocol channel private: anything printed by imports goes
+    # to /dev/null instead of corrupting the JSON stream.
+    proto = os.fdopen(os.dup(1), "w")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    import pytest
+
+    skip = _plugin_packages()
+    known = set(sys.modules)
+    proto.write(json.dumps({"ready": True, "pid": os.getpid(), "pytest": pytest.__version__}) + "\n")
+    proto.flush()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            reply = _run(json.loads(line), root, known, skip, proto)
+        except Exception as exc:
+            reply = {"exit_code": -1, "killed": False, "error": f"{type(exc).__name__}: {exc}"}
+        proto.write(json.dumps(reply) + "\n")
+        proto.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,9 @@ Call ``register_builtin_tools(registry)`` to wire all 7 into a
 
 from __future__ import annotations
 
+import logging
 import re
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from forge_ide.contracts import (
@@ -38,6 +40,35 @@ from app.services.tool_executor import (
 if TYPE_CHECKING:
     from forge_ide.registry import Registry
 
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Write events — lets e.g. SnapshotService track writes without polling
+# ---------------------------------------------------------------------------
+
+_write_listeners: list[Callable[[str, str], None]] = []
+
+
+def add_write_listener(listener: Callable[[str, str], None]) -> None:
+    """Call ``listener(working_dir, rel_path)`` after every successful write."""
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
+
+
+def remove_write_listener(listener: Callable[[str, str], None]) -> None:
+    """Unsubscribe a listener added with ``add_write_listener``."""
+    if listener in _write_listeners:
+        _write_listeners.remove(listener)
+
+
+def _notify_write(working_dir: str, rel_path: str) -> None:
+    for listener in list(_write_listeners):
+        try:
+            listener(working_dir, rel_path)
+        except Exception:
+            logger.exception("write listener failed for %s", rel_path)
+
 
 # ---------------------------------------------------------------------------
 # Individual adapters
@@ -147,6 +178,7 @@ def _adapt_write_file(req: WriteFileRequest, working_dir: str) -> ToolResponse:
 
     m_ok = _WRITE_OK_RE.match(raw)
     if m_ok:
+        _notify_write(working_dir, req.path)
         return ToolResponse.ok(
             {
                 "path": m_ok.group(2),
@@ -172,7 +204,8 @@ def _adapt_write_file(req: WriteFileRequest, working_dir: str) -> ToolResponse:
 
 async def _adapt_run_tests(req: RunTestsRequest, working_dir: str) -> ToolResponse:
     raw = await _exec_run_tests(
-        {"command": req.command, "timeout": req.timeout}, working_dir
+        {"command": req.command, "timeout": req.timeout, "max_failures": req.max_failures},
+        working_dir,
     )
 
     return _parse_command_output(raw, req.command)
@@ -15,6 +15,12 @@ the filesystem or spawn subprocesses.
 
 from __future__ import annotations
 
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import PurePosixPath
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -89,6 +95,89 @@ def estimate_tokens(text: str) -> int:
     return max(1, len(text) // 4)
 
 
+Tokenizer = Callable[[str], int]
+"""Returns the token count of a string — e.g. wraps ``tiktoken`` or a
+vendor tokenizer.  Must be deterministic for a given string."""
+
+# GPT-2 style pre-tokenisation: contractions, words, numbers, punctuation
+# runs and whitespace, each optionally carrying one leading space.
+_PRETOKEN_RE = re.compile(
+    r"""'(?:[sdmt]|ll|ve|re)| ?[A-Za-z]+| ?[0-9]+| ?[^\sA-Za-z0-9]+|\s+(?!\S)|\s+"""
+)
+
+# Token-count cache: keyed by a digest of the text (not the text itself, so
+# cached counts don't keep file contents alive), least recently used first.
+_TOKEN_CACHE_SIZE = 4096
+_TOKEN_CACHE_MAX_CHARS = 256_000  # larger texts are counted but not cached
+_token_cache: OrderedDict[bytes, int] = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def approx_bpe_tokens(text: str) -> int:
+    """Offline approximation of a byte-level BPE token count.
+
+    Splits *text* the way BPE tokenisers pre-tokenise, then charges each
+    piece by class: short words are one token and long identifiers about
+    one per four letters, numbers one per three digits, punctuation one
+    per two characters, and each whitespace run one token.  Unlike the
+    ``len/4`` heuristic this tracks punctuation- and indentation-heavy
+    source code, which ``len/4`` undercounts.
+    """
+    total = 0
+    for piece in _PRETOKEN_RE.findall(text):
+        body = piece.lstrip(" ") or piece
+        first = body[0]
+        n = len(body)
+        if first.isspace():
+            total += 1
+        elif first.isascii() and first.isalpha():
+            total += 1 if n <= 6 else (n + 3) // 4
+        elif first.isdigit():
+            total += (n + 2) // 3
+        else:
+            total += (n + 1) // 2
+    return total
+
+
+_tokenizer: Tokenizer = approx_bpe_tokens
+
+
+def set_tokenizer(tokenizer: Tokenizer | None) -> None:
+    """Install the tokenizer used by ``count_tokens`` and pack assembly.
+
+    ``None`` restores the built-in ``approx_bpe_tokens``.  Clears the
+    token-count cache.
+    """
+    global _tokenizer
+    _tokenizer = tokenizer or approx_bpe_tokens
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def _cached_count(text: str) -> int:
+    if len(text) > _TOKEN_CACHE_MAX_CHARS:
+        return _tokenizer(text)
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _token_cache_lock:
+        count = _token_cache.get(key)
+        if count is not None:
+            _token_cache.move_to_end(key)
+            return count
+    count = _tokenizer(text)
+    with _token_cache_lock:
+        _token_cache[key] = count
+        while len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return count
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the installed tokenizer (results are cached)."""
+    if not text:
+        return 0
+    return _cached_count(text)
+
+
 # ---------------------------------------------------------------------------
 # Structure tree builder
 # ---------------------------------------------------------------------------
@@ -212,15 +301,20 @@ def assemble_pack(
     2. target_files
     3. diagnostics_summary
 
-    Budget-trimmed (lowest-relevance items dropped first):
+    Budget-selected (highest value per token first):
     4. dependency_snippets
     5. related_snippets (assumed sorted by relevance descending)
     6. test_output, git_diff_summary
 
+    Each optional item is rendered once and costed with ``count_tokens``;
+    a 0/1 knapsack over those costs picks the most valuable subset that
+    fits, and the rendered fragments are joined without re-rendering the
+    pack.  Kept items stay in their original order.
+
     Parameters
     ----------
     budget_tokens:
-        Maximum token estimate for the pack.  0 or negative means
+        Maximum token count for the pack.  0 or negative means
         unlimited (no trimming).
     """
     target_files = target_files or []
@@ -228,16 +322,6 @@ def assemble_pack(
     related_snippets = list(related_snippets or [])
     repo_summary = repo_summary or RepoSummary()
 
-    # Always-included sections
-    core_text = pack_to_text(
-        ContextPack(
-            repo_summary=repo_summary,
-            target_files=target_files,
-            diagnostics_summary=diagnostics_summary,
-        )
-    )
-    core_tokens = estimate_tokens(core_text)
-
     # Start with unlimited budget if 0 or negative
     if budget_tokens <= 0:
         pack = ContextPack(
@@ -249,55 +333,162 @@ def assemble_pack(
             test_output=test_output,
             git_diff_summary=git_diff_summary,
         )
-        full_text = pack_to_text(pack)
-        return pack.model_copy(update={"token_estimate": estimate_tokens(full_text)})
-
-    # Budget-aware assembly
-    remaining = budget_tokens - core_tokens
-
-    # Add dependency snippets (high priority)
-    kept_deps: list[DependencySnippet] = []
-    for ds in dependency_snippets:
-        dep_tokens = estimate_tokens(ds.content)
-        if dep_tokens <= remaining:
-            kept_deps.append(ds)
-            remaining -= dep_tokens
-
-    # Add related snippets (already sorted by relevance, trim from end)
-    kept_related: list[Snippet] = []
-    for rs in related_snippets:
-        rs_tokens = estimate_tokens(rs.content)
-        if rs_tokens <= remaining:
-            kept_related.append(rs)
-            remaining -= rs_tokens
-
-    # Add test output
-    kept_test = ""
-    if test_output:
-        test_tokens = estimate_tokens(test_output)
-        if test_tokens <= remaining:
-            kept_test = test_output
-            remaining -= test_tokens
+        return pack.model_copy(update={"token_estimate": count_tokens(pack_to_text(pack))})
 
-    # Add git diff summary
-    kept_diff = ""
+    # Always-included sections
+    head = _render_head(repo_summary, target_files)
+    diag = _render_diagnostics(diagnostics_summary) if diagnostics_summary else ""
+    core_tokens = count_tokens(_join_sections(head, [], [], diag, "", ""))
+
+    items: list[_PackItem] = []
+    for i, ds in enumerate(dependency_snippets):
+        items.append(_PackItem(_DEPS, i, ds, _render_dependency(ds), _VALUE_DEPENDENCY))
+    for i, rs in enumerate(related_snippets):
+        items.append(_PackItem(_RELATED, i, rs, _render_related(rs), _VALUE_RELATED / (1 + i) ** 0.5))
+    if test_output:
+        items.append(_PackItem(_TEST, 0, test_output, _render_test_output(test_output), _VALUE_TEST_OUTPUT))
     if git_diff_summary:
-        diff_tokens = estimate_tokens(git_diff_summary)
-        if diff_tokens <= remaining:
-            kept_diff = git_diff_summary
-            remaining -= diff_tokens
+        items.append(_PackItem(_DIFF, 0, git_diff_summary, _render_git_diff(git_diff_summary), _VALUE_GIT_DIFF))
+
+    chosen = _select_items(items, budget_tokens - core_tokens)
+
+    # Token counts are only near-additive across joins; trim until the
+    # rendered whole (not just the sum of parts) fits.
+    while True:
+        text = _join_items(head, diag, chosen)
+        total = count_tokens(text)
+        if total <= budget_tokens or not chosen:
+            break
+        chosen.remove(min(chosen, key=lambda it: it.value / it.cost))
+
+    by_section: dict[str, list] = {_DEPS: [], _RELATED: [], _TEST: [""], _DIFF: [""]}
+    for it in sorted(chosen, key=lambda it: it.index):
+        if it.section in (_TEST, _DIFF):
+            by_section[it.section] = [it.source]
+        else:
+            by_section[it.section].append(it.source)
 
-    pack = ContextPack(
+    return ContextPack(
         repo_summary=repo_summary,
         target_files=target_files,
-        dependency_snippets=kept_deps,
-        related_snippets=kept_related,
+        dependency_snippets=by_section[_DEPS],
+        related_snippets=by_section[_RELATED],
         diagnostics_summary=diagnostics_summary,
-        test_output=kept_test,
-        git_diff_summary=kept_diff,
+        test_output=by_section[_TEST][0],
+        git_diff_summary=by_section[_DIFF][0],
+        token_estimate=total,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Budget selection
+# ---------------------------------------------------------------------------
+
+_DEPS = "deps"
+_RELATED = "related"
+_TEST = "test"
+_DIFF = "diff"
+
+# Relative worth of one item of each kind; related snippets additionally
+# decay with rank.
+_VALUE_DEPENDENCY = 4.0
+_VALUE_RELATED = 2.0
+_VALUE_TEST_OUTPUT = 1.5
+_VALUE_GIT_DIFF = 1.0
+
+# Knapsack capacity is bucketed to at most this many cells; item costs are
+# rounded up to whole buckets so the solution never overshoots.
+_KNAPSACK_RESOLUTION = 2000
+
+_SECTION_HEADERS = {_DEPS: "## Dependencies", _RELATED: "## Related"}
+
+
+class _PackItem:
+    """One optional piece of a pack, rendered once and costed once."""
+
+    __slots__ = ("cost", "index", "section", "source", "text", "value")
+
+    def __init__(self, section: str, index: int, source: object, text: str, value: float) -> None:
+        self.section = section
+        self.index = index
+        self.source = source
+        self.text = text
+        self.value = value
+        # +1 for the newline / blank line joining it to its neighbour
+        self.cost = count_tokens(text) + 1
+
+
+def _select_items(items: list[_PackItem], capacity: int) -> list[_PackItem]:
+    """Choose the highest-value subset of *items* whose cost fits *capacity*.
+
+    Shared section headers are reserved up front for every section that
+    has an affordable item, refunded for sections that end up empty, and
+    the leftover is topped up greedily by value per token.
+    """
+    header_cost = {sec: count_tokens(h) + 2 for sec, h in _SECTION_HEADERS.items()}
+    affordable = [it for it in items if it.cost <= capacity]
+    reserved = sum(
+        header_cost[sec] for sec in header_cost if any(it.section == sec for it in affordable)
+    )
+
+    chosen = _knapsack(affordable, capacity - reserved)
+    chosen_ids = {id(it) for it in chosen}
+    used = sum(it.cost for it in chosen)
+    open_sections = {it.section for it in chosen}
+    used += sum(cost for sec, cost in header_cost.items() if sec in open_sections)
+
+    for it in sorted(affordable, key=lambda it: it.value / it.cost, reverse=True):
+        if id(it) in chosen_ids:
+            continue
+        extra = it.cost
+        if it.section in header_cost and it.section not in open_sections:
+            extra += header_cost[it.section]
+        if used + extra <= capacity:
+            chosen.append(it)
+            chosen_ids.add(id(it))
+            open_sections.add(it.section)
+            used += extra
+    return chosen
+
+
+def _knapsack(items: list[_PackItem], capacity: int) -> list[_PackItem]:
+    """0/1 knapsack by dynamic programming over bucketed token costs."""
+    if capacity <= 0 or not items:
+        return []
+    scale = max(1, math.ceil(capacity / _KNAPSACK_RESOLUTION))
+    cap = capacity // scale
+    weights = [math.ceil(it.cost / scale) for it in items]
+
+    best = [0.0] * (cap + 1)
+    keep: list[bytearray] = []
+    for it, w in zip(items, weights, strict=True):
+        row = bytearray(cap + 1)
+        for c in range(cap, w - 1, -1):
+            candidate = best[c - w] + it.value
+            if candidate > best[c]:
+                best[c] = candidate
+                row[c] = 1
+        keep.append(row)
+
+    chosen: list[_PackItem] = []
+    c = cap
+    for i in range(len(items) - 1, -1, -1):
+        if keep[i][c]:
+            chosen.append(items[i])
+            c -= weights[i]
+    return chosen
+
+
+def _join_items(head: str, diag: str, chosen: list[_PackItem]) -> str:
+    ordered = sorted(chosen, key=lambda it: it.index)
+    return _join_sections(
+        head,
+        [it.text for it in ordered if it.section == _DEPS],
+        [it.text for it in ordered if it.section == _RELATED],
+        diag,
+        next((it.text for it in chosen if it.section == _TEST), ""),
+        next((it.text for it in chosen if it.section == _DIFF), ""),
     )
-    full_text = pack_to_text(pack)
-    return pack.model_copy(update={"token_estimate": estimate_tokens(full_text)})
 
 
 # ---------------------------------------------------------------------------
@@ -311,10 +502,39 @@ def pack_to_text(pack: ContextPack) -> str:
     The format is designed for prompt injection — clear section headers,
     fenced code blocks, and concise summaries.
     """
+    return _join_sections(
+        _render_head(pack.repo_summary, pack.target_files),
+        [_render_dependency(ds) for ds in pack.dependency_snippets],
+        [_render_related(rs) for rs in pack.related_snippets],
+        _render_diagnostics(pack.diagnostics_summary) if pack.diagnostics_summary else "",
+        _render_test_output(pack.test_output) if pack.test_output else "",
+        _render_git_diff(pack.git_diff_summary) if pack.git_diff_summary else "",
+    )
+
+
+def _join_sections(
+    head: str,
+    dependencies: list[str],
+    related: list[str],
+    diagnostics: str,
+    test_output: str,
+    git_diff: str,
+) -> str:
+    """Join pre-rendered section fragments in pack order."""
+    sections: list[str] = [head] if head else []
+    if dependencies:
+        sections.append("\n".join([_SECTION_HEADERS[_DEPS], *dependencies]))
+    if related:
+        sections.append("\n".join([_SECTION_HEADERS[_RELATED], *related]))
+    sections.extend(s for s in (diagnostics, test_output, git_diff) if s)
+    return "\n\n".join(sections)
+
+
+def _render_head(rs: RepoSummary, target_files: list[TargetFile]) -> str:
+    """Render the repo summary and target file sections."""
     sections: list[str] = []
 
     # Repo summary
-    rs = pack.repo_summary
     if rs.file_count or rs.structure_tree:
         lines = [f"## Repository ({rs.file_count} files)"]
         if rs.languages:
@@ -328,7 +548,7 @@ def pack_to_text(pack: ContextPack) -> str:
         sections.append("\n".join(lines))
 
     # Target files
-    for tf in pack.target_files:
+    for tf in target_files:
         header = f"## Target: {tf.path}"
         section_lines = [header, f"```\n{tf.content}\n```"]
         if tf.diagnostics:
@@ -337,57 +557,48 @@ def pack_to_text(pack: ContextPack) -> str:
                 section_lines.append(f"  L{d.line}: [{d.severity}] {d.message}")
         sections.append("\n".join(section_lines))
 
-    # Dependency snippets
-    if pack.dependency_snippets:
-        dep_lines = ["## Dependencies"]
-        for ds in pack.dependency_snippets:
-            dep_lines.append(f"### {ds.path} ({ds.why})")
-            dep_lines.append(f"```\n{ds.content}\n```")
-        sections.append("\n".join(dep_lines))
-
-    # Related snippets
-    if pack.related_snippets:
-        rel_lines = ["## Related"]
-        for rs_item in pack.related_snippets:
-            rel_lines.append(
-                f"### {rs_item.path} (L{rs_item.start_line}-{rs_item.end_line})"
-            )
-            rel_lines.append(f"```\n{rs_item.content}\n```")
-        sections.append("\n".join(rel_lines))
-
-    # Diagnostics summary
-    if pack.diagnostics_summary:
-        ds_item = pack.diagnostics_summary
-        diag_lines = [
-            f"## Diagnostics (E:{ds_item.error_count} W:{ds_item.warning_count})"
-        ]
-        for fpath, diags in ds_item.files.items():
-            for d in diags:
-                diag_lines.append(f"  {fpath}:{d.line} [{d.severity}] {d.message}")
-        sections.append("\n".join(diag_lines))
-
-    # Test output
-    if pack.test_output:
-        sections.append(f"## Test Output\n```\n{pack.test_output}\n```")
-
-    # Git diff
-    if pack.git_diff_summary:
-        sections.append(f"## Git Diff\n{pack.git_diff_summary}")
-
     return "\n\n".join(sections)
 
 
+def _render_dependency(ds: DependencySnippet) -> str:
+    return f"### {ds.path} ({ds.why})\n```\n{ds.content}\n```"
+
+
+def _render_related(rs: Snippet) -> str:
+    return f"### {rs.path} (L{rs.start_line}-{rs.end_line})\n```\n{rs.content}\n```"
+
+
+def _render_diagnostics(report: DiagnosticReport) -> str:
+    diag_lines = [f"## Diagnostics (E:{report.error_count} W:{report.warning_count})"]
+    for fpath, diags in report.files.items():
+        for d in diags:
+            diag_lines.append(f"  {fpath}:{d.line} [{d.severity}] {d.message}")
+    return "\n".join(diag_lines)
+
+
+def _render_test_output(text: str) -> str:
+    return f"## Test Output\n```\n{text}\n```"
+
+
+def _render_git_diff(text: str) -> str:
+    return f"## Git Diff\n{text}"
+
+
 __all__ = [
     "ContextPack",
     "DependencySnippet",
     "RepoSummary",
     "TargetFile",
+    "Tokenizer",
+    "approx_bpe_tokens",
     "assemble_pack",
     "build_context_pack_for_file",
     "build_repo_summary",
     "build_structure_tree",
+    "count_tokens",
     "estimate_tokens",
     "pack_to_text",
+    "set_tokenizer",
 ]
 
 
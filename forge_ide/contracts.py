@@ -10,7 +10,10 @@ execution (Phase 41).
 
 from __future__ import annotations
 
+import asyncio
 import enum
+import heapq
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import datetime, timezone
 from typing import Annotated, Any, Literal
 
@@ -133,13 +136,15 @@ class TaskStatus(str, enum.Enum):
 class TaskNode:
     """A single task in the build DAG.
 
-    Mutable — status transitions happen during the build loop.
+    Mutable — status transitions happen during the build loop.  Status
+    changes (including direct assignment) are reported to the owning
+    :class:`TaskDAG` so its ready queue stays current.
     """
 
     __slots__ = (
-        "id", "title", "phase", "status", "depends_on", "blocks",
+        "id", "title", "phase", "_status", "depends_on", "blocks",
         "file_path", "estimated_tokens", "actual_tokens",
-        "started_at", "completed_at", "error", "retry_count",
+        "started_at", "completed_at", "error", "retry_count", "_dag",
     )
 
     def __init__(
@@ -159,10 +164,11 @@ class TaskNode:
         error: str | None = None,
         retry_count: int = 0,
     ) -> None:
+        self._dag: TaskDAG | None = None
         self.id = id
         self.title = title
         self.phase = phase
-        self.status = status
+        self._status = status
         self.depends_on: list[str] = depends_on or []
         self.blocks: list[str] = blocks or []
         self.file_path = file_path
@@ -173,6 +179,17 @@ class TaskNode:
         self.error = error
         self.retry_count = retry_count
 
+    @property
+    def status(self) -> TaskStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: TaskStatus) -> None:
+        old = self._status
+        self._status = value
+        if self._dag is not None and old != value:
+            self._dag._on_status_change(self, old)
+
     # -- serialisation -------------------------------------------------------
 
     def to_dict(self) -> dict[str, Any]:
@@ -218,6 +235,13 @@ class CyclicDependencyError(ValueError):
     """Raised when the task DAG contains a cycle."""
 
 
+# Statuses that satisfy a dependency edge.
+_DONE_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.SKIPPED})
+
+# Ready-queue ordering policies accepted by TaskDAG.run / pop_ready.
+SchedulingPolicy = Literal["critical_path", "largest_first", "fifo"]
+
+
 class TaskDAG:
     """Directed acyclic graph of build tasks.
 
@@ -226,18 +250,36 @@ class TaskDAG:
 
     Nodes are mutable :class:`TaskNode` instances; the DAG enforces
     transition rules and dependency ordering.
+
+    Scheduling is event-driven: every node keeps a count of unmet
+    dependencies, and status transitions update the counts of its
+    direct dependents and a ready queue.  Dispatching a whole graph
+    therefore costs O(V+E) rather than a rescan per step.
     """
 
-    __slots__ = ("nodes",)
+    __slots__ = (
+        "_critical_path", "_dependents", "_dirty", "_heap", "_order",
+        "_policy", "_ready", "_unmet", "nodes",
+    )
 
     def __init__(self) -> None:
         self.nodes: dict[str, TaskNode] = {}
+        self._dirty = True
+        self._order: dict[str, int] = {}
+        self._dependents: dict[str, list[str]] = {}
+        self._unmet: dict[str, int] = {}
+        self._ready: set[str] = set()
+        self._heap: list[tuple[tuple[float, ...], str]] = []
+        self._policy: SchedulingPolicy = "critical_path"
+        self._critical_path: dict[str, int] = {}
 
     # -- construction --------------------------------------------------------
 
     def add_task(self, node: TaskNode) -> None:
         """Add a task to the DAG."""
         self.nodes[node.id] = node
+        node._dag = self
+        self._dirty = True
 
     def wire_blocks(self) -> None:
         """Compute the reverse ``blocks`` edges from ``depends_on``.
@@ -252,6 +294,7 @@ class TaskDAG:
                 dep = self.nodes.get(dep_id)
                 if dep is not None and n.id not in dep.blocks:
                     dep.blocks.append(n.id)
+        self._dirty = True
 
     @classmethod
     def from_manifest(
@@ -265,26 +308,30 @@ class TaskDAG:
         Each entry in *manifest* is a dict with at least ``path``
         and optionally ``depends_on``, ``purpose``, ``estimated_lines``.
         """
+        def _task_id(i: int) -> str:
+            return f"p{phase_label}_t{i}" if phase_label else f"t{i}"
+
+        # First occurrence wins, matching the original linear scan.
+        index_by_path: dict[str, int] = {}
+        for i, entry in enumerate(manifest):
+            index_by_path.setdefault(entry["path"], i)
+
         dag = cls()
         for i, entry in enumerate(manifest):
             path = entry["path"]
-            task_id = f"p{phase_label}_t{i}" if phase_label else f"t{i}"
             est_lines = entry.get("estimated_lines", 100)
             # Rough token estimate: ~4 tokens per line of output
             est_tokens = est_lines * 4
 
             # Map depends_on file paths → task IDs
-            dep_paths = entry.get("depends_on", [])
-            dep_ids: list[str] = []
-            for dp in dep_paths:
-                for j, other in enumerate(manifest):
-                    if other["path"] == dp:
-                        other_id = f"p{phase_label}_t{j}" if phase_label else f"t{j}"
-                        dep_ids.append(other_id)
-                        break
+            dep_ids = [
+                _task_id(index_by_path[dp])
+                for dp in entry.get("depends_on", [])
+                if dp in index_by_path
+            ]
 
             node = TaskNode(
-                id=task_id,
+                id=_task_id(i),
                 title=entry.get("purpose", f"Generate {path}"),
                 phase=phase_label,
                 file_path=path,
@@ -301,17 +348,37 @@ class TaskDAG:
 
     def get_ready_tasks(self) -> list[TaskNode]:
         """Return tasks whose dependencies are all completed/skipped."""
-        ready: list[TaskNode] = []
-        for n in self.nodes.values():
-            if n.status != TaskStatus.PENDING:
-                continue
-            if all(
-                self.nodes[d].status in (TaskStatus.COMPLETED, TaskStatus.SKIPPED)
-                for d in n.depends_on
-                if d in self.nodes
-            ):
-                ready.append(n)
-        return ready
+        self._ensure_index()
+        return [self.nodes[nid] for nid in sorted(self._ready, key=self._order.__getitem__)]
+
+    def pop_ready(self, policy: SchedulingPolicy | None = None) -> TaskNode | None:
+        """Return the highest-priority ready task, or ``None``.
+
+        The task stays PENDING; callers are expected to move it on with
+        :meth:`mark_in_progress` (or another transition) before popping
+        again.  *policy* selects the ordering:
+
+        - ``"critical_path"`` — longest remaining token-weighted chain first,
+          then largest task (default; minimises makespan).
+        - ``"largest_first"`` — largest ``estimated_tokens`` first.
+        - ``"fifo"`` — manifest order.
+        """
+        self._ensure_index()
+        if policy is not None and policy != self._policy:
+            self._policy = policy
+            self._heap = [(self._priority(nid), nid) for nid in self._ready]
+            heapq.heapify(self._heap)
+        while self._heap:
+            _, nid = self._heap[0]
+            if nid in self._ready:
+                return self.nodes[nid]
+            heapq.heappop(self._heap)  # stale entry
+        return None
+
+    def critical_path_tokens(self, task_id: str) -> int:
+        """Estimated tokens on the longest chain starting at *task_id*."""
+        self._ensure_index()
+        return self._critical_path.get(task_id, 0)
 
     def get_blocked_by(self, task_id: str) -> list[TaskNode]:
         """Return all tasks transitively blocked by *task_id*."""
@@ -338,25 +405,30 @@ class TaskDAG:
         temp: set[str] = set()
         order: list[TaskNode] = []
 
-        def _visit(nid: str) -> None:
-            if nid in temp:
-                raise CyclicDependencyError(
-                    f"Cycle detected involving task {nid!r}"
-                )
-            if nid in visited:
-                return
-            temp.add(nid)
-            node = self.nodes[nid]
-            for dep in node.depends_on:
-                if dep in self.nodes:
-                    _visit(dep)
-            temp.discard(nid)
-            visited.add(nid)
-            order.append(node)
-
-        for nid in self.nodes:
-            if nid not in visited:
-                _visit(nid)
+        # Iterative post-order DFS — deep dependency chains in large
+        # manifests would otherwise hit the recursion limit.
+        for root in self.nodes:
+            if root in visited:
+                continue
+            temp.add(root)
+            stack: list[tuple[str, Iterator[str]]] = [(root, iter(self.nodes[root].depends_on))]
+            while stack:
+                nid, deps = stack[-1]
+                for dep in deps:
+                    if dep not in self.nodes or dep in visited:
+                        continue
+                    if dep in temp:
+                        raise CyclicDependencyError(
+                            f"Cycle detected involving task {dep!r}"
+                        )
+                    temp.add(dep)
+                    stack.append((dep, iter(self.nodes[dep].depends_on)))
+                    break
+                else:
+                    stack.pop()
+                    temp.discard(nid)
+                    visited.add(nid)
+                    order.append(self.nodes[nid])
         return order
 
     # -- state transitions ---------------------------------------------------
@@ -380,7 +452,7 @@ class TaskDAG:
         node.status = TaskStatus.FAILED
         node.error = error
         node.completed_at = datetime.now(timezone.utc)
-        # Cascade: block all downstream tasks
+        # Cascade: block all downstream tasks (each descendant visited once)
         for blocked in self.get_blocked_by(task_id):
             if blocked.status == TaskStatus.PENDING:
                 blocked.status = TaskStatus.BLOCKED
@@ -397,22 +469,68 @@ class TaskDAG:
 
         Returns the list of tasks that were unblocked.
         """
+        self._ensure_index()
         unblocked: list[TaskNode] = []
         for blocked in self.get_blocked_by(task_id):
             if blocked.status != TaskStatus.BLOCKED:
                 continue
-            # Check if ALL deps are now completed/skipped
-            all_met = all(
-                self.nodes[d].status in (TaskStatus.COMPLETED, TaskStatus.SKIPPED)
-                for d in blocked.depends_on
-                if d in self.nodes
-            )
-            if all_met:
+            # All deps completed/skipped ⇔ no unmet dependency edges left
+            if self._unmet[blocked.id] == 0:
                 blocked.status = TaskStatus.PENDING
                 blocked.error = None
                 unblocked.append(blocked)
         return unblocked
 
+    # -- async driver --------------------------------------------------------
+
+    async def run(
+        self,
+        executor: Callable[[TaskNode], Awaitable[int | None]],
+        *,
+        concurrency: int = 4,
+        policy: SchedulingPolicy = "critical_path",
+    ) -> DAGProgress:
+        """Dispatch every runnable task through *executor*.
+
+        Up to *concurrency* tasks run at once; a task starts as soon as its
+        own dependencies are satisfied.  *executor* receives the node and
+        may return the actual token count.  An exception marks the task
+        failed (blocking its dependents); tasks the executor transitions
+        itself (e.g. ``mark_skipped``) are left as they are.
+
+        Returns the final :class:`DAGProgress`.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        running: dict[asyncio.Task[int | None], str] = {}
+        try:
+            while True:
+                while len(running) < concurrency:
+                    node = self.pop_ready(policy)
+                    if node is None:
+                        break
+                    self.mark_in_progress(node.id)
+                    running[asyncio.ensure_future(executor(node))] = node.id
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    tid = running.pop(fut)
+                    if self.nodes[tid].status != TaskStatus.IN_PROGRESS:
+                        continue  # executor already settled the task
+                    if fut.cancelled():
+                        self.mark_failed(tid, "Task cancelled")
+                        continue
+                    exc = fut.exception()
+                    if exc is not None:
+                        self.mark_failed(tid, str(exc) or type(exc).__name__)
+                    else:
+                        self.mark_completed(tid, actual_tokens=int(fut.result() or 0))
+        finally:
+            for fut in running:
+                fut.cancel()
+        return self.get_progress()
+
     # -- progress ------------------------------------------------------------
 
     def get_progress(self) -> DAGProgress:
@@ -454,6 +572,79 @@ class TaskDAG:
 
     # -- internals -----------------------------------------------------------
 
+    def _ensure_index(self) -> None:
+        if self._dirty:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Recompute dependency counters, ready set and priorities (O(V+E))."""
+        self._order = {nid: i for i, nid in enumerate(self.nodes)}
+        self._dependents = {nid: [] for nid in self.nodes}
+        self._unmet = {}
+        for nid, node in self.nodes.items():
+            deps = {d for d in node.depends_on if d in self.nodes}
+            unmet = 0
+            for d in deps:
+                self._dependents[d].append(nid)
+                if self.nodes[d].status not in _DONE_STATUSES:
+                    unmet += 1
+            self._unmet[nid] = unmet
+
+        # Token-weighted longest chain from each node to a sink, computed in
+        # reverse Kahn order.  Nodes on a cycle keep just their own weight.
+        remaining = {nid: len(deps) for nid, deps in self._dependents.items()}
+        frontier = [nid for nid, n in remaining.items() if n == 0]
+        cp = {nid: node.estimated_tokens for nid, node in self.nodes.items()}
+        while frontier:
+            nid = frontier.pop()
+            for d in {d for d in self.nodes[nid].depends_on if d in self.nodes}:
+                own = self.nodes[d].estimated_tokens
+                if own + cp[nid] > cp[d]:
+                    cp[d] = own + cp[nid]
+                remaining[d] -= 1
+                if remaining[d] == 0:
+                    frontier.append(d)
+        self._critical_path = cp
+
+        self._ready = {
+            nid for nid, node in self.nodes.items()
+            if node.status == TaskStatus.PENDING and self._unmet[nid] == 0
+        }
+        self._heap = [(self._priority(nid), nid) for nid in self._ready]
+        heapq.heapify(self._heap)
+        self._dirty = False
+
+    def _priority(self, nid: str) -> tuple[float, ...]:
+        order = self._order[nid]
+        if self._policy == "fifo":
+            return (order,)
+        tokens = self.nodes[nid].estimated_tokens
+        if self._policy == "largest_first":
+            return (-tokens, order)
+        return (-self._critical_path.get(nid, tokens), -tokens, order)
+
+    def _refresh_ready(self, node: TaskNode) -> None:
+        nid = node.id
+        if node.status == TaskStatus.PENDING and self._unmet[nid] == 0:
+            if nid not in self._ready:
+                self._ready.add(nid)
+                heapq.heappush(self._heap, (self._priority(nid), nid))
+        else:
+            self._ready.discard(nid)
+
+    def _on_status_change(self, node: TaskNode, old: TaskStatus) -> None:
+        """Propagate a status transition to dependent counters and the ready set."""
+        if self._dirty or node.id not in self._unmet:
+            return  # index will be rebuilt lazily
+        was_done = old in _DONE_STATUSES
+        is_done = node.status in _DONE_STATUSES
+        if was_done != is_done:
+            delta = -1 if is_done else 1
+            for dep_id in self._dependents[node.id]:
+                self._unmet[dep_id] += delta
+                self._refresh_ready(self.nodes[dep_id])
+        self._refresh_ready(node)
+
     def _detect_cycles(self) -> None:
         """Raise :class:`CyclicDependencyError` if the graph has a cycle."""
         try:
@@ -557,6 +748,9 @@ class RunTestsRequest(BaseModel):
 
     command: str = Field(..., min_length=1, description="Test command to run")
     timeout: int = Field(default=120, ge=1, le=300, description="Timeout in seconds")
+    max_failures: int | None = Field(
+        default=None, ge=1, description="Stop after this many failing tests",
+    )
 
 
 class CheckSyntaxRequest(BaseModel):
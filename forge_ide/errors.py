@@ -113,3 +113,27 @@ class ToolNotFound(IDEError):
             f"Tool '{tool_name}' not found. Available: {', '.join(available_tools)}",
             detail={"tool_name": tool_name, "available_tools": available_tools},
         )
+
+
+class TransactionAborted(IDEError):
+    """A multi-file patch transaction was rejected or rolled back.
+
+    Raised before anything touches disk when validation fails or a file
+    changed underneath the transaction, and after rollback when a commit
+    fails part-way.
+    """
+
+    def __init__(
+        self,
+        reason: str,
+        *,
+        paths: list[str] | None = None,
+        diagnostics: list[dict] | None = None,
+    ) -> None:
+        self.reason = reason
+        self.paths = paths or []
+        self.diagnostics = diagnostics or []
+        detail: dict = {"reason": reason, "paths": self.paths}
+        if self.diagnostics:
+            detail["diagnostics"] = self.diagnostics
+        super().__init__(f"Transaction aborted: {reason}", detail=detail)
@@ -10,11 +10,15 @@ from __future__ import annotations
 import ast
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from forge_ide.workspace import Workspace, _detect_language
 
+if TYPE_CHECKING:
+    from forge_ide.relevance import RelatedFile, RelevanceIndex
+
 # ---------------------------------------------------------------------------
 # Models
 # ---------------------------------------------------------------------------
@@ -45,13 +49,14 @@ class FileIndex:
     Selective invalidation on file changes.
     """
 
-    __slots__ = ("_workspace", "_index", "_import_graph", "_reverse_graph")
+    __slots__ = ("_workspace", "_index", "_import_graph", "_reverse_graph", "_relevance")
 
     def __init__(self, workspace: Workspace) -> None:
         self._workspace = workspace
         self._index: dict[str, FileMetadata] = {}
         self._import_graph: dict[str, list[str]] = {}
         self._reverse_graph: dict[str, list[str]] = {}
+        self._relevance: RelevanceIndex | None = None
 
     # -- Factory ------------------------------------------------------------
 
@@ -124,6 +129,21 @@ class FileIndex:
             counts[meta.language] = counts.get(meta.language, 0) + 1
         return counts
 
+    def relevance_index(self) -> RelevanceIndex:
+        """Return the relevance index, building it on first use.
+
+        Kept current by ``invalidate_file`` from then on.
+        """
+        if self._relevance is None:
+            from forge_ide.relevance import RelevanceIndex
+
+            self._relevance = RelevanceIndex.build(self._index.values(), self._import_graph)
+        return self._relevance
+
+    def find_related(self, rel_path: str, *, max_results: int = 15) -> list[RelatedFile]:
+        """Return files related to *rel_path*, ranked as ``find_related`` does."""
+        return self.relevance_index().related(rel_path, max_results=max_results)
+
     # -- Invalidation -------------------------------------------------------
 
     def invalidate_file(self, rel_path: str) -> None:
@@ -173,6 +193,10 @@ class FileIndex:
                 self._import_graph[rel_path] = list(imports)
 
         self._rebuild_reverse_graph()
+        if self._relevance is not None:
+            self._relevance.update_file(
+                rel_path, self._index.get(rel_path), self._import_graph.get(rel_path, ()),
+            )
 
     # -- Internal -----------------------------------------------------------
 
@@ -10,6 +10,9 @@ Supported parsers:
 - ``summarise_build``   — compiler / build tool output → ``BuildSummary``
 - ``summarise_generic`` — any output → ``GenericSummary`` (head + tail + error lines)
 - ``auto_summarise``    — detect parser from command, then dispatch
+
+``IncrementalSummariser`` is the streaming counterpart: it is fed one
+line at a time while a command runs and keeps live counts.
 """
 
 from __future__ import annotations
@@ -445,3 +448,182 @@ def auto_summarise(
     if parser == "build":
         return summarise_build(stdout, stderr)
     return summarise_generic(stdout, stderr)
+
+
+# ---------------------------------------------------------------------------
+# Incremental parsing
+# ---------------------------------------------------------------------------
+
+# Live per-test result lines: ``path::test PASSED`` (``-v``) or
+# ``[gw0] [ 10%] PASSED path::test`` (xdist).
+_LIVE_PYTEST_VERBOSE_RE = re.compile(
+    r"^(?:(\S+::\S.*?)\s+(PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)\b"
+    r"|(?:\[\S+\]\s+)+(?:\[\s*\d+%\]\s+)?(PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)\s+(\S+::\S+))",
+)
+# Progress-dot lines: ``tests/test_x.py ..F.s  [ 40%]``, or ``..F.s  [ 40%]`` under ``-q``
+_LIVE_PYTEST_PROGRESS_RE = re.compile(
+    r"^(?:\S+\.py\s+([.FEsxX]+)\s*(?:\[\s*\d+%\])?|([.FEsxX]+)\s*\[\s*\d+%\])\s*$",
+)
+# Section banners after which pytest reports rather than runs
+_LIVE_PYTEST_REPORT_RE = re.compile(
+    r"^=+ (?:FAILURES|ERRORS|short test summary info|warnings summary) =+$",
+)
+_LIVE_PYTEST_KEEP_RE = re.compile(r"FAILED\s|ERROR collecting ")
+_LIVE_NPM_KEEP_RE = re.compile(r"FAIL\s|\u00d7|✕|●|^\s*Tests?\b|^\s*Test (?:Files|Suites)\b")
+_LIVE_NPM_PASS_RE = re.compile(r"^\s*[✓√]\s")
+_LIVE_NPM_FAIL_RE = re.compile(r"^\s*[\u00d7✕]\s")
+
+_PYTEST_STATUS_FIELD: dict[str, str] = {
+    "PASSED": "passed", "XFAIL": "skipped", "XPASS": "passed",
+    "FAILED": "failed", "ERROR": "errors", "SKIPPED": "skipped",
+    ".": "passed", "x": "skipped", "X": "passed",
+    "F": "failed", "E": "errors", "s": "skipped",
+}
+
+MAX_KEPT_LINES: int = 500
+
+
+class IncrementalSummariser:
+    """Line-at-a-time counterpart of ``summarise_pytest`` / ``summarise_npm_test``.
+
+    ``feed()`` keeps live pass/fail counts while a command is still
+    running and retains only the lines the final parser needs (failure
+    lines, collection errors, the closing counts line), so the full
+    output never has to be held in memory.  ``summary()`` runs the
+    regular parser over those retained lines.
+
+    ``build`` and ``generic`` output is not line-classifiable in the
+    same way; for those parsers ``summary()`` parses whatever text the
+    caller passes in (typically the bounded output it kept).
+
+    Parameters
+    ----------
+    parser : str
+        Parser name as returned by ``detect_parser``.
+    """
+
+    __slots__ = (
+        "_counts_line",
+        "_failed_ids",
+        "_in_report",
+        "_kept",
+        "errors",
+        "failed",
+        "lines_seen",
+        "parser",
+        "passed",
+        "skipped",
+    )
+
+    def __init__(self, parser: Literal["pytest", "npm", "build", "generic"]) -> None:
+        self.parser = parser
+        self.passed = 0
+        self.failed = 0
+        self.errors = 0
+        self.skipped = 0
+        self.lines_seen = 0
+        self._kept: list[str] = []
+        self._failed_ids: list[str] = []
+        self._counts_line = ""
+        self._in_report = False
+
+    @property
+    def failures(self) -> int:
+        """Failed plus errored tests observed so far."""
+        return self.failed + self.errors
+
+    def feed(self, line: str) -> bool:
+        """Consume one output line; return ``True`` when the live counts changed."""
+        self.lines_seen += 1
+        line = line.rstrip("\r\n")
+        if self.parser == "pytest":
+            return self._feed_pytest(line)
+        if self.parser == "npm":
+            return self._feed_npm(line)
+        return False
+
+    def summary(
+        self, stdout: str = "", stderr: str = "",
+    ) -> PytestSummary | NpmTestSummary | BuildSummary | GenericSummary:
+        """Return the final structured summary.
+
+        *stdout* / *stderr* are only consulted for the ``build`` and
+        ``generic`` parsers.  A pytest run that never printed its closing
+        counts line (killed, or stopped early) reports the live counts.
+        """
+        if self.parser == "pytest":
+            kept = "\n".join(self._kept + ([self._counts_line] if self._counts_line else []))
+            result = summarise_pytest(kept)
+            if not self._counts_line:
+                failures = result.failures or [
+                    TestFailure(test_name=name, file=file)
+                    for file, _, name in (nid.partition("::") for nid in self._failed_ids)
+                ]
+                result = result.model_copy(update={
+                    "failures": failures,
+                    "passed": self.passed,
+                    "failed": self.failed,
+                    "errors": self.errors,
+                    "skipped": self.skipped,
+                    "total": self.passed + self.failed + self.errors + self.skipped,
+                })
+            return result
+        if self.parser == "npm":
+            return summarise_npm_test("\n".join(self._kept))
+        if self.parser == "build":
+            return summarise_build(stdout, stderr)
+        return summarise_generic(stdout, stderr)
+
+    # -- Internals ----------------------------------------------------------
+
+    def _keep(self, line: str) -> None:
+        if len(self._kept) < MAX_KEPT_LINES:
+            self._kept.append(line)
+
+    def _feed_pytest(self, line: str) -> bool:
+        if _LIVE_PYTEST_REPORT_RE.match(line):
+            self._in_report = True
+        if self._in_report and _LIVE_PYTEST_KEEP_RE.search(line):
+            self._keep(line)
+        if _PYTEST_COUNTS_RE.search(line) and (
+            self._in_report or _PYTEST_SUMMARY_RE.search(line)
+        ):
+            self._counts_line = line
+            return False
+        if self._in_report:
+            return False
+        m = _LIVE_PYTEST_VERBOSE_RE.match(line)
+        if m:
+            node_id = m.group(1) or m.group(4)
+            status = m.group(2) or m.group(3)
+            if status in ("FAILED", "ERROR") and len(self._failed_ids) < MAX_KEPT_LINES:
+                self._failed_ids.append(node_id)
+            return self._bump(status)
+        m = _LIVE_PYTEST_PROGRESS_RE.match(line)
+        if m:
+            for ch in m.group(1) or m.group(2):
+                self._bump(ch)
+            return True
+        return False
+
+    def _feed_npm(self, line: str) -> bool:
+        if _LIVE_NPM_KEEP_RE.search(line):
+            self._keep(line)
+        if _LIVE_NPM_PASS_RE.match(line):
+            self.passed += 1
+            return True
+        if _LIVE_NPM_FAIL_RE.match(line):
+            self.failed += 1
+            return True
+        return False
+
+    def _bump(self, status: str) -> bool:
+        field = _PYTEST_STATUS_FIELD[status]
+        setattr(self, field, getattr(self, field) + 1)
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"IncrementalSummariser(parser={self.parser!r}, passed={self.passed}, "
+            f"failed={self.failed}, errors={self.errors}, skipped={self.skipped})"
+        )
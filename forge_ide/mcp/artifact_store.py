@@ -18,27 +18,47 @@ seal        ForgeSeal / integrity envelopes
 
 Storage
 -------
-Primary  : in-process dict (survives for the lifetime of the MCP server process).
-Secondary: optional disk persistence under .forge_artifacts/ for cross-session
-           durability.  Disk writes are best-effort; failures are swallowed.
+Memory : LRU tier bounded by ARTIFACT_MEMORY_MAX_BYTES.  Entries carry their
+         size (measured once, on store) and a TTL; the least recently used
+         are evicted when the budget is exceeded.  Artifacts stored with
+         persist=False live only here and can be evicted under pressure.
+Disk   : source of truth for persisted artifacts, under .forge_artifacts/.
+         Content is stored once per distinct value as a gzip-compressed,
+         content-addressed blob (.blobs/<sha256[:2]>/<sha256>.json.gz).  Each
+         project keeps an index.json mapping type → key → blob digest and
+         size, so listing never walks the directory.  Blobs are garbage
+         collected by mark-and-sweep: when an artifact is overwritten or
+         cleared, its old blob is deleted only if no project index still
+         references it.  Index updates and sweeps run under an exclusive
+         file lock (.blobs/.lock) shared by every process using the store,
+         and a sweep that cannot read every index deletes nothing.  Files
+         are written atomically (temp file + rename).  Disk writes are
+         best-effort; failures are swallowed.
 """
 
 from __future__ import annotations
 
+import contextlib
+import gzip
+import hashlib
 import json
+import os
+import tempfile
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-from .config import FORGEGUARD_ROOT
+from .config import ARTIFACT_MEMORY_MAX_BYTES, FORGEGUARD_ROOT
 
 # ── Constants ─────────────────────────────────────────────────────────────
 
 _ARTIFACTS_DIR: Path = FORGEGUARD_ROOT / ".forge_artifacts"
 _DEFAULT_TTL_HOURS: float = 24.0
-
-# In-memory store: store_key -> (stored_at_monotonic, ttl_seconds, content)
-_store: dict[str, tuple[float, float, Any]] = {}
+_INDEX_FILE = "index.json"
+_BLOBS_DIR = ".blobs"
+_LOCK_FILE = ".lock"
 
 # Known artifact types (for documentation / validation hints)
 ARTIFACT_TYPES = frozenset(
@@ -46,6 +66,70 @@ ARTIFACT_TYPES = frozenset(
 )
 
 
+# ── Memory tier ───────────────────────────────────────────────────────────
+
+
+class _Entry(NamedTuple):
+    stored_at: float  # time.monotonic()
+    ttl_secs: float
+    content: Any
+    size: int
+    persisted: bool = False
+
+
+class _MemoryTier:
+    """LRU map of store_key → _Entry bounded by total entry size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __contains__(self, store_key: str) -> bool:
+        return store_key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, store_key: str) -> _Entry:
+        return self._entries[store_key]
+
+    def __setitem__(self, store_key: str, entry: _Entry) -> None:
+        self.pop(store_key)
+        if entry.persisted and entry.size > self.max_bytes:
+            return  # disk has it; don't flush the whole tier for one read
+        self._entries[store_key] = entry
+        self.bytes += entry.size
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self.bytes -= self._entries.pop(oldest).size
+
+    def get(self, store_key: str) -> _Entry | None:
+        entry = self._entries.get(store_key)
+        if entry is not None:
+            self._entries.move_to_end(store_key)
+        return entry
+
+    def pop(self, store_key: str) -> _Entry | None:
+        entry = self._entries.pop(store_key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+
+    def items(self) -> list[tuple[str, _Entry]]:
+        return list(self._entries.items())
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+
+_store = _MemoryTier(ARTIFACT_MEMORY_MAX_BYTES)
+
+# Parsed index files: path -> (mtime_ns, data), revalidated by mtime
+_json_files: dict[Path, tuple[int, Any]] = {}
+
+
 # ── Public API ────────────────────────────────────────────────────────────
 
 
@@ -71,11 +155,12 @@ def store_artifact(
     """
     store_key = _make_key(project_id, artifact_type, key)
     ttl_secs = ttl_hours * 3600
-    _store[store_key] = (time.monotonic(), ttl_secs, content)
-
     size_chars = _measure(content)
-    if persist:
-        _persist_to_disk(project_id, artifact_type, key, content)
+
+    persisted = persist and _persist_to_disk(
+        project_id, artifact_type, key, content, size_chars
+    )
+    _store[store_key] = _Entry(time.monotonic(), ttl_secs, content, size_chars, persisted)
 
     return {
         "stored": True,
@@ -96,30 +181,35 @@ def get_artifact(project_id: str, artifact_type: str, key: str) -> dict:
     entry = _store.get(store_key)
 
     if entry is not None:
-        stored_at, ttl_secs, content = entry
-        age = time.monotonic() - stored_at
-        if age <= ttl_secs:
+        age = time.monotonic() - entry.stored_at
+        if age <= entry.ttl_secs:
             return {
                 "project_id": project_id,
                 "artifact_type": artifact_type,
                 "key": key,
-                "content": content,
+                "content": entry.content,
                 "source": "memory",
                 "age_seconds": round(age),
-                "ttl_remaining_seconds": round(ttl_secs - age),
-                "size_chars": _measure(content),
+                "ttl_remaining_seconds": round(entry.ttl_secs - age),
+                "size_chars": entry.size,
             }
         # Expired — evict and try disk
-        del _store[store_key]
+        _store.pop(store_key)
 
     # Disk fallback
     disk_content = _load_from_disk(project_id, artifact_type, key)
     if disk_content is not None:
+        meta = _project_index(project_id).get(artifact_type, {}).get(key) or {}
+        size_chars = meta.get("size_chars")
+        if size_chars is None:
+            size_chars = _measure(disk_content)
         # Warm back into memory for fast subsequent reads
-        _store[store_key] = (
+        _store[store_key] = _Entry(
             time.monotonic(),
             _DEFAULT_TTL_HOURS * 3600,
             disk_content,
+            size_chars,
+            True,
         )
         return {
             "project_id": project_id,
@@ -129,7 +219,7 @@ def get_artifact(project_id: str, artifact_type: str, key: str) -> dict:
             "source": "disk",
             "age_seconds": None,
             "ttl_remaining_seconds": None,
-            "size_chars": _measure(disk_content),
+            "size_chars": size_chars,
         }
 
     return {"error": f"Artifact not found: {store_key}"}
@@ -148,11 +238,11 @@ def list_artifacts(
     expired: list[str] = []
     results: list[dict] = []
 
-    for store_key, (stored_at, ttl_secs, content) in list(_store.items()):
+    for store_key, entry in _store.items():
         if not store_key.startswith(prefix):
             continue
-        age = now - stored_at
-        if age > ttl_secs:
+        age = now - entry.stored_at
+        if age > entry.ttl_secs:
             expired.append(store_key)
             continue
         parts = store_key.split(":", 3)  # ["project", id, type, key]
@@ -163,28 +253,31 @@ def list_artifacts(
                 "key": parts[3],
                 "source": "memory",
                 "age_seconds": round(age),
-                "ttl_remaining_seconds": round(ttl_secs - age),
-                "size_chars": _measure(content),
+                "ttl_remaining_seconds": round(entry.ttl_secs - age),
+                "size_chars": entry.size,
             }
         )
 
     for k in expired:
-        del _store[k]
+        _store.pop(k)
 
     # Supplement with disk-only entries
     memory_keys = {r["store_key"] for r in results}
-    for dk in _list_disk_keys(project_id, artifact_type):
-        if dk not in memory_keys:
-            parts = dk.split(":", 3)
+    index = _project_index(project_id)
+    for atype in [artifact_type] if artifact_type else list(index):
+        for key, meta in index.get(atype, {}).items():
+            dk = _make_key(project_id, atype, key)
+            if dk in memory_keys:
+                continue
             results.append(
                 {
                     "store_key": dk,
-                    "artifact_type": parts[2],
-                    "key": parts[3],
+                    "artifact_type": atype,
+                    "key": key,
                     "source": "disk",
                     "age_seconds": None,
                     "ttl_remaining_seconds": None,
-                    "size_chars": None,
+                    "size_chars": meta.get("size_chars"),
                 }
             )
 
@@ -205,15 +298,16 @@ def clear_artifacts(
     if artifact_type:
         prefix += f"{artifact_type}:"
 
-    mem_keys = [k for k in list(_store) if k.startswith(prefix)]
+    mem_keys = [k for k, _ in _store.items() if k.startswith(prefix)]
     for k in mem_keys:
-        del _store[k]
+        _store.pop(k)
 
-    disk_cleared = _clear_disk(project_id, artifact_type)
+    disk_cleared, blobs_freed = _clear_disk(project_id, artifact_type)
 
     return {
         "cleared_memory": len(mem_keys),
         "cleared_disk": disk_cleared,
+        "blobs_freed": blobs_freed,
         "project_id": project_id,
         "artifact_type": artifact_type,
     }
@@ -238,26 +332,109 @@ def _measure(content: Any) -> int:
 
 
 def _artifact_path(project_id: str, artifact_type: str, key: str) -> Path:
+    """Per-artifact JSON file used before blobs existed (read-only fallback)."""
     return _ARTIFACTS_DIR / project_id / artifact_type / f"{key}.json"
 
 
+def _blob_path(digest: str) -> Path:
+    return _ARTIFACTS_DIR / _BLOBS_DIR / digest[:2] / f"{digest}.json.gz"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a temp file + rename, so readers never
+    see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _read_json(path: Path) -> Any | None:
+    """Parsed contents of *path*, cached until its mtime changes.
+
+    Revalidating by mtime means writes from another process are picked up
+    with a single ``stat``.  Returns None when the file is missing or
+    unreadable.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    cached = _json_files.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    _json_files[path] = (mtime, data)
+    return data
+
+
+def _write_json(path: Path, data: Any) -> None:
+    _atomic_write(path, json.dumps(data, sort_keys=True).encode("utf-8"))
+    _json_files[path] = (path.stat().st_mtime_ns, data)
+
+
 def _persist_to_disk(
-    project_id: str, artifact_type: str, key: str, content: Any
-) -> None:
+    project_id: str, artifact_type: str, key: str, content: Any, size_chars: int
+) -> bool:
+    """Reference the artifact's content blob from the project index.
+
+    Storing content the key already points at writes nothing.  Returns True
+    when the artifact is durably on disk.
+    """
     try:
-        path = _artifact_path(project_id, artifact_type, key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(content, indent=2, default=str), encoding="utf-8"
-        )
+        data = json.dumps(content, default=str).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        previous = _project_index(project_id).get(artifact_type, {}).get(key)
+        if (previous or {}).get("digest") == digest:
+            return True
+
+        with _blob_lock():
+            # Re-read under the lock; copy so the cached index only changes
+            # once the new one is on disk.
+            index = dict(_project_index(project_id, strict=True))
+            entries = dict(index.get(artifact_type, {}))
+            previous = entries.get(key)
+            previous_digest = (previous or {}).get("digest")
+            if previous_digest == digest:
+                return True
+
+            blob = _blob_path(digest)
+            if not blob.exists():
+                _atomic_write(blob, gzip.compress(data, mtime=0))
+            entries[key] = {
+                "digest": digest,
+                "size_chars": size_chars,
+                "stored_at": time.time(),
+            }
+            index[artifact_type] = entries
+            _write_json(_ARTIFACTS_DIR / project_id / _INDEX_FILE, index)
+
+            if previous_digest:
+                _sweep_blobs([previous_digest])
+            elif previous is not None:
+                _artifact_path(project_id, artifact_type, key).unlink(missing_ok=True)
+        return True
     except Exception:
-        pass  # Non-fatal
+        return False  # Non-fatal
 
 
 def _load_from_disk(
     project_id: str, artifact_type: str, key: str
 ) -> Any | None:
     try:
+        meta = _project_index(project_id).get(artifact_type, {}).get(key) or {}
+        digest = meta.get("digest")
+        if digest:
+            return json.loads(gzip.decompress(_blob_path(digest).read_bytes()))
         path = _artifact_path(project_id, artifact_type, key)
         if path.exists():
             return json.loads(path.read_text(encoding="utf-8"))
@@ -266,38 +443,131 @@ def _load_from_disk(
     return None
 
 
-def _list_disk_keys(
-    project_id: str, artifact_type: str | None
-) -> list[str]:
+def _project_index(project_id: str, *, strict: bool = False) -> dict[str, dict[str, dict]]:
+    """Return the project's ``{type: {key: meta}}`` index.
+
+    The returned dict is shared with the parse cache — copy before
+    modifying.  A project directory without an index (per-artifact files
+    written before blobs existed) is scanned once and the index is written
+    for next time.  An index that exists but cannot be read yields ``{}``,
+    or raises ``OSError`` when *strict* (callers about to rewrite it).
+    """
+    project_dir = _ARTIFACTS_DIR / project_id
+    index_path = project_dir / _INDEX_FILE
+    index = _read_json(index_path)
+    if index is not None:
+        return index
+    if index_path.exists():
+        if strict:
+            raise OSError(f"unreadable artifact index: {index_path}")
+        return {}
+    index = _scan_project_dir(project_dir)
+    if index:
+        with contextlib.suppress(Exception):
+            _write_json(project_dir / _INDEX_FILE, index)
+    return index
+
+
+def _scan_project_dir(project_dir: Path) -> dict[str, dict[str, dict]]:
+    index: dict[str, dict[str, dict]] = {}
     try:
-        base = _ARTIFACTS_DIR / project_id
-        if artifact_type:
-            base = base / artifact_type
-        if not base.exists():
-            return []
-        keys = []
-        for f in base.rglob("*.json"):
-            rel = f.relative_to(_ARTIFACTS_DIR)
-            parts = rel.parts  # (project_id, artifact_type, key.json)
-            if len(parts) == 3:
-                keys.append(
-                    f"project:{parts[0]}:{parts[1]}:{parts[2][:-5]}"
-                )
-        return keys
+        for f in project_dir.glob("*/*.json"):
+            index.setdefault(f.parent.name, {})[f.stem] = {"size_chars": None}
     except Exception:
-        return []
+        pass
+    return index
+
+
+@contextlib.contextmanager
+def _blob_lock() -> Iterator[None]:
+    """Exclusive lock over blobs and indexes, shared across processes."""
+    path = _ARTIFACTS_DIR / _BLOBS_DIR / _LOCK_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as fh:
+        if os.name == "nt":
+            import msvcrt
+
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _live_digests() -> set[str] | None:
+    """Digests referenced by any project index; None if one can't be read."""
+    live: set[str] = set()
+    try:
+        for index_path in _ARTIFACTS_DIR.glob(f"*/{_INDEX_FILE}"):
+            index = _read_json(index_path)
+            if not isinstance(index, dict):
+                return None
+            for entries in index.values():
+                for meta in entries.values():
+                    if meta.get("digest"):
+                        live.add(meta["digest"])
+    except (OSError, AttributeError):
+        return None
+    return live
+
+
+def _sweep_blobs(candidates: list[str]) -> int:
+    """Delete the *candidates* no project index references.
+
+    Must be called holding ``_blob_lock``.  Deletes nothing when any index
+    is unreadable — an unreadable index may still point at the blob.
+    """
+    if not candidates:
+        return 0
+    live = _live_digests()
+    if live is None:
+        return 0
+    freed = 0
+    for digest in set(candidates) - live:
+        path = _blob_path(digest)
+        if path.exists():
+            path.unlink(missing_ok=True)
+            freed += 1
+    return freed
 
 
-def _clear_disk(project_id: str, artifact_type: str | None) -> int:
+def _clear_disk(project_id: str, artifact_type: str | None) -> tuple[int, int]:
+    """Remove the project's references; return (artifacts cleared, blobs freed)."""
     try:
-        base = _ARTIFACTS_DIR / project_id
-        if artifact_type:
-            base = base / artifact_type
-        if not base.exists():
-            return 0
-        files = list(base.rglob("*.json"))
-        for f in files:
-            f.unlink(missing_ok=True)
-        return len(files)
+        if not _project_index(project_id):
+            return 0, 0
+        with _blob_lock():
+            index = _project_index(project_id, strict=True)
+            types = [artifact_type] if artifact_type else list(index)
+            removed = {atype: index[atype] for atype in types if atype in index}
+            cleared = sum(len(entries) for entries in removed.values())
+            if not cleared:
+                return 0, 0
+            remaining = {atype: entries for atype, entries in index.items() if atype not in removed}
+            index_path = _ARTIFACTS_DIR / project_id / _INDEX_FILE
+            if remaining:
+                _write_json(index_path, remaining)
+            else:
+                index_path.unlink(missing_ok=True)
+                _json_files.pop(index_path, None)
+
+            released: list[str] = []
+            for atype, entries in removed.items():
+                for key, meta in entries.items():
+                    if meta.get("digest"):
+                        released.append(meta["digest"])
+                    else:
+                        _artifact_path(project_id, atype, key).unlink(missing_ok=True)
+            return cleared, _sweep_blobs(released)
     except Exception:
-        return 0
+        return 0, 0
@@ -0,0 +1,154 @@
+"""Contract bundles — every contract for a build, materialized once.
+
+Agents that need several contracts used to call ``forge_get_contract`` once
+per contract, paying a tool round trip and an LLM turn each time.  A
+``ContractBundle`` holds all of a build's contracts, split into sections on
+first use, so one ``forge_get_contracts`` call can return several contracts —
+or only the sections an agent asks for.
+
+Sections are markdown headings (a heading's section runs to the next heading
+of the same or a higher level).  Contracts without headings — physics.yaml,
+for instance — are split on top-level YAML keys instead.  A selector matches
+a section when it is a case-insensitive substring of the heading (a trailing
+number must match whole, so "Phase 1" does not select "Phase 12").
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+MAX_CONTRACT_CHARS = 50_000
+
+# Too large to return whole; agents must select sections (or use the
+# phase-window tool).
+_SECTION_ONLY = frozenset({"phases"})
+
+_MD_HEADING = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+_YAML_KEY = re.compile(r"^([A-Za-z_][\w.-]*)[ \t]*:", re.MULTILINE)
+_FENCE = re.compile(r"^(```|~~~).*?^\1", re.MULTILINE | re.DOTALL)
+
+
+def _split_sections(content: str) -> list[tuple[str, int, int, int]]:
+    """Return ``(title, level, start, end)`` for every section in *content*."""
+    fences = [(m.start(), m.end()) for m in _FENCE.finditer(content)]
+    marks = [
+        (m.group(2), len(m.group(1)), m.start())
+        for m in _MD_HEADING.finditer(content)
+        if not any(s <= m.start() < e for s, e in fences)  # "# comment" in code
+    ]
+    if not marks:
+        marks = [(m.group(1), 1, m.start()) for m in _YAML_KEY.finditer(content)]
+    sections = []
+    for i, (title, level, start) in enumerate(marks):
+        end = len(content)
+        for _, next_level, next_start in marks[i + 1:]:
+            if next_level <= level:
+                end = next_start
+                break
+        sections.append((title, level, start, end))
+    return sections
+
+
+def _truncate(text: str) -> str:
+    if len(text) > MAX_CONTRACT_CHARS:
+        return text[:MAX_CONTRACT_CHARS] + f"\n\n[... truncated at {MAX_CONTRACT_CHARS // 1000}KB ...]"
+    return text
+
+
+class ContractBundle:
+    """All contracts for one build, with lazily computed section indexes."""
+
+    __slots__ = ("_contents", "_sections")
+
+    def __init__(self, contracts: Iterable[dict[str, Any]]) -> None:
+        self._contents: dict[str, str] = {
+            c["contract_type"]: c.get("content") or "" for c in contracts
+        }
+        self._sections: dict[str, list[tuple[str, int, int, int]]] = {}
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._contents)
+
+    def sections(self, name: str) -> list[tuple[str, int, int, int]]:
+        if name not in self._sections:
+            self._sections[name] = _split_sections(self._contents.get(name, ""))
+        return self._sections[name]
+
+    def select(
+        self,
+        names: Iterable[str],
+        sections: dict[str, list[str]] | None = None,
+    ) -> dict[str, Any]:
+        """Return the requested contracts, narrowed to *sections* where given.
+
+        The result has ``contracts`` (name → text, in request order),
+        ``missing`` (names not in the bundle), ``unmatched_sections``
+        (name → selectors that matched no heading) and ``errors`` (name →
+        why it was withheld).  When none of a contract's selectors match,
+        the whole contract is returned.
+        """
+        sections = sections or {}
+        contracts: dict[str, str] = {}
+        missing: list[str] = []
+        unmatched: dict[str, list[str]] = {}
+        errors: dict[str, str] = {}
+
+        for name in dict.fromkeys(names):
+            content = self._contents.get(name)
+            if content is None:
+                missing.append(name)
+                continue
+            selectors = [s for s in sections.get(name) or [] if s and s.strip()]
+            if not selectors:
+                if name in _SECTION_ONLY:
+                    errors[name] = (
+                        f"The full {name} contract is too large for context — "
+                        "pass section selectors (e.g. 'Phase 3') or use "
+                        "forge_get_phase_window."
+                    )
+                    continue
+                contracts[name] = _truncate(content)
+                continue
+
+            spans: list[tuple[int, int]] = []
+            misses: list[str] = []
+            for selector in selectors:
+                needle = selector.strip()
+                # "Phase 1" must not match "Phase 12"
+                pattern = re.compile(
+                    re.escape(needle) + (r"(?!\d)" if needle[-1].isdigit() else ""),
+                    re.IGNORECASE,
+                )
+                hits = [(s, e) for title, _, s, e in self.sections(name) if pattern.search(title)]
+                if hits:
+                    spans.extend(hits)
+                else:
+                    misses.append(selector)
+            if misses:
+                unmatched[name] = misses
+            if not spans:
+                if name in _SECTION_ONLY:
+                    errors[name] = f"No {name} sections matched {selectors!r}."
+                    continue
+                contracts[name] = _truncate(content)
+                continue
+            # Merge overlapping spans (a heading and one of its subsections).
+            merged: list[list[int]] = []
+            for start, end in sorted(spans):
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            contracts[name] = _truncate(
+                "\n\n".join(content[s:e].strip() for s, e in merged)
+            )
+
+        return {
+            "contracts": contracts,
+            "missing": missing,
+            "unmatched_sections": unmatched,
+            "errors": errors,
+        }
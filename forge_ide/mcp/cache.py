@@ -1,28 +1,261 @@
-"""Simple TTL cache for MCP server responses."""
+"""Bounded LRU + TTL cache for MCP server responses.
+
+Entries are evicted when they expire (swept periodically, not just
+ignored on read), when the cache exceeds its entry or byte budget
+(least-recently-used first), or when their namespace exceeds its own
+entry cap.  The namespace is the key prefix before the first ``:``
+(``api:/forge/summary`` → ``api``), so one busy namespace can't push
+everything else out.
+
+``get_or_load`` adds stampede protection: concurrent misses for the same
+key share a single in-flight load instead of each calling upstream.
+``coalesce`` is the same single-flight without caching the result.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-_CACHE_TTL = 300  # 5 minutes
-_cache: dict[str, tuple[float, Any]] = {}
+from .config import (
+    MCP_CACHE_MAX_BYTES,
+    MCP_CACHE_MAX_ENTRIES,
+    MCP_CACHE_NAMESPACE_LIMITS,
+    MCP_CACHE_TTL_S,
+)
+
+_SWEEP_INTERVAL_S = 30.0
+
+
+def _namespace(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+def _measure(value: Any) -> int:
+    """Approximate size of *value* in bytes (its JSON encoding)."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class BoundedCache:
+    """LRU cache with TTL, entry/byte budgets and per-namespace caps."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = MCP_CACHE_TTL_S,
+        max_entries: int = MCP_CACHE_MAX_ENTRIES,
+        max_bytes: int = MCP_CACHE_MAX_BYTES,
+        namespace_limits: dict[str, int] | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.namespace_limits = dict(namespace_limits or {})
+        # key → (expires_at, size, value); order is least → most recently used
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self._ns_counts: dict[str, int] = {}
+        self._bytes = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._last_sweep = time.monotonic()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "evicted_lru": 0,
+            "evicted_namespace": 0,
+            "expired": 0,
+        }
+
+    # -- basic operations ----------------------------------------------------
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value if fresh, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._counters["misses"] += 1
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self._counters["expired"] += 1
+            self._counters["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._counters["hits"] += 1
+        return entry[2]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> Any:
+        """Store *value* under *key* and return it."""
+        now = time.monotonic()
+        if now - self._last_sweep >= _SWEEP_INTERVAL_S:
+            self.sweep(now)
+        if key in self._entries:
+            self._remove(key)
+        size = _measure(value)
+        if size > self.max_bytes:
+            return value  # would evict everything else; serve it uncached
+        ns = _namespace(key)
+        self._entries[key] = (now + (self.ttl if ttl is None else ttl), size, value)
+        self._ns_counts[ns] = self._ns_counts.get(ns, 0) + 1
+        self._bytes += size
+        self._enforce_limits(ns)
+        return value
+
+    def clear(self, namespace: str | None = None) -> int:
+        """Drop every entry (or only *namespace*'s); return how many."""
+        if namespace is None:
+            count = len(self._entries)
+            self._entries.clear()
+            self._ns_counts.clear()
+            self._bytes = 0
+            return count
+        keys = [k for k in self._entries if _namespace(k) == namespace]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def sweep(self, now: float | None = None) -> int:
+        """Remove expired entries; return how many were removed."""
+        now = time.monotonic() if now is None else now
+        self._last_sweep = now
+        expired = [k for k, (expires, _, _) in self._entries.items() if expires <= now]
+        for key in expired:
+            self._remove(key)
+        self._counters["expired"] += len(expired)
+        return len(expired)
+
+    # -- single-flight -------------------------------------------------------
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Return the cached value, or load it once for all concurrent callers.
+
+        A loader exception propagates to every waiter and nothing is cached.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        async def _load_and_store() -> Any:
+            value = await loader()
+            if value is not None:
+                self.set(key, value, ttl)
+            return value
+
+        return await self.coalesce(key, _load_and_store)
+
+    async def coalesce(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run *loader* once for all concurrent callers with the same *key*.
+
+        Nothing is cached: a call made after the load finishes runs again.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._counters["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._counters["loads"] += 1
+        try:
+            value = await loader()
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                future.exception()  # mark retrieved when nobody was waiting
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    # -- diagnostics ---------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Counters plus current size, overall and per namespace."""
+        lookups = self._counters["hits"] + self._counters["misses"]
+        return {
+            **self._counters,
+            "hit_rate": round(self._counters["hits"] / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "inflight": len(self._inflight),
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_s": self.ttl,
+            "namespaces": {
+                ns: {"entries": count, "limit": self.namespace_limits.get(ns)}
+                for ns, count in sorted(self._ns_counts.items())
+            },
+        }
+
+    # -- internals -----------------------------------------------------------
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        ns = _namespace(key)
+        remaining = self._ns_counts[ns] - 1
+        if remaining:
+            self._ns_counts[ns] = remaining
+        else:
+            del self._ns_counts[ns]
+
+    def _enforce_limits(self, ns: str) -> None:
+        limit = self.namespace_limits.get(ns)
+        if limit is not None and self._ns_counts.get(ns, 0) > limit:
+            for key in list(self._entries):  # oldest first
+                if _namespace(key) == ns:
+                    self._remove(key)
+                    self._counters["evicted_namespace"] += 1
+                    if self._ns_counts.get(ns, 0) <= limit:
+                        break
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._counters["evicted_lru"] += 1
+
+
+_cache = BoundedCache(namespace_limits=MCP_CACHE_NAMESPACE_LIMITS)
 
 
 def cache_get(key: str) -> Any | None:
     """Return cached value if fresh, else None."""
-    entry = _cache.get(key)
-    if entry and (time.monotonic() - entry[0]) < _CACHE_TTL:
-        return entry[1]
-    return None
+    return _cache.get(key)
 
 
 def cache_set(key: str, value: Any) -> Any:
     """Store value in cache and return it."""
-    _cache[key] = (time.monotonic(), value)
-    return value
+    return _cache.set(key, value)
+
+
+async def cache_get_or_load(key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Cached value for *key*, loading it once across concurrent callers."""
+    return await _cache.get_or_load(key, loader)
+
+
+async def cache_coalesce(key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Share one in-flight *loader* call among concurrent callers (uncached)."""
+    return await _cache.coalesce(key, loader)
 
 
 def cache_clear() -> None:
     """Clear all cached entries."""
     _cache.clear()
+
+
+def cache_stats() -> dict[str, Any]:
+    """Hit / miss / eviction counters and current occupancy."""
+    return _cache.stats()
@@ -16,6 +16,25 @@ FORGEGUARD_ROOT: Path = Path(
 FORGEGUARD_URL: str = os.getenv("FORGEGUARD_URL", "http://localhost:8000").rstrip("/")
 FORGEGUARD_API_KEY: str = os.getenv("FORGEGUARD_API_KEY", "")
 
+# ── Response cache limits ────────────────────────────────────────────────
+
+MCP_CACHE_TTL_S: float = float(os.getenv("FORGEGUARD_MCP_CACHE_TTL", "300"))
+MCP_CACHE_MAX_ENTRIES: int = int(os.getenv("FORGEGUARD_MCP_CACHE_MAX_ENTRIES", "1000"))
+MCP_CACHE_MAX_BYTES: int = int(os.getenv("FORGEGUARD_MCP_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Per-namespace entry caps (namespace = key prefix before the first ":").
+MCP_CACHE_NAMESPACE_LIMITS: dict[str, int] = {
+    "api": 500,
+    "contract": 100,
+}
+
+# ── Artifact store limits ────────────────────────────────────────────────
+
+# Byte budget for the in-memory artifact tier; disk remains the source of truth.
+ARTIFACT_MEMORY_MAX_BYTES: int = int(
+    os.getenv("FORGEGUARD_ARTIFACT_MEMORY_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
 # ── Contract registry ────────────────────────────────────────────────────
 
 CONTRACTS_DIR: Path = FORGEGUARD_ROOT / "Forge" / "Contracts"
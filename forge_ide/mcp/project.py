@@ -12,13 +12,20 @@ Session defaults (project_id, build_id) are resolved automatically via
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from typing import Any
 
+from .bundle import ContractBundle
 from .remote import api_get
 from .session import resolve_build_id, resolve_project_id
 
 logger = logging.getLogger(__name__)
 
+# Parsed build bundles, reused for as long as api_get serves the same
+# (cached) response object.
+_BUNDLE_CACHE_SIZE = 16
+_bundles: OrderedDict[str, tuple[dict, ContractBundle]] = OrderedDict()
+
 
 async def get_project_context(arguments: dict[str, Any]) -> dict[str, Any]:
     """Fetch combined project manifest — metadata only, no full content.
@@ -76,3 +83,56 @@ async def get_build_contracts(arguments: dict[str, Any]) -> dict[str, Any]:
         return {"error": "Missing required parameter: build_id (not in arguments or session)"}
     logger.info("[mcp:project] get_build_contracts  build=%s", build_id)
     return await api_get(f"/api/mcp/build/{build_id}/contracts")
+
+
+async def get_build_bundle(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Fetch every contract for a build in one call — full content.
+
+    Uses the build's pinned snapshot, or the project's current contracts
+    when nothing is pinned.
+
+    Endpoint: GET /api/mcp/build/{build_id}/bundle
+    """
+    build_id = resolve_build_id(arguments)
+    if not build_id:
+        return {"error": "Missing required parameter: build_id (not in arguments or session)"}
+    logger.info("[mcp:project] get_build_bundle  build=%s", build_id)
+    return await api_get(f"/api/mcp/build/{build_id}/bundle")
+
+
+async def get_contracts(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Fetch several contracts — or selected sections of them — in one call.
+
+    Backed by the build bundle, fetched once per build and split into
+    sections on first use.
+
+    Endpoint: GET /api/mcp/build/{build_id}/bundle
+    """
+    names = arguments.get("names")
+    if not names or not isinstance(names, list):
+        return {"error": "Missing required parameter: names (list of contract types)"}
+    build_id = resolve_build_id(arguments)
+    if not build_id:
+        return {"error": "Missing required parameter: build_id (not in arguments or session)"}
+    logger.info("[mcp:project] get_contracts  build=%s  names=%s", build_id, names)
+    resp = await api_get(f"/api/mcp/build/{build_id}/bundle")
+    if "error" in resp:
+        return resp
+    return {
+        "build_id": build_id,
+        "source": resp.get("source"),
+        "batch": resp.get("batch"),
+        **_materialize(build_id, resp).select(names, arguments.get("sections")),
+    }
+
+
+def _materialize(build_id: str, resp: dict[str, Any]) -> ContractBundle:
+    cached = _bundles.get(build_id)
+    if cached is not None and cached[0] is resp:
+        _bundles.move_to_end(build_id)
+        return cached[1]
+    bundle = ContractBundle(resp.get("contracts", []))
+    _bundles[build_id] = (resp, bundle)
+    while len(_bundles) > _BUNDLE_CACHE_SIZE:
+        _bundles.popitem(last=False)
+    return bundle
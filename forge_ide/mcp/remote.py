@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from .cache import cache_get, cache_set
+from .cache import cache_get_or_load
 from .config import FORGEGUARD_API_KEY, FORGEGUARD_URL
 
 _http_client = None
@@ -27,12 +27,14 @@ def _get_client():
 
 
 async def api_get(path: str) -> dict[str, Any]:
-    """GET a ForgeGuard endpoint, returning parsed JSON (cached)."""
-    cached = cache_get(f"api:{path}")
-    if cached is not None:
-        return cached
-
-    client = _get_client()
-    resp = await client.get(path)
-    resp.raise_for_status()
-    return cache_set(f"api:{path}", resp.json())
+    """GET a ForgeGuard endpoint, returning parsed JSON (cached).
+
+    Concurrent calls for the same uncached *path* share one request.
+    """
+
+    async def _load() -> dict[str, Any]:
+        resp = await _get_client().get(path)
+        resp.raise_for_status()
+        return resp.json()
+
+    return await cache_get_or_load(f"api:{path}", _load)
@@ -2,29 +2,33 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import time
 from typing import Any
 
-logger = logging.getLogger(__name__)
-
 from .artifact_store import (
     clear_artifacts,
     get_artifact,
     list_artifacts,
     store_artifact,
 )
+from .cache import cache_coalesce, cache_stats
 from .config import LOCAL_MODE
 from .local import get_governance, get_invariants, get_summary, list_contracts, load_contract
 from .project import (
+    get_build_bundle,
     get_build_contracts,
-    get_project_contract,
+    get_contracts,
     get_project_context,
+    get_project_contract,
     list_project_contracts,
 )
 from .remote import api_get
 from .session import clear_session, get_session, set_session
 
+logger = logging.getLogger(__name__)
+
 # Contract types that are generated per-project and live in the Neon DB.
 # When a session is active, these should be fetched from the DB rather
 # than from local disk.  Static governance templates (system_prompt,
@@ -41,6 +45,9 @@ _ARTIFACT_TOOLS = frozenset(
     {"forge_store_artifact", "forge_get_artifact", "forge_list_artifacts", "forge_clear_artifacts"}
 )
 
+# Diagnostic tools report on this server process itself
+_DIAGNOSTIC_TOOLS = frozenset({"forge_cache_stats"})
+
 # Planner tools always run in-process against the local planner package
 _PLANNER_TOOLS = frozenset({"forge_run_planner"})
 
@@ -53,9 +60,15 @@ _PROJECT_TOOLS = frozenset(
         "forge_list_project_contracts",
         "forge_get_project_contract",
         "forge_get_build_contracts",
+        "forge_get_build_bundle",
+        "forge_get_contracts",
     }
 )
 
+# Read-only project tools: identical concurrent calls (e.g. every sub-agent
+# of a build starting at once) share a single upstream request.
+_COALESCED_PROJECT_TOOLS = _PROJECT_TOOLS - {"forge_set_session", "forge_clear_session"}
+
 # ── Annotation presets ────────────────────────────────────────────────────
 
 _READ_ONLY = {
@@ -73,8 +86,9 @@ _WRITE = {
 }
 
 # ── Tool definitions ─────────────────────────────────────────────────────
-# Single list for all modes.  16 tools (removed 4 redundant shortcuts,
-# added forge_get_governance).  Descriptions optimised for Forge agents
+# Single list for all modes.  19 tools (removed 4 redundant shortcuts,
+# added forge_get_governance, forge_get_build_bundle, forge_get_contracts
+# and forge_cache_stats).  Descriptions optimised for Forge agents
 # (Scout, Coder, Auditor, Planner, Fixer) as primary consumers.
 #
 # The 4 shortcut tools (forge_get_boundaries, forge_get_physics,
@@ -412,6 +426,70 @@ TOOL_DEFINITIONS: list[dict] = [
         },
         "annotations": _READ_ONLY,
     },
+    {
+        "name": "forge_get_build_bundle",
+        "description": (
+            "Fetch every contract for a build in ONE call — full content, "
+            "version and size for each. Uses the build's pinned snapshot, "
+            "or the project's current contracts if none is pinned. Prefer "
+            "this over forge_get_project_context followed by one "
+            "forge_get_project_contract call per contract."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "build_id": {
+                    "type": "string",
+                    "description": "Build identifier (UUID). Optional if session is set.",
+                },
+            },
+            "required": [],
+        },
+        "annotations": _READ_ONLY,
+    },
+    {
+        "name": "forge_get_contracts",
+        "description": (
+            "Fetch SEVERAL build contracts in one call, optionally narrowed "
+            "to the sections you need. Use instead of repeated "
+            "forge_get_project_contract calls. Sections match markdown "
+            "headings (or top-level YAML keys) by case-insensitive "
+            "substring, e.g. {\"physics\": [\"paths\"], \"phases\": [\"Phase 3\"]}. "
+            "'phases' requires a section selector."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Contract types, e.g. [\"stack\", \"schema\", \"physics\"].",
+                },
+                "sections": {
+                    "type": "object",
+                    "additionalProperties": {"type": "array", "items": {"type": "string"}},
+                    "description": "Optional: contract type → heading selectors. Omitted contracts are returned whole.",
+                },
+                "build_id": {
+                    "type": "string",
+                    "description": "Build identifier (UUID). Optional if session is set.",
+                },
+            },
+            "required": ["names"],
+        },
+        "annotations": _READ_ONLY,
+    },
+    # ── Diagnostics ───────────────────────────────────────────────────────
+    {
+        "name": "forge_cache_stats",
+        "description": (
+            "Report the MCP server's response cache — hit / miss / eviction "
+            "counters, coalesced (single-flight) loads, and current entries "
+            "and bytes per namespace. For diagnosing memory or upstream load."
+        ),
+        "inputSchema": {"type": "object", "properties": {}, "required": []},
+        "annotations": _READ_ONLY,
+    },
     # ── Planner ───────────────────────────────────────────────────────────
     {
         "name": "forge_run_planner",
@@ -460,6 +538,10 @@ async def dispatch(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         result = await _dispatch_project(name, arguments)
         _log_result(name, result, start)
         return result
+    if name in _DIAGNOSTIC_TOOLS:
+        result = {"cache": cache_stats()}
+        _log_result(name, result, start)
+        return result
     # Planner tools always run in-process (local planner package)
     if name in _PLANNER_TOOLS:
         result = await _dispatch_planner(name, arguments)
@@ -530,6 +612,13 @@ def _dispatch_artifact(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
 
 async def _dispatch_project(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Serve project-scoped tool calls via ForgeGuard API."""
+    if name in _COALESCED_PROJECT_TOOLS:
+        # Session defaults are part of the key: the same arguments can
+        # resolve to a different project or build.
+        key = "tool:" + json.dumps(
+            [name, arguments, get_session().as_dict()], sort_keys=True, default=str
+        )
+        return await cache_coalesce(key, lambda: _dispatch_project_read(name, arguments))
     match name:
         case "forge_set_session":
             pid = arguments.get("project_id")
@@ -542,6 +631,12 @@ async def _dispatch_project(name: str, arguments: dict[str, Any]) -> dict[str, A
             )
         case "forge_clear_session":
             return clear_session()
+        case _:
+            return {"error": f"Unknown project tool: {name}"}
+
+
+async def _dispatch_project_read(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    match name:
         case "forge_get_project_context":
             return await get_project_context(arguments)
         case "forge_list_project_contracts":
@@ -550,6 +645,10 @@ async def _dispatch_project(name: str, arguments: dict[str, Any]) -> dict[str, A
             return await get_project_contract(arguments)
         case "forge_get_build_contracts":
             return await get_build_contracts(arguments)
+        case "forge_get_build_bundle":
+            return await get_build_bundle(arguments)
+        case "forge_get_contracts":
+            return await get_contracts(arguments)
         case _:
             return {"error": f"Unknown project tool: {name}"}
 
@@ -14,7 +14,9 @@ for reading/writing the filesystem.
 from __future__ import annotations
 
 import difflib
+import heapq
 import re
+from collections import Counter
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -362,8 +364,8 @@ def apply_multi_patch(
 
     Processes all patches in order.  If any raises ``PatchConflict``,
     it propagates immediately — results for successfully-applied patches
-    up to that point are not returned (caller manages rollback at the
-    filesystem level).
+    up to that point are not returned.  Works on in-memory content only;
+    use ``PatchTransaction`` to apply a batch to disk all-or-nothing.
 
     Returns a list of ``PatchResult`` — one per input patch.
     """
@@ -389,6 +391,14 @@ _DIFFLIB_THRESHOLD: float = 0.80
 # Maximum line offset when searching for anchor context
 _ANCHOR_SEARCH_RANGE: int = 40
 
+# Windows given a full SequenceMatcher.ratio() by the difflib matcher:
+# this many line-hash anchored ones, then this many by quick_ratio
+_DIFFLIB_MAX_CANDIDATES: int = 8
+
+# Anchored windows are also tried this many lines either side, since a
+# replaced or duplicated line can pull the vote off by a line or two
+_DIFFLIB_ANCHOR_SLACK: int = 2
+
 
 def _find_exact(content: str, old_text: str) -> int | None:
     """Find *old_text* in *content*. Return index if unique, else None."""
@@ -453,48 +463,150 @@ def _find_by_difflib(
 
     Returns ``(start_index, end_index)`` of the best match in
     *content*, or ``None`` if no match exceeds *threshold*.
+
+    Candidate windows are ``len(old_lines)`` lines long.  The expensive
+    ``SequenceMatcher.ratio()`` only runs on a handful of them, each
+    gated first by ``real_quick_ratio`` (read off a line-offset table)
+    and ``quick_ratio``:
+
+    1. Windows that line up identical lines with *old_text* (via a line
+       hash map), most aligned lines first, plus a couple of lines of
+       slack either side.
+    2. Only if none of those clears *threshold*: every window's
+       ``quick_ratio`` is computed in one sliding pass over the content
+       and the highest few are scored.
+
+    Ties go to the earliest window.
     """
     old_lines = old_text.split("\n")
     content_lines = content.split("\n")
     n = len(old_lines)
+    total = len(content_lines)
 
-    if n == 0 or len(content_lines) == 0:
+    # Quick line-count pre-check (only bites when content is shorter)
+    width = min(n, total)
+    if width / max(n, 1) < threshold * 0.8:
         return None
 
+    # offsets[i] is the character index where line i starts; the extra
+    # entry lets a window's end be read as offsets[i + width] - 1.
+    offsets = [0] * (total + 1)
+    pos = 0
+    for i, line in enumerate(content_lines):
+        pos += len(line) + 1
+        offsets[i + 1] = pos
+
+    window_count = max(1, total - n + 1)
+    old_len = len(old_text)
+    sm = difflib.SequenceMatcher(None, old_text)
     best_ratio = 0.0
     best_start = -1
 
-    # Slide a window of size n over content_lines
-    for i in range(max(1, len(content_lines) - n + 1)):
-        candidate = content_lines[i : i + n]
-        # Quick length-ratio pre-check
-        len_ratio = min(len(candidate), n) / max(len(candidate), n, 1)
-        if len_ratio < threshold * 0.8:
-            continue
-        sm = difflib.SequenceMatcher(
-            None,
-            "\n".join(old_lines),
-            "\n".join(candidate),
-        )
+    def score(i: int, bound: float = 1.0) -> None:
+        nonlocal best_ratio, best_start
+        floor = max(threshold, best_ratio)
+        cand_len = offsets[i + width] - offsets[i] - 1
+        both = old_len + cand_len
+        # real_quick_ratio, from the offset table alone
+        if (both and 2.0 * min(old_len, cand_len) / both < floor) or bound < floor:
+            return
+        sm.set_seq2(content[offsets[i]:offsets[i + width] - 1])
+        if sm.quick_ratio() < floor:
+            return
         ratio = sm.ratio()
-        if ratio > best_ratio:
+        if ratio > best_ratio or (ratio == best_ratio and i < best_start):
             best_ratio = ratio
             best_start = i
 
+    # 1. Anchors: windows that line up identical non-blank lines, most
+    #    aligned lines first.
+    line_positions: dict[str, list[int]] = {}
+    for j, line in enumerate(content_lines):
+        if line.strip():
+            line_positions.setdefault(line, []).append(j)
+    votes: Counter[int] = Counter()
+    for k, line in enumerate(old_lines):
+        for j in line_positions.get(line, ()):
+            if 0 <= j - k < window_count:
+                votes[j - k] += 1
+    near: set[int] = set()
+    for i, _ in votes.most_common(_DIFFLIB_MAX_CANDIDATES):
+        near.update(range(max(0, i - _DIFFLIB_ANCHOR_SLACK), min(window_count, i + _DIFFLIB_ANCHOR_SLACK + 1)))
+    for i in sorted(near):
+        score(i)
+    if best_ratio >= threshold:
+        return (offsets[best_start], offsets[best_start + width] - 1)
+
+    # 2. No usable anchor: bound every window, score the most promising.
+    bounds = _quick_ratio_bounds(old_text, content_lines, width, window_count)
+    for i in heapq.nsmallest(_DIFFLIB_MAX_CANDIDATES, range(window_count), key=lambda i: -bounds[i]):
+        if bounds[i] < max(threshold, best_ratio):
+            break
+        score(i, bounds[i])
+
     if best_ratio < threshold or best_start < 0:
         return None
 
-    # Convert line-based window back to character positions
-    start_chars = sum(len(content_lines[j]) + 1 for j in range(best_start))
-    # The matched region spans n lines
-    end_chars = start_chars + sum(
-        len(content_lines[best_start + j]) + 1 for j in range(min(n, len(content_lines) - best_start))
-    )
-    # Remove trailing newline from end
-    if end_chars > 0:
-        end_chars -= 1
+    # Matched region spans `width` lines, without the trailing newline
+    return (offsets[best_start], offsets[best_start + width] - 1)
 
-    return (start_chars, end_chars)
+
+def _quick_ratio_bounds(
+    old_text: str,
+    content_lines: list[str],
+    width: int,
+    window_count: int,
+) -> list[float]:
+    """``quick_ratio`` of *old_text* against every *width*-line window.
+
+    Character counts for the window are updated line by line as it
+    slides, so the whole table costs one pass over the content.  Only
+    characters present in *old_text* are tracked — others can't add to
+    the shared count.
+    """
+    target = Counter(old_text)
+    ids = {ch: k for k, ch in enumerate(target)}
+    want = list(target.values())
+    have = [0] * len(want)
+    line_counts = [
+        [(ids[ch], k) for ch, k in Counter(line).items() if ch in ids]
+        for line in content_lines
+    ]
+    newline = ids.get("\n")
+    if newline is not None:
+        have[newline] = width - 1
+    shared = min(target["\n"], width - 1)
+    length = width - 1
+    old_len = len(old_text)
+
+    for j in range(width):
+        for c, k in line_counts[j]:
+            h = have[c]
+            if h < want[c]:
+                shared += min(k, want[c] - h)
+            have[c] = h + k
+        length += len(content_lines[j])
+
+    bounds = [0.0] * window_count
+    for i in range(window_count):
+        if i:
+            for c, k in line_counts[i - 1]:
+                h = have[c]
+                after = h - k
+                if h <= want[c]:
+                    shared -= k
+                elif after < want[c]:
+                    shared -= want[c] - after
+                have[c] = after
+            for c, k in line_counts[i + width - 1]:
+                h = have[c]
+                if h < want[c]:
+                    shared += min(k, want[c] - h)
+                have[c] = h + k
+            length += len(content_lines[i + width - 1]) - len(content_lines[i - 1])
+        both = old_len + length
+        bounds[i] = 2.0 * shared / both if both else 1.0
+    return bounds
 
 
 def apply_edits(
@@ -0,0 +1,455 @@
+"""Persistent pytest worker — warm, forked test runs per workspace.
+
+A cold ``pytest`` run pays for a fresh interpreter, the pytest import,
+plugin discovery and every third-party import the suite needs — usually
+most of the wall-clock time of a scoped run during a fix cycle.
+
+``PytestWorker`` keeps one long-lived zygote per workspace (see
+``_pytest_zygote``).  The zygote has pytest and its plugins imported and
+forks a child per run, so each run starts from a warm, clean interpreter.
+Workspace modules are only ever imported in the children, so edits are
+always picked up; third-party modules a run needed are pre-imported into
+the zygote for the next fork.
+
+``run_pytest`` is the entry point most callers want: it routes a pytest
+command line to the workspace's worker and falls back to
+``runner.stream_process`` when the worker cannot be used (no ``os.fork``,
+a command the worker does not understand, or the zygote failed).
+
+Usage::
+
+    result = await run_pytest("pytest tests/test_auth.py -q", cwd=root, env=env)
+
+    result = await get_worker(root, python=py).run_scoped(changed, all_files)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import shlex
+import shutil
+import signal
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from forge_ide.log_parser import IncrementalSummariser
+from forge_ide.runner import (
+    DEFAULT_TIMEOUT_S,
+    MAX_STDOUT_BYTES,
+    StreamRunResult,
+    _OutputBuffer,
+    stream_process,
+)
+from forge_ide.test_scope import scope_tests_for_changes
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ZYGOTE_SCRIPT: Path = Path(__file__).with_name("_pytest_zygote.py")
+STARTUP_TIMEOUT_S: float = 60.0
+IDLE_TIMEOUT_S: float = 600.0  # workers unused this long are shut down
+MAX_RUNS_PER_WORKER: int = 200  # recycle to bound drift in the warm set
+
+_REPLY_GRACE_S: float = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Command parsing
+# ---------------------------------------------------------------------------
+
+
+def parse_pytest_command(command: str) -> tuple[str, list[str], bool] | None:
+    """Split a pytest command line for the worker.
+
+    Returns ``(interpreter name, pytest args, module_mode)`` for
+    ``pytest …``, ``python -m pytest …`` and ``python3 -m pytest …``;
+    ``None`` for anything else.  *module_mode* is ``True`` for the
+    ``-m`` forms, which put the working directory on ``sys.path``.
+    """
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return None
+    if tokens[:1] == ["pytest"]:
+        return "python", tokens[1:], False
+    if len(tokens) >= 3 and tokens[0] in ("python", "python3") and tokens[1:3] == ["-m", "pytest"]:
+        return tokens[0], tokens[3:], True
+    return None
+
+
+def resolve_interpreter(name: str, env: dict[str, str] | None = None) -> str | None:
+    """Find the interpreter a command would run under *env*.
+
+    Prefers ``$VIRTUAL_ENV``'s interpreter, then *name* on ``$PATH``.
+    """
+    env = env if env is not None else dict(os.environ)
+    venv = env.get("VIRTUAL_ENV")
+    if venv:
+        candidate = Path(venv) / ("Scripts" if os.name == "nt" else "bin") / name
+        for path in (candidate, candidate.with_suffix(".exe")):
+            if path.is_file():
+                return str(path)
+    return shutil.which(name, path=env.get("PATH"))
+
+
+# ---------------------------------------------------------------------------
+# PytestWorker
+# ---------------------------------------------------------------------------
+
+
+class PytestWorker:
+    """A warm pytest zygote bound to one workspace and interpreter.
+
+    Runs are serialised — concurrent pytest runs in one workspace would
+    fight over ``.pytest_cache`` and fixtures' temp files anyway.
+
+    Parameters
+    ----------
+    root : str
+        Workspace root; the zygote's working directory.
+    python : str
+        Interpreter to run the zygote under (the project's, not Forge's).
+    env : dict[str, str] | None
+        Complete environment for the zygote and its children.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_loop",
+        "_proc",
+        "_runs",
+        "_tmpdir",
+        "env",
+        "last_used",
+        "python",
+        "root",
+    )
+
+    def __init__(self, root: str, *, python: str, env: dict[str, str] | None = None) -> None:
+        self.root = os.path.realpath(root)
+        self.python = python
+        self.env = env
+        self.last_used = time.monotonic()
+        self._loop = asyncio.get_running_loop()
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+        self._runs = 0
+        self._tmpdir: str | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def start(self) -> bool:
+        """Start the zygote if needed; ``False`` if it could not be started."""
+        if self.alive:
+            return True
+        if not hasattr(os, "fork"):
+            return False
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                self.python, "-u", str(ZYGOTE_SCRIPT), self.root,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=self.root,
+                env=self.env,
+            )
+            reply = await self._read_reply(STARTUP_TIMEOUT_S)
+        except (TimeoutError, OSError) as exc:
+            logger.info("pytest worker for %s did not start: %s", self.root, exc)
+            await self.close()
+            return False
+        if not reply or not reply.get("ready"):
+            await self.close()
+            return False
+        self._runs = 0
+        self._tmpdir = tempfile.mkdtemp(prefix="forge-pytest-")
+        logger.debug("pytest worker ready for %s (pytest %s)", self.root, reply.get("pytest"))
+        return True
+
+    async def run(
+        self,
+        args: Sequence[str],
+        *,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        module_mode: bool = False,
+        command: str = "",
+        max_failures: int | None = None,
+    ) -> StreamRunResult | None:
+        """Run ``pytest <args>`` in a forked child.
+
+        Returns ``None`` when the worker is unavailable; the caller
+        should fall back to a cold run.  With *max_failures*, pytest's
+        own ``--maxfail`` stops the run.
+        """
+        args = list(args)
+        if max_failures:
+            args.append(f"--maxfail={max_failures}")
+        command = command or shlex.join(["pytest", *args])
+        async with self._lock:
+            self.last_used = time.monotonic()
+            if self._runs >= MAX_RUNS_PER_WORKER:
+                await self.close()
+            if not await self.start():
+                return None
+            assert self._proc is not None and self._proc.stdin is not None and self._tmpdir
+            self._runs += 1
+            output = os.path.join(self._tmpdir, f"run-{self._runs}.log")
+            request = {
+                "args": args, "output": output, "timeout": timeout_s, "module_mode": module_mode,
+            }
+            start = time.perf_counter()
+            try:
+                self._proc.stdin.write((json.dumps(request) + "\n").encode())
+                await self._proc.stdin.drain()
+                reply = await self._read_reply(timeout_s + _REPLY_GRACE_S)
+            except (TimeoutError, OSError) as exc:
+                logger.warning("pytest worker for %s failed: %s", self.root, exc)
+                reply = None
+            if reply is None or "error" in reply:
+                if reply is not None:
+                    logger.warning("pytest worker for %s: %s", self.root, reply["error"])
+                await self.close()
+                return None
+            self.last_used = time.monotonic()
+            return _collect(
+                output,
+                command=command,
+                exit_code=int(reply["exit_code"]),
+                killed=bool(reply.get("killed")),
+                duration_ms=int((time.perf_counter() - start) * 1000),
+                max_failures=max_failures,
+            )
+
+    async def run_scoped(
+        self,
+        changed_files: Sequence[str],
+        existing_files: Sequence[str],
+        *,
+        extra_args: str = "-x -q",
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+    ) -> StreamRunResult | None:
+        """Run the tests ``scope_tests_for_changes`` selects for *changed_files*.
+
+        Returns ``None`` when no test file matches.  Falls back to a
+        cold run when the worker is unavailable.
+        """
+        matched, command = scope_tests_for_changes(
+            changed_files, existing_files, extra_args=extra_args,
+        )
+        if not matched:
+            return None
+        result = await self.run(
+            [*matched, *shlex.split(extra_args)], timeout_s=timeout_s, command=command,
+        )
+        if result is None:
+            result = await stream_process(
+                command, cwd=self.root, env=self.env, timeout_s=timeout_s, parser="pytest",
+            )
+        return result
+
+    async def close(self) -> None:
+        """Stop the zygote (idempotent).  In-flight children are killed."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.returncode is None:
+            try:
+                if proc.stdin is not None:
+                    proc.stdin.close()
+                await asyncio.wait_for(proc.wait(), 2.0)
+            except (TimeoutError, OSError):
+                proc.kill()
+                await proc.wait()
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    async def _read_reply(self, timeout_s: float) -> dict | None:
+        """Read the next JSON line from the zygote, skipping stray output."""
+        assert self._proc is not None and self._proc.stdout is not None
+        deadline = time.monotonic() + timeout_s
+        while True:
+            line = await asyncio.wait_for(
+                self._proc.stdout.readline(), max(deadline - time.monotonic(), 0.01),
+            )
+            if not line:
+                return None  # zygote exited
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(reply, dict):
+                return reply
+
+    def _abandon(self) -> None:
+        """Kill the zygote without awaiting — for workers whose event loop
+        is gone or can't be awaited from the caller's context."""
+        if self._proc is not None and self._proc.returncode is None:
+            with contextlib.suppress(OSError):
+                os.kill(self._proc.pid, signal.SIGKILL)
+        self._proc = None
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    def __repr__(self) -> str:
+        return f"PytestWorker(root={self.root!r}, python={self.python!r}, alive={self.alive})"
+
+
+def _collect(
+    path: str,
+    *,
+    command: str,
+    exit_code: int,
+    killed: bool,
+    duration_ms: int,
+    max_failures: int | None,
+) -> StreamRunResult:
+    """Read a child's output file into a bounded, summarised result."""
+    buf = _OutputBuffer(MAX_STDOUT_BYTES)
+    summariser = IncrementalSummariser("pytest")
+    try:
+        with open(path, "rb") as fh:
+            for raw in fh:
+                line = raw.decode("utf-8", errors="replace").replace("\r\n", "\n")
+                buf.append(line)
+                summariser.feed(line)
+        os.unlink(path)
+    except OSError:
+        pass
+    stdout = buf.text()
+    summary = summariser.summary()
+    return StreamRunResult(
+        exit_code=exit_code,
+        stdout=stdout,
+        duration_ms=duration_ms,
+        truncated=buf.truncated,
+        killed=killed,
+        command=command,
+        summary=summary,
+        stopped_early=bool(max_failures) and summary.failed + summary.errors >= max_failures,
+        output_bytes=buf.total,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Per-workspace registry
+# ---------------------------------------------------------------------------
+
+_WORKERS: dict[str, PytestWorker] = {}
+_CLOSING: set[asyncio.Task[None]] = set()  # strong refs until each close finishes
+
+
+def _close_later(worker: PytestWorker) -> None:
+    task = asyncio.ensure_future(worker.close())
+    _CLOSING.add(task)
+    task.add_done_callback(_CLOSING.discard)
+
+
+def get_worker(root: str, *, python: str, env: dict[str, str] | None = None) -> PytestWorker:
+    """Return the worker for *root*, replacing it if *python* or *env* changed.
+
+    Also shuts down workers that have been idle for ``IDLE_TIMEOUT_S``.
+    Must be called from a running event loop.
+    """
+    key = os.path.realpath(root)
+    now = time.monotonic()
+    loop = asyncio.get_running_loop()
+    for other_key, other in list(_WORKERS.items()):
+        if other._loop is not loop:
+            del _WORKERS[other_key]
+            other._abandon()
+        elif other_key != key and now - other.last_used > IDLE_TIMEOUT_S and not other._lock.locked():
+            del _WORKERS[other_key]
+            _close_later(other)
+    worker = _WORKERS.get(key)
+    if worker is not None and (worker.python != python or worker.env != env):
+        _close_later(worker)
+        worker = None
+    if worker is None:
+        worker = _WORKERS[key] = PytestWorker(key, python=python, env=env)
+    return worker
+
+
+async def shutdown_workers(root: str | None = None) -> None:
+    """Stop the worker for *root*, or every worker when *root* is ``None``.
+
+    Call after installing packages into a workspace so the next run
+    doesn't fork from a zygote holding the old versions.
+    """
+    if root is None:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    else:
+        worker = _WORKERS.pop(os.path.realpath(root), None)
+        workers = [worker] if worker is not None else []
+    loop = asyncio.get_running_loop()
+    for worker in workers:
+        if worker._loop is loop:
+            await worker.close()
+        else:
+            worker._abandon()
+
+
+async def run_pytest(
+    command: str,
+    *,
+    cwd: str,
+    env: dict[str, str] | None = None,
+    timeout_s: float = DEFAULT_TIMEOUT_S,
+    max_failures: int | None = None,
+    fallback: bool = True,
+) -> StreamRunResult | None:
+    """Run a pytest *command* on *cwd*'s warm worker.
+
+    No validation is applied — callers check the command first, as for
+    ``stream_process``.  When the worker cannot take the command, runs it
+    cold through ``stream_process`` — or returns ``None`` if *fallback*
+    is ``False``.
+    """
+    parsed = parse_pytest_command(command)
+    if parsed is not None:
+        name, args, module_mode = parsed
+        python = resolve_interpreter(name, env)
+        if python is not None:
+            worker = get_worker(cwd, python=python, env=env)
+            result = await worker.run(
+                args,
+                timeout_s=timeout_s,
+                module_mode=module_mode,
+                command=command,
+                max_failures=max_failures,
+            )
+            if result is not None:
+                return result
+    if not fallback:
+        return None
+    return await stream_process(
+        command,
+        cwd=cwd,
+        env=env,
+        timeout_s=timeout_s,
+        parser="pytest",
+        max_failures=max_failures,
+    )
+
+
+__all__ = [
+    "IDLE_TIMEOUT_S",
+    "MAX_RUNS_PER_WORKER",
+    "PytestWorker",
+    "get_worker",
+    "parse_pytest_command",
+    "resolve_interpreter",
+    "run_pytest",
+    "shutdown_workers",
+]
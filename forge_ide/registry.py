@@ -45,6 +45,8 @@ class Registry:
 
     def __init__(self) -> None:
         self._tools: dict[str, _ToolEntry] = {}
+        # Compiled tool list, rebuilt only when a tool is registered.
+        self._definitions: tuple[dict[str, Any], ...] | None = None
 
     # ------------------------------------------------------------------
     # Registration
@@ -73,6 +75,7 @@ class Registry:
             description=description,
             definition=definition,
         )
+        self._definitions = None
 
     # ------------------------------------------------------------------
     # Dispatch
@@ -148,8 +151,13 @@ class Registry:
     def list_tools(self) -> list[dict[str, Any]]:
         """Return Anthropic-compatible tool definitions for all
         registered tools.
+
+        The definitions are compiled once and reused, so every agent turn
+        sends the same tool block, in the same order (prompt-cache friendly).
         """
-        return [entry.definition for entry in self._tools.values()]
+        if self._definitions is None:
+            self._definitions = tuple(entry.definition for entry in self._tools.values())
+        return list(self._definitions)
 
     def has_tool(self, name: str) -> bool:
         return name in self._tools
@@ -5,13 +5,23 @@ directory proximity, filename similarity, and recency) plus a
 ``find_related`` orchestrator that aggregates scores and returns
 ranked results.
 
+``RelevanceIndex`` answers the same query without scoring every file:
+a directory trie yields the proximity candidates, stem maps yield the
+name-similarity candidates, cached import neighbourhoods yield the
+graph candidates, and an mtime-sorted list is walked outwards from the
+target only as far as recency can still change the top-k.  Results are
+identical to ``find_related`` over the same inputs.
+
 All functions are pure — they operate on in-memory data, never touch
 the filesystem or spawn subprocesses.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import bisect
+import heapq
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from pathlib import PurePosixPath
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -153,8 +163,8 @@ def score_recency(
         return 0.0
 
     # Normalise to UTC-aware
-    t = target_mtime if target_mtime.tzinfo else target_mtime.replace(tzinfo=timezone.utc)
-    c = candidate_mtime if candidate_mtime.tzinfo else candidate_mtime.replace(tzinfo=timezone.utc)
+    t = target_mtime if target_mtime.tzinfo else target_mtime.replace(tzinfo=UTC)
+    c = candidate_mtime if candidate_mtime.tzinfo else candidate_mtime.replace(tzinfo=UTC)
 
     delta_secs = abs((t - c).total_seconds())
     window_secs = window_hours * 3600.0
@@ -205,48 +215,311 @@ def find_related(
             target_meta = fm
             break
 
+    target_mtime = target_meta.last_modified if target_meta else None
     results: list[RelatedFile] = []
 
     for fm in all_files:
         if fm.path == target_path:
             continue
 
-        reasons: list[str] = []
-        total = 0.0
-
         ig = score_import_graph(target_path, fm.path, imports, importers)
-        if ig > 0:
-            total += ig
-            if ig >= 1.0:
-                reasons.append("direct import")
-            elif ig >= 0.8:
-                reasons.append("reverse import")
-            else:
-                reasons.append("transitive import")
+        related = _score_candidate(target_path, target_mtime, fm, ig)
+        if related is not None:
+            results.append(related)
+
+    results.sort(key=lambda r: r.score, reverse=True)
+    return results[:max_results]
+
+
+# ---------------------------------------------------------------------------
+# RelevanceIndex
+# ---------------------------------------------------------------------------
 
-        dp = score_directory_proximity(target_path, fm.path)
-        if dp > 0:
-            total += dp
-            reasons.append("directory proximity")
+_RECENCY_WINDOW_SECS = 24.0 * 3600.0
 
-        ns = score_name_similarity(target_path, fm.path)
-        if ns > 0:
-            total += ns
-            reasons.append("name similarity")
 
+class RelevanceIndex:
+    """Precomputed lookup structures for top-k ``find_related`` queries.
+
+    Only files that can score on a structural factor are visited:
+
+    - directory trie — same dir, parent/child and grandparent/grandchild/
+      sibling directories (proximity distance <= 2)
+    - stem maps — test/impl mirrors and shared 4-character stem prefixes
+    - import neighbourhoods — direct, reverse and 2-hop imports, computed
+      on first use per target and dropped when an edge they read changes
+
+    Recency-only candidates come from a list sorted by mtime, walked
+    outwards from the target and stopped once the next recency score
+    cannot reach the current k-th best.
+
+    ``FileIndex.relevance_index()`` builds one and keeps it current from
+    ``FileIndex.invalidate_file``; it can also be maintained by hand with
+    ``update_file``.
+    """
+
+    __slots__ = (
+        "_by_mtime",
+        "_dir_children",
+        "_dir_files",
+        "_files",
+        "_hoods",
+        "_imports",
+        "_next_order",
+        "_order",
+        "_prefixes",
+        "_reverse",
+        "_stems",
+    )
+
+    def __init__(self) -> None:
+        self._files: dict[str, FileMetadata] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        self._imports: dict[str, tuple[str, ...]] = {}
+        self._reverse: dict[str, set[str]] = {}
+        self._hoods: dict[str, dict[str, float]] = {}
+        self._dir_files: dict[tuple[str, ...], set[str]] = {}
+        self._dir_children: dict[tuple[str, ...], set[str]] = {}
+        self._stems: dict[str, set[str]] = {}
+        self._prefixes: dict[str, set[str]] = {}
+        self._by_mtime: list[tuple[float, str]] = []
+
+    # -- Factory ------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        files: Iterable[FileMetadata],
+        imports: dict[str, list[str]],
+    ) -> RelevanceIndex:
+        """Index *files* and the forward import graph *imports*.
+
+        Iteration order of *files* is the tie-break order, as it is for
+        ``find_related``.
+        """
+        idx = cls()
+        for path, modules in imports.items():
+            idx._set_imports(path, modules)
+        for fm in files:
+            idx._add(fm)
+        return idx
+
+    # -- Queries ------------------------------------------------------------
+
+    def related(self, target_path: str, *, max_results: int = 15) -> list[RelatedFile]:
+        """Return the same ranking as ``find_related`` for *target_path*."""
+        if max_results <= 0:
+            return []
+        target_meta = self._files.get(target_path)
         target_mtime = target_meta.last_modified if target_meta else None
-        rc = score_recency(target_mtime, fm.last_modified)
-        if rc > 0:
-            total += rc
-            reasons.append("recent modification")
 
-        if total > 0:
-            results.append(
-                RelatedFile(path=fm.path, score=round(total, 4), reasons=reasons)
-            )
+        hood = self._neighbourhood(target_path)
+        candidates = set(hood)
+        candidates.update(self._proximity_candidates(target_path))
+        candidates.update(self._name_candidates(target_path))
+        candidates.discard(target_path)
+
+        scored: list[tuple[float, int, RelatedFile]] = []
+        top: list[float] = []  # min-heap of the best max_results scores
+        for path in candidates:
+            fm = self._files.get(path)
+            if fm is None:
+                continue
+            related = _score_candidate(target_path, target_mtime, fm, hood.get(path, 0.0))
+            if related is not None:
+                scored.append((related.score, self._order[path], related))
+                _push_top(top, related.score, max_results)
+
+        if target_mtime is not None:
+            for fm, rc in self._recent_around(target_path, target_mtime, candidates):
+                if len(top) >= max_results and rc < top[0]:
+                    break
+                related = RelatedFile(path=fm.path, score=rc, reasons=["recent modification"])
+                scored.append((rc, self._order[fm.path], related))
+                _push_top(top, rc, max_results)
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [related for _, _, related in scored[:max_results]]
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._files
+
+    # -- Invalidation -------------------------------------------------------
+
+    def update_file(
+        self,
+        rel_path: str,
+        meta: FileMetadata | None,
+        imports: Iterable[str] = (),
+    ) -> None:
+        """Replace (or, with *meta* ``None``, remove) one file's entry.
+
+        A re-added file moves to the end of the tie-break order, matching
+        a dict whose key was popped and re-inserted.
+        """
+        self._remove(rel_path)
+        self._set_imports(rel_path, imports)
+        if meta is not None:
+            self._add(meta)
+
+    # -- Internal -----------------------------------------------------------
+
+    def _add(self, fm: FileMetadata) -> None:
+        path = fm.path
+        self._remove(path)
+        self._files[path] = fm
+        self._order[path] = self._next_order
+        self._next_order += 1
+
+        parts = _dir_parts(path)
+        self._dir_files.setdefault(parts, set()).add(path)
+        while parts:
+            parent = parts[:-1]
+            children = self._dir_children.setdefault(parent, set())
+            if parts[-1] in children:
+                break
+            children.add(parts[-1])
+            parts = parent
+
+        stem = _stem(path)
+        self._stems.setdefault(stem, set()).add(path)
+        if len(stem) >= 4:
+            self._prefixes.setdefault(stem[:4], set()).add(path)
+
+        ts = _timestamp(fm.last_modified)
+        if ts is not None:
+            bisect.insort(self._by_mtime, (ts, path))
+
+    def _remove(self, path: str) -> None:
+        fm = self._files.pop(path, None)
+        if fm is None:
+            return
+        del self._order[path]
+
+        parts = _dir_parts(path)
+        files = self._dir_files[parts]
+        files.discard(path)
+        while parts and not self._dir_files.get(parts) and not self._dir_children.get(parts):
+            self._dir_files.pop(parts, None)
+            self._dir_children.pop(parts, None)
+            parent = parts[:-1]
+            self._dir_children[parent].discard(parts[-1])
+            parts = parent
+        if not parts and not self._dir_files.get(parts):
+            self._dir_files.pop(parts, None)
+
+        stem = _stem(path)
+        _discard(self._stems, stem, path)
+        if len(stem) >= 4:
+            _discard(self._prefixes, stem[:4], path)
+
+        ts = _timestamp(fm.last_modified)
+        if ts is not None:
+            i = bisect.bisect_left(self._by_mtime, (ts, path))
+            if i < len(self._by_mtime) and self._by_mtime[i] == (ts, path):
+                del self._by_mtime[i]
+
+    def _set_imports(self, path: str, modules: Iterable[str]) -> None:
+        old = self._imports.pop(path, ())
+        new = tuple(modules)
+        if new:
+            self._imports[path] = new
+        if old == new:
+            return
+        for mod in set(old):
+            _discard(self._reverse, mod, path)
+        for mod in set(new):
+            self._reverse.setdefault(mod, set()).add(path)
+        # Neighbourhoods that read this file's edges: its own, the
+        # reverse-import view of each endpoint, and 2-hop walks through it.
+        stale = {path, *old, *new, *self._reverse.get(path, ())}
+        for target in stale:
+            self._hoods.pop(target, None)
+
+    def _neighbourhood(self, target: str) -> dict[str, float]:
+        """Import-graph scores (as ``score_import_graph``) keyed by candidate."""
+        hood = self._hoods.get(target)
+        if hood is not None:
+            return hood
+        hood = {}
+        direct = self._imports.get(target, ())
+        for mid in direct:
+            for cand in self._imports.get(mid, ()):
+                hood[cand] = 0.5
+        for cand in self._reverse.get(target, ()):
+            hood[cand] = 0.8
+        for cand in direct:
+            hood[cand] = 1.0
+        hood.pop(target, None)
+        self._hoods[target] = hood
+        return hood
+
+    def _proximity_candidates(self, target: str) -> Iterable[str]:
+        """Files within directory distance 2 of *target*."""
+        parts = _dir_parts(target)
+        dirs: list[tuple[str, ...]] = [parts]
+        for child in self._dir_children.get(parts, ()):
+            sub = (*parts, child)
+            dirs.append(sub)
+            dirs.extend((*sub, grandchild) for grandchild in self._dir_children.get(sub, ()))
+        if parts:
+            parent = parts[:-1]
+            dirs.append(parent)
+            dirs.extend((*parent, sibling) for sibling in self._dir_children.get(parent, ()) if sibling != parts[-1])
+            if parent:
+                dirs.append(parent[:-1])
+        for d in dirs:
+            yield from self._dir_files.get(d, ())
+
+    def _name_candidates(self, target: str) -> Iterable[str]:
+        """Files whose stem mirrors *target*'s or shares its 4-char prefix."""
+        stem = _stem(target)
+        mirrors = {f"test_{stem}", f"{stem}_test"}
+        if stem.startswith("test_"):
+            mirrors.add(stem[5:])
+        if stem.endswith("_test"):
+            mirrors.add(stem[:-5])
+        for mirror in mirrors:
+            yield from self._stems.get(mirror, ())
+        if len(stem) >= 4:
+            yield from self._prefixes.get(stem[:4], ())
+
+    def _recent_around(
+        self,
+        target: str,
+        target_mtime: datetime,
+        exclude: set[str],
+    ) -> Iterable[tuple[FileMetadata, float]]:
+        """Yield ``(meta, recency score)`` in descending score order.
+
+        Walks the mtime-sorted list outwards from *target_mtime*, skipping
+        *exclude*, until the recency window is exhausted.
+        """
+        ts = _timestamp(target_mtime)
+        entries = self._by_mtime
+        hi = bisect.bisect_left(entries, (ts, ""))
+        lo = hi - 1
+        while lo >= 0 or hi < len(entries):
+            if hi >= len(entries) or (lo >= 0 and ts - entries[lo][0] <= entries[hi][0] - ts):
+                path = entries[lo][1]
+                lo -= 1
+            else:
+                path = entries[hi][1]
+                hi += 1
+            if path == target or path in exclude:
+                continue
+            fm = self._files[path]
+            rc = score_recency(target_mtime, fm.last_modified)
+            if rc <= 0:
+                return
+            yield fm, rc
 
-    results.sort(key=lambda r: r.score, reverse=True)
-    return results[:max_results]
+    def __repr__(self) -> str:
+        return f"RelevanceIndex(files={len(self._files)})"
 
 
 # ---------------------------------------------------------------------------
@@ -254,6 +527,76 @@ def find_related(
 # ---------------------------------------------------------------------------
 
 
+def _score_candidate(
+    target_path: str,
+    target_mtime: datetime | None,
+    fm: FileMetadata,
+    ig: float,
+) -> RelatedFile | None:
+    """Combine the four factors for one candidate; ``None`` if it scores 0."""
+    reasons: list[str] = []
+    total = 0.0
+
+    if ig > 0:
+        total += ig
+        if ig >= 1.0:
+            reasons.append("direct import")
+        elif ig >= 0.8:
+            reasons.append("reverse import")
+        else:
+            reasons.append("transitive import")
+
+    dp = score_directory_proximity(target_path, fm.path)
+    if dp > 0:
+        total += dp
+        reasons.append("directory proximity")
+
+    ns = score_name_similarity(target_path, fm.path)
+    if ns > 0:
+        total += ns
+        reasons.append("name similarity")
+
+    rc = score_recency(target_mtime, fm.last_modified)
+    if rc > 0:
+        total += rc
+        reasons.append("recent modification")
+
+    if total <= 0:
+        return None
+    return RelatedFile(path=fm.path, score=round(total, 4), reasons=reasons)
+
+
+def _push_top(heap: list[float], score: float, k: int) -> None:
+    if len(heap) < k:
+        heapq.heappush(heap, score)
+    elif score > heap[0]:
+        heapq.heapreplace(heap, score)
+
+
+def _dir_parts(path: str) -> tuple[str, ...]:
+    return PurePosixPath(path.replace("\\", "/")).parent.parts
+
+
+def _stem(path: str) -> str:
+    return PurePosixPath(path.replace("\\", "/")).stem
+
+
+def _timestamp(mtime: datetime | None) -> float | None:
+    if mtime is None:
+        return None
+    if mtime.tzinfo is None:
+        mtime = mtime.replace(tzinfo=UTC)
+    return mtime.timestamp()
+
+
+def _discard(buckets: dict[str, set[str]], key: str, path: str) -> None:
+    bucket = buckets.get(key)
+    if bucket is not None:
+        bucket.discard(path)
+        if not bucket:
+            del buckets[key]
+
+
 def _is_test_impl_pair(stem_a: str, stem_b: str) -> bool:
     """Return True if *stem_a* and *stem_b* are a test↔impl pair.
 
@@ -269,6 +612,7 @@ def _is_test_impl_pair(stem_a: str, stem_b: str) -> bool:
 
 __all__ = [
     "RelatedFile",
+    "RelevanceIndex",
     "find_related",
     "score_directory_proximity",
     "score_import_graph",
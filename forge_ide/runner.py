@@ -4,22 +4,39 @@ Provides ``run()`` for executing sandboxed shell commands and returning
 structured ``RunResult`` models.  Command validation, environment isolation,
 timeout management and output truncation are all handled transparently.
 
+``run_streaming()`` is the incremental variant: output is read as it is
+produced, held in bounded head/tail buffers, parsed line by line, and
+reported through an optional progress callback.  It can stop a test run
+after the first N failures.  ``stream_process()`` is the same machinery
+without command validation, for callers that apply their own policy.
+
 No LLM involvement — this is a pure systems layer.
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
+import logging
 import os
+import signal
 import time
-from typing import TYPE_CHECKING
+from collections import deque
+from collections.abc import Awaitable, Callable
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from forge_ide.errors import SandboxViolation
+from forge_ide.log_parser import (
+    BuildSummary,
+    GenericSummary,
+    IncrementalSummariser,
+    NpmTestSummary,
+    PytestSummary,
+    detect_parser,
+)
 
-if TYPE_CHECKING:
-    pass  # reserved for future type-only imports
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -28,6 +45,11 @@ if TYPE_CHECKING:
 MAX_STDOUT_BYTES: int = 50_000  # 50 KB
 MAX_STDERR_BYTES: int = 10_000  # 10 KB
 DEFAULT_TIMEOUT_S: int = 120
+PROGRESS_INTERVAL_S: float = 0.5  # min gap between progress events without new counts
+
+_READ_CHUNK: int = 64 * 1024
+_MAX_LINE_BYTES: int = 64 * 1024  # a line longer than this is split
+_KILL_GRACE_S: float = 2.0
 
 INJECTION_CHARS: frozenset[str] = frozenset({
     ";", "|", "&", "`", "$", "(", ")", "{", "}",
@@ -88,6 +110,39 @@ class RunResult(BaseModel):
     command: str = Field(..., description="The command that was executed")
 
 
+class StreamRunResult(RunResult):
+    """``RunResult`` from ``run_streaming`` / ``stream_process``."""
+
+    summary: PytestSummary | NpmTestSummary | BuildSummary | GenericSummary | None = Field(
+        default=None, description="Parsed summary of the output",
+    )
+    stopped_early: bool = Field(
+        default=False,
+        description="True if the process was stopped after max_failures failures",
+    )
+    output_bytes: int = Field(
+        default=0, ge=0, description="Total characters produced, before truncation",
+    )
+
+
+class RunProgress(BaseModel):
+    """Live progress event emitted while a streamed command runs."""
+
+    model_config = ConfigDict(frozen=True)
+
+    command: str
+    elapsed_ms: int = Field(default=0, ge=0)
+    lines: int = Field(default=0, ge=0, description="Output lines seen so far")
+    passed: int = Field(default=0, ge=0)
+    failed: int = Field(default=0, ge=0)
+    errors: int = Field(default=0, ge=0)
+    skipped: int = Field(default=0, ge=0)
+    last_line: str = Field(default="", description="Most recent output line")
+
+
+ProgressCallback = Callable[[RunProgress], "Awaitable[None] | None"]
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -159,6 +214,74 @@ def _truncate(text: str, max_bytes: int) -> tuple[str, bool]:
     )
 
 
+class _OutputBuffer:
+    """Bounded capture of one output stream.
+
+    Keeps the first quarter of the budget verbatim (the command banner,
+    collection output) and a rolling tail for the rest (where summaries
+    and tracebacks land).  Whatever falls in between is dropped and
+    replaced by a marker in ``text()``.
+    """
+
+    __slots__ = ("_head", "_head_room", "_tail", "_tail_room", "_tail_size", "total")
+
+    def __init__(self, max_bytes: int) -> None:
+        self._head: list[str] = []
+        self._head_room = max_bytes // 4
+        self._tail: deque[str] = deque()
+        self._tail_size = 0
+        self._tail_room = max_bytes - self._head_room
+        self.total = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > sum(map(len, self._head)) + self._tail_size
+
+    def append(self, text: str) -> None:
+        self.total += len(text)
+        if self._head_room:
+            take = text[: self._head_room]
+            self._head.append(take)
+            self._head_room -= len(take)
+            text = text[len(take):]
+        if not text or not self._tail_room:
+            return
+        if len(text) > self._tail_room:
+            text = text[-self._tail_room:]
+        self._tail.append(text)
+        self._tail_size += len(text)
+        while self._tail_size > self._tail_room:
+            excess = self._tail_size - self._tail_room
+            first = self._tail[0]
+            if len(first) <= excess:
+                self._tail.popleft()
+                self._tail_size -= len(first)
+            else:
+                self._tail[0] = first[excess:]
+                self._tail_size -= excess
+
+    def text(self) -> str:
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        dropped = self.total - len(head) - len(tail)
+        if not dropped:
+            return head + tail
+        return f"{head}\n\n[... {dropped} bytes omitted ...]\n\n{tail}"
+
+
+def _kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill *proc* and, on POSIX, every process in its session."""
+    if proc.returncode is not None:
+        return
+    try:
+        if os.name != "nt":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
 # ---------------------------------------------------------------------------
 # Core runner
 # ---------------------------------------------------------------------------
@@ -255,3 +378,236 @@ async def run(
         killed=was_killed,
         command=command,
     )
+
+
+# ---------------------------------------------------------------------------
+# Streaming runner
+# ---------------------------------------------------------------------------
+
+
+async def stream_process(
+    command: str,
+    *,
+    timeout_s: float = DEFAULT_TIMEOUT_S,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    parser: str | None = None,
+    max_failures: int | None = None,
+    on_progress: ProgressCallback | None = None,
+    max_stdout_bytes: int = MAX_STDOUT_BYTES,
+    max_stderr_bytes: int = MAX_STDERR_BYTES,
+) -> StreamRunResult:
+    """Run *command* with streamed, size-bounded output capture.
+
+    No validation is applied and *env* is passed through unchanged
+    (``None`` → inherit); ``run_streaming`` is the sandboxed entry point.
+
+    Parameters
+    ----------
+    command:
+        Shell command string.
+    timeout_s:
+        Maximum wall-clock seconds before the process tree is killed.
+    cwd:
+        Working directory for the subprocess.  ``None`` → inherit.
+    env:
+        Complete environment for the subprocess.
+    parser:
+        Log parser name (``"pytest"``, ``"npm"``, ``"build"``,
+        ``"generic"``).  ``None`` → ``detect_parser(command)``.
+    max_failures:
+        Stop the run once this many failed / errored tests have been
+        seen.  ``None`` or ``0`` → run to completion.
+    on_progress:
+        Called with a ``RunProgress`` whenever the live test counts
+        change, and otherwise at most every ``PROGRESS_INTERVAL_S`` while
+        output is arriving.  May be a coroutine function.  Exceptions it
+        raises are logged and ignored.
+    max_stdout_bytes, max_stderr_bytes:
+        Capture budgets per stream; see ``StreamRunResult.truncated``.
+    """
+    summariser = IncrementalSummariser(parser or detect_parser(command))  # type: ignore[arg-type]
+    out_buf = _OutputBuffer(max_stdout_bytes)
+    err_buf = _OutputBuffer(max_stderr_bytes)
+    limit_hit = asyncio.Event()
+    start = time.perf_counter()
+    last_emit = 0.0
+    last_line = ""
+
+    def elapsed_ms() -> int:
+        return int((time.perf_counter() - start) * 1000)
+
+    async def emit(force: bool) -> None:
+        nonlocal last_emit
+        now = time.perf_counter()
+        if on_progress is None or (not force and now - last_emit < PROGRESS_INTERVAL_S):
+            return
+        last_emit = now
+        event = RunProgress(
+            command=command,
+            elapsed_ms=elapsed_ms(),
+            lines=summariser.lines_seen,
+            passed=summariser.passed,
+            failed=summariser.failed,
+            errors=summariser.errors,
+            skipped=summariser.skipped,
+            last_line=last_line,
+        )
+        try:
+            pending = on_progress(event)
+            if inspect.isawaitable(pending):
+                await pending
+        except Exception:
+            logger.warning("Progress callback failed for %r", command, exc_info=True)
+
+    def consume(raw: bytes, buf: _OutputBuffer) -> bool:
+        nonlocal last_line
+        line = raw.decode("utf-8", errors="replace").replace("\r\n", "\n")
+        buf.append(line)
+        changed = summariser.feed(line)
+        last_line = line.rstrip()
+        if max_failures and summariser.failures >= max_failures:
+            limit_hit.set()
+        return changed
+
+    async def pump(stream: asyncio.StreamReader, buf: _OutputBuffer) -> None:
+        pending = b""
+        while chunk := await stream.read(_READ_CHUNK):
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            changed = False
+            for raw in lines:
+                changed |= consume(raw + b"\n", buf)
+            while len(pending) > _MAX_LINE_BYTES:
+                changed |= consume(pending[:_MAX_LINE_BYTES], buf)
+                pending = pending[_MAX_LINE_BYTES:]
+            await emit(changed)
+        if pending:
+            consume(pending, buf)
+
+    def result(exit_code: int, *, killed: bool = False, stopped: bool = False) -> StreamRunResult:
+        stdout, stderr = out_buf.text(), err_buf.text()
+        return StreamRunResult(
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            duration_ms=elapsed_ms(),
+            truncated=out_buf.truncated or err_buf.truncated,
+            killed=killed,
+            command=command,
+            summary=summariser.summary(stdout, stderr),
+            stopped_early=stopped,
+            output_bytes=out_buf.total + err_buf.total,
+        )
+
+    try:
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            start_new_session=os.name != "nt",
+        )
+    except NotImplementedError:
+        # Windows selector event loop: no subprocess support — run the
+        # command in a thread and parse its output afterwards.
+        exit_code, raw_out, raw_err, was_killed = await asyncio.to_thread(
+            _run_blocking, command, cwd, env, timeout_s,
+        )
+        for raw, buf in ((raw_out, out_buf), (raw_err, err_buf)):
+            for line in raw.splitlines(keepends=True):
+                consume(line, buf)
+        await emit(True)
+        return result(exit_code, killed=was_killed)
+    except Exception as exc:
+        err_buf.append(f"Error: {exc}")
+        return result(-1)
+
+    assert proc.stdout is not None and proc.stderr is not None
+    finished = asyncio.gather(pump(proc.stdout, out_buf), pump(proc.stderr, err_buf), proc.wait())
+    limit_wait = asyncio.ensure_future(limit_hit.wait())
+    killed = stopped = False
+    try:
+        done, _ = await asyncio.wait(
+            {finished, limit_wait}, timeout=timeout_s, return_when=asyncio.FIRST_COMPLETED,
+        )
+        if finished not in done:
+            stopped = limit_wait in done
+            killed = not stopped
+            _kill_process_tree(proc)
+            try:
+                # Pipes close once the tree is gone; a process that escaped
+                # the session could hold them open, so don't wait forever.
+                await asyncio.wait_for(finished, _KILL_GRACE_S)
+            except TimeoutError:
+                logger.warning("Output pipes still open after killing %r", command)
+        await emit(True)
+    finally:
+        limit_wait.cancel()
+        _kill_process_tree(proc)
+
+    if killed or proc.returncode is None:
+        return result(-1, killed=killed, stopped=stopped)
+    return result(proc.returncode, stopped=stopped)
+
+
+async def run_streaming(
+    command: str,
+    *,
+    timeout_s: int = DEFAULT_TIMEOUT_S,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    allowed_prefixes: tuple[str, ...] | None = None,
+    max_failures: int | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> StreamRunResult:
+    """Sandboxed, streaming counterpart of ``run``.
+
+    Applies the same validation and environment isolation as ``run``,
+    then executes through ``stream_process``.  Memory use is bounded by
+    ``MAX_STDOUT_BYTES`` + ``MAX_STDERR_BYTES`` regardless of how much
+    the command prints, and ``StreamRunResult.summary`` is already
+    parsed.
+
+    Raises
+    ------
+    SandboxViolation
+        When the command fails validation.
+    """
+    error = validate_command(command, allowed_prefixes)
+    if error:
+        raise SandboxViolation(error)
+    return await stream_process(
+        command,
+        timeout_s=timeout_s,
+        cwd=cwd,
+        env=_build_env(env),
+        max_failures=max_failures,
+        on_progress=on_progress,
+    )
+
+
+def _run_blocking(
+    command: str,
+    cwd: str | None,
+    env: dict[str, str] | None,
+    timeout_s: float,
+) -> tuple[int, bytes, bytes, bool]:
+    """``subprocess.run`` fallback for event loops without subprocess support."""
+    import subprocess as _sp
+
+    try:
+        proc = _sp.run(
+            command,
+            capture_output=True,
+            stdin=_sp.DEVNULL,
+            cwd=cwd,
+            env=env,
+            shell=True,
+            timeout=timeout_s,
+        )
+        return proc.returncode, proc.stdout or b"", proc.stderr or b"", False
+    except _sp.TimeoutExpired as exc:
+        return -1, exc.stdout or b"", exc.stderr or b"", True
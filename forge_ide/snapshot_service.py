@@ -0,0 +1,372 @@
+"""Snapshot service — a ``WorkspaceSnapshot`` kept current by change events.
+
+``capture_snapshot`` reads and parses every file in the workspace.
+``SnapshotService`` does that once, remembers each file's contribution,
+and afterwards applies per-file deltas to the symbol table, dependency
+graph, test inventory and schema inventory.  Requesting a fresh snapshot
+after a write therefore costs O(changed files).
+
+Change sources (use any combination):
+
+- ``notify_changed(paths)`` — explicit notification, e.g. from the tool
+  layer; ``watch_tool_writes()`` subscribes to ``write_file`` events.
+- ``start()`` — background watcher thread using inotify when the optional
+  ``inotify_simple`` package is installed (Linux), otherwise a stat-polling
+  sweep every ``poll_interval`` seconds.
+- ``refresh()`` — a one-off stat sweep with no thread involved.
+
+Thread-safe: watcher threads only queue paths; the analysis runs on the
+thread that calls ``snapshot()``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import stat
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from forge_ide.workspace import (
+    DEFAULT_SKIP_DIRS,
+    Workspace,
+    WorkspaceSnapshot,
+    _analyse_file,
+    _detect_language,
+    _read_source,
+    _SnapshotIndex,
+    _tree_lines_from_paths,
+)
+
+try:
+    from inotify_simple import INotify  # optional — Linux only
+    from inotify_simple import flags as _inotify_flags
+except ImportError:  # pragma: no cover - depends on environment
+    INotify = None  # type: ignore[assignment,misc]
+    _inotify_flags = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_POLL_INTERVAL_SECS: float = 1.0
+
+# (st_mtime_ns, st_size) — enough to tell whether a file needs re-reading
+_Signature = tuple[int, int]
+
+
+# ---------------------------------------------------------------------------
+# SnapshotService
+# ---------------------------------------------------------------------------
+
+
+class SnapshotService:
+    """Long-lived, incrementally maintained workspace snapshot.
+
+    Parameters
+    ----------
+    workspace : Workspace
+        The workspace to track.  The initial full scan happens in the
+        constructor.
+    ignore_patterns : list[str] | None
+        Directory names to skip (default: ``DEFAULT_SKIP_DIRS``).
+    poll_interval : float
+        Seconds between sweeps for the polling watcher, and the read
+        timeout for the inotify watcher.
+
+    Usage::
+
+        with SnapshotService(ws) as svc:   # starts watcher + tool-write hook
+            ...
+            snap = svc.snapshot()          # O(changed) since the last call
+    """
+
+    __slots__ = (
+        "_index",
+        "_lock",
+        "_pending",
+        "_poll_interval",
+        "_root",
+        "_signatures",
+        "_skip",
+        "_snapshot",
+        "_stop",
+        "_thread",
+        "_tool_listener",
+        "_tree_text",
+        "_version",
+        "_workspace",
+    )
+
+    def __init__(
+        self,
+        workspace: Workspace,
+        *,
+        ignore_patterns: list[str] | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECS,
+    ) -> None:
+        self._workspace = workspace
+        self._root: Path = workspace.root
+        self._skip = frozenset(ignore_patterns) if ignore_patterns is not None else DEFAULT_SKIP_DIRS
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._index = _SnapshotIndex()
+        self._signatures: dict[str, _Signature] = {}
+        self._pending: set[str] = set()
+        self._tree_text: str | None = None
+        self._snapshot: WorkspaceSnapshot | None = None
+        self._version = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._tool_listener = None
+
+        for rel in sorted(_scan(self._root, self._skip)):
+            self._apply(rel)
+
+    # -- Properties ---------------------------------------------------------
+
+    @property
+    def workspace(self) -> Workspace:
+        return self._workspace
+
+    @property
+    def version(self) -> int:
+        """Incremented every time a file's contribution changes."""
+        return self._version
+
+    # -- Snapshot -----------------------------------------------------------
+
+    def snapshot(self) -> WorkspaceSnapshot:
+        """Return a snapshot reflecting every change queued so far.
+
+        Re-analyses only the queued files; returns the cached snapshot
+        object when nothing changed since the previous call.
+        """
+        with self._lock:
+            for rel in sorted(self._pending):
+                self._apply(rel)
+            self._pending.clear()
+            if self._snapshot is None:
+                if self._tree_text is None:
+                    lines: list[str] = []
+                    _tree_lines_from_paths(sorted(self._signatures), lines)
+                    self._tree_text = "\n".join(lines)
+                self._snapshot = self._index.build(self._tree_text)
+            return self._snapshot
+
+    # -- Change sources -----------------------------------------------------
+
+    def notify_changed(self, paths: Iterable[str]) -> None:
+        """Queue created / modified / deleted paths for the next snapshot.
+
+        Accepts workspace-relative paths (either separator) or absolute
+        paths inside the root.  Paths outside the workspace or inside
+        ignored directories are dropped.
+        """
+        with self._lock:
+            for path in paths:
+                rel = self._relative(path)
+                if rel is not None:
+                    self._pending.add(rel)
+
+    def refresh(self) -> int:
+        """Stat-sweep the workspace and queue files that appeared, vanished,
+        or whose (mtime, size) changed.  Returns how many were queued.
+
+        No file contents are read here — only ``stat`` calls.
+        """
+        current = _scan(self._root, self._skip)
+        with self._lock:
+            changed = {rel for rel, sig in current.items() if self._signatures.get(rel) != sig}
+            changed.update(rel for rel in self._signatures if rel not in current)
+            self._pending |= changed
+        return len(changed)
+
+    def watch_tool_writes(self) -> None:
+        """Subscribe to ``write_file`` tool events for this workspace."""
+        if self._tool_listener is not None:
+            return
+        from forge_ide.adapters import add_write_listener
+
+        root = os.path.realpath(self._root)
+
+        def _on_write(working_dir: str, rel_path: str) -> None:
+            if os.path.realpath(working_dir) == root:
+                self.notify_changed([rel_path])
+
+        self._tool_listener = _on_write
+        add_write_listener(_on_write)
+
+    def start(self) -> None:
+        """Start the background filesystem watcher (idempotent)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        target = self._watch_inotify if INotify is not None else self._watch_polling
+        self._thread = threading.Thread(
+            target=target, name=f"snapshot-watcher:{self._root.name}", daemon=True,
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the watcher thread and unsubscribe from tool writes."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        if self._tool_listener is not None:
+            from forge_ide.adapters import remove_write_listener
+
+            remove_write_listener(self._tool_listener)
+            self._tool_listener = None
+
+    def __enter__(self) -> SnapshotService:
+        self.start()
+        self.watch_tool_writes()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- Internals ----------------------------------------------------------
+
+    def _relative(self, path: str) -> str | None:
+        """Normalise *path* to a workspace-relative, forward-slash path."""
+        if not path:
+            return None
+        if os.path.isabs(path):
+            try:
+                path = os.path.relpath(path, self._root)
+            except ValueError:  # different drive (Windows)
+                return None
+        parts = [p for p in path.replace("\\", "/").split("/") if p and p != "."]
+        if not parts or ".." in parts or any(p in self._skip for p in parts):
+            return None
+        return "/".join(parts)
+
+    def _apply(self, rel: str) -> None:
+        """Bring one path's contribution up to date (caller holds the lock)."""
+        abs_path = self._root / rel
+        try:
+            st = abs_path.stat()
+        except OSError:
+            st = None
+
+        if st is not None and stat.S_ISDIR(st.st_mode):
+            # A directory appeared (created or moved in) — pick up its files.
+            for sub in sorted(_scan(abs_path, self._skip, prefix=rel + "/")):
+                self._apply(sub)
+            return
+
+        if st is None or not stat.S_ISREG(st.st_mode):
+            if rel in self._signatures:
+                self._forget(rel)
+            else:
+                # A directory vanished — drop everything under it.
+                prefix = rel + "/"
+                for sub in [p for p in self._signatures if p.startswith(prefix)]:
+                    self._forget(sub)
+            return
+
+        source = _read_source(abs_path)
+        language = _detect_language(abs_path.suffix)
+        self._index.add(rel, _analyse_file(rel, language, source))
+        if rel not in self._signatures:
+            self._tree_text = None
+        self._signatures[rel] = (st.st_mtime_ns, st.st_size)
+        self._snapshot = None
+        self._version += 1
+
+    def _forget(self, rel: str) -> None:
+        self._index.remove(rel)
+        del self._signatures[rel]
+        self._tree_text = None
+        self._snapshot = None
+        self._version += 1
+
+    def _watch_polling(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Snapshot polling sweep failed")
+
+    def _watch_inotify(self) -> None:
+        f = _inotify_flags
+        mask = f.CLOSE_WRITE | f.CREATE | f.DELETE | f.MOVED_FROM | f.MOVED_TO
+        inotify = INotify()
+        watches: dict[int, str] = {}  # watch descriptor -> relative dir ("" = root)
+
+        def add_tree(rel_dir: str) -> None:
+            top = self._root / rel_dir if rel_dir else self._root
+            for dirpath, dirnames, _ in os.walk(top):
+                dirnames[:] = [d for d in dirnames if d not in self._skip]
+                rel = os.path.relpath(dirpath, self._root).replace("\\", "/")
+                # OSError: directory vanished, or permission denied
+                with contextlib.suppress(OSError):
+                    watches[inotify.add_watch(dirpath, mask)] = "" if rel == "." else rel
+
+        try:
+            add_tree("")
+            # Catch anything written between the initial scan and arming watches
+            self.refresh()
+            timeout_ms = int(self._poll_interval * 1000)
+            while not self._stop.is_set():
+                changed: list[str] = []
+                for event in inotify.read(timeout=timeout_ms):
+                    if event.mask & f.IGNORED:
+                        watches.pop(event.wd, None)
+                        continue
+                    base = watches.get(event.wd)
+                    if base is None or not event.name:
+                        continue
+                    rel = f"{base}/{event.name}" if base else event.name
+                    if (
+                        event.mask & f.ISDIR
+                        and event.mask & (f.CREATE | f.MOVED_TO)
+                        and event.name not in self._skip
+                    ):
+                        add_tree(rel)
+                    changed.append(rel)
+                if changed:
+                    self.notify_changed(changed)
+        except OSError as exc:  # e.g. fs.inotify.max_user_watches exhausted
+            logger.warning("inotify watcher failed (%s) — falling back to polling", exc)
+            self._watch_polling()
+        finally:
+            inotify.close()
+
+    def __repr__(self) -> str:
+        return f"SnapshotService(root={str(self._root)!r}, files={len(self._signatures)})"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _scan(top: Path, skip: frozenset[str], *, prefix: str = "") -> dict[str, _Signature]:
+    """Return ``{relative path: signature}`` for every file under *top*."""
+    found: dict[str, _Signature] = {}
+    stack: list[tuple[str, str]] = [(str(top), prefix)]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip:
+                                stack.append((entry.path, f"{rel_dir}{entry.name}/"))
+                        elif entry.is_file():
+                            st = entry.stat()
+                            found[rel_dir + entry.name] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue  # vanished mid-scan
+        except OSError:
+            continue
+    return found
@@ -0,0 +1,306 @@
+"""Patch transactions — stage multi-file edits, validate, commit atomically.
+
+``PatchTransaction`` collects new contents for any number of files in
+memory (directly, from :class:`Edit` lists, or from unified diffs),
+checks them together, and only then touches disk:
+
+1. **Validate** — staged Python files must not gain syntax errors
+   (``parse_python_ast_errors``), and no file may have changed on disk
+   since it was read for staging.
+2. **Prepare** — each new content is written and fsynced to a temp file
+   beside its target, and the original bytes go into an undo journal.
+3. **Commit** — temp files are renamed over their targets
+   (``os.replace`` is atomic per file).  If any rename fails, every file
+   already replaced is restored from the journal.
+
+After a successful commit ``rollback()`` restores the journal, undoing
+the whole batch.  Either the batch lands or the workspace is left as it
+was — never half-patched.
+
+Usage::
+
+    with PatchTransaction(ws) as txn:
+        txn.stage_edits("app/main.py", edits)
+        txn.stage_patch("app/util.py", diff_text)
+    # committed here; an exception inside the block discards everything
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+from forge_ide.contracts import Diagnostic, Edit, EditResult
+from forge_ide.errors import TransactionAborted
+from forge_ide.lang.python_intel import parse_python_ast_errors
+from forge_ide.patcher import DEFAULT_FUZZ, PatchResult, apply_edits, apply_patch
+from forge_ide.workspace import Workspace
+
+_TEMP_SUFFIX = ".forge-tmp"
+
+
+class PatchTransaction:
+    """All-or-nothing application of edits across several files.
+
+    Parameters
+    ----------
+    workspace : Workspace | str | Path
+        Sandbox root.  Every path is resolved through
+        ``Workspace.resolve()``, so traversal attempts raise
+        ``SandboxViolation`` at staging time.
+    validate_python : bool
+        Reject the commit when a staged ``.py`` file has syntax errors
+        that its original did not (default True).
+    """
+
+    __slots__ = ("_base", "_journal", "_staged", "_state", "_validate_python", "_workspace")
+
+    def __init__(
+        self,
+        workspace: Workspace | str | Path,
+        *,
+        validate_python: bool = True,
+    ) -> None:
+        self._workspace = workspace if isinstance(workspace, Workspace) else Workspace(workspace)
+        self._validate_python = validate_python
+        # rel_path -> new content (None = delete)
+        self._staged: dict[str, str | None] = {}
+        # rel_path -> content when first read for staging (None = absent)
+        self._base: dict[str, str | None] = {}
+        # rel_path -> original bytes (None = did not exist), filled on commit
+        self._journal: dict[str, bytes | None] = {}
+        self._state = "open"
+
+    # -- Properties ---------------------------------------------------------
+
+    @property
+    def staged_paths(self) -> list[str]:
+        """Sorted relative paths with staged changes."""
+        return sorted(self._staged)
+
+    @property
+    def state(self) -> str:
+        """``open``, ``committed``, ``rolled_back`` or ``aborted``."""
+        return self._state
+
+    # -- Staging ------------------------------------------------------------
+
+    def read(self, rel_path: str) -> str | None:
+        """Return the staged content of *rel_path*, else its disk content.
+
+        ``None`` means the file does not exist (or is staged for deletion).
+        """
+        rel = self._normalise(rel_path)
+        if rel in self._staged:
+            return self._staged[rel]
+        return self._read_base(rel)
+
+    def stage(self, rel_path: str, content: str | None) -> None:
+        """Stage *content* for *rel_path*; ``None`` stages a deletion."""
+        self._require_open()
+        rel = self._normalise(rel_path)
+        self._read_base(rel)
+        self._staged[rel] = content
+
+    def stage_edits(self, rel_path: str, edits: list[Edit]) -> EditResult:
+        """Apply *edits* to the current content of *rel_path* and stage it.
+
+        Nothing is staged unless every edit applies; the returned
+        ``EditResult`` says which ones failed.
+        """
+        self._require_open()
+        current = self.read(rel_path)
+        if current is None:
+            return EditResult(
+                success=False,
+                file_path=rel_path,
+                failed=[(rel_path, "File does not exist")],
+            )
+        result = apply_edits(current, edits, file_path=rel_path)
+        if result.success:
+            self.stage(rel_path, result.final_content)
+        return result
+
+    def stage_patch(self, rel_path: str, diff_text: str, *, fuzz: int = DEFAULT_FUZZ) -> PatchResult:
+        """Apply a unified diff to the current content of *rel_path* and stage it.
+
+        Raises ``PatchConflict`` (staging nothing) when a hunk does not match.
+        """
+        self._require_open()
+        current = self.read(rel_path) or ""
+        result = apply_patch(current, diff_text, path=rel_path, fuzz=fuzz)
+        self.stage(rel_path, result.post_content)
+        return result
+
+    # -- Validation ---------------------------------------------------------
+
+    def validate(self) -> list[Diagnostic]:
+        """Return syntax errors introduced by the staged Python files."""
+        if not self._validate_python:
+            return []
+        diagnostics: list[Diagnostic] = []
+        for rel in self.staged_paths:
+            content = self._staged[rel]
+            if content is None or not rel.endswith(".py"):
+                continue
+            errors = parse_python_ast_errors(content, path=rel)
+            if errors and not parse_python_ast_errors(self._base.get(rel) or "", path=rel):
+                diagnostics.extend(errors)
+        return diagnostics
+
+    # -- Commit / rollback --------------------------------------------------
+
+    def commit(self) -> list[str]:
+        """Write every staged change, or none of them.
+
+        Returns the sorted list of paths that changed.
+
+        Raises
+        ------
+        TransactionAborted
+            When validation fails, a file changed on disk since it was
+            staged, or an I/O error occurred (after restoring the files
+            already written).
+        """
+        self._require_open()
+        diagnostics = self.validate()
+        if diagnostics:
+            self._state = "aborted"
+            raise TransactionAborted(
+                "staged changes introduce syntax errors",
+                paths=sorted({d.file for d in diagnostics}),
+                diagnostics=[d.model_dump() for d in diagnostics],
+            )
+
+        changes = {rel: c for rel, c in self._staged.items() if c != self._base.get(rel)}
+        stale = [rel for rel in sorted(changes) if self._disk_text(rel) != self._base.get(rel)]
+        if stale:
+            self._state = "aborted"
+            raise TransactionAborted("files changed on disk since staging", paths=stale)
+
+        temps: dict[str, str] = {}
+        written: list[str] = []
+        try:
+            for rel in sorted(changes):
+                target = self._workspace.resolve(rel)
+                self._journal[rel] = target.read_bytes() if target.is_file() else None
+                content = changes[rel]
+                if content is not None:
+                    temps[rel] = _write_temp(target, content.encode("utf-8"))
+            for rel in sorted(changes):
+                target = self._workspace.resolve(rel)
+                if rel in temps:
+                    os.replace(temps[rel], target)
+                    del temps[rel]
+                elif target.exists():
+                    target.unlink()
+                written.append(rel)
+        except OSError as exc:
+            for tmp in temps.values():
+                _unlink_quietly(tmp)
+            self._restore(written)
+            self._state = "aborted"
+            raise TransactionAborted(f"I/O error during commit: {exc}", paths=sorted(changes)) from exc
+
+        self._state = "committed"
+        return written
+
+    def rollback(self) -> list[str]:
+        """Undo a committed transaction from its journal.
+
+        Returns the restored paths.  Raises ``TransactionAborted`` if the
+        transaction is not in the committed state.
+        """
+        if self._state != "committed":
+            raise TransactionAborted(f"cannot roll back a transaction that is {self._state}")
+        restored = sorted(self._journal)
+        self._restore(restored)
+        self._state = "rolled_back"
+        return restored
+
+    def discard(self) -> None:
+        """Drop all staged changes without touching disk."""
+        self._staged.clear()
+        self._base.clear()
+        if self._state == "open":
+            self._state = "aborted"
+
+    def __enter__(self) -> PatchTransaction:
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        if exc_type is None and self._state == "open":
+            self.commit()
+        elif self._state == "open":
+            self.discard()
+
+    # -- Internal -----------------------------------------------------------
+
+    def _require_open(self) -> None:
+        if self._state != "open":
+            raise TransactionAborted(f"transaction is {self._state}")
+
+    def _normalise(self, rel_path: str) -> str:
+        self._workspace.resolve(rel_path)  # sandbox check
+        return "/".join(p for p in rel_path.replace("\\", "/").split("/") if p and p != ".")
+
+    def _read_base(self, rel: str) -> str | None:
+        if rel not in self._base:
+            self._base[rel] = self._disk_text(rel)
+        return self._base[rel]
+
+    def _disk_text(self, rel: str) -> str | None:
+        target = self._workspace.resolve(rel)
+        try:
+            return target.read_text(encoding="utf-8", errors="replace")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+
+    def _restore(self, paths: list[str]) -> None:
+        """Put the journalled originals of *paths* back (best effort)."""
+        for rel in paths:
+            original = self._journal.get(rel)
+            target = self._workspace.resolve(rel)
+            try:
+                if original is None:
+                    if target.exists():
+                        target.unlink()
+                else:
+                    os.replace(_write_temp(target, original), target)
+            except OSError:
+                continue
+
+    def __repr__(self) -> str:
+        return f"PatchTransaction(state={self._state!r}, staged={len(self._staged)})"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _write_temp(target: Path, data: bytes) -> str:
+    """Write *data* to a fsynced temp file beside *target*; return its path."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=_TEMP_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        if target.exists():
+            os.chmod(tmp, target.stat().st_mode & 0o7777)
+    except BaseException:
+        _unlink_quietly(tmp)
+        raise
+    return tmp
+
+
+def _unlink_quietly(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.unlink(path)
+
+
+__all__ = ["PatchTransaction"]
@@ -9,7 +9,10 @@ Provides a single ``Workspace`` instance per build that handles:
   test inventory, and schema inventory
 
 Thread-safe for reads; cache invalidation is cooperative (call
-``invalidate_cache()`` after writes).
+``invalidate_cache()`` after writes).  Once the TTL expires the tree is
+refreshed incrementally: only directories whose mtime changed are
+re-listed, and the files of the others are re-stat'ed, so listings and
+summaries are cheap to call freely.
 """
 
 from __future__ import annotations
@@ -18,6 +21,7 @@ import ast
 import os
 import re
 import time
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Annotated, Any
@@ -32,6 +36,11 @@ from forge_ide.errors import SandboxViolation
 
 DEFAULT_CACHE_TTL_SECS: float = 30.0
 
+# A directory listed within this long of its own mtime may have been
+# modified again in the same mtime tick — it is re-listed on the next
+# refresh until it has been stable for this long ("racily clean").
+_RACY_WINDOW_NS: int = 1_000_000_000
+
 DEFAULT_SKIP_DIRS: frozenset[str] = frozenset(
     {
         ".git",
@@ -161,6 +170,10 @@ class Workspace:
         "_cache_summary",
         "_cache_summary_ts",
         "_cache_ttl",
+        "_tree_dirs",
+        "_tree_key",
+        "_tree_dirty",
+        "_tree_entries",
     )
 
     def __init__(self, root: str | Path, *, cache_ttl: float = DEFAULT_CACHE_TTL_SECS) -> None:
@@ -178,6 +191,11 @@ class Workspace:
         self._cache_file_tree_key: frozenset[str] | None = None
         self._cache_summary: WorkspaceSummary | None = None
         self._cache_summary_ts: float = 0.0
+        # Incremental tree state: relative dir ("" = root) -> its listing
+        self._tree_dirs: dict[str, _DirListing] | None = None
+        self._tree_key: frozenset[str] | None = None
+        self._tree_dirty: set[str] = set()
+        self._tree_entries: list[FileEntry] | None = None
 
     # -- Properties ---------------------------------------------------------
 
@@ -271,7 +289,10 @@ class Workspace:
 
         Results are cached for ``cache_ttl`` seconds.  Different
         *ignore_patterns* values are treated as separate cache keys
-        and will trigger a re-scan.
+        and will trigger a re-scan.  After the TTL only directories
+        whose mtime changed are re-listed; files in the other directories
+        are re-stat'ed so in-place edits show up with their new
+        size/mtime.
 
         Parameters
         ----------
@@ -289,53 +310,114 @@ class Workspace:
         ):
             return self._cache_file_tree
 
-        entries: list[FileEntry] = []
-        for dirpath_str, dirnames, filenames in os.walk(self._root):
-            # Filter out skip dirs in-place
-            dirnames[:] = sorted(d for d in dirnames if d not in skip)
+        self._sync_tree(skip)
+        if self._tree_entries is None:
+            self._tree_entries = self._build_entries()
+        entries = list(self._tree_entries)
+
+        self._cache_file_tree = entries
+        self._cache_file_tree_ts = now
+        self._cache_file_tree_key = skip
+        return entries
 
-            dirpath = Path(dirpath_str)
-            rel_dir = dirpath.relative_to(self._root)
+    def _sync_tree(self, skip: frozenset[str]) -> None:
+        """Bring ``_tree_dirs`` up to date — full walk or incremental refresh."""
+        if self._tree_dirs is None or self._tree_key != skip:
+            self._tree_dirs = {}
+            self._tree_key = skip
+            self._tree_dirty.clear()
+            self._walk("", skip)
+            changed = True
+        else:
+            changed = self._refresh_dirs(skip)
+        if changed:
+            self._tree_entries = None
+            self._cache_summary = None
+
+    def _walk(self, rel_dir: str, skip: frozenset[str]) -> None:
+        """List *rel_dir* and every directory below it into ``_tree_dirs``."""
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            listing = _scan_dir(self._root_str, current, skip)
+            if listing is None:
+                continue
+            self._tree_dirs[current] = listing
+            prefix = f"{current}/" if current else ""
+            stack.extend(prefix + name for name in listing.subdirs)
+
+    def _refresh_dirs(self, skip: frozenset[str]) -> bool:
+        """Re-list directories whose mtime changed and re-stat the files of
+        the rest; return True if anything changed."""
+        changed = False
+        dirs = self._tree_dirs
+        for rel_dir in list(dirs):
+            listing = dirs.get(rel_dir)
+            if listing is None:
+                continue  # dropped along with a removed parent
+            abs_dir = os.path.join(self._root_str, rel_dir) if rel_dir else self._root_str
+            try:
+                mtime_ns = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if (
+                mtime_ns == listing.mtime_ns
+                and rel_dir not in self._tree_dirty
+                and listing.scanned_ns - mtime_ns >= _RACY_WINDOW_NS
+            ):
+                # Same entries — but files edited in place don't touch the
+                # directory mtime, so refresh their size/mtime.
+                changed = _restat_files(self._root_str, listing.files) or changed
+                continue
 
+            changed = True
+            fresh = _scan_dir(self._root_str, rel_dir, skip) if mtime_ns is not None else None
+            if fresh is None:
+                self._drop_subtree(rel_dir)
+                continue
+            dirs[rel_dir] = fresh
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            old_subdirs, new_subdirs = set(listing.subdirs), set(fresh.subdirs)
+            for name in old_subdirs - new_subdirs:
+                self._drop_subtree(prefix + name)
+            for name in new_subdirs - old_subdirs:
+                self._walk(prefix + name, skip)
+        self._tree_dirty.clear()
+        return changed
+
+    def _drop_subtree(self, rel_dir: str) -> None:
+        prefix = rel_dir + "/"
+        for key in [k for k in self._tree_dirs if k == rel_dir or k.startswith(prefix)]:
+            del self._tree_dirs[key]
+
+    def _build_entries(self) -> list[FileEntry]:
+        """Materialise ``FileEntry`` models from the compact listings."""
+        entries: list[FileEntry] = []
+        for rel_dir, listing in self._tree_dirs.items():
             # Add directory entries (except root itself)
-            if rel_dir != Path("."):
+            if rel_dir:
                 entries.append(
-                    FileEntry(
-                        path=str(rel_dir).replace("\\", "/"),
+                    FileEntry.model_construct(
+                        path=rel_dir,
                         is_dir=True,
                         size_bytes=0,
                         language="unknown",
-                        last_modified=_safe_mtime(dirpath),
+                        last_modified=_utc(listing.mtime),
                     )
                 )
-
-            for fname in sorted(filenames):
-                fpath = dirpath / fname
-                rel = fpath.relative_to(self._root)
-                try:
-                    stat = fpath.stat()
-                    size = stat.st_size
-                    mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-                except OSError:
-                    size = 0
-                    mtime = None
-
+            for rec in listing.files:
                 entries.append(
-                    FileEntry(
-                        path=str(rel).replace("\\", "/"),
+                    FileEntry.model_construct(
+                        path=rec.path,
                         is_dir=False,
-                        size_bytes=size,
-                        language=_detect_language(fpath.suffix),
-                        last_modified=mtime,
+                        size_bytes=rec.size,
+                        language=rec.language,
+                        last_modified=_utc(rec.mtime),
                     )
                 )
 
         # Sort entries by path for deterministic output
         entries.sort(key=lambda e: e.path)
-
-        self._cache_file_tree = entries
-        self._cache_file_tree_ts = now
-        self._cache_file_tree_key = skip
         return entries
 
     # -- Workspace summary --------------------------------------------------
@@ -349,23 +431,25 @@ class Workspace:
         ):
             return self._cache_summary
 
-        tree = self.file_tree()  # uses its own cache
-        files_only = [e for e in tree if not e.is_dir]
-        total_size = sum(e.size_bytes for e in files_only)
-
+        # Aggregate straight from the compact listings (no FileEntry models)
+        self._sync_tree(DEFAULT_SKIP_DIRS)
+        file_count = 0
+        total_size = 0
         langs: dict[str, int] = {}
-        latest: datetime | None = None
-        for f in files_only:
-            langs[f.language] = langs.get(f.language, 0) + 1
-            if f.last_modified is not None:
-                if latest is None or f.last_modified > latest:
-                    latest = f.last_modified
+        latest: float | None = None
+        for listing in self._tree_dirs.values():
+            for rec in listing.files:
+                file_count += 1
+                total_size += rec.size
+                langs[rec.language] = langs.get(rec.language, 0) + 1
+                if rec.mtime is not None and (latest is None or rec.mtime > latest):
+                    latest = rec.mtime
 
         summary = WorkspaceSummary(
-            file_count=len(files_only),
+            file_count=file_count,
             total_size_bytes=total_size,
             languages=langs,
-            last_modified=latest,
+            last_modified=_utc(latest),
         )
 
         self._cache_summary = summary
@@ -374,13 +458,26 @@ class Workspace:
 
     # -- Cache management ---------------------------------------------------
 
-    def invalidate_cache(self) -> None:
-        """Clear all cached data (file tree + summary)."""
+    def invalidate_cache(self, changed_paths: Iterable[str] | None = None) -> None:
+        """Clear cached data (file tree + summary).
+
+        With *changed_paths* (workspace-relative), only the directories
+        holding those paths are re-listed on the next call; without it
+        the next call walks the whole tree again.
+        """
         self._cache_file_tree = None
         self._cache_file_tree_ts = 0.0
         self._cache_file_tree_key = None
         self._cache_summary = None
         self._cache_summary_ts = 0.0
+        if changed_paths is None:
+            self._tree_dirs = None
+            self._tree_entries = None
+            self._tree_dirty.clear()
+            return
+        for path in changed_paths:
+            parent = path.replace("\\", "/").strip("/").rpartition("/")[0]
+            self._tree_dirty.add(parent)
 
     # -- Repr ---------------------------------------------------------------
 
@@ -398,13 +495,101 @@ def _detect_language(ext: str) -> str:
     return _EXTENSION_LANGUAGE.get(ext.lower(), "unknown")
 
 
-def _safe_mtime(path: Path) -> datetime | None:
-    """Get the last-modified time for *path*, or None on error."""
+def _utc(ts: float | None) -> datetime | None:
+    return datetime.fromtimestamp(ts, tz=timezone.utc) if ts is not None else None
+
+
+class _FileRecord:
+    """Compact per-file tree record — ``FileEntry`` models are built lazily."""
+
+    __slots__ = ("language", "mtime", "path", "size")
+
+    def __init__(self, path: str, size: int, mtime: float | None, language: str) -> None:
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.language = language
+
+
+class _DirListing:
+    """One directory's direct children, plus the mtime they were read at."""
+
+    __slots__ = ("files", "mtime", "mtime_ns", "scanned_ns", "subdirs")
+
+    def __init__(
+        self,
+        mtime_ns: int,
+        mtime: float,
+        scanned_ns: int,
+        files: list[_FileRecord],
+        subdirs: list[str],
+    ) -> None:
+        self.mtime_ns = mtime_ns
+        self.mtime = mtime
+        self.scanned_ns = scanned_ns
+        self.files = files
+        self.subdirs = subdirs
+
+
+def _restat_files(root: str, files: list[_FileRecord]) -> bool:
+    """Refresh each record's size/mtime in place; return True if any changed."""
+    changed = False
+    for rec in files:
+        try:
+            st = os.stat(os.path.join(root, rec.path))
+            size: int = st.st_size
+            mtime: float | None = st.st_mtime
+        except OSError:
+            size = 0
+            mtime = None
+        if size != rec.size or mtime != rec.mtime:
+            rec.size = size
+            rec.mtime = mtime
+            changed = True
+    return changed
+
+
+def _scan_dir(root: str, rel_dir: str, skip: frozenset[str]) -> _DirListing | None:
+    """List one directory with ``os.scandir``, reusing each entry's stat.
+
+    Mirrors ``os.walk(followlinks=False)``: symlinked directories are
+    neither listed nor descended into; broken symlinks are listed as
+    files with no size/mtime.
+    """
+    abs_dir = os.path.join(root, rel_dir) if rel_dir else root
+    prefix = f"{rel_dir}/" if rel_dir else ""
+    scanned_ns = time.time_ns()
     try:
-        return datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+        st = os.stat(abs_dir)
+        it = os.scandir(abs_dir)
     except OSError:
         return None
 
+    files: list[_FileRecord] = []
+    subdirs: list[str] = []
+    with it:
+        for entry in it:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if name not in skip and not entry.is_symlink():
+                    subdirs.append(name)
+                continue
+            try:
+                est = entry.stat()
+                size: int = est.st_size
+                mtime: float | None = est.st_mtime
+            except OSError:
+                size = 0
+                mtime = None
+            files.append(
+                _FileRecord(prefix + name, size, mtime, _detect_language(os.path.splitext(name)[1]))
+            )
+    return _DirListing(st.st_mtime_ns, st.st_mtime, scanned_ns, files, subdirs)
+
 
 # ---------------------------------------------------------------------------
 # Workspace Snapshot — unified reconnaissance artefact
@@ -421,6 +606,10 @@ _SQL_COLUMN_PATTERN = re.compile(
     r"^\s+(\w+)\s+(TEXT|VARCHAR|INTEGER|BIGINT|SERIAL|UUID|BOOLEAN|TIMESTAMP|JSONB|REAL|FLOAT|NUMERIC|INT|SMALLINT|BYTEA)",
     re.IGNORECASE | re.MULTILINE,
 )
+_ALEMBIC_TABLE_PATTERN = re.compile(r"op\.create_table\(\s*['\"](\w+)['\"]")
+_TS_EXPORT_PATTERN = re.compile(
+    r"export\s+(?:default\s+)?(?:async\s+)?(?:function|class|const|let|var|interface|type|enum)\s+(\w+)"
+)
 
 
 class TestInventory(BaseModel):
@@ -478,6 +667,270 @@ class WorkspaceSnapshot(BaseModel):
     )
 
 
+class _FileFacts:
+    """Everything a snapshot derives from one file — kept so it can be undone."""
+
+    __slots__ = (
+        "columns",
+        "frameworks",
+        "imports",
+        "is_test",
+        "language",
+        "lines",
+        "migration",
+        "symbols",
+        "tables",
+        "test_count",
+    )
+
+    def __init__(self, language: str) -> None:
+        self.language = language
+        self.lines = 0
+        self.symbols: dict[str, str] = {}
+        self.imports: tuple[str, ...] = ()
+        self.is_test = False
+        self.test_count = 0
+        self.frameworks: frozenset[str] = frozenset()
+        self.migration = False
+        self.tables: tuple[str, ...] = ()
+        self.columns: dict[str, tuple[str, ...]] = {}
+
+
+def _analyse_file(rel_path: str, language: str, source: str) -> _FileFacts:
+    """Extract lines, symbols, imports, tests and schema from one file."""
+    facts = _FileFacts(language)
+    facts.lines = source.count("\n") + (1 if source and not source.endswith("\n") else 0)
+
+    # Detect test files
+    if _TEST_FILE_PATTERNS.search(rel_path):
+        facts.is_test = True
+        # Count test functions
+        facts.test_count = len(_TEST_FUNC_PATTERN.findall(source))
+        # Detect frameworks
+        frameworks: set[str] = set()
+        if "pytest" in source:
+            frameworks.add("pytest")
+        if "vitest" in source:
+            frameworks.add("vitest")
+        if "from jest" in source or "describe(" in source:
+            frameworks.add("jest")
+        facts.frameworks = frozenset(frameworks)
+
+    # Python symbol + import extraction
+    if language == "python" and source:
+        module_path = rel_path.replace("/", ".").removesuffix(".py")
+        try:
+            parsed = ast.parse(source)
+        except SyntaxError:
+            parsed = None
+
+        if parsed is not None:
+            imports: list[str] = []
+            for node in ast.walk(parsed):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        imports.append(alias.name)
+                elif isinstance(node, ast.ImportFrom):
+                    if node.level and node.level > 0:
+                        prefix = "." * node.level
+                        if node.module:
+                            imports.append(prefix + node.module)
+                        else:
+                            for alias in node.names:
+                                imports.append(prefix + alias.name)
+                    elif node.module:
+                        imports.append(node.module)
+            facts.imports = tuple(imports)
+
+            for node in ast.iter_child_nodes(parsed):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    if not node.name.startswith("_"):
+                        facts.symbols[f"{module_path}.{node.name}"] = "function"
+                elif isinstance(node, ast.ClassDef):
+                    if not node.name.startswith("_"):
+                        facts.symbols[f"{module_path}.{node.name}"] = "class"
+                elif isinstance(node, ast.Assign):
+                    for target in node.targets:
+                        if isinstance(target, ast.Name) and target.id.isupper():
+                            facts.symbols[f"{module_path}.{target.id}"] = "constant"
+
+    # TypeScript/JavaScript export extraction (regex-based)
+    elif language in ("typescript", "typescriptreact", "javascript", "javascriptreact") and source:
+        module_path = rel_path.removesuffix(".tsx").removesuffix(".ts").removesuffix(".jsx").removesuffix(".js")
+        module_path = module_path.replace("/", ".")
+        for match in _TS_EXPORT_PATTERN.finditer(source):
+            name = match.group(1)
+            # Infer kind from keyword
+            line = match.group(0)
+            if "class " in line:
+                kind = "class"
+            elif "function " in line:
+                kind = "function"
+            elif "interface " in line or "type " in line:
+                kind = "type"
+            elif "enum " in line:
+                kind = "enum"
+            else:
+                kind = "variable"
+            facts.symbols[f"{module_path}.{name}"] = kind
+
+    lowered = rel_path.lower()
+    # SQL migration file parsing
+    if language == "sql" and ("migration" in lowered or "alembic" in lowered):
+        facts.migration = True
+        tables: list[str] = []
+        for tbl_match in _SQL_TABLE_PATTERN.finditer(source):
+            tbl_name = tbl_match.group(1)
+            if tbl_name not in tables:
+                tables.append(tbl_name)
+            # Extract columns for this table
+            # Find the block after CREATE TABLE ... (
+            tbl_start = tbl_match.end()
+            # Find matching closing paren
+            paren_depth = 0
+            block_end = tbl_start
+            for i in range(tbl_start, len(source)):
+                if source[i] == "(":
+                    paren_depth += 1
+                elif source[i] == ")":
+                    if paren_depth == 0:
+                        block_end = i
+                        break
+                    paren_depth -= 1
+            block = source[tbl_start:block_end]
+            cols = tuple(
+                m.group(1) for m in _SQL_COLUMN_PATTERN.finditer(block)
+            )
+            if cols:
+                facts.columns[tbl_name] = cols
+        facts.tables = tuple(tables)
+
+    # Python migration files (Alembic)
+    elif language == "python" and "alembic" in lowered:
+        facts.migration = True
+        facts.tables = tuple(dict.fromkeys(_ALEMBIC_TABLE_PATTERN.findall(source)))
+
+    return facts
+
+
+def _read_source(abs_path: Path) -> str:
+    try:
+        return abs_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+class _SnapshotIndex:
+    """Running aggregates over per-file facts.
+
+    ``add`` / ``remove`` adjust every inventory by one file's contribution,
+    so keeping a snapshot current costs O(changed files), not O(workspace).
+    """
+
+    __slots__ = (
+        "_schema",
+        "dependency_graph",
+        "facts",
+        "framework_files",
+        "language_files",
+        "languages",
+        "symbols",
+        "test_count",
+        "test_files",
+        "total_lines",
+    )
+
+    def __init__(self) -> None:
+        self.facts: dict[str, _FileFacts] = {}
+        self.symbols: dict[str, str] = {}
+        self.dependency_graph: dict[str, tuple[str, ...]] = {}
+        self.languages: dict[str, int] = {}
+        self.language_files: dict[str, int] = {}
+        self.total_lines = 0
+        self.test_files: set[str] = set()
+        self.test_count = 0
+        self.framework_files: dict[str, int] = {}  # framework -> files using it
+        self._schema: SchemaInventory | None = SchemaInventory()
+
+    def add(self, rel_path: str, facts: _FileFacts) -> None:
+        if rel_path in self.facts:
+            self.remove(rel_path)
+        self.facts[rel_path] = facts
+        self.total_lines += facts.lines
+        self.languages[facts.language] = self.languages.get(facts.language, 0) + facts.lines
+        self.language_files[facts.language] = self.language_files.get(facts.language, 0) + 1
+        self.symbols.update(facts.symbols)
+        if facts.imports:
+            self.dependency_graph[rel_path] = facts.imports
+        if facts.is_test:
+            self.test_files.add(rel_path)
+            self.test_count += facts.test_count
+            for fw in facts.frameworks:
+                self.framework_files[fw] = self.framework_files.get(fw, 0) + 1
+        if facts.migration:
+            self._schema = None
+
+    def remove(self, rel_path: str) -> None:
+        facts = self.facts.pop(rel_path, None)
+        if facts is None:
+            return
+        self.total_lines -= facts.lines
+        self.languages[facts.language] -= facts.lines
+        self.language_files[facts.language] -= 1
+        if not self.language_files[facts.language]:
+            del self.languages[facts.language]
+            del self.language_files[facts.language]
+        for name in facts.symbols:
+            self.symbols.pop(name, None)
+        self.dependency_graph.pop(rel_path, None)
+        if facts.is_test:
+            self.test_files.discard(rel_path)
+            self.test_count -= facts.test_count
+            for fw in facts.frameworks:
+                self.framework_files[fw] -= 1
+                if not self.framework_files[fw]:
+                    del self.framework_files[fw]
+        if facts.migration:
+            self._schema = None
+
+    def schema_inventory(self) -> SchemaInventory:
+        """Schema inventory, recomputed only after a migration file changed."""
+        if self._schema is None:
+            migrations = sorted(p for p, f in self.facts.items() if f.migration)
+            tables: list[str] = []
+            columns: dict[str, tuple[str, ...]] = {}
+            # SQL migrations first, then Alembic scripts — each in path order
+            for path in sorted(migrations, key=lambda p: self.facts[p].language != "sql"):
+                facts = self.facts[path]
+                for tbl in facts.tables:
+                    if tbl not in tables:
+                        tables.append(tbl)
+                columns.update(facts.columns)
+            self._schema = SchemaInventory(
+                tables=tuple(tables),
+                columns=columns,
+                migration_files=tuple(migrations),
+            )
+        return self._schema
+
+    def build(self, file_tree: str) -> WorkspaceSnapshot:
+        """Materialise an immutable snapshot of the current aggregates."""
+        return WorkspaceSnapshot(
+            file_tree=file_tree,
+            symbol_table=dict(self.symbols),
+            dependency_graph=dict(self.dependency_graph),
+            test_inventory=TestInventory(
+                test_files=tuple(sorted(self.test_files)),
+                test_count=self.test_count,
+                frameworks=tuple(sorted(self.framework_files)),
+            ),
+            schema_inventory=self.schema_inventory(),
+            total_files=len(self.facts),
+            total_lines=self.total_lines,
+            languages=dict(self.languages),
+        )
+
+
 def capture_snapshot(workspace: Workspace) -> WorkspaceSnapshot:
     """Build a full ``WorkspaceSnapshot`` from a workspace.
 
@@ -486,176 +939,22 @@ def capture_snapshot(workspace: Workspace) -> WorkspaceSnapshot:
     and detecting frameworks.  Schema information is extracted from
     SQL migration files.
 
-    This is a synchronous function (file I/O only, no network).
+    This is a synchronous function (file I/O only, no network).  For a
+    snapshot that stays current across many writes, use
+    ``forge_ide.snapshot_service.SnapshotService``.
     """
     tree = workspace.file_tree()
-    files_only = [e for e in tree if not e.is_dir]
-
-    symbol_table: dict[str, str] = {}
-    dependency_graph: dict[str, tuple[str, ...]] = {}
-    languages: dict[str, int] = {}
-    total_lines = 0
-
-    test_files: list[str] = []
-    test_count = 0
-    frameworks: set[str] = set()
 
-    tables: list[str] = []
-    columns: dict[str, tuple[str, ...]] = {}
-    migration_files: list[str] = []
+    index = _SnapshotIndex()
+    for entry in tree:
+        if entry.is_dir:
+            continue
+        source = _read_source(workspace.root / entry.path)
+        index.add(entry.path, _analyse_file(entry.path, entry.language, source))
 
     tree_lines: list[str] = []
     _build_tree_lines(tree, tree_lines)
-
-    for entry in files_only:
-        abs_path = workspace.root / entry.path
-        lang = entry.language
-
-        # Count lines
-        try:
-            source = abs_path.read_text(encoding="utf-8", errors="replace")
-            line_count = source.count("\n") + (1 if source and not source.endswith("\n") else 0)
-        except OSError:
-            source = ""
-            line_count = 0
-
-        total_lines += line_count
-        languages[lang] = languages.get(lang, 0) + line_count
-
-        # Detect test files
-        if _TEST_FILE_PATTERNS.search(entry.path):
-            test_files.append(entry.path)
-            # Count test functions
-            test_count += len(_TEST_FUNC_PATTERN.findall(source))
-            # Detect frameworks
-            if "pytest" in source or "import pytest" in source:
-                frameworks.add("pytest")
-            if "vitest" in source or "from vitest" in source or "@vitest" in source:
-                frameworks.add("vitest")
-            if "from jest" in source or "describe(" in source:
-                frameworks.add("jest")
-
-        # Python symbol + import extraction
-        if lang == "python" and source:
-            module_path = entry.path.replace("/", ".").removesuffix(".py")
-            try:
-                parsed = ast.parse(source)
-            except SyntaxError:
-                parsed = None
-
-            if parsed is not None:
-                imports: list[str] = []
-                for node in ast.walk(parsed):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.level and node.level > 0:
-                            prefix = "." * node.level
-                            if node.module:
-                                imports.append(prefix + node.module)
-                            else:
-                                for alias in node.names:
-                                    imports.append(prefix + alias.name)
-                        elif node.module:
-                            imports.append(node.module)
-                if imports:
-                    dependency_graph[entry.path] = tuple(imports)
-
-                for node in ast.iter_child_nodes(parsed):
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        if not node.name.startswith("_"):
-                            symbol_table[f"{module_path}.{node.name}"] = "function"
-                    elif isinstance(node, ast.ClassDef):
-                        if not node.name.startswith("_"):
-                            symbol_table[f"{module_path}.{node.name}"] = "class"
-                    elif isinstance(node, ast.Assign):
-                        for target in node.targets:
-                            if isinstance(target, ast.Name) and target.id.isupper():
-                                symbol_table[f"{module_path}.{target.id}"] = "constant"
-
-        # TypeScript/JavaScript export extraction (regex-based)
-        elif lang in ("typescript", "typescriptreact", "javascript", "javascriptreact") and source:
-            module_path = entry.path.removesuffix(".tsx").removesuffix(".ts").removesuffix(".jsx").removesuffix(".js")
-            module_path = module_path.replace("/", ".")
-            for match in re.finditer(
-                r"export\s+(?:default\s+)?(?:async\s+)?(?:function|class|const|let|var|interface|type|enum)\s+(\w+)",
-                source,
-            ):
-                name = match.group(1)
-                # Infer kind from keyword
-                line = match.group(0)
-                if "class " in line:
-                    kind = "class"
-                elif "function " in line:
-                    kind = "function"
-                elif "interface " in line or "type " in line:
-                    kind = "type"
-                elif "enum " in line:
-                    kind = "enum"
-                else:
-                    kind = "variable"
-                symbol_table[f"{module_path}.{name}"] = kind
-
-        # SQL migration file parsing
-        if lang == "sql" and ("migration" in entry.path.lower() or "alembic" in entry.path.lower()):
-            migration_files.append(entry.path)
-            for tbl_match in _SQL_TABLE_PATTERN.finditer(source):
-                tbl_name = tbl_match.group(1)
-                if tbl_name not in tables:
-                    tables.append(tbl_name)
-                # Extract columns for this table
-                # Find the block after CREATE TABLE ... (
-                tbl_start = tbl_match.end()
-                # Find matching closing paren
-                paren_depth = 0
-                block_end = tbl_start
-                for i in range(tbl_start, len(source)):
-                    if source[i] == "(":
-                        paren_depth += 1
-                    elif source[i] == ")":
-                        if paren_depth == 0:
-                            block_end = i
-                            break
-                        paren_depth -= 1
-                block = source[tbl_start:block_end]
-                cols = tuple(
-                    m.group(1) for m in _SQL_COLUMN_PATTERN.finditer(block)
-                )
-                if cols:
-                    columns[tbl_name] = cols
-
-    # Also check for Python migration files (Alembic)
-    for entry in files_only:
-        if entry.path not in [m for m in migration_files] and "alembic" in entry.path.lower() and entry.language == "python":
-            migration_files.append(entry.path)
-            try:
-                source = (workspace.root / entry.path).read_text(encoding="utf-8", errors="replace")
-                for tbl_match in re.finditer(r"op\.create_table\(\s*['\"](\w+)['\"]", source):
-                    tbl_name = tbl_match.group(1)
-                    if tbl_name not in tables:
-                        tables.append(tbl_name)
-            except OSError:
-                pass
-
-    return WorkspaceSnapshot(
-        file_tree="\n".join(tree_lines),
-        symbol_table=symbol_table,
-        dependency_graph=dependency_graph,
-        test_inventory=TestInventory(
-            test_files=tuple(sorted(test_files)),
-            test_count=test_count,
-            frameworks=tuple(sorted(frameworks)),
-        ),
-        schema_inventory=SchemaInventory(
-            tables=tuple(tables),
-            columns=columns,
-            migration_files=tuple(sorted(migration_files)),
-        ),
-        total_files=len(files_only),
-        total_lines=total_lines,
-        languages=languages,
-    )
+    return index.build("\n".join(tree_lines))
 
 
 def update_snapshot(
@@ -667,7 +966,9 @@ def update_snapshot(
 
     Rebuilds the full symbol table and dependency graph, replacing
     entries for *changed_files* with fresh data while preserving
-    entries for all other files.
+    entries for all other files.  Line counts are approximate because a
+    bare snapshot does not remember per-file contributions — callers that
+    update repeatedly should hold a ``SnapshotService`` instead.
 
     Parameters
     ----------
@@ -716,66 +1017,25 @@ def update_snapshot(
         if not abs_path.is_file():
             continue
 
-        ext = abs_path.suffix
-        lang = _detect_language(ext)
-
         try:
             source = abs_path.read_text(encoding="utf-8", errors="replace")
-            line_count = source.count("\n") + (1 if source and not source.endswith("\n") else 0)
         except OSError:
             continue
+        facts = _analyse_file(cf, _detect_language(abs_path.suffix), source)
 
         # Update line counts (approximate — we don't track per-file old counts)
-        languages[lang] = languages.get(lang, 0) + line_count
+        languages[facts.language] = languages.get(facts.language, 0) + facts.lines
 
         # Test detection on changed file
-        if _TEST_FILE_PATTERNS.search(cf):
+        if facts.is_test:
             if cf not in test_files:
                 test_files.append(cf)
-            tc = len(_TEST_FUNC_PATTERN.findall(source))
-            test_count += tc
-            if "pytest" in source:
-                frameworks.add("pytest")
-            if "vitest" in source:
-                frameworks.add("vitest")
-
-        # Python analysis
-        if lang == "python" and source:
-            module_path = cf.replace("/", ".").removesuffix(".py")
-            try:
-                parsed = ast.parse(source)
-            except SyntaxError:
-                continue
-
-            imports: list[str] = []
-            for node in ast.walk(parsed):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.append(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.level and node.level > 0:
-                        prefix = "." * node.level
-                        if node.module:
-                            imports.append(prefix + node.module)
-                        else:
-                            for alias in node.names:
-                                imports.append(prefix + alias.name)
-                    elif node.module:
-                        imports.append(node.module)
-            if imports:
-                dep_graph[cf] = tuple(imports)
+            test_count += facts.test_count
+            frameworks.update(facts.frameworks)
 
-            for node in ast.iter_child_nodes(parsed):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if not node.name.startswith("_"):
-                        symbol_table[f"{module_path}.{node.name}"] = "function"
-                elif isinstance(node, ast.ClassDef):
-                    if not node.name.startswith("_"):
-                        symbol_table[f"{module_path}.{node.name}"] = "class"
-                elif isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name) and target.id.isupper():
-                            symbol_table[f"{module_path}.{target.id}"] = "constant"
+        if facts.imports:
+            dep_graph[cf] = facts.imports
+        symbol_table.update(facts.symbols)
 
     # Rebuild tree
     tree = workspace.file_tree()
@@ -868,12 +1128,20 @@ def _build_tree_lines(
     Shows directories up to *max_depth* with file counts at leaf
     directories and individual files at the deepest shown level.
     """
+    _tree_lines_from_paths((e.path for e in entries if not e.is_dir), lines, max_depth=max_depth)
+
+
+def _tree_lines_from_paths(
+    paths: Iterable[str],
+    lines: list[str],
+    *,
+    max_depth: int = 3,
+) -> None:
+    """``_build_tree_lines`` over bare file paths (no ``FileEntry`` needed)."""
     # Group by directory
     dir_files: dict[str, list[str]] = {}
-    for e in entries:
-        if e.is_dir:
-            continue
-        parts = e.path.replace("\\", "/").split("/")
+    for path in paths:
+        parts = path.replace("\\", "/").split("/")
         if len(parts) == 1:
             dir_files.setdefault(".", []).append(parts[0])
         else:
@@ -591,3 +591,17 @@ def test_get_key_pool_singleton():
     p2 = agent_client.get_key_pool(["key-a", "key-b"])
     assert p1 is p2  # second call returns existing
     agent_client._global_pool = None
+
+
+def test_shared_key_pools_draw_from_one_budget():
+    """Pools created with shared=True reuse one limiter per key."""
+    agent_client._shared_limiters.clear()
+    p1 = agent_client.ApiKeyPool(["key-a"], shared=True)
+    p2 = agent_client.ApiKeyPool(["key-a", "key-b"], shared=True)
+    assert p1.get_limiter("key-a") is p2.get_limiter("key-a")
+    p1.get_limiter("key-a").record(10_000, 500)
+    assert p2.aggregate_usage() == (10_000, 500)
+    # Unshared pools keep their own budget.
+    p3 = agent_client.ApiKeyPool(["key-a"])
+    assert p3.get_limiter("key-a") is not p1.get_limiter("key-a")
+    agent_client._shared_limiters.clear()
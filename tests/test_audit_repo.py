@@ -0,0 +1,72 @@
+"""Tests for app/repos/audit_repo.py -- audit run updates and the repo_health rollup."""
+
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.repos import audit_repo
+
+
+def _fake_pool_with_conn():
+    """Pool whose acquire() yields a connection with a no-op transaction."""
+    conn = AsyncMock()
+
+    @asynccontextmanager
+    async def _transaction():
+        yield
+
+    conn.transaction = MagicMock(side_effect=_transaction)
+
+    @asynccontextmanager
+    async def _acquire():
+        yield conn
+
+    pool = AsyncMock()
+    pool.acquire = MagicMock(side_effect=_acquire)
+    return pool, conn
+
+
+@pytest.mark.asyncio
+@patch("app.repos.audit_repo.note_write")
+@patch("app.repos.audit_repo.get_pool")
+async def test_completed_audit_refreshes_repo_health(mock_get_pool, mock_note_write):
+    pool, conn = _fake_pool_with_conn()
+    repo_id = uuid.uuid4()
+    conn.fetchval.return_value = repo_id
+    mock_get_pool.return_value = pool
+
+    await audit_repo.update_audit_run(uuid.uuid4(), "completed", "PASS", 12)
+
+    conn.transaction.assert_called_once()
+    statements = [c.args[0] for c in conn.execute.call_args_list]
+    assert any("FOR UPDATE" in s for s in statements)
+    assert any("INSERT INTO repo_health" in s and "ON CONFLICT (repo_id) DO UPDATE" in s for s in statements)
+    assert all(c.args[1] == repo_id for c in conn.execute.call_args_list)
+    mock_note_write.assert_called_once_with("audit_runs", "repo_health")
+
+
+@pytest.mark.asyncio
+@patch("app.repos.audit_repo.get_pool")
+async def test_non_completed_status_skips_rollup(mock_get_pool):
+    pool, _ = _fake_pool_with_conn()
+    mock_get_pool.return_value = pool
+
+    await audit_repo.update_audit_run(uuid.uuid4(), "running", None, 0)
+
+    pool.fetchval.assert_called_once()
+    pool.acquire.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.repos.audit_repo.note_write")
+@patch("app.repos.audit_repo.get_pool")
+async def test_missing_audit_run_does_not_touch_rollup(mock_get_pool, mock_note_write):
+    pool, conn = _fake_pool_with_conn()
+    conn.fetchval.return_value = None
+    mock_get_pool.return_value = pool
+
+    await audit_repo.update_audit_run(uuid.uuid4(), "completed", "FAIL", 3)
+
+    conn.execute.assert_not_called()
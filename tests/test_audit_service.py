@@ -5,7 +5,8 @@ from uuid import UUID
 
 import pytest
 
-from app.services.audit_service import backfill_repo_commits
+from app.clients.github_client import GitHubRateLimitError
+from app.services.audit_service import backfill_repo_commits, process_push_event
 
 
 REPO_ID = UUID("33333333-3333-3333-3333-333333333333")
@@ -55,7 +56,9 @@ def _make_patches():
             "head_author": "Alice",
         }),
         "get_commit_files": AsyncMock(return_value=["README.md"]),
-        "get_repo_file_content": AsyncMock(return_value="# Hello"),
+        "get_repo_file_contents": AsyncMock(
+            side_effect=lambda token, name, paths, ref: {p: "# Hello" for p in paths},
+        ),
         "run_all_checks": MagicMock(return_value=[{"check_code": "A1", "result": "PASS", "detail": None, "check_name": "test"}]),
         "insert_audit_checks": AsyncMock(),
         "ws_manager": _make_ws_mock(),
@@ -213,6 +216,57 @@ async def test_backfill_handles_compare_error():
     assert result["synced"] == 0
 
 
+@pytest.mark.asyncio
+async def test_backfill_reraises_rate_limit():
+    """A rate-limited compare call surfaces to the caller instead of a silent no-op."""
+    mocks = _make_patches()
+    mocks["list_commits"].return_value = [
+        {"sha": "aaa111", "message": "first", "author": "Alice"},
+        {"sha": "bbb222", "message": "second", "author": "Bob"},
+    ]
+    mocks["get_existing_commit_shas"].return_value = {"bbb222"}
+    mocks["compare_commits"].side_effect = GitHubRateLimitError(120)
+
+    patches = _apply_patches(mocks)
+    for p in patches:
+        p.start()
+    try:
+        with pytest.raises(GitHubRateLimitError):
+            await backfill_repo_commits(REPO_ID, USER_ID)
+    finally:
+        for p in patches:
+            p.stop()
+
+    mocks["create_audit_run"].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_push_event_marks_error_when_rate_limited():
+    """process_push_event records a rate-limited fetch as an errored audit run."""
+    mocks = _make_patches()
+    mocks["get_repo_by_github_id"] = AsyncMock(return_value=MOCK_REPO)
+    mocks["get_repo_file_contents"] = AsyncMock(side_effect=GitHubRateLimitError(120))
+    payload = {
+        "ref": "refs/heads/main",
+        "head_commit": {"id": "aaa111", "message": "first", "author": {"name": "Alice"}},
+        "repository": {"id": 12345, "full_name": "octocat/hello-world"},
+        "commits": [{"added": ["README.md"], "modified": []}],
+    }
+
+    patches = _apply_patches(mocks)
+    for p in patches:
+        p.start()
+    try:
+        audit_run = await process_push_event(payload)
+    finally:
+        for p in patches:
+            p.stop()
+
+    assert audit_run is not None
+    assert mocks["update_audit_run"].call_args.kwargs["status"] == "error"
+    mocks["insert_audit_checks"].assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_backfill_cleans_stale_runs():
     """backfill_repo_commits calls mark_stale_audit_runs before processing."""
@@ -245,7 +299,7 @@ async def test_backfill_marks_error_on_cancel():
     ]
     mocks["get_existing_commit_shas"].return_value = set()
     # Cancel during file fetch
-    mocks["get_repo_file_content"].side_effect = asyncio.CancelledError()
+    mocks["get_repo_file_contents"].side_effect = asyncio.CancelledError()
 
     patches = _apply_patches(mocks)
     for p in patches:
@@ -274,7 +328,9 @@ async def test_backfill_broadcasts_progress():
     ]
     mocks["get_existing_commit_shas"].return_value = set()
     mocks["get_commit_files"].return_value = ["README.md", "main.py"]
-    mocks["get_repo_file_content"].return_value = "content"
+    mocks["get_repo_file_contents"].side_effect = (
+        lambda token, name, paths, ref: {p: "content" for p in paths}
+    )
 
     patches = _apply_patches(mocks)
     for p in patches:
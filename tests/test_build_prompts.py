@@ -0,0 +1,78 @@
+"""Tests for app.services.build.prompts — the prompt/tool-schema registry."""
+
+from __future__ import annotations
+
+import os
+
+from app.services.build import planner_agent_loop
+from app.services.build.prompts import PromptRegistry, files_fingerprint
+
+# ---------------------------------------------------------------------------
+# PromptRegistry
+# ---------------------------------------------------------------------------
+
+
+def test_builds_once_per_key():
+    reg = PromptRegistry()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return "prompt"
+
+    first = reg.get(("role", "coder", "full", "v1"), build)
+    assert reg.get(("role", "coder", "full", "v1"), build) is first
+    reg.get(("role", "coder", "mini", "v1"), build)
+    assert len(calls) == 2
+    assert reg.stats() == {"entries": 2, "hits": 1, "builds": 2}
+
+
+def test_evicts_least_recently_used():
+    reg = PromptRegistry(max_entries=2)
+    reg.get("a", lambda: 1)
+    reg.get("b", lambda: 2)
+    reg.get("a", lambda: 1)
+    reg.get("c", lambda: 3)
+    assert reg.get("a", lambda: "rebuilt") == 1
+    assert reg.get("b", lambda: "rebuilt") == "rebuilt"
+    assert reg.stats()["entries"] == 2
+
+
+def test_files_fingerprint_changes_on_edit(tmp_path):
+    path = tmp_path / "builder_contract.md"
+    missing = files_fingerprint([path])
+    path.write_text("v1", encoding="utf-8")
+    v1 = files_fingerprint([path])
+    assert v1 != missing
+    path.write_text("version 2", encoding="utf-8")
+    assert files_fingerprint([path]) != v1
+
+
+# ---------------------------------------------------------------------------
+# Planner system prompt
+# ---------------------------------------------------------------------------
+
+
+def test_planner_prompt_is_byte_identical_and_reloads_on_edit(tmp_path, monkeypatch):
+    contract = tmp_path / "builder_contract.md"
+    contract.write_text("# Builder contract v1", encoding="utf-8")
+    monkeypatch.setattr(planner_agent_loop, "FORGE_CONTRACTS_DIR", tmp_path)
+
+    first = planner_agent_loop._build_system_prompt()
+    second = planner_agent_loop._build_system_prompt()
+    assert first == second
+    assert first[1]["text"] is second[1]["text"]
+    assert "v1" in first[1]["text"]
+    assert first[1]["cache_control"] == {"type": "ephemeral"}
+
+    contract.write_text("# Builder contract v2 (edited)", encoding="utf-8")
+    st = contract.stat()
+    os.utime(contract, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert "v2" in planner_agent_loop._build_system_prompt()[1]["text"]
+
+
+def test_planner_prompt_without_governance(tmp_path, monkeypatch):
+    monkeypatch.setattr(planner_agent_loop, "FORGE_CONTRACTS_DIR", tmp_path / "missing")
+    blocks = planner_agent_loop._build_system_prompt()
+    assert len(blocks) == 1
+    assert "cache_control" not in blocks[0]
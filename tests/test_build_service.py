@@ -2659,6 +2659,29 @@ class TestCompactConversationMCP:
         assert "phase_window(0)" in summary
         assert "re-fetch" in summary.lower() or "Re-fetch" in summary
 
+    def test_mcp_compaction_tracks_batched_fetch(self):
+        """forge_get_contracts calls record every requested contract."""
+        messages = [
+            {"role": "user", "content": "directive"},
+            {"role": "assistant", "content": [
+                {"type": "tool_use", "id": "t1", "name": "forge_get_contracts",
+                 "input": {"names": ["physics", "schema"]}},
+            ]},
+            {"role": "user", "content": "result 1"},
+            {"role": "assistant", "content": "response 2"},
+            {"role": "user", "content": "feedback 2"},
+            {"role": "assistant", "content": "response 3"},
+            {"role": "user", "content": "feedback 3"},
+            {"role": "assistant", "content": "response 4"},
+        ]
+        result = build_service._compact_conversation(
+            messages, files_written=[], current_phase="Phase 0",
+            use_mcp_contracts=True,
+        )
+        summary = result[1]["content"]
+        assert "Contracts previously fetched: physics, schema" in summary
+        assert "forge_get_contracts(" in summary
+
     def test_mcp_compaction_no_contracts_adds_generic_hint(self):
         """When MCP is on but no contracts were fetched, add a generic hint."""
         messages = [
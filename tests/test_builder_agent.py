@@ -640,6 +640,141 @@ class TestExecuteTierParallelism:
             assert f"fixed-import-in-src/svc_{i}.py" in lessons
 
 
+class TestExecuteTierDagSchedule:
+    """schedule="dag" — files start as soon as their own depends_on are written."""
+
+    @staticmethod
+    async def _run(tmp_path, tier_files, mock_run_builder, mock_state, **kwargs):
+        from app.services.build.planner import execute_tier
+
+        with patch("builder.builder_agent.run_builder", side_effect=mock_run_builder), \
+             patch("app.services.build.planner._state", mock_state), \
+             patch("app.services.build.subagent.build_context_pack", return_value={}):
+            return await execute_tier(
+                build_id=uuid4(),
+                user_id=uuid4(),
+                api_key="sk-test",
+                tier_index=0,
+                tier_files=tier_files,
+                contracts=[],
+                phase_deliverables="",
+                working_dir=str(tmp_path),
+                interface_map="",
+                all_files_written={},
+                schedule="dag",
+                **kwargs,
+            )
+
+    @pytest.mark.asyncio
+    async def test_slow_file_does_not_stall_unrelated_dependents(self, tmp_path):
+        tier_files = [
+            {"path": "src/slow.py", "depends_on": []},
+            {"path": "src/fast.py", "depends_on": []},
+            {"path": "src/uses_fast.py", "depends_on": ["src/fast.py"]},
+            {"path": "src/uses_slow.py", "depends_on": ["src/slow.py"]},
+        ]
+        started: dict[str, float] = {}
+        finished: dict[str, float] = {}
+        loop = asyncio.get_running_loop()
+
+        async def mock_run_builder(*, file_entry, **kwargs):
+            fp = file_entry["path"]
+            started[fp] = loop.time()
+            await asyncio.sleep(0.2 if fp == "src/slow.py" else 0.01)
+            finished[fp] = loop.time()
+            return _make_builder_result(fp)
+
+        written, _ = await self._run(
+            tmp_path, tier_files, mock_run_builder, _mock_planner_state(tmp_path),
+        )
+
+        assert len(written) == 4
+        assert started["src/uses_fast.py"] < finished["src/slow.py"]
+        assert started["src/uses_slow.py"] >= finished["src/slow.py"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_scales_with_key_pool(self, tmp_path):
+        tier_files = [{"path": f"src/f{i}.py", "depends_on": []} for i in range(8)]
+        current = peak = 0
+
+        async def mock_run_builder(*, file_entry, **kwargs):
+            nonlocal current, peak
+            current += 1
+            peak = max(peak, current)
+            await asyncio.sleep(0.02)
+            current -= 1
+            return _make_builder_result(file_entry["path"])
+
+        key_pool = MagicMock(key_count=2)
+        with patch("app.config.settings.BUILD_AGENTS_PER_KEY", 2):
+            await self._run(
+                tmp_path, tier_files, mock_run_builder, _mock_planner_state(tmp_path),
+                key_pool=key_pool,
+            )
+
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_emits_tier_events_per_group_and_passes_fresh_deps(self, tmp_path):
+        tier_files = [
+            {"path": "src/base.py", "depends_on": []},
+            {"path": "src/child.py", "depends_on": ["src/base.py"]},
+        ]
+        seen_context: dict[str, dict] = {}
+
+        async def mock_run_builder(*, file_entry, context_files=None, **kwargs):
+            seen_context[file_entry["path"]] = dict(context_files or {})
+            return _make_builder_result(file_entry["path"], content=f"# {file_entry['path']}\n")
+
+        mock_state = _mock_planner_state(tmp_path)
+        await self._run(tmp_path, tier_files, mock_run_builder, mock_state)
+
+        events = [
+            (c.args[2], c.args[3]["tier"])
+            for c in mock_state._broadcast_build_event.call_args_list
+            if c.args[2] in ("tier_start", "tier_complete")
+        ]
+        assert events == [
+            ("tier_start", 0), ("tier_complete", 0),
+            ("tier_start", 1), ("tier_complete", 1),
+        ]
+        assert seen_context["src/child.py"]["src/base.py"] == "# src/base.py\n"
+
+    def test_dependency_graph_breaks_cycles(self):
+        from app.services.build.planner import _file_dependency_graph
+
+        files = [
+            {"path": "a.py", "depends_on": ["b.py"]},
+            {"path": "b.py", "depends_on": ["a.py"]},
+            {"path": "c.py", "depends_on": ["a.py", "missing.py"]},
+        ]
+        _, _, dag = _file_dependency_graph(files)
+        deps = {n.file_path: [dag.nodes[d].file_path for d in n.depends_on] for n in dag.nodes.values()}
+
+        # Exactly one edge of the a<->b cycle survives, and external deps drop out
+        assert len(deps["a.py"]) + len(deps["b.py"]) == 1
+        assert deps["c.py"] == ["a.py"]
+        assert [n.file_path for n in dag.topological_order()][-1] == "c.py"
+
+    @pytest.mark.asyncio
+    async def test_failed_file_does_not_hold_back_dependents(self, tmp_path):
+        tier_files = [
+            {"path": "src/base.py", "depends_on": []},
+            {"path": "src/child.py", "depends_on": ["src/base.py"]},
+        ]
+        built: list[str] = []
+
+        async def mock_run_builder(*, file_entry, **kwargs):
+            built.append(file_entry["path"])
+            if file_entry["path"] == "src/base.py":
+                raise RuntimeError("boom")
+            return _make_builder_result(file_entry["path"])
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await self._run(tmp_path, tier_files, mock_run_builder, _mock_planner_state(tmp_path))
+        assert built == ["src/base.py", "src/child.py"]
+
+
 # ---------------------------------------------------------------------------
 # 7. Config-file skip logic
 # ---------------------------------------------------------------------------
@@ -219,3 +219,26 @@ class TestGetModelForRole:
              patch.object(config.settings, "LLM_PLANNER_MODEL", "claude-sonnet-4-6"):
             result = get_model_for_role("planner")
         assert result == "claude-sonnet-4-6"
+
+
+def test_pool_min_size_cannot_exceed_max_size():
+    """Settings rejects DB_POOL_MIN_SIZE > DB_POOL_MAX_SIZE."""
+    import pytest
+    from pydantic import ValidationError
+
+    from app.config import Settings
+
+    with pytest.raises(ValidationError, match="DB_POOL_MIN_SIZE"):
+        Settings(DB_POOL_MIN_SIZE=20, DB_POOL_MAX_SIZE=10)
+
+
+def test_build_schedule_rejects_unknown_mode():
+    """Settings rejects a BUILD_SCHEDULE other than "tier" or "dag"."""
+    import pytest
+    from pydantic import ValidationError
+
+    from app.config import Settings
+
+    assert Settings(BUILD_SCHEDULE="dag").BUILD_SCHEDULE == "dag"
+    with pytest.raises(ValidationError, match="BUILD_SCHEDULE"):
+        Settings(BUILD_SCHEDULE="DAG")
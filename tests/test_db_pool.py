@@ -0,0 +1,276 @@
+"""Tests for app/repos/db.py -- resilient pool retry and query instrumentation."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import asyncpg
+import pytest
+
+from app.repos import db
+from app.repos.db import _ResilientPool, query_stats, reset_query_stats
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    reset_query_stats()
+    yield
+    reset_query_stats()
+
+
+def _repo_fn(pool):
+    """Build a coroutine function that looks like it lives in a repo module."""
+    ns = {"__name__": "app.repos.fake_repo"}
+    exec(
+        "async def list_things(pool):\n"
+        "    return await pool.fetch('SELECT *\\n   FROM things WHERE id = $1', 1)\n",
+        ns,
+    )
+    return ns["list_things"]
+
+
+@pytest.mark.asyncio
+async def test_stats_labelled_by_repo_function():
+    """Queries are grouped by calling repo function and normalised SQL."""
+    raw = AsyncMock()
+    raw.fetch = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
+    pool = _ResilientPool(raw)
+    list_things = _repo_fn(pool)
+
+    await list_things(pool)
+    await list_things(pool)
+
+    stats = query_stats()
+    assert len(stats) == 1
+    entry = stats[0]
+    assert entry["caller"] == "fake_repo.list_things"
+    assert entry["statement"] == "SELECT * FROM things WHERE id = $1"
+    assert entry["calls"] == 2
+    assert entry["rows"] == 4
+    assert entry["retries"] == 0
+    assert sum(entry["histogram_ms"].values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_row_count_parsed_from_status():
+    """execute() row counts come from the command status tag."""
+    raw = AsyncMock()
+    raw.execute = AsyncMock(return_value="UPDATE 3")
+    pool = _ResilientPool(raw)
+    await pool.execute("UPDATE things SET x = 1")
+    assert query_stats()[0]["rows"] == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_and_errors_recorded():
+    """Retried attempts are counted; exhausted retries count as an error."""
+    raw = AsyncMock()
+    raw.fetchval = AsyncMock(side_effect=[ConnectionResetError(), 7])
+    pool = _ResilientPool(raw)
+    with patch("app.repos.db.asyncio.sleep", new_callable=AsyncMock):
+        assert await pool.fetchval("SELECT 7") == 7
+    assert query_stats()[0]["retries"] == 1
+    assert query_stats()[0]["errors"] == 0
+
+    reset_query_stats()
+    raw.fetchval = AsyncMock(side_effect=asyncpg.InterfaceError("dead"))
+    with patch("app.repos.db.asyncio.sleep", new_callable=AsyncMock), \
+         patch("app.repos.db._invalidate_pool"), pytest.raises(asyncpg.InterfaceError):
+        await pool.fetchval("SELECT 7")
+    entry = query_stats()[0]
+    assert entry["errors"] == 1
+    assert entry["retries"] == db._MAX_RETRIES
+
+
+@pytest.mark.asyncio
+async def test_stats_disabled_by_config():
+    """DB_QUERY_STATS_ENABLED=False skips instrumentation entirely."""
+    raw = AsyncMock()
+    raw.fetch = AsyncMock(return_value=[])
+    pool = _ResilientPool(raw)
+    with patch.object(db.settings, "DB_QUERY_STATS_ENABLED", False):
+        await pool.fetch("SELECT 1")
+    assert query_stats() == []
+
+
+def test_query_stats_sorted_by_total_time():
+    """query_stats() returns the most expensive statements first."""
+    db._query_stats[("a.fast", "SELECT 1")] = db._StatementStats()
+    db._query_stats[("a.fast", "SELECT 1")].record(1.0, 1, 0, False)
+    db._query_stats[("b.slow", "SELECT 2")] = db._StatementStats()
+    db._query_stats[("b.slow", "SELECT 2")].record(900.0, 1, 0, False)
+    assert [s["caller"] for s in query_stats()] == ["b.slow", "a.fast"]
+    assert len(query_stats(top=1)) == 1
+
+
+def test_query_stats_table_is_bounded():
+    """Distinct statements beyond the cap evict the least recently used."""
+    with patch.object(db, "_MAX_TRACKED_STATEMENTS", 3):
+        for i in range(3):
+            db._stats_for(("c.f", f"SELECT {i}"))
+        db._stats_for(("c.f", "SELECT 0"))  # touch — now most recent
+        db._stats_for(("c.f", "SELECT 3"))
+    assert set(db._query_stats) == {("c.f", "SELECT 0"), ("c.f", "SELECT 2"), ("c.f", "SELECT 3")}
+
+
+# ---------------------------------------------------------------------------
+# Read-replica routing
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def two_pools():
+    """Patch pool creation so primary and replica DSNs get distinct fakes."""
+    created = {}
+
+    async def fake_create(dsn, max_size):
+        pool = AsyncMock()
+        pool.terminate = lambda: None
+        created[dsn] = pool
+        return pool
+
+    with patch.object(db.settings, "DATABASE_URL", "postgresql://primary"), \
+         patch.object(db.settings, "DATABASE_REPLICA_URL", "postgresql://replica"), \
+         patch("app.repos.db._create_pool", side_effect=fake_create):
+        db._invalidate_pool()
+        db._invalidate_replica_pool()
+        db._recent_writes.clear()
+        db._replica_down_until = 0.0
+        yield created
+        db._invalidate_pool()
+        db._invalidate_replica_pool()
+        db._recent_writes.clear()
+        db._replica_down_until = 0.0
+
+
+@pytest.mark.asyncio
+async def test_readonly_routes_to_replica(two_pools):
+    """readonly=True reads use the replica; default calls use the primary."""
+    primary = await db.get_pool()
+    replica = await db.get_pool(readonly=True, tables=("repos",))
+    assert primary._pool is two_pools["postgresql://primary"]
+    assert replica._pool is two_pools["postgresql://replica"]
+    assert replica._replica is True
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_falls_back_to_primary(two_pools):
+    """A recent write to a table sends readonly reads of it to the primary."""
+    primary = await db.get_pool()
+    await primary.execute("UPDATE audit_runs SET status = 'completed' WHERE id = $1", 1)
+
+    pool = await db.get_pool(readonly=True, tables=("repos", "audit_runs"))
+    assert pool is primary
+    # Unrelated tables still go to the replica
+    other = await db.get_pool(readonly=True, tables=("scout_runs",))
+    assert other._replica is True
+
+
+@pytest.mark.asyncio
+async def test_write_window_expires(two_pools):
+    """After DB_READ_YOUR_WRITES_SECONDS the replica serves reads again."""
+    db.note_write("repos")
+    with patch.object(db.settings, "DB_READ_YOUR_WRITES_SECONDS", 0.0):
+        db._recent_writes["repos"] -= 1.0
+        pool = await db.get_pool(readonly=True, tables=("repos",))
+    assert pool._replica is True
+
+
+@pytest.mark.asyncio
+async def test_no_replica_configured_uses_primary():
+    """Without DATABASE_REPLICA_URL, readonly calls share the primary pool."""
+    fake = AsyncMock()
+    with patch.object(db.settings, "DATABASE_REPLICA_URL", ""), \
+         patch("app.repos.db._create_pool", new_callable=AsyncMock, return_value=fake):
+        db._invalidate_pool()
+        pool = await db.get_pool(readonly=True)
+        assert pool._pool is fake and pool._replica is False
+        db._invalidate_pool()
+
+
+@pytest.mark.asyncio
+async def test_replica_failure_falls_back_to_primary(two_pools):
+    """If the replica pool cannot be created, the primary serves the read."""
+    with patch("app.repos.db._get_replica_pool", side_effect=OSError("down")):
+        pool = await db.get_pool(readonly=True, tables=("repos",))
+    assert pool._replica is False
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_is_not_retried_during_backoff(two_pools):
+    """A failed replica connect sends reads to the primary without retrying it."""
+    attempts = []
+
+    async def replica_down(dsn, max_size):
+        attempts.append(dsn)
+        if dsn == "postgresql://replica":
+            raise OSError("replica down")
+        return two_pools.setdefault(dsn, AsyncMock())
+
+    with patch("app.repos.db._create_pool", side_effect=replica_down):
+        for _ in range(3):
+            pool = await db.get_pool(readonly=True)
+            assert pool._replica is False
+        assert attempts.count("postgresql://replica") == 1
+
+        db._replica_down_until = 0.0  # backoff elapsed
+        await db.get_pool(readonly=True)
+        assert attempts.count("postgresql://replica") == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_replica_calls_create_one_pool(two_pools):
+    """Concurrent first readonly calls share a single replica pool."""
+    calls = []
+
+    async def slow_create(dsn, max_size):
+        calls.append(dsn)
+        await asyncio.sleep(0.01)
+        pool = AsyncMock()
+        pool.terminate = lambda: None
+        return pool
+
+    with patch("app.repos.db._create_pool", side_effect=slow_create):
+        pools = await asyncio.gather(*(db.get_pool(readonly=True) for _ in range(5)))
+    assert calls == ["postgresql://replica"]
+    assert len({id(p) for p in pools}) == 1
+
+
+@pytest.mark.asyncio
+async def test_replica_query_connection_error_retries_on_primary(two_pools):
+    """A replica that fails twice in a row hands the read to the primary."""
+    replica = await db.get_pool(readonly=True)
+    dead = replica._pool
+    dead.fetch.side_effect = ConnectionResetError("reset")
+    primary = await db.get_pool()
+    primary._pool.fetch.return_value = [{"id": 1}]
+
+    with patch("app.repos.db.asyncio.sleep", new_callable=AsyncMock):
+        assert await replica.fetch("SELECT id FROM repos") == [{"id": 1}]
+    assert dead.fetch.await_count == 2
+    assert (await db.get_pool(readonly=True))._replica is False  # backing off
+    await asyncio.gather(*db._closing_pools)
+    dead.close.assert_awaited_once()  # dropped pool's connections released
+
+
+@pytest.mark.asyncio
+async def test_single_replica_connection_drop_is_retried_on_replica(two_pools):
+    """One dropped connection is retried on the replica without backing off."""
+    replica = await db.get_pool(readonly=True)
+    replica._pool.fetch.side_effect = [ConnectionResetError("reset"), [{"id": 2}]]
+
+    with patch("app.repos.db.asyncio.sleep", new_callable=AsyncMock):
+        assert await replica.fetch("SELECT id FROM repos") == [{"id": 2}]
+    assert db._replica_down_until == 0.0
+    assert (await db.get_pool(readonly=True)) is replica
+    replica._pool.close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stale_replica_failure_keeps_newer_pool(two_pools):
+    """A failure on an already-replaced replica pool leaves the new one alone."""
+    replica = await db.get_pool(readonly=True)
+    db._invalidate_replica_pool()
+    fresh = await db.get_pool(readonly=True)
+
+    db._invalidate_replica_pool(replica._pool)
+    assert (await db.get_pool(readonly=True)) is fresh
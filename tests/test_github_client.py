@@ -1,20 +1,51 @@
-"""Tests for GitHub client -- list_commits, create_github_repo."""
+"""Tests for GitHub client -- list_commits, create_github_repo, conditional requests,
+rate-limit scheduling, batched file fetches."""
 
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 
-from app.clients.github_client import list_commits, create_github_repo
+from app.clients import github_client
+from app.clients.github_client import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    create_github_repo,
+    delete_github_repo,
+    get_repo_file_contents,
+    get_repo_health,
+    get_repo_metadata,
+    list_commits,
+    request_priority,
+)
 
 
-def _mock_response(data, status_code=200):
+def _mock_response(data, status_code=200, headers=None):
     """Create a mock httpx response."""
     resp = MagicMock()
     resp.status_code = status_code
     resp.json.return_value = data
     resp.raise_for_status = MagicMock()
+    if headers is not None:
+        resp.headers = headers
     return resp
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    github_client._conditional_cache.clear()
+    github_client._repo_meta_cache.clear()
+    github_client._schedulers.clear()
+    yield
+    github_client._conditional_cache.clear()
+    github_client._repo_meta_cache.clear()
+    github_client._schedulers.clear()
+
+
 @pytest.mark.asyncio
 @patch("app.clients.github_client._get_client")
 async def test_list_commits_returns_commits(mock_get_client):
@@ -100,3 +131,269 @@ async def test_create_github_repo_returns_repo_info(mock_get_client):
     assert result["default_branch"] == "main"
     assert result["private"] is True
     mock_client.post.assert_called_once()
+
+
+# ---------- conditional requests (ETag / Last-Modified) ----------
+
+
+_REPO = {"full_name": "owner/repo", "archived": False, "stargazers_count": 7}
+
+
+@pytest.mark.asyncio
+@patch("app.clients.github_client._get_client")
+async def test_revalidates_with_etag_and_serves_304_from_cache(mock_get_client):
+    """A second read sends If-None-Match and reuses the body on 304."""
+    mock_client = AsyncMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get.side_effect = [
+        _mock_response(_REPO, headers={"ETag": 'W/"abc"'}),
+        _mock_response(None, status_code=304, headers={}),
+    ]
+
+    first = await get_repo_health("token", "owner/repo")
+    second = await get_repo_health("token", "owner/repo")
+
+    assert first == second == (200, {"full_name": "owner/repo", "archived": False})
+    sent = mock_client.get.call_args_list[1].kwargs["headers"]
+    assert sent["If-None-Match"] == 'W/"abc"'
+    assert "If-None-Match" not in mock_client.get.call_args_list[0].kwargs["headers"]
+
+
+@pytest.mark.asyncio
+@patch("app.clients.github_client._get_client")
+async def test_health_and_metadata_share_validators(mock_get_client):
+    """get_repo_metadata revalidates the body get_repo_health fetched."""
+    mock_client = AsyncMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get.side_effect = [
+        _mock_response(_REPO, headers={"Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT"}),
+        _mock_response(None, status_code=304, headers={}),
+    ]
+
+    await get_repo_health("token", "owner/repo")
+    meta = await get_repo_metadata("token", "owner/repo")
+
+    assert meta["stargazers_count"] == 7
+    sent = mock_client.get.call_args_list[1].kwargs["headers"]
+    assert sent["If-Modified-Since"] == "Tue, 01 Sep 2026 00:00:00 GMT"
+
+
+@pytest.mark.asyncio
+@patch("app.clients.github_client._get_client")
+async def test_validators_are_per_token(mock_get_client):
+    """A cached ETag is never sent with a different access token."""
+    mock_client = AsyncMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get.side_effect = [
+        _mock_response([], headers={"ETag": '"one"'}),
+        _mock_response([], headers={}),
+    ]
+
+    await list_commits("token-a", "owner/repo")
+    await list_commits("token-b", "owner/repo")
+
+    assert "If-None-Match" not in mock_client.get.call_args_list[1].kwargs["headers"]
+
+
+@pytest.mark.asyncio
+@patch("app.clients.github_client._get_client")
+async def test_changed_resource_replaces_cached_body(mock_get_client):
+    """A 200 on revalidation refreshes both the body and the ETag."""
+    mock_client = AsyncMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get.side_effect = [
+        _mock_response(_REPO, headers={"ETag": '"v1"'}),
+        _mock_response({**_REPO, "archived": True}, headers={"ETag": '"v2"'}),
+        _mock_response(None, status_code=304, headers={}),
+    ]
+
+    await get_repo_health("token", "owner/repo")
+    await get_repo_health("token", "owner/repo")
+    _, data = await get_repo_health("token", "owner/repo")
+
+    assert data["archived"] is True
+    assert mock_client.get.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"v2"'
+
+
+# ---------- rate-limit scheduling ----------
+
+
+@pytest.mark.asyncio
+@patch("app.clients.github_client._get_client")
+async def test_secondary_limit_is_retried_and_halves_concurrency(mock_get_client):
+    """A 429 with Retry-After is retried after the delay; concurrency backs off."""
+    mock_client = AsyncMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get.side_effect = [
+        _mock_response(None, status_code=429, headers={"Retry-After": "0"}),
+        _mock_response(_REPO, headers={"X-RateLimit-Remaining": "4000"}),
+    ]
+
+    status, data = await get_repo_health("token", "owner/repo")
+
+    assert status == 200 and data["full_name"] == "owner/repo"
+    assert mock_client.get.call_count == 2
+    scheduler = github_client._schedulers["token"]
+    assert scheduler.limit == github_client.MAX_CONCURRENCY // 2
+    assert scheduler.remaining == 4000
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+@patch("app.clients.github_client._get_client")
+async def test_plain_403_is_not_treated_as_rate_limit(mock_get_client):
+    """A permissions 403 is returned to the caller untouched, without retries."""
+    mock_client = AsyncMock()
+    mock_get_client.return_value = mock_client
+    resp = _mock_response({"message": "Must have admin rights"}, status_code=403, headers={})
+    resp.text = '{"message": "Must have admin rights"}'
+    mock_client.delete.return_value = resp
+
+    with pytest.raises(PermissionError):
+        await delete_github_repo("token", "owner/repo")
+
+    assert mock_client.delete.call_count == 1
+    assert github_client._schedulers["token"].limit == github_client.MAX_CONCURRENCY
+
+
+@pytest.mark.asyncio
+@patch("app.clients.github_client._get_client")
+async def test_background_requests_leave_reserve_for_interactive(mock_get_client):
+    """Once quota falls into the reserve, only interactive requests are sent."""
+    mock_client = AsyncMock()
+    mock_get_client.return_value = mock_client
+    low_quota = {
+        "X-RateLimit-Remaining": "50",
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Reset": str(int(time.time()) + 3600),
+    }
+    mock_client.get.side_effect = [
+        _mock_response(_REPO, headers=low_quota),
+        _mock_response(_REPO, headers=low_quota),
+    ]
+
+    await get_repo_health("token", "owner/repo")
+    with request_priority(PRIORITY_BACKGROUND):
+        background_status, _ = await get_repo_health("token", "owner/repo")
+    status, _ = await get_repo_health("token", "owner/repo")
+
+    assert background_status == 429
+    assert status == 200
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_free_slots_go_to_interactive_waiters_first():
+    """With every slot taken, a queued interactive request beats earlier background ones."""
+    scheduler = github_client._TokenScheduler()
+    scheduler.limit = 1
+    await scheduler.acquire(PRIORITY_INTERACTIVE)
+    order: list[str] = []
+
+    async def worker(name: str, priority: int) -> None:
+        await scheduler.acquire(priority)
+        order.append(name)
+        scheduler.release()
+
+    background = asyncio.create_task(worker("background", PRIORITY_BACKGROUND))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(worker("interactive", PRIORITY_INTERACTIVE))
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(background, interactive)
+
+    assert order == ["interactive", "background"]
+    assert scheduler.in_flight == 0
+
+
+# ---------- batched file contents (GraphQL) ----------
+
+
+class _FakeGitHub:
+    """Local transport serving a tiny repo over GraphQL and REST Contents."""
+
+    def __init__(self, files: dict[str, str | bytes], graphql_status: int = 200):
+        self.files = files
+        self.graphql_status = graphql_status
+        self.graphql_calls = 0
+        self.rest_paths: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/graphql":
+            self.graphql_calls += 1
+            if self.graphql_status != 200:
+                return httpx.Response(self.graphql_status, json={"message": "boom"})
+            variables = json.loads(request.content)["variables"]
+            repository = {}
+            for key, expression in variables.items():
+                if not key.startswith("e"):
+                    continue
+                path = expression.split(":", 1)[1]
+                content = self.files.get(path)
+                if content is None:
+                    repository[f"f{key[1:]}"] = None
+                elif isinstance(content, bytes):
+                    repository[f"f{key[1:]}"] = {"text": None, "isBinary": True, "isTruncated": False}
+                else:
+                    repository[f"f{key[1:]}"] = {"text": content, "isBinary": False, "isTruncated": False}
+            return httpx.Response(200, json={"data": {"repository": repository}})
+        path = request.url.path.split("/contents/", 1)[1]
+        self.rest_paths.append(path)
+        content = self.files.get(path)
+        if content is None:
+            return httpx.Response(404, json={"message": "Not Found"})
+        raw = content if isinstance(content, bytes) else content.encode()
+        return httpx.Response(200, json={"encoding": "base64", "content": base64.b64encode(raw).decode()})
+
+
+@pytest.fixture()
+def fake_github():
+    def install(files, **kwargs):
+        fake = _FakeGitHub(files, **kwargs)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+        patcher = patch("app.clients.github_client._get_client", return_value=client)
+        patcher.start()
+        installed.append(patcher)
+        return fake
+
+    installed: list = []
+    yield install
+    for patcher in installed:
+        patcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_fetch_uses_one_graphql_request_per_chunk(fake_github, monkeypatch):
+    """Text blobs come back from GraphQL, chunked by GRAPHQL_BATCH_SIZE."""
+    monkeypatch.setattr(github_client, "GRAPHQL_BATCH_SIZE", 2)
+    fake = fake_github({"a.py": "A", "b.py": "B", "c.py": "C"})
+
+    result = await get_repo_file_contents("token", "owner/repo", ["a.py", "b.py", "c.py", "gone.py"], "abc123")
+
+    assert result == {"a.py": "A", "b.py": "B", "c.py": "C", "gone.py": None}
+    assert list(result) == ["a.py", "b.py", "c.py", "gone.py"]
+    assert fake.graphql_calls == 2
+    assert fake.rest_paths == []
+
+
+@pytest.mark.asyncio
+async def test_batch_fetch_falls_back_to_rest_for_binary_blobs(fake_github):
+    """Blobs GraphQL can't return as text are fetched over REST."""
+    fake = fake_github({"readme.md": "hi", "logo.png": b"\x89PNG"})
+
+    result = await get_repo_file_contents("token", "owner/repo", ["readme.md", "logo.png"], "abc123")
+
+    assert result["readme.md"] == "hi"
+    assert result["logo.png"].endswith("PNG")
+    assert fake.rest_paths == ["logo.png"]
+
+
+@pytest.mark.asyncio
+async def test_batch_fetch_falls_back_to_rest_when_graphql_fails(fake_github):
+    """A failed GraphQL query degrades to one REST call per path."""
+    fake = fake_github({"a.py": "A"}, graphql_status=502)
+
+    result = await get_repo_file_contents("token", "owner/repo", ["a.py", "missing.py"], "abc123")
+
+    assert result == {"a.py": "A", "missing.py": None}
+    assert sorted(fake.rest_paths) == ["a.py", "missing.py"]
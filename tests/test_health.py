@@ -48,3 +48,27 @@ def test_nonexistent_route_returns_json_error():
     data = response.json()
     assert "error" in data
     assert "request_id" in data
+
+
+def test_health_db_requires_auth():
+    """GET /health/db exposes query stats only to authenticated users."""
+    response = client.get("/health/db")
+    assert response.status_code == 401
+
+
+def test_health_db_disabled_by_default():
+    """Authenticated users get 404 unless the stats endpoint is enabled."""
+    from unittest.mock import patch
+
+    from app.api.deps import get_current_user
+    from app.config import settings
+
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    try:
+        assert client.get("/health/db").status_code == 404
+        with patch.object(settings, "DB_QUERY_STATS_ENDPOINT_ENABLED", True):
+            response = client.get("/health/db")
+        assert response.status_code == 200
+        assert set(response.json()) == {"pool", "queries"}
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
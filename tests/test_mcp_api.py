@@ -4,6 +4,7 @@ Covers:
 - GET /mcp/context/{project_id}          — project manifest
 - GET /mcp/context/{project_id}/{type}   — single contract
 - GET /mcp/build/{build_id}/contracts    — pinned snapshot
+- GET /mcp/build/{build_id}/bundle       — all contracts for a build
 - Auth / ownership checks
 """
 
@@ -231,6 +232,64 @@ class TestGetBuildContracts:
         assert resp.status_code == 403
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# GET /mcp/build/{build_id}/bundle — all contracts for a build
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGetBuildBundle:
+    ENDPOINT = f"/mcp/build/{BUILD_ID}/bundle"
+
+    def test_pinned_snapshot(self, client: TestClient):
+        snapshot = [
+            {"contract_type": "manifesto", "content": "# M"},
+            {"contract_type": "stack", "content": "# S"},
+        ]
+        with (
+            patch("app.api.routers.mcp.get_build_by_id", new_callable=AsyncMock, return_value=MOCK_BUILD),
+            patch("app.api.routers.mcp.get_project_by_id", new_callable=AsyncMock, return_value=MOCK_PROJECT),
+            patch("app.api.routers.mcp.get_snapshot_contracts", new_callable=AsyncMock, return_value=snapshot),
+        ):
+            resp = client.get(self.ENDPOINT)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["source"] == "snapshot"
+        assert data["batch"] == 3
+        assert data["project_name"] == "TestProject"
+        assert [c["content"] for c in data["contracts"]] == ["# M", "# S"]
+        assert data["contracts"][1]["size_chars"] == 3
+
+    def test_falls_back_to_current_contracts(self, client: TestClient):
+        with (
+            patch("app.api.routers.mcp.get_build_by_id", new_callable=AsyncMock, return_value=MOCK_BUILD_NO_BATCH),
+            patch("app.api.routers.mcp.get_project_by_id", new_callable=AsyncMock, return_value=MOCK_PROJECT),
+            patch(
+                "app.api.routers.mcp.get_contracts_by_project",
+                new_callable=AsyncMock,
+                return_value=[MOCK_CONTRACT_MANIFESTO, MOCK_CONTRACT_STACK],
+            ),
+        ):
+            resp = client.get(self.ENDPOINT)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["source"] == "project_db"
+        assert data["batch"] is None
+        assert {c["contract_type"]: c["version"] for c in data["contracts"]} == {"manifesto": 2, "stack": 1}
+
+    def test_build_not_found(self, client: TestClient):
+        with patch("app.api.routers.mcp.get_build_by_id", new_callable=AsyncMock, return_value=None):
+            resp = client.get(self.ENDPOINT)
+        assert resp.status_code == 404
+
+    def test_wrong_owner(self, client: TestClient):
+        with (
+            patch("app.api.routers.mcp.get_build_by_id", new_callable=AsyncMock, return_value=MOCK_BUILD),
+            patch("app.api.routers.mcp.get_project_by_id", new_callable=AsyncMock, return_value=MOCK_OTHER_PROJECT),
+        ):
+            resp = client.get(self.ENDPOINT)
+        assert resp.status_code == 403
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Auth guard — unauthed requests
 # ═══════════════════════════════════════════════════════════════════════════
@@ -250,3 +309,7 @@ class TestAuthGuard:
     def test_build_requires_auth(self, unauthed_client: TestClient):
         resp = unauthed_client.get(f"/mcp/build/{BUILD_ID}/contracts")
         assert resp.status_code in (401, 403)
+
+    def test_bundle_requires_auth(self, unauthed_client: TestClient):
+        resp = unauthed_client.get(f"/mcp/build/{BUILD_ID}/bundle")
+        assert resp.status_code in (401, 403)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -103,8 +106,8 @@ def test_get_expired_returns_error():
     store_artifact("p-3", "contract", "stack", "data", ttl_hours=0.0, persist=False)
     # Force expiry by setting stored_at far in the past
     key = "project:p-3:contract:stack"
-    stored_at, ttl_secs, content = _store[key]
-    _store[key] = (stored_at - 100, ttl_secs, content)  # aged 100 seconds past TTL=0
+    entry = _store[key]
+    _store[key] = entry._replace(stored_at=entry.stored_at - 100)  # aged 100 seconds past TTL=0
     result = get_artifact("p-3", "contract", "stack")
     assert "error" in result
 
@@ -117,6 +120,54 @@ def test_get_reports_age_and_ttl_remaining():
     assert result["ttl_remaining_seconds"] > 0
 
 
+def test_get_does_not_remeasure_content():
+    _clear()
+    store_artifact("p-4", "scout", "big", {"k": "v" * 100}, persist=False)
+    with patch("forge_ide.mcp.artifact_store._measure", side_effect=AssertionError):
+        assert get_artifact("p-4", "scout", "big")["size_chars"] > 100
+
+
+# ---------------------------------------------------------------------------
+# Memory budget
+# ---------------------------------------------------------------------------
+
+
+def test_memory_tier_evicts_least_recently_used():
+    _clear()
+    with patch.object(_store, "max_bytes", 250):
+        store_artifact("p-lru", "phase", "a", "a" * 100, persist=False)
+        store_artifact("p-lru", "phase", "b", "b" * 100, persist=False)
+        get_artifact("p-lru", "phase", "a")  # a is now most recent
+        store_artifact("p-lru", "phase", "c", "c" * 100, persist=False)
+        assert "project:p-lru:phase:b" not in _store
+        assert "project:p-lru:phase:a" in _store
+        assert "project:p-lru:phase:c" in _store
+        assert _store.bytes <= 250
+
+
+def test_memory_eviction_falls_back_to_disk(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path), \
+            patch.object(_store, "max_bytes", 150):
+        store_artifact("p-tier", "phase", "a", "a" * 100, persist=True)
+        store_artifact("p-tier", "phase", "b", "b" * 100, persist=True)
+        assert "project:p-tier:phase:a" not in _store
+        result = get_artifact("p-tier", "phase", "a")
+        assert result["source"] == "disk"
+        assert result["content"] == "a" * 100
+
+
+def test_oversized_persisted_artifact_skips_memory(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path), \
+            patch.object(_store, "max_bytes", 50):
+        store_artifact("p-big", "phase", "small", "s", persist=True)
+        store_artifact("p-big", "phase", "huge", "h" * 100, persist=True)
+        assert "project:p-big:phase:small" in _store
+        assert "project:p-big:phase:huge" not in _store
+        assert get_artifact("p-big", "phase", "huge")["content"] == "h" * 100
+
+
 # ---------------------------------------------------------------------------
 # list_artifacts
 # ---------------------------------------------------------------------------
@@ -163,8 +214,8 @@ def test_list_evicts_expired():
     _clear()
     store_artifact("p-7", "phase", "out", "data", ttl_hours=0.0, persist=False)
     key = "project:p-7:phase:out"
-    stored_at, ttl_secs, content = _store[key]
-    _store[key] = (stored_at - 100, ttl_secs, content)
+    entry = _store[key]
+    _store[key] = entry._replace(stored_at=entry.stored_at - 100)
     result = list_artifacts("p-7")
     assert result["count"] == 0
     assert key not in _store  # Evicted during list
@@ -276,6 +327,162 @@ def test_disk_clear_removes_files(tmp_path):
         assert result["count"] == 0
 
 
+def test_disk_writes_index_and_no_temp_files(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-idx", "contract", "stack", "s", persist=True)
+        store_artifact("p-idx", "phase", "out", {"a": 1}, persist=True)
+        index = json.loads((tmp_path / "p-idx" / "index.json").read_text(encoding="utf-8"))
+        assert set(index) == {"contract", "phase"}
+        assert index["phase"]["out"]["size_chars"] == len(json.dumps({"a": 1}))
+        assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_disk_list_uses_index_not_directory_walk(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-walk", "scout", "dossier", "d" * 50, persist=True)
+        _store.clear()
+        with patch.object(Path, "rglob", side_effect=AssertionError("walked")), \
+                patch.object(Path, "glob", side_effect=AssertionError("walked")):
+            result = list_artifacts("p-walk")
+        assert result["count"] == 1
+        assert result["artifacts"][0]["size_chars"] == 52
+
+
+def test_disk_legacy_layout_is_indexed(tmp_path):
+    _clear()
+    legacy = tmp_path / "p-old" / "contract"
+    legacy.mkdir(parents=True)
+    (legacy / "manifesto.json").write_text('"# M"', encoding="utf-8")
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        result = list_artifacts("p-old")
+        assert [a["key"] for a in result["artifacts"]] == ["manifesto"]
+        assert (tmp_path / "p-old" / "index.json").exists()
+        assert get_artifact("p-old", "contract", "manifesto")["content"] == "# M"
+        assert clear_artifacts("p-old")["cleared_disk"] == 1
+
+
+def test_disk_index_picks_up_external_writes(tmp_path):
+    """Another process writing the index is seen on the next list."""
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-ext", "contract", "stack", "s", persist=True)
+        assert list_artifacts("p-ext")["count"] == 1
+        index_path = tmp_path / "p-ext" / "index.json"
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        index["contract"]["physics"] = {"size_chars": 3}
+        index_path.write_text(json.dumps(index), encoding="utf-8")
+        stat = index_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert list_artifacts("p-ext")["count"] == 2
+
+
+def _blobs(root: Path) -> list[Path]:
+    return sorted((root / ".blobs").rglob("*.json.gz"))
+
+
+def test_disk_dedups_identical_content(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-a", "contract", "stack", {"lang": "Python"}, persist=True)
+        store_artifact("p-a", "phase", "copy", {"lang": "Python"}, persist=True)
+        store_artifact("p-b", "contract", "stack", {"lang": "Python"}, persist=True)
+        blobs = _blobs(tmp_path)
+        assert len(blobs) == 1
+        assert json.loads(gzip.decompress(blobs[0].read_bytes())) == {"lang": "Python"}
+        _store.clear()
+        assert get_artifact("p-b", "contract", "stack")["content"] == {"lang": "Python"}
+
+
+def test_disk_restore_of_same_content_writes_nothing(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-same", "phase", "summary", "done", persist=True)
+        with patch("forge_ide.mcp.artifact_store._atomic_write") as write:
+            store_artifact("p-same", "phase", "summary", "done", persist=True)
+        write.assert_not_called()
+
+
+def test_disk_overwrite_releases_old_blob(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-ow", "contract", "stack", "v1", persist=True)
+        store_artifact("p-ow", "contract", "stack", "v2", persist=True)
+        _store.clear()
+        assert get_artifact("p-ow", "contract", "stack")["content"] == "v2"
+        assert len(_blobs(tmp_path)) == 1
+
+
+def test_disk_clear_gcs_unreferenced_blobs_only(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-gc", "contract", "shared", "same", persist=True)
+        store_artifact("p-gc", "contract", "own", "mine", persist=True)
+        store_artifact("p-keep", "contract", "shared", "same", persist=True)
+
+        result = clear_artifacts("p-gc")
+        assert result["cleared_disk"] == 2
+        assert result["blobs_freed"] == 1
+        assert len(_blobs(tmp_path)) == 1
+        _store.clear()
+        assert get_artifact("p-keep", "contract", "shared")["content"] == "same"
+
+        assert clear_artifacts("p-keep")["blobs_freed"] == 1
+        assert _blobs(tmp_path) == []
+
+
+def test_disk_clear_keeps_blobs_when_an_index_is_unreadable(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-gone", "contract", "shared", "same", persist=True)
+        store_artifact("p-other", "contract", "shared", "same", persist=True)
+        (tmp_path / "p-other" / "index.json").write_text('{"contract": {', encoding="utf-8")
+
+        result = clear_artifacts("p-gone")
+        assert result["cleared_disk"] == 1
+        assert result["blobs_freed"] == 0
+        assert len(_blobs(tmp_path)) == 1
+
+
+def test_disk_store_refuses_to_overwrite_unreadable_index(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-bad", "contract", "stack", "s", persist=True)
+        index_path = tmp_path / "p-bad" / "index.json"
+        index_path.write_text("{half-written", encoding="utf-8")
+        store_artifact("p-bad", "contract", "physics", "p", persist=True)
+        assert index_path.read_text(encoding="utf-8") == "{half-written"
+        assert clear_artifacts("p-bad")["cleared_disk"] == 0
+
+
+def test_disk_failed_index_write_leaves_cached_index_untouched(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        store_artifact("p-atom", "contract", "stack", "v1", persist=True)
+        store_artifact("p-atom", "phase", "out", "o", persist=True)
+        with patch("forge_ide.mcp.artifact_store._write_json", side_effect=OSError("disk full")):
+            store_artifact("p-atom", "contract", "stack", "v2", persist=True)
+            store_artifact("p-atom", "phase", "new", "x", persist=True)
+            assert clear_artifacts("p-atom", "phase")["cleared_disk"] == 0
+        _store.clear()
+        assert get_artifact("p-atom", "contract", "stack")["content"] == "v1"
+        assert [a["key"] for a in list_artifacts("p-atom")["artifacts"]] == ["stack", "out"]
+
+
+def test_disk_concurrent_stores_keep_every_entry(tmp_path):
+    _clear()
+    with patch("forge_ide.mcp.artifact_store._ARTIFACTS_DIR", tmp_path):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda i: store_artifact("p-conc", "phase", f"k{i}", f"v{i % 4}", persist=True),
+                range(32),
+            ))
+        index = json.loads((tmp_path / "p-conc" / "index.json").read_text(encoding="utf-8"))
+        assert len(index["phase"]) == 32
+        assert len(_blobs(tmp_path)) == 4
+
+
 def test_disk_write_failure_is_non_fatal():
     """store_artifact should not raise if disk write fails."""
     _clear()
@@ -0,0 +1,126 @@
+"""Tests for forge_ide.mcp.bundle — contract bundles and section selection."""
+
+from __future__ import annotations
+
+from forge_ide.mcp import bundle as bundle_mod
+from forge_ide.mcp.bundle import ContractBundle
+
+_SCHEMA = """# Schema
+
+## users
+id uuid
+
+```sql
+# not a heading
+CREATE TABLE users (id uuid);
+```
+
+### users indexes
+idx_users_email
+
+## posts
+body text
+"""
+
+_PHASES = """# Phases
+
+## Phase 1 — Auth
+JWT
+
+## Phase 2 — Core
+CRUD
+
+## Phase 12 — Polish
+CSS
+"""
+
+_PHYSICS = """openapi: 3.0
+paths:
+  /health:
+    get: {}
+components:
+  schemas: {}
+"""
+
+
+def _bundle() -> ContractBundle:
+    return ContractBundle([
+        {"contract_type": "schema", "content": _SCHEMA},
+        {"contract_type": "phases", "content": _PHASES},
+        {"contract_type": "physics", "content": _PHYSICS},
+        {"contract_type": "stack", "content": None},
+    ])
+
+
+# ---------------------------------------------------------------------------
+# Section splitting
+# ---------------------------------------------------------------------------
+
+
+def test_markdown_sections_ignore_fenced_code():
+    titles = [title for title, *_ in _bundle().sections("schema")]
+    assert titles == ["Schema", "users", "users indexes", "posts"]
+
+
+def test_subsection_is_included_in_parent():
+    text = _bundle().select(["schema"], {"schema": ["users"]})["contracts"]["schema"]
+    assert "idx_users_email" in text
+    assert "CREATE TABLE" in text
+    assert "body text" not in text
+
+
+def test_yaml_falls_back_to_top_level_keys():
+    b = _bundle()
+    assert [title for title, *_ in b.sections("physics")] == ["openapi", "paths", "components"]
+    text = b.select(["physics"], {"physics": ["paths"]})["contracts"]["physics"]
+    assert "/health" in text
+    assert "components" not in text
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+
+def test_select_preserves_request_order_and_reports_missing():
+    result = _bundle().select(["stack", "schema", "ui", "stack"])
+    assert list(result["contracts"]) == ["stack", "schema"]
+    assert result["contracts"]["stack"] == ""
+    assert result["missing"] == ["ui"]
+
+
+def test_phase_number_must_match_whole():
+    text = _bundle().select(["phases"], {"phases": ["phase 1"]})["contracts"]["phases"]
+    assert "JWT" in text
+    assert "CSS" not in text
+
+
+def test_phases_require_selectors():
+    result = _bundle().select(["phases"])
+    assert "phases" not in result["contracts"]
+    assert "forge_get_phase_window" in result["errors"]["phases"]
+
+
+def test_unmatched_selectors_return_whole_contract():
+    result = _bundle().select(["schema"], {"schema": ["comments"]})
+    assert result["contracts"]["schema"] == _SCHEMA
+    assert result["unmatched_sections"] == {"schema": ["comments"]}
+
+
+def test_unmatched_phases_selector_is_an_error():
+    result = _bundle().select(["phases"], {"phases": ["Phase 7"]})
+    assert "phases" not in result["contracts"]
+    assert "phases" in result["errors"]
+
+
+def test_overlapping_selections_are_merged():
+    text = _bundle().select(
+        ["schema"], {"schema": ["users", "users indexes"]},
+    )["contracts"]["schema"]
+    assert text.count("idx_users_email") == 1
+
+
+def test_large_contract_is_truncated(monkeypatch):
+    monkeypatch.setattr(bundle_mod, "MAX_CONTRACT_CHARS", 10)
+    text = ContractBundle([{"contract_type": "stack", "content": "x" * 50}]).select(["stack"])
+    assert text["contracts"]["stack"].startswith("x" * 10 + "\n\n[... truncated")
@@ -0,0 +1,151 @@
+"""Tests for forge_ide.mcp.cache — bounded LRU/TTL cache with single-flight."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from forge_ide.mcp import cache as cache_mod
+from forge_ide.mcp.cache import BoundedCache, cache_clear, cache_stats
+
+# ---------------------------------------------------------------------------
+# Eviction
+# ---------------------------------------------------------------------------
+
+
+def test_lru_evicts_least_recently_used():
+    c = BoundedCache(max_entries=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1  # a is now most recent
+    c.set("c", 3)
+    assert c.get("b") is None
+    assert c.get("a") == 1
+    assert c.get("c") == 3
+    assert c.stats()["evicted_lru"] == 1
+
+
+def test_namespace_limit_evicts_only_that_namespace():
+    c = BoundedCache(max_entries=100, namespace_limits={"api": 2})
+    c.set("contract:x", "keep")
+    for i in range(4):
+        c.set(f"api:/p/{i}", i)
+    stats = c.stats()
+    assert stats["namespaces"]["api"]["entries"] == 2
+    assert stats["evicted_namespace"] == 2
+    assert c.get("contract:x") == "keep"
+    assert c.get("api:/p/0") is None
+    assert c.get("api:/p/3") == 3
+
+
+def test_byte_budget_evicts_oldest():
+    c = BoundedCache(max_bytes=30)
+    c.set("a", "x" * 10)
+    c.set("b", "y" * 10)
+    c.set("c", "z" * 10)
+    assert c.get("a") is None
+    assert c.stats()["bytes"] <= 30
+
+
+def test_oversized_value_is_returned_but_not_cached():
+    c = BoundedCache(max_bytes=10)
+    c.set("small", "ok")
+    assert c.set("big", "x" * 100) == "x" * 100
+    assert c.get("big") is None
+    assert c.get("small") == "ok"
+
+
+def test_ttl_expiry_and_sweep():
+    c = BoundedCache(ttl=10)
+    with patch.object(cache_mod.time, "monotonic", return_value=1000.0):
+        c.set("a", 1)
+        c.set("b", 2, ttl=100)
+    with patch.object(cache_mod.time, "monotonic", return_value=1050.0):
+        assert c.sweep() == 1
+        assert c.get("a") is None
+        assert c.get("b") == 2
+    assert c.stats()["expired"] == 1
+    assert c.stats()["entries"] == 1
+
+
+def test_clear_namespace():
+    c = BoundedCache()
+    c.set("api:/a", 1)
+    c.set("contract:m", 2)
+    assert c.clear("api") == 1
+    assert c.stats()["namespaces"] == {"contract": {"entries": 1, "limit": None}}
+
+
+# ---------------------------------------------------------------------------
+# Single-flight
+# ---------------------------------------------------------------------------
+
+
+async def test_concurrent_misses_share_one_load():
+    c = BoundedCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"v": 1}
+
+    results = await asyncio.gather(*(c.get_or_load("api:/x", loader) for _ in range(5)))
+    assert results == [{"v": 1}] * 5
+    assert calls == 1
+    stats = c.stats()
+    assert stats["loads"] == 1
+    assert stats["coalesced"] == 4
+    assert await c.get_or_load("api:/x", loader) == {"v": 1}
+    assert calls == 1
+
+
+async def test_loader_error_reaches_waiters_and_is_not_cached():
+    c = BoundedCache()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        c.get_or_load("api:/x", failing),
+        c.get_or_load("api:/x", failing),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert c.stats()["entries"] == 0
+    assert c.stats()["inflight"] == 0
+
+
+async def test_coalesce_shares_inflight_but_does_not_cache():
+    c = BoundedCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    assert await asyncio.gather(c.coalesce("tool:x", loader), c.coalesce("tool:x", loader)) == [1, 1]
+    assert await c.coalesce("tool:x", loader) == 2
+    assert c.stats()["entries"] == 0
+
+
+# ---------------------------------------------------------------------------
+# forge_cache_stats tool
+# ---------------------------------------------------------------------------
+
+
+async def test_cache_stats_tool():
+    from forge_ide.mcp.tools import dispatch
+
+    cache_clear()
+    try:
+        result = await dispatch("forge_cache_stats", {})
+        assert result["cache"]["entries"] == 0
+        assert "hit_rate" in result["cache"]
+        assert cache_stats()["max_entries"] == result["cache"]["max_entries"]
+    finally:
+        cache_clear()
@@ -246,6 +246,53 @@ class TestProjectHandlers:
         result = asyncio.run(get_build_contracts({}))
         assert "error" in result
 
+    def test_get_build_bundle_uses_session(self):
+        set_session("p1", build_id="sess-build")
+        mock_resp = {"build_id": "sess-build", "source": "snapshot", "contracts": []}
+        with patch("forge_ide.mcp.project.api_get", new_callable=AsyncMock, return_value=mock_resp) as mock:
+            from forge_ide.mcp.project import get_build_bundle
+            result = asyncio.run(get_build_bundle({}))
+            mock.assert_called_once_with("/api/mcp/build/sess-build/bundle")
+            assert result["source"] == "snapshot"
+
+    def test_get_build_bundle_missing_bid(self):
+        from forge_ide.mcp.project import get_build_bundle
+        result = asyncio.run(get_build_bundle({}))
+        assert "error" in result
+
+    def test_get_contracts_selects_from_bundle(self):
+        mock_resp = {"build_id": "b1", "source": "snapshot", "batch": 3, "contracts": [
+            {"contract_type": "stack", "content": "# Stack\nFastAPI"},
+            {"contract_type": "schema", "content": "# Schema\n## users\nid\n## posts\nbody"},
+        ]}
+        with patch("forge_ide.mcp.project.api_get", new_callable=AsyncMock, return_value=mock_resp) as mock:
+            from forge_ide.mcp.project import get_contracts
+            result = asyncio.run(get_contracts({
+                "build_id": "b1",
+                "names": ["stack", "schema", "ui"],
+                "sections": {"schema": ["posts"]},
+            }))
+            mock.assert_called_once_with("/api/mcp/build/b1/bundle")
+        assert result["batch"] == 3
+        assert list(result["contracts"]) == ["stack", "schema"]
+        assert "users" not in result["contracts"]["schema"]
+        assert result["missing"] == ["ui"]
+
+    def test_get_contracts_reuses_bundle_for_same_response(self):
+        from forge_ide.mcp import project
+        mock_resp = {"build_id": "b1", "contracts": [{"contract_type": "stack", "content": "# S"}]}
+        with patch("forge_ide.mcp.project.api_get", new_callable=AsyncMock, return_value=mock_resp):
+            asyncio.run(project.get_contracts({"build_id": "b1", "names": ["stack"]}))
+            first = project._bundles["b1"][1]
+            asyncio.run(project.get_contracts({"build_id": "b1", "names": ["stack"]}))
+            assert project._bundles["b1"][1] is first
+
+    def test_get_contracts_requires_names(self):
+        set_session("p1", build_id="b1")
+        from forge_ide.mcp.project import get_contracts
+        result = asyncio.run(get_contracts({"names": "stack"}))
+        assert "error" in result
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Dispatch routing for _PROJECT_TOOLS
@@ -306,6 +353,44 @@ class TestDispatchProjectTools:
             result = asyncio.run(dispatch("forge_get_build_contracts", {"build_id": "b1"}))
             assert result["batch"] == 2
 
+    def test_dispatch_get_build_bundle(self):
+        mock_resp = {"build_id": "b1", "contracts": [{"contract_type": "stack", "content": "# S"}]}
+        with patch("forge_ide.mcp.project.api_get", new_callable=AsyncMock, return_value=mock_resp):
+            from forge_ide.mcp.tools import dispatch
+            result = asyncio.run(dispatch("forge_get_build_bundle", {"build_id": "b1"}))
+            assert result["contracts"][0]["content"] == "# S"
+
+    def test_dispatch_get_contracts(self):
+        mock_resp = {"build_id": "b1", "contracts": [{"contract_type": "stack", "content": "# S"}]}
+        with patch("forge_ide.mcp.project.api_get", new_callable=AsyncMock, return_value=mock_resp):
+            from forge_ide.mcp.tools import dispatch
+            result = asyncio.run(dispatch("forge_get_contracts", {"build_id": "b1", "names": ["stack"]}))
+            assert result["contracts"] == {"stack": "# S"}
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        async def slow_get(path):
+            await asyncio.sleep(0.01)
+            return {"build_id": "b1", "contracts": []}
+
+        with patch("forge_ide.mcp.project.api_get", new_callable=AsyncMock, side_effect=slow_get) as mock:
+            from forge_ide.mcp.tools import dispatch
+
+            async def _run():
+                return await asyncio.gather(
+                    *(dispatch("forge_get_build_contracts", {"build_id": "b1"}) for _ in range(5)),
+                    dispatch("forge_get_build_contracts", {"build_id": "b2"}),
+                )
+
+            results = asyncio.run(_run())
+            assert mock.await_count == 2  # one per distinct build
+            assert all(r["build_id"] == "b1" for r in results)
+
+    def test_session_tools_are_not_coalesced(self):
+        from forge_ide.mcp.tools import _COALESCED_PROJECT_TOOLS
+        assert "forge_set_session" not in _COALESCED_PROJECT_TOOLS
+        assert "forge_clear_session" not in _COALESCED_PROJECT_TOOLS
+        assert "forge_get_build_bundle" in _COALESCED_PROJECT_TOOLS
+
     def test_project_tools_bypass_local_mode(self):
         """Project tools must always proxy to API, even in LOCAL_MODE."""
         mock_resp = {"project": {"id": "p1"}, "contracts": [], "latest_batch": None, "build_count": 0}
@@ -330,8 +415,8 @@ class TestToolDefinitions:
 
     def test_project_tool_count(self):
         from forge_ide.mcp.tools import _PROJECT_TOOLS
-        # session (set+clear) + project context + list + get + build = 6
-        assert len(_PROJECT_TOOLS) == 6
+        # session (set+clear) + project context + list + get + build + bundle + contracts = 8
+        assert len(_PROJECT_TOOLS) == 8
 
     def test_tool_definitions_have_required_fields(self):
         from forge_ide.mcp.tools import TOOL_DEFINITIONS
@@ -347,5 +432,5 @@ class TestToolDefinitions:
 
     def test_total_tool_count(self):
         from forge_ide.mcp.tools import TOOL_DEFINITIONS
-        # 8 governance + 4 artifact + 6 project = 18
-        assert len(TOOL_DEFINITIONS) == 18
+        # 5 governance + 4 artifact + 8 project + 1 planner + 1 diagnostics = 19
+        assert len(TOOL_DEFINITIONS) == 19
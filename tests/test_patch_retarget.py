@@ -313,6 +313,26 @@ class TestInternalHelpers:
         result = _find_by_difflib(content, old_text)
         assert result is None
 
+    def test_find_by_difflib_picks_best_window(self) -> None:
+        lines = [f"    value_{i} = compute(item_{i})" for i in range(200)]
+        content = "\n".join(lines)
+        old_text = "\n".join(lines[120:124]).replace("item_121", "itm_121")
+        start, end = _find_by_difflib(content, old_text)
+        assert content[start:end] == "\n".join(lines[120:124])
+
+    def test_find_by_difflib_without_anchor_lines(self) -> None:
+        """Every line differs slightly — falls back to the quick_ratio sweep."""
+        lines = [f"    value_{i} = compute(item_{i}, factor={i % 7})" for i in range(300)]
+        content = "\n".join(lines)
+        old_text = "\n".join(lines[200:205]).replace("compute", "compte")
+        start, end = _find_by_difflib(content, old_text)
+        assert content[start:end] == "\n".join(lines[200:205])
+
+    def test_find_by_difflib_span_excludes_trailing_newline(self) -> None:
+        content = "a = 1\nb = 2\nc = 3\n"
+        start, end = _find_by_difflib(content, "a = 1\nb = 9")
+        assert (start, end) == (0, len("a = 1\nb = 2"))
+
 
 # ===========================================================================
 # 42.3  edit_file tool
@@ -413,6 +433,25 @@ class TestEditFileTool:
         )
 
         assert "PARTIAL" in result or "FAILED" in result
+        # All-or-nothing: the matching edit is not written either
+        assert target.read_text(encoding="utf-8") == "line1\nline2\nline3\n"
+
+    def test_edit_file_rejects_syntax_error(self, tmp_path: Path) -> None:
+        from app.services.tool_executor import _exec_edit_file
+
+        target = tmp_path / "test.py"
+        target.write_text("def hello():\n    return 'world'\n", encoding="utf-8")
+
+        result = _exec_edit_file(
+            {
+                "path": "test.py",
+                "edits": [{"old_text": "def hello():", "new_text": "def hello(:"}],
+            },
+            str(tmp_path),
+        )
+
+        assert "syntax" in result
+        assert target.read_text(encoding="utf-8") == "def hello():\n    return 'world'\n"
 
     def test_edit_file_sandbox_violation(self, tmp_path: Path) -> None:
         from app.services.tool_executor import _exec_edit_file
@@ -311,11 +311,14 @@ async def test_generate_contracts_cancelled_mid_generation(
     pid = str(PROJECT_ID)
     call_count = 0
 
+    cancelled_during: list[str] = []
+
     async def fake_gen(*args, **kwargs):
         nonlocal call_count
         call_count += 1
         if call_count >= 3:
-            # Simulate cancel being triggered after 3rd contract
+            # Simulate cancel being triggered during the 3rd LLM call
+            cancelled_during.append(kwargs["contract_type"])
             evt = _active_generations.get(pid)
             if evt:
                 evt.set()
@@ -346,8 +349,105 @@ async def test_generate_contracts_cancelled_mid_generation(
     with pytest.raises(ContractCancelled):
         await generate_contracts(USER_ID, PROJECT_ID)
 
-    # Cancel fires during the 3rd LLM call, so only 2 contracts are saved
-    assert mock_upsert.call_count == 2
+    # Cancel fires during the 3rd LLM call: that contract is never saved and
+    # nothing after it starts.
+    saved = [c.args[1] for c in mock_upsert.call_args_list]
+    assert cancelled_during[0] not in saved
+    assert "phases" not in saved and "builder_directive" not in saved
+    assert pid not in _active_generations
+
+
+def test_contract_dependencies_point_backwards():
+    """Every dependency precedes its dependent in CONTRACT_TYPES (no cycles)."""
+    from app.services.project.contract_generator import CONTRACT_DEPENDENCIES, CONTRACT_TYPES
+
+    order = {ct: i for i, ct in enumerate(CONTRACT_TYPES)}
+    assert set(CONTRACT_DEPENDENCIES) == set(CONTRACT_TYPES)
+    for ct, deps in CONTRACT_DEPENDENCIES.items():
+        assert all(order[d] < order[ct] for d in deps), ct
+
+
+def test_contract_ancestors_are_transitive_and_mode_aware():
+    from app.services.project.contract_generator import (
+        CONTRACT_TYPES,
+        MINI_CONTRACT_TYPES,
+        _contract_ancestors,
+    )
+
+    full = _contract_ancestors(CONTRACT_TYPES)
+    assert full["manifesto"] == []
+    assert full["physics"] == ["blueprint", "stack", "schema"]
+    assert full["ui"] == ["blueprint", "stack", "schema", "physics"]
+    assert full["phases"] == CONTRACT_TYPES[:CONTRACT_TYPES.index("phases")]
+    assert "physics" in full["builder_directive"]
+    mini = _contract_ancestors(MINI_CONTRACT_TYPES)
+    assert mini["builder_directive"] == []  # phases isn't generated in mini builds
+
+
+@pytest.mark.asyncio
+@patch("app.services.project.contract_generator.save_generation_metrics", new_callable=AsyncMock)
+@patch("app.services.project.contract_generator._run_consistency_check", new_callable=AsyncMock, return_value=[])
+@patch("app.services.project.contract_generator._store_forge_config", new_callable=AsyncMock)
+@patch("app.services.project.contract_generator._generate_greenfield_contract_with_tools", new_callable=AsyncMock)
+@patch("app.services.project.contract_generator.manager.send_to_user", new_callable=AsyncMock)
+@patch("app.services.project.contract_generator.update_project_status", new_callable=AsyncMock)
+@patch("app.services.project.contract_generator.upsert_contract", new_callable=AsyncMock)
+@patch("app.services.project.contract_generator.get_contracts_by_project", new_callable=AsyncMock, return_value=[])
+@patch("app.services.project.contract_generator.get_project_by_id", new_callable=AsyncMock)
+async def test_generate_contracts_runs_independent_contracts_concurrently(
+    mock_project, mock_existing, mock_upsert, mock_status, mock_ws, mock_gen,
+    mock_forge_config, mock_consistency, mock_metrics,
+):
+    """Contracts with no dependency between them overlap; dependents wait."""
+    running: set[str] = set()
+    overlapped: set[frozenset[str]] = set()
+    seen_prior: dict[str, set[str]] = {}
+
+    async def fake_gen(*, contract_type, prior_contracts, **kwargs):
+        seen_prior[contract_type] = set(prior_contracts)
+        running.add(contract_type)
+        if len(running) > 1:
+            overlapped.add(frozenset(running))
+        await asyncio.sleep(0.01)
+        running.discard(contract_type)
+        return (f"# {contract_type}", {"input_tokens": 10, "output_tokens": 20})
+
+    async def fake_upsert(project_id, contract_type, content):
+        return {
+            "id": UUID("55555555-5555-5555-5555-555555555555"),
+            "project_id": PROJECT_ID,
+            "contract_type": contract_type,
+            "version": 1,
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:00Z",
+        }
+
+    mock_gen.side_effect = fake_gen
+    mock_upsert.side_effect = fake_upsert
+    mock_project.return_value = {
+        "id": PROJECT_ID,
+        "user_id": USER_ID,
+        "name": "My Project",
+        "description": "A test",
+        "status": "contracts_ready",
+        "questionnaire_state": {
+            "completed_sections": list(QUESTIONNAIRE_SECTIONS),
+            "answers": {s: {"key": "value"} for s in QUESTIONNAIRE_SECTIONS},
+        },
+    }
+
+    result = await generate_contracts(USER_ID, PROJECT_ID)
+
+    from app.services.project.contract_generator import CONTRACT_TYPES
+
+    assert [r["contract_type"] for r in result] == CONTRACT_TYPES
+    assert frozenset({"manifesto", "blueprint"}) in overlapped
+    assert seen_prior["manifesto"] == set()
+    assert seen_prior["schema"] == {"blueprint", "stack"}
+    assert seen_prior["ui"] == {"blueprint", "stack", "schema", "physics"}
+    # phases sees every earlier contract, as before the dependency graph
+    assert seen_prior["phases"] == set(CONTRACT_TYPES[:CONTRACT_TYPES.index("phases")])
+    assert str(PROJECT_ID) not in _active_generations
 
 
 # ---------------------------------------------------------------------------
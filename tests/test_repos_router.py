@@ -7,6 +7,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.auth import create_token
+from app.clients.github_client import GitHubRateLimitError
 from app.main import app
 
 
@@ -240,6 +241,17 @@ def test_sync_commits_not_found(mock_backfill, mock_dep_user):
     assert response.status_code == 404
 
 
+@patch("app.api.deps.get_user_by_id", new_callable=AsyncMock)
+@patch("app.api.routers.repos.backfill_repo_commits", new_callable=AsyncMock)
+def test_sync_commits_rate_limited(mock_backfill, mock_dep_user):
+    mock_dep_user.return_value = MOCK_USER
+    mock_backfill.side_effect = GitHubRateLimitError(90.5)
+
+    response = client.post(f"/repos/{REPO_ID}/sync", headers=_auth_header())
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "91"
+
+
 def test_sync_commits_requires_auth():
     response = client.post(f"/repos/{REPO_ID}/sync")
     assert response.status_code == 401
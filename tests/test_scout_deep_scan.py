@@ -6,6 +6,7 @@ from uuid import UUID
 
 import pytest
 
+from app.services.scout.deep_scan import _fetch_key_files
 from app.services.scout_service import (
     _select_key_files,
     get_scout_dossier,
@@ -119,6 +120,49 @@ def test_select_key_files_migration_files():
     assert "db/migrations/001_init.sql" in selected
 
 
+# ---------------------------------------------------------------------------
+# _fetch_key_files
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fetch_key_files_refills_missing_files():
+    """Missing files make room for later candidates, fetched in follow-up batches."""
+    from app.services.scout_service import _DEEP_SCAN_MAX_FILES
+
+    paths = [f"src/file_{i}.py" for i in range(_DEEP_SCAN_MAX_FILES + 10)]
+    missing = set(paths[:3])
+
+    async def fake_fetch(token, name, chunk, ref):
+        return {p: None if p in missing else "x = 1\n" for p in chunk}
+
+    with patch(
+        "app.services.scout.deep_scan.get_repo_file_contents",
+        new_callable=AsyncMock, side_effect=fake_fetch,
+    ) as mock_fetch:
+        contents = await _fetch_key_files("token", "org/repo", paths, "abc123")
+
+    assert list(contents) == paths[3:_DEEP_SCAN_MAX_FILES + 3]
+    assert [len(c.args[2]) for c in mock_fetch.call_args_list] == [_DEEP_SCAN_MAX_FILES, 3]
+
+
+@pytest.mark.asyncio
+async def test_fetch_key_files_stops_at_byte_cap():
+    """No further batches are requested once the byte budget is spent."""
+    from app.services.scout.deep_scan import _DEEP_SCAN_MAX_BYTES
+
+    big = "x" * _DEEP_SCAN_MAX_BYTES
+    paths = ["a.py", "b.py", "c.py"]
+    with patch(
+        "app.services.scout.deep_scan.get_repo_file_contents",
+        new_callable=AsyncMock, return_value={"a.py": big, "b.py": "y", "c.py": "z"},
+    ) as mock_fetch:
+        contents = await _fetch_key_files("token", "org/repo", paths, "abc123")
+
+    assert list(contents) == ["a.py"]
+    mock_fetch.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # start_deep_scan
 # ---------------------------------------------------------------------------
@@ -85,6 +85,7 @@ FAKE_TOOLS = [
     {"name": "check_syntax", "description": "Check syntax", "input_schema": {}},
     {"name": "run_command", "description": "Run cmd", "input_schema": {}},
     {"name": "forge_get_contract", "description": "Get contract", "input_schema": {}},
+    {"name": "forge_get_contracts", "description": "Get several contracts", "input_schema": {}},
     {"name": "forge_get_phase_window", "description": "Phase window", "input_schema": {}},
     {"name": "forge_list_contracts", "description": "List contracts", "input_schema": {}},
     {"name": "forge_get_summary", "description": "Summary", "input_schema": {}},
@@ -256,6 +257,32 @@ class TestSystemPrompts:
         assert with_extra.startswith(base)
         assert "CUSTOM DIRECTIVE" in with_extra
 
+    def test_prompt_compiled_once(self):
+        first = system_prompt_for_role(SubAgentRole.CODER, build_mode="mini")
+        assert system_prompt_for_role(SubAgentRole.CODER, build_mode="mini") is first
+        assert system_prompt_for_role(SubAgentRole.CODER) is not first
+
+    def test_compiled_prompt_includes_builder_contract_slice(self):
+        from app.services.build.subagent import _contract_for_role, compiled_system_prompt
+        prompt = compiled_system_prompt(SubAgentRole.FIXER)
+        assert prompt.startswith(system_prompt_for_role(SubAgentRole.FIXER))
+        assert compiled_system_prompt(SubAgentRole.FIXER) is prompt
+        if _contract_for_role(SubAgentRole.FIXER):
+            assert "## builder_contract (governance)" in prompt
+
+    def test_compiled_prompt_override(self):
+        from app.services.build.subagent import compiled_system_prompt
+        prompt = compiled_system_prompt(SubAgentRole.AUDITOR, override="BATCH PROMPT")
+        assert prompt.startswith("BATCH PROMPT")
+        assert compiled_system_prompt(SubAgentRole.AUDITOR) != prompt
+
+    def test_default_tool_list_is_stable(self):
+        first = tools_for_role(SubAgentRole.CODER)
+        second = tools_for_role(SubAgentRole.CODER)
+        assert first == second
+        assert first is not second  # callers get their own list
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
 
 # ===================================================================
 # Dataclass tests
@@ -546,3 +546,147 @@ class TestEdgeCases:
         assert node.actual_tokens == 500
         assert node.completed_at is not None
         assert node.started_at is not None
+
+
+# ===========================================================================
+# Event-driven ready queue & async driver
+# ===========================================================================
+
+
+class TestReadyQueue:
+    """Tests for the incremental ready set and scheduling priorities."""
+
+    def test_direct_status_assignment_updates_ready_set(self) -> None:
+        dag = TaskDAG.from_manifest(_simple_manifest())
+        dag.get_ready_tasks()
+        dag.nodes["t0"].status = TaskStatus.COMPLETED
+        assert [n.id for n in dag.get_ready_tasks()] == ["t1"]
+        # Reverting a dependency makes its dependent unready again
+        dag.nodes["t0"].status = TaskStatus.PENDING
+        assert [n.id for n in dag.get_ready_tasks()] == ["t0"]
+
+    def test_in_progress_task_leaves_ready_set(self) -> None:
+        dag = TaskDAG.from_manifest(_diamond_manifest())
+        dag.mark_completed("t0")
+        dag.mark_in_progress("t1")
+        assert [n.id for n in dag.get_ready_tasks()] == ["t2"]
+
+    def test_critical_path_first(self) -> None:
+        manifest = [
+            {"path": "short.py", "depends_on": [], "estimated_lines": 50},
+            {"path": "head.py", "depends_on": [], "estimated_lines": 10},
+            {"path": "tail.py", "depends_on": ["head.py"], "estimated_lines": 200},
+        ]
+        dag = TaskDAG.from_manifest(manifest)
+        assert dag.critical_path_tokens("t1") == (10 + 200) * 4
+        assert dag.pop_ready().file_path == "head.py"
+        assert dag.pop_ready("largest_first").file_path == "short.py"
+        assert dag.pop_ready("fifo").file_path == "short.py"
+
+    def test_pop_ready_empty(self) -> None:
+        dag = TaskDAG.from_manifest(_simple_manifest())
+        dag.mark_in_progress("t0")
+        assert dag.pop_ready() is None
+
+    def test_long_chain_dispatch(self) -> None:
+        manifest = [{"path": "f0.py", "depends_on": []}] + [
+            {"path": f"f{i}.py", "depends_on": [f"f{i - 1}.py"]} for i in range(1, 2000)
+        ]
+        dag = TaskDAG.from_manifest(manifest)
+        for i in range(2000):
+            ready = dag.get_ready_tasks()
+            assert [n.id for n in ready] == [f"t{i}"]
+            dag.mark_completed(f"t{i}")
+        assert dag.get_ready_tasks() == []
+
+
+class TestRunDriver:
+    """Tests for the async TaskDAG.run driver."""
+
+    @pytest.mark.asyncio
+    async def test_runs_all_tasks_respecting_dependencies(self) -> None:
+        import asyncio
+
+        dag = TaskDAG.from_manifest(_diamond_manifest())
+        finished: list[str] = []
+        active = 0
+        peak = 0
+
+        async def executor(node: TaskNode) -> int:
+            nonlocal active, peak
+            for dep in node.depends_on:
+                assert dag.nodes[dep].status == TaskStatus.COMPLETED
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            finished.append(node.file_path)
+            return 7
+
+        progress = await dag.run(executor, concurrency=4)
+        assert progress.completed == 4
+        assert finished[0] == "a.py" and finished[-1] == "d.py"
+        assert peak == 2  # b.py and c.py ran in parallel
+        assert dag.nodes["t3"].actual_tokens == 7
+
+    @pytest.mark.asyncio
+    async def test_failure_blocks_dependents_only(self) -> None:
+        dag = TaskDAG.from_manifest(_diamond_manifest())
+
+        async def executor(node: TaskNode) -> None:
+            if node.file_path == "b.py":
+                raise RuntimeError("boom")
+
+        progress = await dag.run(executor, concurrency=2)
+        assert dag.nodes["t1"].status == TaskStatus.FAILED
+        assert dag.nodes["t1"].error == "boom"
+        assert dag.nodes["t2"].status == TaskStatus.COMPLETED
+        assert dag.nodes["t3"].status == TaskStatus.BLOCKED
+        assert progress.failed == 1 and progress.blocked == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bound(self) -> None:
+        import asyncio
+
+        manifest = [{"path": f"f{i}.py", "depends_on": []} for i in range(10)]
+        dag = TaskDAG.from_manifest(manifest)
+        active = 0
+        peak = 0
+
+        async def executor(node: TaskNode) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            active -= 1
+
+        await dag.run(executor, concurrency=3)
+        assert peak == 3
+        assert dag.get_progress().completed == 10
+
+    @pytest.mark.asyncio
+    async def test_cancelled_executor_task_marks_failure(self) -> None:
+        import asyncio
+
+        dag = TaskDAG.from_manifest(_diamond_manifest())
+
+        async def executor(node: TaskNode) -> None:
+            if node.file_path == "b.py":
+                asyncio.current_task().cancel()
+                await asyncio.sleep(0)
+
+        progress = await dag.run(executor, concurrency=2)
+        assert dag.nodes["t1"].status == TaskStatus.FAILED
+        assert dag.nodes["t1"].error == "Task cancelled"
+        assert dag.nodes["t3"].status == TaskStatus.BLOCKED
+        assert progress.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_executor_may_settle_task_itself(self) -> None:
+        dag = TaskDAG.from_manifest(_simple_manifest())
+
+        async def executor(node: TaskNode) -> None:
+            dag.mark_skipped(node.id)
+
+        progress = await dag.run(executor, concurrency=1)
+        assert progress.skipped == 3
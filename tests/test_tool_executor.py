@@ -3,25 +3,26 @@
 import json
 import os
 import textwrap
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.services.tool_executor import (
+    _DEPENDENCY_MANIFESTS,
     BUILDER_TOOLS,
     MAX_READ_FILE_BYTES,
     MAX_WRITE_FILE_BYTES,
+    RUN_COMMAND_PREFIXES,
+    RUN_TESTS_PREFIXES,
     SKIP_DIRS,
+    _auto_install_deps,
+    _build_project_env,
     _resolve_sandboxed,
     _validate_command,
-    _build_project_env,
-    _auto_install_deps,
-    _DEPENDENCY_MANIFESTS,
-    RUN_TESTS_PREFIXES,
-    RUN_COMMAND_PREFIXES,
     execute_tool,
     execute_tool_async,
 )
-
+from forge_ide.pytest_worker import shutdown_workers
 
 # ---------------------------------------------------------------------------
 # _resolve_sandboxed
@@ -361,9 +362,9 @@ class TestExecuteTool:
 class TestBuilderToolsSpec:
     """Verify the BUILDER_TOOLS constant is well-formed."""
 
-    def test_has_eighteen_tools(self):
-        # 8 base + 5 forge governance + 4 project-scoped (Phase F) + 1 forge_ask_clarification
-        assert len(BUILDER_TOOLS) == 18
+    def test_has_nineteen_tools(self):
+        # 8 base + 6 forge governance + 4 project-scoped (Phase F) + 1 forge_ask_clarification
+        assert len(BUILDER_TOOLS) == 19
 
     def test_tool_names(self):
         names = {t["name"] for t in BUILDER_TOOLS}
@@ -372,7 +373,7 @@ class TestBuilderToolsSpec:
             "read_file", "list_directory", "search_code", "write_file",
             "edit_file", "run_tests", "check_syntax", "run_command",
             # Forge governance tools (Phase 55)
-            "forge_get_contract", "forge_get_phase_window",
+            "forge_get_contract", "forge_get_contracts", "forge_get_phase_window",
             "forge_list_contracts", "forge_get_summary", "forge_scratchpad",
             "forge_ask_clarification",
             # Project-scoped contract tools (Phase F)
@@ -570,6 +571,32 @@ class TestRunTestsValidation:
         assert "Error" in result
 
 
+class TestRunTestsStreaming:
+    """run_tests streams output and honours max_failures."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_failures(self, tmp_path):
+        (tmp_path / "test_many.py").write_text(textwrap.dedent("""\
+            import time
+            import pytest
+
+            @pytest.mark.parametrize("i", range(100))
+            def test_fail(i):
+                time.sleep(0.05)
+                assert i < 0
+        """))
+        try:
+            result = await execute_tool_async(
+                "run_tests",
+                {"command": "python -m pytest -v -p no:cacheprovider test_many.py", "max_failures": 2},
+                str(tmp_path),
+            )
+        finally:
+            await shutdown_workers(str(tmp_path))
+        assert "[stopped after 2 failure(s)]" in result
+        assert "test_fail[99]" not in result
+
+
 # ---------------------------------------------------------------------------
 # run_command tool -- command validation (Phase 19)
 # ---------------------------------------------------------------------------
@@ -898,8 +925,130 @@ class TestBuilderToolsIncludesForge:
         assert "forge_scratchpad" in tool_names
 
     def test_total_tool_count(self):
-        # 8 base + 5 forge governance + 1 forge_ask_clarification + 4 project-scoped = 18
-        assert len(BUILDER_TOOLS) == 18
+        # 8 base + 6 forge governance + 1 forge_ask_clarification + 4 project-scoped = 19
+        assert len(BUILDER_TOOLS) == 19
+
+
+# ---------------------------------------------------------------------------
+# forge_get_contracts — batched DB-backed contract retrieval
+# ---------------------------------------------------------------------------
+
+_PROJECT_ID = "11111111-1111-1111-1111-111111111111"
+_BUILD_ID = "22222222-2222-2222-2222-222222222222"
+
+_DB_CONTRACTS = [
+    {"contract_type": "stack", "content": "# Stack\nBackend: FastAPI"},
+    {"contract_type": "schema", "content": "# Schema\n## users\nid uuid\n## posts\nbody text"},
+    {"contract_type": "phases", "content": "# Phases\n## Phase 1 — Auth\nJWT\n## Phase 12 — Polish\nCSS"},
+]
+
+
+class TestForgeGetContractsDb:
+    """Tests for _exec_forge_get_contracts_db."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_bundles(self):
+        from app.services.tool_executor import _contract_bundle_cache
+        _contract_bundle_cache().clear()
+        yield
+        _contract_bundle_cache().clear()
+
+    @pytest.mark.asyncio
+    async def test_returns_several_contracts(self):
+        from app.services.tool_executor import _exec_forge_get_contracts_db
+        with patch("app.repos.project_repo.get_contracts_by_project",
+                   new=AsyncMock(return_value=_DB_CONTRACTS)):
+            result = await _exec_forge_get_contracts_db(
+                {"names": ["stack", "schema", "ui"]}, _PROJECT_ID,
+            )
+        assert "## Contract: stack" in result
+        assert "FastAPI" in result
+        assert "## Contract: schema" in result
+        assert "Not found for this project: ui" in result
+
+    @pytest.mark.asyncio
+    async def test_sections_narrow_output(self):
+        from app.services.tool_executor import _exec_forge_get_contracts_db
+        with patch("app.repos.project_repo.get_contracts_by_project",
+                   new=AsyncMock(return_value=_DB_CONTRACTS)):
+            result = await _exec_forge_get_contracts_db(
+                {"names": ["schema", "phases"],
+                 "sections": {"schema": ["posts"], "phases": ["Phase 1"]}},
+                _PROJECT_ID,
+            )
+        assert "(sections: posts)" in result
+        assert "body text" in result
+        assert "id uuid" not in result
+        assert "JWT" in result
+        assert "CSS" not in result
+
+    @pytest.mark.asyncio
+    async def test_phases_without_selector_is_withheld(self):
+        from app.services.tool_executor import _exec_forge_get_contracts_db
+        with patch("app.repos.project_repo.get_contracts_by_project",
+                   new=AsyncMock(return_value=_DB_CONTRACTS)):
+            result = await _exec_forge_get_contracts_db({"names": ["phases"]}, _PROJECT_ID)
+        assert "Error" in result
+        assert "forge_get_phase_window" in result
+        assert "JWT" not in result
+
+    @pytest.mark.asyncio
+    async def test_requires_names_and_project(self):
+        from app.services.tool_executor import _exec_forge_get_contracts_db
+        assert "Error" in await _exec_forge_get_contracts_db({}, _PROJECT_ID)
+        assert "Error" in await _exec_forge_get_contracts_db({"names": ["stack"]}, "")
+
+    @pytest.mark.asyncio
+    async def test_pinned_bundle_loaded_once_per_build(self):
+        import asyncio
+
+        from app.services.tool_executor import _exec_forge_get_contracts_db
+        loader = AsyncMock(return_value=_DB_CONTRACTS)
+        with patch("app.repos.project_repo.get_snapshot_contracts", new=loader), \
+             patch("app.repos.build_repo.get_build_by_id",
+                   new=AsyncMock(return_value={"project_id": _PROJECT_ID, "contract_batch": 3})):
+            await asyncio.gather(*(
+                _exec_forge_get_contracts_db({"names": ["stack"]}, _PROJECT_ID, build_id=_BUILD_ID)
+                for _ in range(3)
+            ))
+            await _exec_forge_get_contracts_db({"names": ["schema"]}, _PROJECT_ID, build_id=_BUILD_ID)
+        assert loader.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unpinned_build_reads_current_contracts_live(self):
+        from app.services.tool_executor import _exec_forge_get_contracts_db
+        edited = [{"contract_type": "stack", "content": "# Stack\nBackend: Django"}]
+        current = AsyncMock(side_effect=[_DB_CONTRACTS, edited])
+        with patch("app.repos.project_repo.get_contracts_by_project", new=current), \
+             patch("app.repos.build_repo.get_build_by_id",
+                   new=AsyncMock(return_value={"project_id": _PROJECT_ID, "contract_batch": None})):
+            first = await _exec_forge_get_contracts_db(
+                {"names": ["stack"]}, _PROJECT_ID, build_id=_BUILD_ID,
+            )
+            second = await _exec_forge_get_contracts_db(
+                {"names": ["stack"]}, _PROJECT_ID, build_id=_BUILD_ID,
+            )
+        assert "FastAPI" in first
+        assert "Django" in second
+        assert current.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_build_bundle_uses_pinned_snapshot(self):
+        from app.services.tool_executor import _exec_forge_get_contracts_db
+        snapshot = [{"contract_type": "stack", "content": "# Stack\nBackend: Django"}]
+        current = AsyncMock(return_value=_DB_CONTRACTS)
+        pinned = AsyncMock(return_value=snapshot)
+        with patch("app.repos.project_repo.get_contracts_by_project", new=current), \
+             patch("app.repos.project_repo.get_snapshot_contracts", new=pinned), \
+             patch("app.repos.build_repo.get_build_by_id",
+                   new=AsyncMock(return_value={"project_id": _PROJECT_ID, "contract_batch": 3})):
+            result = await _exec_forge_get_contracts_db(
+                {"names": ["stack"]}, _PROJECT_ID, build_id=_BUILD_ID,
+            )
+        assert "Django" in result
+        assert "FastAPI" not in result
+        pinned.assert_awaited_once_with(_PROJECT_ID, 3)
+        current.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
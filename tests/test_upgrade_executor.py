@@ -783,6 +783,7 @@ async def test_push_prompt_y_runs_tests(tmp_path):
             patch("app.services.upgrade_executor._emit", new_callable=AsyncMock),
             patch("app.services.upgrade_executor.git_client") as mock_git,
             patch("subprocess.run") as mock_sub_run,
+            patch("app.services.upgrade_executor.settings.PYTEST_WORKER_ENABLED", False),
         ):
             # Mock test run — pass
             mock_sub_run.return_value = MagicMock(
@@ -10,6 +10,7 @@ import os
 import textwrap
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -22,6 +23,7 @@ from forge_ide.workspace import (
     update_snapshot,
     snapshot_to_workspace_info,
 )
+from forge_ide.snapshot_service import SnapshotService
 from forge_ide.context_pack import (
     build_context_pack_for_file,
     estimate_tokens,
@@ -280,6 +282,121 @@ class TestUpdateSnapshot:
         assert "app.config.Settings" not in updated.symbol_table
 
 
+class TestSnapshotService:
+    """Tests for the incrementally maintained snapshot service."""
+
+    @staticmethod
+    def _comparable(snap: WorkspaceSnapshot) -> dict:
+        return snap.model_dump(exclude={"captured_at"})
+
+    def test_initial_snapshot_matches_capture(self, tmp_path: Path) -> None:
+        _root, ws = _make_workspace(tmp_path)
+
+        svc = SnapshotService(ws)
+
+        assert self._comparable(svc.snapshot()) == self._comparable(capture_snapshot(ws))
+
+    def test_unchanged_returns_cached_snapshot(self, tmp_path: Path) -> None:
+        _root, ws = _make_workspace(tmp_path)
+        svc = SnapshotService(ws)
+
+        assert svc.snapshot() is svc.snapshot()
+
+    def test_notify_reanalyses_only_changed_files(self, tmp_path: Path) -> None:
+        root, ws = _make_workspace(tmp_path)
+        svc = SnapshotService(ws)
+
+        (root / "app" / "config.py").write_text(
+            "def load():\n    return {}\n", encoding="utf-8",
+        )
+        import forge_ide.snapshot_service as mod
+        with patch.object(mod, "_read_source", wraps=mod._read_source) as reads:
+            svc.notify_changed(["app/config.py"])
+            snap = svc.snapshot()
+
+        assert reads.call_count == 1
+        assert "app.config.load" in snap.symbol_table
+        assert "app.config.Settings" not in snap.symbol_table
+        ws.invalidate_cache()
+        assert self._comparable(snap) == self._comparable(capture_snapshot(ws))
+
+    def test_deletes_and_new_migrations(self, tmp_path: Path) -> None:
+        root, ws = _make_workspace(tmp_path)
+        svc = SnapshotService(ws)
+
+        (root / "tests" / "test_main.py").unlink()
+        (root / "db" / "migrations" / "002_orgs.sql").write_text(
+            "CREATE TABLE orgs (\n    id UUID PRIMARY KEY,\n    name TEXT\n);\n",
+            encoding="utf-8",
+        )
+        svc.notify_changed([str(root / "tests" / "test_main.py"), "db\\migrations\\002_orgs.sql"])
+        snap = svc.snapshot()
+
+        assert snap.test_inventory.test_count == 0
+        assert snap.test_inventory.frameworks == ()
+        assert snap.schema_inventory.tables == ("users", "repos", "orgs")
+        assert "db/migrations/002_orgs.sql" in snap.schema_inventory.migration_files
+        ws.invalidate_cache()
+        assert self._comparable(snap) == self._comparable(capture_snapshot(ws))
+
+    def test_refresh_detects_changes_by_stat(self, tmp_path: Path) -> None:
+        root, ws = _make_workspace(tmp_path)
+        svc = SnapshotService(ws)
+
+        (root / "app" / "extra.py").write_text("class Extra:\n    pass\n", encoding="utf-8")
+        (root / "web" / "src" / "App.tsx").unlink()
+
+        assert svc.refresh() == 2
+        snap = svc.snapshot()
+        assert "app.extra.Extra" in snap.symbol_table
+        assert "web.src.App.App" not in snap.symbol_table
+        assert "typescriptreact" not in snap.languages
+
+    def test_ignores_paths_outside_workspace(self, tmp_path: Path) -> None:
+        _root, ws = _make_workspace(tmp_path)
+        svc = SnapshotService(ws)
+        version = svc.version
+
+        svc.notify_changed(["../escape.py", str(tmp_path / "other.py"), "node_modules/x.js"])
+        svc.snapshot()
+
+        assert svc.version == version
+
+    def test_tool_write_events(self, tmp_path: Path) -> None:
+        from forge_ide.adapters import _notify_write, _write_listeners
+
+        root, ws = _make_workspace(tmp_path)
+        svc = SnapshotService(ws)
+        svc.watch_tool_writes()
+        try:
+            (root / "app" / "written.py").write_text("def tool_made():\n    pass\n", encoding="utf-8")
+            _notify_write(str(root), "app/written.py")
+            _notify_write(str(tmp_path), "app/elsewhere.py")  # other workspace
+
+            assert "app.written.tool_made" in svc.snapshot().symbol_table
+        finally:
+            svc.close()
+        assert not _write_listeners
+
+    def test_polling_watcher_picks_up_writes(self, tmp_path: Path) -> None:
+        import time
+
+        import forge_ide.snapshot_service as mod
+
+        root, ws = _make_workspace(tmp_path)
+        with patch.object(mod, "INotify", None):
+            svc = SnapshotService(ws, poll_interval=0.02)
+            svc.start()
+        try:
+            (root / "app" / "late.py").write_text("LATE = 1\n", encoding="utf-8")
+            deadline = time.monotonic() + 5
+            while "app.late.LATE" not in svc.snapshot().symbol_table:
+                assert time.monotonic() < deadline, "watcher never saw the write"
+                time.sleep(0.02)
+        finally:
+            svc.close()
+
+
 # ===========================================================================
 # 40.x  snapshot_to_workspace_info
 # ===========================================================================
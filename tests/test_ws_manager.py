@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from app.ws_manager import ConnectionManager, MAX_CONNECTIONS_PER_USER
+from app.ws_manager import MAX_CONNECTIONS_PER_USER, ConnectionManager
 
 
 class FakeWebSocket:
@@ -152,3 +152,271 @@ async def test_connection_limit_evicts_oldest():
 
     # Newest socket should still be connected
     assert not sockets[-1].closed
+
+
+# ---------- resumable event stream ----------
+
+
+@pytest.mark.asyncio
+async def test_events_carry_monotonic_seq():
+    """Every event sent to a user is stamped with an increasing seq."""
+    import json
+    mgr = ConnectionManager()
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws)
+    for i in range(3):
+        await mgr.send_to_user("user-1", {"type": "build_log", "payload": {"i": i}})
+    seqs = [json.loads(m)["seq"] for m in ws.messages]
+    assert seqs == [1, 2, 3]
+    assert mgr.last_seq("user-1") == 3
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_only_the_gap():
+    """Reconnecting with resume_from replays just the missed events."""
+    import json
+    mgr = ConnectionManager()
+    for i in range(5):
+        await mgr.send_to_user("user-1", {"type": "build_log", "payload": {"i": i}})
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws, resume_from=3, epoch=mgr.stream_epoch("user-1"))
+    assert [json.loads(m)["seq"] for m in ws.messages] == [4, 5]
+
+    # Live events continue the same sequence after the replay
+    await mgr.send_to_user("user-1", {"type": "build_log", "payload": {}})
+    assert json.loads(ws.messages[-1])["seq"] == 6
+
+
+@pytest.mark.asyncio
+async def test_resume_up_to_date_sends_nothing():
+    """resume_from equal to the latest seq replays nothing."""
+    mgr = ConnectionManager()
+    await mgr.send_to_user("user-1", {"type": "x"})
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws, resume_from=1, epoch=mgr.stream_epoch("user-1"))
+    assert ws.messages == []
+
+
+@pytest.mark.asyncio
+async def test_resume_gap_outside_buffer_requests_resync():
+    """A gap older than the replay buffer yields a single resync_required."""
+    import json
+
+    from app.ws_manager import REPLAY_BUFFER_SIZE
+    mgr = ConnectionManager()
+    for _ in range(REPLAY_BUFFER_SIZE + 10):
+        await mgr.send_to_user("user-1", {"type": "x"})
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws, resume_from=2, epoch=mgr.stream_epoch("user-1"))
+    assert len(ws.messages) == 1
+    msg = json.loads(ws.messages[0])
+    assert msg["type"] == "resync_required"
+    assert msg["payload"]["seq"] == REPLAY_BUFFER_SIZE + 10
+
+
+@pytest.mark.asyncio
+async def test_resume_after_server_restart_requests_resync():
+    """resume_from ahead of the server's seq (restart) yields resync_required."""
+    import json
+    mgr = ConnectionManager()
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws, resume_from=42)
+    assert json.loads(ws.messages[0])["type"] == "resync_required"
+
+
+@pytest.mark.asyncio
+async def test_resume_from_earlier_stream_requests_resync():
+    """A resume_from from another epoch is not matched against this stream."""
+    import json
+    mgr = ConnectionManager()
+    for _ in range(5):
+        await mgr.send_to_user("user-1", {"type": "x"})
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws, resume_from=3, epoch="stale")
+    assert len(ws.messages) == 1
+    msg = json.loads(ws.messages[0])
+    assert msg["type"] == "resync_required"
+    assert msg["payload"]["epoch"] == mgr.stream_epoch("user-1")
+
+
+class BlockingWebSocket(FakeWebSocket):
+    """Fake WebSocket whose sends wait until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def send_text(self, text: str) -> None:
+        await self.release.wait()
+        await super().send_text(text)
+
+
+@pytest.mark.asyncio
+async def test_slow_replay_does_not_block_other_sockets():
+    """A replay in flight holds no lock; live events queue behind it."""
+    import json
+    mgr = ConnectionManager()
+    for _ in range(3):
+        await mgr.send_to_user("user-1", {"type": "old"})
+    slow = BlockingWebSocket()
+    replay = asyncio.create_task(
+        mgr.connect("user-1", slow, resume_from=1, epoch=mgr.stream_epoch("user-1")),
+    )
+    await asyncio.sleep(0)
+
+    other = FakeWebSocket()
+    await asyncio.wait_for(mgr.connect("user-2", other), timeout=1)
+    await asyncio.wait_for(mgr.send_to_user("user-2", {"type": "x"}), timeout=1)
+    await asyncio.wait_for(mgr.send_to_user("user-1", {"type": "live"}), timeout=1)
+    assert len(other.messages) == 1
+
+    slow.release.set()
+    await asyncio.wait_for(replay, timeout=1)
+    assert [json.loads(m)["seq"] for m in slow.messages] == [2, 3, 4]
+    await mgr.send_to_user("user-1", {"type": "after"})
+    assert json.loads(slow.messages[-1])["seq"] == 5
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_state_expires(monkeypatch):
+    """Replay state is freed once a user has been disconnected long enough."""
+    import app.ws_manager as ws_manager
+    mgr = ConnectionManager()
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws)
+    await mgr.send_to_user("user-1", {"type": "x"})
+    await mgr.disconnect("user-1", ws)
+
+    mgr._expire_streams()
+    assert mgr.last_seq("user-1") == 1  # still within the grace period
+
+    monkeypatch.setattr(ws_manager, "REPLAY_RETENTION_SECONDS", 0)
+    mgr._expire_streams()
+    assert mgr.last_seq("user-1") == 0
+    assert mgr.stream_epoch("user-1") is None
+    assert "user-1" not in mgr._replay
+
+
+# ---------- wire encodings ----------
+
+
+class FakeBinaryWebSocket(FakeWebSocket):
+    """Fake WebSocket that also records binary frames."""
+
+    def __init__(self):
+        super().__init__()
+        self.binary: list[bytes] = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        if self.closed:
+            raise RuntimeError("WebSocket closed")
+        self.binary.append(data)
+
+
+def test_resolve_encoding_falls_back_to_json():
+    """Unknown or missing encodings resolve to json."""
+    from app.ws_manager import resolve_encoding
+    assert resolve_encoding(None) == "json"
+    assert resolve_encoding("cbor") == "json"
+    assert resolve_encoding("JSON") == "json"
+
+
+@pytest.mark.asyncio
+async def test_wire_types_encoded_without_reflection():
+    """Registered wire types (UUID, sets) serialise to plain JSON values."""
+    import json
+    from uuid import UUID
+    mgr = ConnectionManager()
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws)
+    uid = UUID("12345678-1234-5678-1234-567812345678")
+    await mgr.send_to_user("user-1", {"type": "x", "payload": {"id": uid, "tags": {"a"}}})
+    msg = json.loads(ws.messages[0])
+    assert msg["payload"] == {"id": str(uid), "tags": ["a"]}
+
+
+@pytest.mark.asyncio
+async def test_unregistered_wire_type_sent_as_str_with_warning(caplog):
+    """Types without a converter go out as str() and are logged, never raised."""
+    import json
+    mgr = ConnectionManager()
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws)
+
+    class Opaque:
+        def __str__(self):
+            return "opaque!"
+
+    with caplog.at_level("WARNING", logger="app.ws_manager"):
+        await mgr.send_to_user("user-1", {"type": "x", "payload": Opaque()})
+    assert json.loads(ws.messages[0])["payload"] == "opaque!"
+    assert "Opaque is not a registered wire type" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_unencodable_event_is_dropped_not_raised():
+    """A payload JSON cannot encode at all is dropped without consuming a seq."""
+    mgr = ConnectionManager()
+    payload: dict = {}
+    payload["self"] = payload
+
+    await mgr.send_to_user("user-1", {"type": "x", "payload": payload})
+    assert mgr.last_seq("user-1") == 0
+
+
+@pytest.mark.asyncio
+async def test_caller_seq_and_epoch_fields_are_overridden():
+    """The envelope fields always come from the manager, appended once."""
+    import json
+    mgr = ConnectionManager()
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws)
+    await mgr.send_to_user("user-1", {"seq": 99, "epoch": "old", "type": "x"})
+    await mgr.send_to_user("user-1", {})
+    first, second = (json.loads(m) for m in ws.messages)
+    assert first == {"type": "x", "seq": 1, "epoch": mgr.stream_epoch("user-1")}
+    assert second == {"seq": 2, "epoch": mgr.stream_epoch("user-1")}
+
+
+@pytest.mark.asyncio
+async def test_replay_is_unaffected_by_later_payload_mutation():
+    """Buffered events are encoded on send, not when replayed."""
+    import json
+    mgr = ConnectionManager()
+    payload = {"status": "running"}
+    await mgr.send_to_user("user-1", {"type": "x", "payload": payload})
+    payload["status"] = "mutated"
+    ws = FakeWebSocket()
+    await mgr.connect("user-1", ws, resume_from=0, epoch=mgr.stream_epoch("user-1"))
+    assert json.loads(ws.messages[0])["payload"] == {"status": "running"}
+
+
+@pytest.mark.asyncio
+async def test_msgpack_connection_receives_binary_frames():
+    """A msgpack socket gets binary frames while json sockets get text."""
+    msgpack = pytest.importorskip("msgpack")
+    mgr = ConnectionManager()
+    ws_bin = FakeBinaryWebSocket()
+    ws_txt = FakeBinaryWebSocket()
+    await mgr.connect("user-1", ws_bin, encoding="msgpack")
+    await mgr.connect("user-1", ws_txt)
+    await mgr.send_to_user("user-1", {"type": "build_log", "payload": {"line": "ok"}})
+
+    assert ws_bin.messages == [] and len(ws_bin.binary) == 1
+    decoded = msgpack.unpackb(ws_bin.binary[0])
+    assert decoded == {
+        "type": "build_log", "payload": {"line": "ok"}, "seq": 1, "epoch": mgr.stream_epoch("user-1"),
+    }
+    assert len(ws_txt.messages) == 1 and ws_txt.binary == []
+
+
+@pytest.mark.asyncio
+async def test_msgpack_replay_uses_binary_frames():
+    """Replayed events honour the reconnecting socket's encoding."""
+    msgpack = pytest.importorskip("msgpack")
+    mgr = ConnectionManager()
+    await mgr.send_to_user("user-1", {"type": "a"})
+    await mgr.send_to_user("user-1", {"type": "b"})
+    ws = FakeBinaryWebSocket()
+    await mgr.connect("user-1", ws, resume_from=1, encoding="msgpack", epoch=mgr.stream_epoch("user-1"))
+    assert [msgpack.unpackb(f)["type"] for f in ws.binary] == ["b"]
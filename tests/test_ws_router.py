@@ -54,3 +54,17 @@ def test_ws_connects_and_disconnects(mock_manager, mock_decode, client):
         mock_manager.connect.assert_called_once()
         call_args = mock_manager.connect.call_args
         assert call_args[0][0] == "uid-123"
+
+
+@patch("app.api.routers.ws.decode_token")
+@patch("app.api.routers.ws.manager")
+def test_ws_passes_resume_from(mock_manager, mock_decode, client):
+    """resume_from query param is forwarded to manager.connect."""
+    mock_decode.return_value = _make_token_payload("uid-123")
+    mock_manager.connect = AsyncMock()
+    mock_manager.disconnect = AsyncMock()
+
+    with client.websocket_connect("/ws?token=validtoken&resume_from=17&epoch=ab12"):
+        mock_manager.connect.assert_called_once()
+        assert mock_manager.connect.call_args.kwargs["resume_from"] == 17
+        assert mock_manager.connect.call_args.kwargs["epoch"] == "ab12"
@@ -15,11 +15,21 @@ export function useWebSocket(onMessage: MessageHandler) {
   handlerRef.current = onMessage;
   const attemptRef = useRef(0);
   const timerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  /** Last event sequence number seen — sent as resume_from on reconnect. */
+  const lastSeqRef = useRef<number | null>(null);
+  /** Epoch of the server stream lastSeqRef belongs to. */
+  const epochRef = useRef<string | null>(null);
 
   const connect = useCallback(() => {
     if (!token) return;
 
-    const url = `${WS_BASE}/ws?token=${encodeURIComponent(token)}`;
+    let url = `${WS_BASE}/ws?token=${encodeURIComponent(token)}`;
+    if (lastSeqRef.current !== null) {
+      url += `&resume_from=${lastSeqRef.current}`;
+      if (epochRef.current !== null) {
+        url += `&epoch=${encodeURIComponent(epochRef.current)}`;
+      }
+    }
     const ws = new WebSocket(url);
 
     ws.onopen = () => {
@@ -30,6 +40,19 @@ export function useWebSocket(onMessage: MessageHandler) {
       try {
         const data = JSON.parse(event.data);
         if (data.type === 'ping') return; // server heartbeat — ignore
+        if (data.type === 'resync_required') {
+          // Missed events are no longer buffered server-side; reload fully.
+          lastSeqRef.current = data.payload?.seq ?? null;
+          epochRef.current = data.payload?.epoch ?? null;
+          handlerRef.current(data);
+          return;
+        }
+        if (typeof data.seq === 'number') {
+          const sameStream = (data.epoch ?? null) === epochRef.current;
+          if (sameStream && lastSeqRef.current !== null && data.seq <= lastSeqRef.current) return; // replay duplicate
+          lastSeqRef.current = data.seq;
+          epochRef.current = data.epoch ?? null;
+        }
         handlerRef.current(data);
       } catch {
         // ignore malformed messages